@@ -11,7 +11,7 @@ import socket
 import sys
 import tempfile
 from functools import wraps
-from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Union
+from typing import Any, Callable, Iterable, List, Mapping, MutableMapping, Optional, Union
 from urllib.parse import urlparse
 
 import requests
@@ -25,6 +25,8 @@ from airbyte_cdk.sources.utils.schema_helpers import check_config_against_spec_o
 from airbyte_cdk.utils import is_cloud_environment
 from airbyte_cdk.utils.airbyte_secrets_utils import get_secrets, update_secrets
 from airbyte_cdk.utils.constants import ENV_REQUEST_CACHE_PATH
+from airbyte_cdk.utils.message_serializer import AirbyteMessageSerializer
+from airbyte_cdk.utils.message_writer import BufferedMessageWriter
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 from requests import PreparedRequest, Response, Session
 
@@ -44,6 +46,13 @@ class AirbyteEntrypoint(object):
 
         self.source = source
         self.logger = logging.getLogger(f"airbyte.{getattr(source, 'name', '')}")
+        self._serializer = AirbyteMessageSerializer.from_environment()
+        # Subclasses overriding airbyte_message_to_string keep serializing the messages their own way
+        self._message_to_string: Callable[[AirbyteMessage], Any] = (
+            self._serializer.serialize
+            if type(self).airbyte_message_to_string is AirbyteEntrypoint.airbyte_message_to_string
+            else self.airbyte_message_to_string
+        )
 
     @staticmethod
     def parse_args(args: List[str]) -> argparse.Namespace:
@@ -97,27 +106,25 @@ class AirbyteEntrypoint(object):
                 os.environ[ENV_REQUEST_CACHE_PATH] = temp_dir  # set this as default directory for request_cache to store *.sqlite files
                 if cmd == "spec":
                     message = AirbyteMessage(type=Type.SPEC, spec=source_spec)
-                    yield from [
-                        self.airbyte_message_to_string(queued_message) for queued_message in self._emit_queued_messages(self.source)
-                    ]
-                    yield self.airbyte_message_to_string(message)
+                    yield from [self._message_to_string(queued_message) for queued_message in self._emit_queued_messages(self.source)]
+                    yield self._message_to_string(message)
                 else:
                     raw_config = self.source.read_config(parsed_args.config)
                     config = self.source.configure(raw_config, temp_dir)
 
                     if cmd == "check":
-                        yield from map(AirbyteEntrypoint.airbyte_message_to_string, self.check(source_spec, config))
+                        yield from map(self._message_to_string, self.check(source_spec, config))
                     elif cmd == "discover":
-                        yield from map(AirbyteEntrypoint.airbyte_message_to_string, self.discover(source_spec, config))
+                        yield from map(self._message_to_string, self.discover(source_spec, config))
                     elif cmd == "read":
                         config_catalog = self.source.read_catalog(parsed_args.catalog)
                         state = self.source.read_state(parsed_args.state)
 
-                        yield from map(AirbyteEntrypoint.airbyte_message_to_string, self.read(source_spec, config, config_catalog, state))
+                        yield from map(self._message_to_string, self.read(source_spec, config, config_catalog, state))
                     else:
                         raise Exception("Unexpected command " + cmd)
         finally:
-            yield from [self.airbyte_message_to_string(queued_message) for queued_message in self._emit_queued_messages(self.source)]
+            yield from [self._message_to_string(queued_message) for queued_message in self._emit_queued_messages(self.source)]
 
     def check(self, source_spec: ConnectorSpecification, config: TConfig) -> Iterable[AirbyteMessage]:
         self.set_up_secret_filter(config, source_spec.connectionSpecification)
@@ -174,7 +181,7 @@ class AirbyteEntrypoint(object):
 
     @staticmethod
     def airbyte_message_to_string(airbyte_message: AirbyteMessage) -> Any:
-        return airbyte_message.json(exclude_unset=True)
+        return AirbyteMessageSerializer.from_environment().serialize(airbyte_message)
 
     @classmethod
     def extract_state(cls, args: List[str]) -> Optional[Any]:
@@ -206,8 +213,9 @@ class AirbyteEntrypoint(object):
 def launch(source: Source, args: List[str]) -> None:
     source_entrypoint = AirbyteEntrypoint(source)
     parsed_args = source_entrypoint.parse_args(args)
-    for message in source_entrypoint.run(parsed_args):
-        print(message)
+    with BufferedMessageWriter() as writer:
+        for message in source_entrypoint.run(parsed_args):
+            writer.write(message)
 
 
 def _init_internal_request_filter() -> None:
@@ -3,7 +3,11 @@
 #
 
 import logging
+import threading
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from queue import Full, Queue
 from typing import Any, Dict, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Tuple, Union
 
 from airbyte_cdk.models import (
@@ -22,22 +26,33 @@ from airbyte_cdk.sources.connector_state_manager import ConnectorStateManager
 from airbyte_cdk.sources.message import MessageRepository
 from airbyte_cdk.sources.source import Source
 from airbyte_cdk.sources.streams import Stream
-from airbyte_cdk.sources.streams.core import StreamData
+from airbyte_cdk.sources.streams.core import StreamData, is_record_batch
 from airbyte_cdk.sources.streams.http.http import HttpStream
-from airbyte_cdk.sources.utils.record_helper import stream_data_to_airbyte_message
+from airbyte_cdk.sources.utils.record_helper import record_batch_to_airbyte_messages, stream_data_to_airbyte_message
 from airbyte_cdk.sources.utils.schema_helpers import InternalConfig, split_config
 from airbyte_cdk.sources.utils.slice_logger import DebugSliceLogger, SliceLogger
-from airbyte_cdk.utils.event_timing import create_timer
+from airbyte_cdk.utils.event_timing import EventTimer, create_timer
 from airbyte_cdk.utils.stream_status_utils import as_airbyte_message as stream_status_as_airbyte_message
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 
 
+@dataclass
+class _StreamReadDone:
+    """
+    Put on the queue of the concurrent reads once a stream is read, with the exception which stopped the read if any
+    """
+
+    exception: Optional[Exception]
+
+
 class AbstractSource(Source, ABC):
     """
     Abstract base class for an Airbyte Source. Consumers should implement any abstract methods
     in this class to create an Airbyte Specification compliant Source.
     """
 
+    _CONCURRENT_READ_QUEUE_SIZE = 10_000
+
     @abstractmethod
     def check_connection(self, logger: logging.Logger, config: Mapping[str, Any]) -> Tuple[bool, Optional[Any]]:
         """
@@ -100,52 +115,152 @@ class AbstractSource(Source, ABC):
         state_manager = ConnectorStateManager(stream_instance_map=stream_instances, state=state)
         self._stream_to_instance_map = stream_instances
         with create_timer(self.name) as timer:
-            for configured_stream in catalog.streams:
-                stream_instance = stream_instances.get(configured_stream.stream.name)
-                if not stream_instance:
-                    if not self.raise_exception_on_missing_stream:
-                        continue
-                    raise KeyError(
-                        f"The stream {configured_stream.stream.name} no longer exists in the configuration. "
-                        f"Refresh the schema in replication settings and remove this stream from future sync attempts."
-                    )
+            if self.max_concurrent_streams > 1 and len(catalog.streams) > 1:
+                yield from self._read_streams_concurrently(logger, catalog, stream_instances, state_manager, internal_config, timer)
+            else:
+                for configured_stream in catalog.streams:
+                    stream_instance = self._get_stream_instance(configured_stream, stream_instances)
+                    if stream_instance:
+                        yield from self._read_configured_stream(
+                            logger, stream_instance, configured_stream, state_manager, internal_config, timer
+                        )
+
+        logger.info(f"Finished syncing {self.name}")
+
+    def _get_stream_instance(self, configured_stream: ConfiguredAirbyteStream, stream_instances: Mapping[str, Stream]) -> Optional[Stream]:
+        stream_instance = stream_instances.get(configured_stream.stream.name)
+        if not stream_instance and self.raise_exception_on_missing_stream:
+            raise KeyError(
+                f"The stream {configured_stream.stream.name} no longer exists in the configuration. "
+                f"Refresh the schema in replication settings and remove this stream from future sync attempts."
+            )
+        return stream_instance
+
+    def _read_configured_stream(
+        self,
+        logger: logging.Logger,
+        stream_instance: Stream,
+        configured_stream: ConfiguredAirbyteStream,
+        state_manager: ConnectorStateManager,
+        internal_config: InternalConfig,
+        timer: EventTimer,
+    ) -> Iterator[AirbyteMessage]:
+        """
+        Reads a stream of the catalog with its status messages. If the stream fails, its INCOMPLETE status is emitted before raising
+        """
+        event_name = f"Syncing stream {configured_stream.stream.name}"
+        try:
+            self._apply_log_level_to_stream_logger(logger, stream_instance)
+            timer.start_event(event_name)
+            stream_is_available, reason = stream_instance.check_availability(logger, self)
+            if not stream_is_available:
+                logger.warning(f"Skipped syncing stream '{stream_instance.name}' because it was unavailable. {reason}")
+                return
+            logger.info(f"Marking stream {configured_stream.stream.name} as STARTED")
+            yield stream_status_as_airbyte_message(configured_stream, AirbyteStreamStatus.STARTED)
+            yield from self._read_stream(
+                logger=logger,
+                stream_instance=stream_instance,
+                configured_stream=configured_stream,
+                state_manager=state_manager,
+                internal_config=internal_config,
+            )
+            logger.info(f"Marking stream {configured_stream.stream.name} as STOPPED")
+            yield stream_status_as_airbyte_message(configured_stream, AirbyteStreamStatus.COMPLETE)
+        except AirbyteTracedException as e:
+            yield stream_status_as_airbyte_message(configured_stream, AirbyteStreamStatus.INCOMPLETE)
+            raise e
+        except Exception as e:
+            yield from self._emit_queued_messages()
+            logger.exception(f"Encountered an exception while reading stream {configured_stream.stream.name}")
+            logger.info(f"Marking stream {configured_stream.stream.name} as STOPPED")
+            yield stream_status_as_airbyte_message(configured_stream, AirbyteStreamStatus.INCOMPLETE)
+            display_message = stream_instance.get_error_display_message(e)
+            if display_message:
+                raise AirbyteTracedException.from_exception(e, message=display_message) from e
+            raise e
+        finally:
+            timer.finish_event(event_name)
+            logger.info(f"Finished syncing {configured_stream.stream.name}")
+            logger.info(timer.report())
 
+    def _read_streams_concurrently(
+        self,
+        logger: logging.Logger,
+        catalog: ConfiguredAirbyteCatalog,
+        stream_instances: Mapping[str, Stream],
+        state_manager: ConnectorStateManager,
+        internal_config: InternalConfig,
+        timer: EventTimer,
+    ) -> Iterator[AirbyteMessage]:
+        """
+        Reads up to `max_concurrent_streams` streams at the same time, in the order of the catalog. Each stream is read by a worker thread
+        which puts its messages on a shared queue, so the messages of a stream keep their order relative to each other. If a stream fails,
+        the streams being read are read until the end but no other stream is started, then the exception of the first failed stream is
+        raised.
+        """
+        output: Queue[Union[AirbyteMessage, _StreamReadDone]] = Queue(maxsize=self._CONCURRENT_READ_QUEUE_SIZE)
+        stop = threading.Event()
+
+        def put(item: Union[AirbyteMessage, _StreamReadDone]) -> None:
+            # The reader of the queue may have stopped, in which case nothing will ever be taken from the queue
+            while not stop.is_set():
                 try:
-                    self._apply_log_level_to_stream_logger(logger, stream_instance)
-                    timer.start_event(f"Syncing stream {configured_stream.stream.name}")
-                    stream_is_available, reason = stream_instance.check_availability(logger, self)
-                    if not stream_is_available:
-                        logger.warning(f"Skipped syncing stream '{stream_instance.name}' because it was unavailable. {reason}")
+                    output.put(item, timeout=0.1)
+                    return
+                except Full:
+                    continue
+
+        def read_stream(stream_instance: Stream, configured_stream: ConfiguredAirbyteStream) -> None:
+            exception: Optional[Exception] = None
+            try:
+                messages = self._read_configured_stream(logger, stream_instance, configured_stream, state_manager, internal_config, timer)
+                for message in messages:
+                    if stop.is_set():
+                        messages.close()
+                        break
+                    put(message)
+            except Exception as e:
+                exception = e
+            finally:
+                put(_StreamReadDone(exception))
+
+        configured_streams = iter(catalog.streams)
+        first_exception: Optional[Exception] = None
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_streams, thread_name_prefix="stream") as executor:
+
+            def start_next_stream() -> bool:
+                nonlocal first_exception
+                for configured_stream in configured_streams:
+                    try:
+                        stream_instance = self._get_stream_instance(configured_stream, stream_instances)
+                    except KeyError as e:
+                        first_exception = e
+                        return False
+                    if stream_instance:
+                        executor.submit(read_stream, stream_instance, configured_stream)
+                        return True
+                return False
+
+            try:
+                streams_being_read = 0
+                while streams_being_read < self.max_concurrent_streams and start_next_stream():
+                    streams_being_read += 1
+                while streams_being_read:
+                    item = output.get()
+                    if not isinstance(item, _StreamReadDone):
+                        yield item
                         continue
-                    logger.info(f"Marking stream {configured_stream.stream.name} as STARTED")
-                    yield stream_status_as_airbyte_message(configured_stream, AirbyteStreamStatus.STARTED)
-                    yield from self._read_stream(
-                        logger=logger,
-                        stream_instance=stream_instance,
-                        configured_stream=configured_stream,
-                        state_manager=state_manager,
-                        internal_config=internal_config,
-                    )
-                    logger.info(f"Marking stream {configured_stream.stream.name} as STOPPED")
-                    yield stream_status_as_airbyte_message(configured_stream, AirbyteStreamStatus.COMPLETE)
-                except AirbyteTracedException as e:
-                    yield stream_status_as_airbyte_message(configured_stream, AirbyteStreamStatus.INCOMPLETE)
-                    raise e
-                except Exception as e:
-                    yield from self._emit_queued_messages()
-                    logger.exception(f"Encountered an exception while reading stream {configured_stream.stream.name}")
-                    logger.info(f"Marking stream {configured_stream.stream.name} as STOPPED")
-                    yield stream_status_as_airbyte_message(configured_stream, AirbyteStreamStatus.INCOMPLETE)
-                    display_message = stream_instance.get_error_display_message(e)
-                    if display_message:
-                        raise AirbyteTracedException.from_exception(e, message=display_message) from e
-                    raise e
-                finally:
-                    timer.finish_event()
-                    logger.info(f"Finished syncing {configured_stream.stream.name}")
-                    logger.info(timer.report())
+                    streams_being_read -= 1
+                    if item.exception and not first_exception:
+                        first_exception = item.exception
+                    if not first_exception and start_next_stream():
+                        streams_being_read += 1
+            finally:
+                stop.set()
 
-        logger.info(f"Finished syncing {self.name}")
+        if first_exception:
+            raise first_exception
 
     @property
     def raise_exception_on_missing_stream(self) -> bool:
@@ -155,6 +270,15 @@ class AbstractSource(Source, ABC):
     def per_stream_state_enabled(self) -> bool:
         return True
 
+    @property
+    def max_concurrent_streams(self) -> int:
+        """
+        The number of streams read at the same time. The streams are read one after the other by default. When reading several streams at
+        the same time, the records of the streams are interleaved, and the streams and the message repository must be safe to use from
+        several threads.
+        """
+        return 1
+
     def _read_stream(
         self,
         logger: logging.Logger,
@@ -236,7 +360,8 @@ class AbstractSource(Source, ABC):
             self.per_stream_state_enabled,
             internal_config,
         ):
-            yield self._get_message(record_data_or_message, stream_instance)
+            # `Stream.read_incremental` already splits the batches where the record limit is reached
+            yield from self._get_messages(record_data_or_message, stream_instance)
 
     def _emit_queued_messages(self) -> Iterable[AirbyteMessage]:
         if self.message_repository:
@@ -252,12 +377,12 @@ class AbstractSource(Source, ABC):
     ) -> Iterator[AirbyteMessage]:
         total_records_counter = 0
         for record_data_or_message in stream_instance.read_full_refresh(configured_stream.cursor_field, logger, self._slice_logger):
-            message = self._get_message(record_data_or_message, stream_instance)
-            yield message
-            if message.type == MessageType.RECORD:
-                total_records_counter += 1
-                if internal_config.is_limit_reached(total_records_counter):
-                    return
+            for message in self._get_messages(record_data_or_message, stream_instance):
+                yield message
+                if message.type == MessageType.RECORD:
+                    total_records_counter += 1
+                    if internal_config.is_limit_reached(total_records_counter):
+                        return
 
     @staticmethod
     def _apply_log_level_to_stream_logger(logger: logging.Logger, stream_instance: Stream) -> None:
@@ -277,6 +402,14 @@ class AbstractSource(Source, ABC):
         else:
             return stream_data_to_airbyte_message(stream.name, record_data_or_message, stream.transformer, stream.get_json_schema())
 
+    def _get_messages(self, record_data_or_message: Union[StreamData, AirbyteMessage], stream: Stream) -> Iterable[AirbyteMessage]:
+        """
+        Converts the input to AirbyteMessages. A batch of records is converted as a whole while any other input is converted by `_get_message`
+        """
+        if is_record_batch(record_data_or_message):
+            return record_batch_to_airbyte_messages(stream.name, record_data_or_message, stream.transformer, stream.get_json_schema())  # type: ignore
+        return [self._get_message(record_data_or_message, stream)]
+
     @property
     def message_repository(self) -> Union[None, MessageRepository]:
         return None
@@ -169,7 +169,8 @@ class ConnectorStateManager:
         Using the current per-stream state, creates a mapping of all the stream states for the connector being synced
         :return: A deep copy of the mapping of stream name to stream state value
         """
-        return {descriptor.name: state.dict() if state else {} for descriptor, state in self.per_stream_states.items()}
+        # The items are copied first since the state of other streams may be updated by other threads
+        return {descriptor.name: state.dict() if state else {} for descriptor, state in list(self.per_stream_states.items())}
 
     @staticmethod
     def _is_legacy_dict_state(state: Union[List[AirbyteStateMessage], MutableMapping[str, Any]]) -> bool:
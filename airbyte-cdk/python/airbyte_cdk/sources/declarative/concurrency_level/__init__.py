@@ -0,0 +1,8 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+from airbyte_cdk.sources.declarative.concurrency_level.concurrency_level import ConcurrencyLevel
+from airbyte_cdk.sources.declarative.concurrency_level.concurrent_slice_reader import ConcurrentSliceReader
+
+__all__ = ["ConcurrencyLevel", "ConcurrentSliceReader"]
@@ -0,0 +1,38 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+from dataclasses import InitVar, dataclass
+from typing import Any, Mapping, Optional, Union
+
+from airbyte_cdk.sources.declarative.interpolation.interpolated_string import InterpolatedString
+from airbyte_cdk.sources.declarative.types import Config
+
+
+@dataclass
+class ConcurrencyLevel:
+    """
+    Defines the number of slices of a stream read at the same time
+
+    Attributes:
+        default_concurrency (Union[int, str]): The number of slices read at the same time, can be interpolated from the config
+        max_concurrency (Optional[int]): The maximum number of slices read at the same time, whatever the config
+    """
+
+    default_concurrency: Union[int, str]
+    max_concurrency: Optional[int]
+    config: Config
+    parameters: InitVar[Mapping[str, Any]]
+
+    def __post_init__(self, parameters: Mapping[str, Any]) -> None:
+        if self.max_concurrency is not None and self.max_concurrency < 1:
+            raise ValueError(f"The maximum concurrency must be at least 1. Got {self.max_concurrency}")
+        self._default_concurrency = InterpolatedString.create(str(self.default_concurrency), parameters=parameters)
+
+    def get_concurrency_level(self) -> int:
+        concurrency_level = self._default_concurrency.eval(self.config)
+        if not isinstance(concurrency_level, int) or concurrency_level < 1:
+            raise ValueError(f"The concurrency level must be a positive integer. Got {concurrency_level}")
+        if self.max_concurrency is not None:
+            return min(concurrency_level, self.max_concurrency)
+        return concurrency_level
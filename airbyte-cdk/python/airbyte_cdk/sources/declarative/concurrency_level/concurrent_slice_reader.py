@@ -0,0 +1,201 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional
+
+from airbyte_cdk.models import AirbyteMessage
+from airbyte_cdk.models import Type as MessageType
+from airbyte_cdk.sources.declarative.incremental.cursor import Cursor as DeclarativeCursor
+from airbyte_cdk.sources.declarative.retrievers.simple_retriever import SimpleRetriever
+from airbyte_cdk.sources.declarative.types import Record as DeclarativeRecord
+from airbyte_cdk.sources.declarative.types import StreamSlice
+from airbyte_cdk.sources.message import MessageRepository
+from airbyte_cdk.sources.streams.concurrent.availability_strategy import AbstractAvailabilityStrategy, StreamAvailability, StreamAvailable
+from airbyte_cdk.sources.streams.concurrent.cursor import Cursor
+from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
+from airbyte_cdk.sources.streams.concurrent.partitions.partition_generator import PartitionGenerator
+from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
+from airbyte_cdk.sources.streams.concurrent.thread_based_concurrent_stream import ThreadBasedConcurrentStream
+from airbyte_cdk.sources.streams.core import StreamData
+from airbyte_cdk.sources.utils.slice_logger import SliceLogger
+
+
+class _RetrieverPerThread:
+    """
+    Gives each thread its own copy of the retriever so the slices read at the same time don't share their pagination state
+    """
+
+    def __init__(self, retriever: SimpleRetriever):
+        self._retriever = retriever
+        self._local = threading.local()
+
+    def get(self) -> SimpleRetriever:
+        retriever: Optional[SimpleRetriever] = getattr(self._local, "retriever", None)
+        if retriever is None:
+            retriever = self._retriever.copy_for_concurrent_read()
+            self._local.retriever = retriever
+        return retriever
+
+
+class DeclarativePartition(Partition):
+    """
+    A slice of a declarative stream. The most recent record of the slice is kept once the slice is read so the slice can be closed on the
+    cursor of the stream later on.
+    """
+
+    def __init__(
+        self,
+        retrievers: _RetrieverPerThread,
+        stream_name: str,
+        stream_slice: Optional[StreamSlice],
+        index: int,
+        message_repository: MessageRepository,
+    ):
+        self._retrievers = retrievers
+        self._stream_name = stream_name
+        self._slice = stream_slice
+        self._message_repository = message_repository
+        self.index = index
+        self.most_recent_record: Optional[DeclarativeRecord] = None
+
+    def read(self) -> Iterable[Record]:
+        retriever = self._retrievers.get()
+        records = retriever.read_records(self._slice)
+        try:
+            for stream_data in records:
+                if isinstance(stream_data, Mapping):
+                    yield Record(stream_data)
+                elif isinstance(stream_data, AirbyteMessage) and stream_data.type == MessageType.RECORD and stream_data.record:
+                    yield Record(stream_data.record.data)
+                else:
+                    self._message_repository.emit_message(stream_data)  # type: ignore  # non-record stream data are AirbyteMessages
+        finally:
+            # The partition reader stops reading once the record queue is closed: closing the records of the retriever right away stops the
+            # pagination instead of leaving the next page to be requested until the generator is garbage collected
+            close = getattr(records, "close", None)
+            if close:
+                close()
+        self.most_recent_record = retriever.most_recent_record_from_last_slice
+
+    def to_slice(self) -> Optional[Mapping[str, Any]]:
+        return self._slice
+
+    def __hash__(self) -> int:
+        return hash((self._stream_name, self.index))
+
+    def __repr__(self) -> str:
+        return f"DeclarativePartition({self._stream_name}, {self._slice})"
+
+
+class DeclarativePartitionGenerator(PartitionGenerator):
+    def __init__(
+        self, retriever: SimpleRetriever, stream_name: str, slices: Iterable[Optional[StreamSlice]], message_repository: MessageRepository
+    ):
+        self._retrievers = _RetrieverPerThread(retriever)
+        self._stream_name = stream_name
+        self._slices = slices
+        self._message_repository = message_repository
+
+    def generate(self) -> Iterable[Partition]:
+        for index, stream_slice in enumerate(self._slices):
+            yield DeclarativePartition(self._retrievers, self._stream_name, stream_slice, index, self._message_repository)
+
+
+class InOrderSliceCursor(Cursor):
+    """
+    Closes the slices on the cursor of a declarative stream in the order they were generated. A slice read before the slices generated
+    before it is only closed once they are all closed, so the state of the stream never moves past a slice which isn't fully read.
+    """
+
+    def __init__(self, cursor: Optional[DeclarativeCursor]):
+        self._cursor = cursor
+        self._next_index = 0
+        self._read_partitions: Dict[int, DeclarativePartition] = {}
+        self.closed_slices = 0
+
+    def observe(self, record: Record) -> None:
+        pass
+
+    def close_partition(self, partition: Partition) -> None:
+        if not isinstance(partition, DeclarativePartition):
+            raise ValueError(f"Expected a DeclarativePartition, got {partition}")
+        self._read_partitions[partition.index] = partition
+        while self._next_index in self._read_partitions:
+            read_partition = self._read_partitions.pop(self._next_index)
+            if self._cursor:
+                self._cursor.close_slice(read_partition.to_slice() or {}, read_partition.most_recent_record)
+            self._next_index += 1
+            self.closed_slices += 1
+
+
+class _AlwaysAvailable(AbstractAvailabilityStrategy):
+    def check_availability(self, logger: logging.Logger) -> StreamAvailability:
+        # The availability of the stream is checked before it is read
+        return StreamAvailable()
+
+
+class ConcurrentSliceReader:
+    """
+    Reads the slices of a declarative stream through a ThreadBasedConcurrentStream. The slices are generated in one thread of the pool
+    and read by the `concurrency_level` others, the generating thread reading slices as well once all the slices are generated. Records are
+    returned as soon as they are read, so the records of different slices are interleaved, but the slices are closed on the cursor in the
+    order they were generated: the state is always a safe checkpoint.
+    """
+
+    def __init__(self, concurrency_level: int, message_repository: MessageRepository):
+        """
+        :param concurrency_level: The maximum number of slices read at the same time
+        :param message_repository: The message repository used to emit the slice logs and the non-record messages of the slices
+        """
+        if concurrency_level < 1:
+            raise ValueError(f"The concurrency level must be at least 1. Got {concurrency_level}")
+        self._concurrency_level = concurrency_level
+        self._message_repository = message_repository
+
+    def read(
+        self,
+        retriever: SimpleRetriever,
+        stream_name: str,
+        slices: Iterable[Optional[StreamSlice]],
+        logger: logging.Logger,
+        slice_logger: SliceLogger,
+        checkpoint: Optional[Callable[[], StreamData]] = None,
+    ) -> Iterable[StreamData]:
+        """
+        :param retriever: The retriever of the stream, used to read the slices and to close them on its cursor
+        :param slices: The slices to read, generated in a separate thread
+        :param checkpoint: Called after slices were closed, before returning the next record. What it returns is returned as is
+        """
+        slice_cursor = InOrderSliceCursor(retriever.cursor)
+        concurrent_stream = ThreadBasedConcurrentStream(
+            partition_generator=DeclarativePartitionGenerator(retriever, stream_name, slices, self._message_repository),
+            max_workers=self._concurrency_level + 1,
+            max_concurrent_tasks=self._concurrency_level + 1,
+            name=stream_name,
+            json_schema={},
+            availability_strategy=_AlwaysAvailable(),
+            primary_key=[],
+            cursor_field=None,
+            slice_logger=slice_logger,
+            logger=logger,
+            message_repository=self._message_repository,
+            cursor=slice_cursor,
+        )
+
+        closed_slices = 0
+        has_checkpointed = False
+        try:
+            for record in concurrent_stream.read():
+                if checkpoint and slice_cursor.closed_slices > closed_slices:
+                    closed_slices = slice_cursor.closed_slices
+                    has_checkpointed = True
+                    yield checkpoint()
+                yield record.data
+            if checkpoint and (slice_cursor.closed_slices > closed_slices or not has_checkpointed):
+                yield checkpoint()
+        finally:
+            # A stream is created for each read so its threads are released whether the slices were all read or not
+            concurrent_stream.shutdown()
@@ -2,16 +2,21 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import logging
 from dataclasses import InitVar, dataclass, field
 from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Union
 
 from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.declarative.concurrency_level.concurrent_slice_reader import ConcurrentSliceReader
 from airbyte_cdk.sources.declarative.interpolation import InterpolatedString
 from airbyte_cdk.sources.declarative.retrievers.retriever import Retriever
+from airbyte_cdk.sources.declarative.retrievers.simple_retriever import SimpleRetriever
 from airbyte_cdk.sources.declarative.schema import DefaultSchemaLoader
 from airbyte_cdk.sources.declarative.schema.schema_loader import SchemaLoader
 from airbyte_cdk.sources.declarative.types import Config
-from airbyte_cdk.sources.streams.core import Stream
+from airbyte_cdk.sources.streams.core import Stream, StreamData
+from airbyte_cdk.sources.utils.schema_helpers import InternalConfig
+from airbyte_cdk.sources.utils.slice_logger import SliceLogger
 
 
 @dataclass
@@ -27,6 +32,7 @@ class DeclarativeStream(Stream):
         config (Config): The user-provided configuration as specified by the source's spec
         stream_cursor_field (Optional[Union[InterpolatedString, str]]): The cursor field
         stream. Transformations are applied in the order in which they are defined.
+        concurrent_slice_reader (Optional[ConcurrentSliceReader]): Reads the slices concurrently if the retriever is a SimpleRetriever
     """
 
     retriever: Retriever
@@ -38,6 +44,7 @@ class DeclarativeStream(Stream):
     _name: str = field(init=False, repr=False, default="")
     _primary_key: str = field(init=False, repr=False, default="")
     stream_cursor_field: Optional[Union[InterpolatedString, str]] = None
+    concurrent_slice_reader: Optional[ConcurrentSliceReader] = None
 
     def __post_init__(self, parameters: Mapping[str, Any]) -> None:
         self._stream_cursor_field = (
@@ -91,6 +98,53 @@ class DeclarativeStream(Stream):
         cursor = self._stream_cursor_field.eval(self.config)
         return cursor if cursor else []
 
+    def read_full_refresh(
+        self,
+        cursor_field: Optional[List[str]],
+        logger: logging.Logger,
+        slice_logger: SliceLogger,
+    ) -> Iterable[StreamData]:
+        if not self.concurrent_slice_reader or not isinstance(self.retriever, SimpleRetriever):
+            yield from super().read_full_refresh(cursor_field, logger, slice_logger)
+            return
+
+        slices = self.stream_slices(sync_mode=SyncMode.full_refresh, cursor_field=cursor_field)
+        yield from self.concurrent_slice_reader.read(self.retriever, self.name, slices, logger, slice_logger)
+
+    def read_incremental(  # type: ignore  # ignoring typing for ConnectorStateManager because of circular dependencies
+        self,
+        cursor_field: Optional[List[str]],
+        logger: logging.Logger,
+        slice_logger: SliceLogger,
+        stream_state: MutableMapping[str, Any],
+        state_manager,
+        per_stream_state_enabled: bool,
+        internal_config: InternalConfig,
+    ) -> Iterable[StreamData]:
+        if not self.concurrent_slice_reader or not isinstance(self.retriever, SimpleRetriever):
+            yield from super().read_incremental(
+                cursor_field, logger, slice_logger, stream_state, state_manager, per_stream_state_enabled, internal_config
+            )
+            return
+
+        slices = self.stream_slices(sync_mode=SyncMode.incremental, cursor_field=cursor_field, stream_state=stream_state)
+        record_counter = 0
+        for record_data_or_message in self.concurrent_slice_reader.read(
+            self.retriever,
+            self.name,
+            slices,
+            logger,
+            slice_logger,
+            checkpoint=lambda: self._checkpoint_state(stream_state, state_manager, per_stream_state_enabled),
+        ):
+            yield record_data_or_message
+            if isinstance(record_data_or_message, Mapping):
+                record_counter += 1
+                if internal_config.is_limit_reached(record_counter):
+                    # The state only covers the slices read until the end
+                    yield self._checkpoint_state(stream_state, state_manager, per_stream_state_enabled)
+                    break
+
     def read_records(
         self,
         sync_mode: SyncMode,
@@ -0,0 +1,258 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import codecs
+import json
+import re
+from dataclasses import InitVar, dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Union
+
+import requests
+from airbyte_cdk.sources.declarative.decoders.json_decoder import JsonDecoder
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_ITEM_SEPARATOR = re.compile(r"[ \t\n\r]*,[ \t\n\r]*")
+_NUMBER_CHARACTERS = re.compile(r"[0-9.eE+\-]*")
+_SCAN_ONCE = json.JSONDecoder().scan_once
+
+
+class _JsonTextReader:
+    """
+    Decodes the JSON values of a text read chunk by chunk. Each value is decoded once it is fully read, so only the value being decoded
+    and the current chunk are kept in memory, whatever the size of the document.
+    """
+
+    def __init__(self, chunks: Iterator[str], chunk_size: int):
+        self._chunks = chunks
+        self._chunk_size = chunk_size
+        self._buffer = ""
+        self._position = 0
+        self._exhausted = False
+
+    def peek(self) -> Optional[str]:
+        """
+        Skips the whitespaces and returns the next character without consuming it, or None at the end of the document
+        """
+        while True:
+            self._position = _WHITESPACE.match(self._buffer, self._position).end()  # type: ignore  # the pattern always matches
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if not self._fill(1):
+                return None
+
+    def consume(self, expected: str) -> None:
+        if self.peek() != expected:
+            raise json.JSONDecodeError(f"Expecting '{expected}'", self._buffer, self._position)
+        self._position += 1
+
+    def decode_value(self) -> Any:
+        while True:
+            try:
+                value, end = _SCAN_ONCE(self._buffer, self._position)
+            except (StopIteration, json.JSONDecodeError) as exception:
+                position = self._position
+                if self.peek() is None:
+                    raise json.JSONDecodeError("Expecting value", self._buffer, self._position)
+                # Either whitespaces were skipped or the value continues in the next chunks
+                if self._position == position and not self._fill(max(2 * (len(self._buffer) - self._position), self._chunk_size)):
+                    if isinstance(exception, json.JSONDecodeError):
+                        raise
+                    raise json.JSONDecodeError("Expecting value", self._buffer, self._position)
+                continue
+            # A number followed by the end of the buffer, or by the start of an exponent or a fraction, may continue in the next chunk
+            if type(value) in (int, float) and _NUMBER_CHARACTERS.match(self._buffer, end).end() == len(self._buffer):  # type: ignore
+                if self._fill(len(self._buffer) - self._position + 1):
+                    continue
+            self._position = end
+            return value
+
+    def iter_array_items(self) -> Iterator[Any]:
+        """
+        Decodes the items of the array starting at the current position
+        """
+        self.consume("[")
+        if self.peek() == "]":
+            self._position += 1
+            return
+        while True:
+            yield self.decode_value()
+            separator = _ITEM_SEPARATOR.match(self._buffer, self._position)
+            if separator:
+                self._position = separator.end()
+            elif self.peek() == "]":
+                self._position += 1
+                return
+            else:
+                self.consume(",")
+
+    def _fill(self, min_size: int) -> bool:
+        """
+        Reads chunks until at least `min_size` characters are available after the current position. Returns False if nothing was read
+        """
+        if self._exhausted:
+            return False
+        chunks = [self._buffer[self._position :]]
+        previously_available = available = len(chunks[0])
+        for chunk in self._chunks:
+            chunks.append(chunk)
+            available += len(chunk)
+            if available >= min_size:
+                break
+        else:
+            self._exhausted = True
+        self._buffer = "".join(chunks)
+        self._position = 0
+        return available > previously_available
+
+
+@dataclass
+class JsonStreamingDecoder(JsonDecoder):
+    """
+    Decoder strategy that returns the json-encoded content of a response, if any, and that can also decode the values at a path of the
+    response while reading it, without loading the response in memory first.
+
+    Decoding the values one at a time is slower than decoding the whole response at once, but the values are available as soon as they
+    are read and the raw content of the response is never held in memory. The requests must be sent with `stream=True` for the content
+    to be read while it is received.
+
+    Once the values at the path are read, the rest of the document is decoded and becomes the content of the response, with an empty array
+    in place of the values, so components decoding the response afterwards, like paginators, still find the values next to the records.
+    """
+
+    parameters: InitVar[Mapping[str, Any]]
+    chunk_size: int = 1 << 16
+
+    def decode_path(self, response: requests.Response, path: List[Union[str, int]]) -> Iterable[Any]:
+        """
+        Yields the items of the array at `path` as they are decoded, or the value at `path` if it isn't an array and isn't empty. Nothing
+        is yielded if the path doesn't exist in the response or if the response is not a JSON document. A JSONDecodeError is raised if the
+        array turns out to be invalid once its first items are yielded.
+        :param path: The keys of the objects and the indexes of the arrays leading to the values
+        """
+        reader = _JsonTextReader(self._iter_text(response), self.chunk_size)
+        # The objects and arrays leading to the path, with the members read so far. The first one holds the document itself
+        containers: List[Any] = [[None]]
+        document_is_read = False
+        value = None
+        try:
+            try:
+                found = self._read_to_path(reader, path, containers)
+                is_array = found and reader.peek() == "["
+                if found and not is_array:
+                    value = reader.decode_value()
+                    self._set_pending_member(containers, value)
+            except json.JSONDecodeError:
+                # Like JsonDecoder, a response which is not a JSON document doesn't have any value
+                return
+
+            if is_array:
+                yield from reader.iter_array_items()
+                self._set_pending_member(containers, [])
+            elif value:
+                yield value
+
+            try:
+                for container in reversed(containers[1:]):
+                    self._read_remaining_members(reader, container)
+            except json.JSONDecodeError:
+                return
+            document_is_read = True
+        finally:
+            self._replace_streamed_content(response, containers[0][0], document_is_read)
+
+    def _iter_text(self, response: requests.Response) -> Iterator[str]:
+        encoding = response.encoding or "utf-8"
+        # The byte order mark of UTF-8 documents is ignored
+        if codecs.lookup(encoding).name == "utf-8":
+            encoding = "utf-8-sig"
+        decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        if response.raw is None:
+            # The response was not received from a connection, so its content can't be streamed
+            chunks: Iterable[bytes] = (response.content[i : i + self.chunk_size] for i in range(0, len(response.content), self.chunk_size))
+        else:
+            chunks = response.iter_content(self.chunk_size)
+        for chunk in chunks:
+            yield decoder.decode(chunk)
+        yield decoder.decode(b"", final=True)
+
+    @classmethod
+    def _read_to_path(cls, reader: _JsonTextReader, path: List[Union[str, int]], containers: List[Any]) -> bool:
+        """
+        Reads the document up to the value at `path`. The objects and arrays opened on the way are added to `containers`, each one with the
+        members read before the path and a None member standing for the value the path continues with. Returns False if the path doesn't
+        exist, in which case the values read are in the containers
+        """
+        for segment in path:
+            next_character = reader.peek()
+            if next_character == "{":
+                reader.consume("{")
+                members: Dict[str, Any] = {}
+                cls._set_pending_member(containers, members)
+                containers.append(members)
+                if reader.peek() == "}":
+                    return False
+                while True:
+                    key = reader.decode_value()
+                    reader.consume(":")
+                    members[key] = None
+                    if key == str(segment):
+                        break
+                    members[key] = reader.decode_value()
+                    if reader.peek() == "}":
+                        return False
+                    reader.consume(",")
+            elif next_character == "[" and str(segment).isdigit():
+                reader.consume("[")
+                items: List[Any] = []
+                cls._set_pending_member(containers, items)
+                containers.append(items)
+                if reader.peek() == "]":
+                    return False
+                for _ in range(int(segment)):
+                    items.append(reader.decode_value())
+                    if reader.peek() == "]":
+                        return False
+                    reader.consume(",")
+                items.append(None)
+            else:
+                cls._set_pending_member(containers, reader.decode_value())
+                return False
+        return True
+
+    @staticmethod
+    def _set_pending_member(containers: List[Any], value: Any) -> None:
+        container = containers[-1]
+        if isinstance(container, dict):
+            container[next(reversed(container))] = value
+        else:
+            container[-1] = value
+
+    @staticmethod
+    def _read_remaining_members(reader: _JsonTextReader, container: Union[Dict[str, Any], List[Any]]) -> None:
+        closing = "}" if isinstance(container, dict) else "]"
+        while reader.peek() != closing:
+            reader.consume(",")
+            if isinstance(container, dict):
+                key = reader.decode_value()
+                reader.consume(":")
+                container[key] = reader.decode_value()
+            else:
+                container.append(reader.decode_value())
+        reader.consume(closing)
+
+    @staticmethod
+    def _replace_streamed_content(response: requests.Response, document: Any, document_is_read: bool) -> None:
+        """
+        Once a streamed response is read, its content is the document without the values at the path. If the document was not read until
+        the end, the content is empty and the connection is released
+        """
+        if response._content is not False:
+            # The content was not streamed
+            return
+        if not document_is_read:
+            response.close()
+            response._content = b""
+        else:
+            response._content = json.dumps(document).encode("utf-8")
+            response.encoding = "utf-8"
@@ -3,12 +3,13 @@
 #
 
 from dataclasses import InitVar, dataclass
-from typing import Any, List, Mapping, Union
+from typing import Any, Iterable, List, Mapping, Optional, Union
 
 import dpath.util
 import requests
 from airbyte_cdk.sources.declarative.decoders.decoder import Decoder
 from airbyte_cdk.sources.declarative.decoders.json_decoder import JsonDecoder
+from airbyte_cdk.sources.declarative.decoders.json_streaming_decoder import JsonStreamingDecoder
 from airbyte_cdk.sources.declarative.extractors.record_extractor import RecordExtractor
 from airbyte_cdk.sources.declarative.interpolation.interpolated_string import InterpolatedString
 from airbyte_cdk.sources.declarative.types import Config
@@ -24,6 +25,9 @@ class DpathExtractor(RecordExtractor):
     If the field path points to an empty object, an empty array is returned.
     If the field path points to a non-existing path, an empty array is returned.
 
+    Paths without wildcards are looked up directly. If the decoder is a JsonStreamingDecoder, the records of such paths are decoded while
+    reading the response, without loading the response in memory first.
+
     Examples of instantiating this transform:
     ```
       extractor:
@@ -58,24 +62,55 @@ class DpathExtractor(RecordExtractor):
     parameters: InitVar[Mapping[str, Any]]
     decoder: Decoder = JsonDecoder(parameters={})
 
-    def __post_init__(self, parameters: Mapping[str, Any]):
+    def __post_init__(self, parameters: Mapping[str, Any]) -> None:
         for path_index in range(len(self.field_path)):
             if isinstance(self.field_path[path_index], str):
                 self.field_path[path_index] = InterpolatedString.create(self.field_path[path_index], parameters=parameters)
+        # The path only depends on the config and the parameters so it is evaluated once
+        self._path: Optional[List[Any]] = None
+
+    @property
+    def streams_records(self) -> bool:
+        """
+        Whether the records are decoded while the response is read, in which case the request should be sent with `stream=True`
+        """
+        return isinstance(self.decoder, JsonStreamingDecoder)
 
     def extract_records(self, response: requests.Response) -> List[Mapping[str, Any]]:
-        response_body = self.decoder.decode(response)
-        if len(self.field_path) == 0:
-            extracted = response_body
+        return list(self.iter_records(response))
+
+    def iter_records(self, response: requests.Response) -> Iterable[Mapping[str, Any]]:
+        """
+        Returns the records of the response. If the decoder is a JsonStreamingDecoder and the path doesn't have wildcards, the records are
+        returned as they are decoded
+        """
+        if self._path is None:
+            self._path = [path.eval(self.config) for path in self.field_path]  # type: ignore  # field_path elements are InterpolatedString
+        if "*" in self._path:
+            extracted = dpath.util.values(self.decoder.decode(response), self._path)
+        elif isinstance(self.decoder, JsonStreamingDecoder):
+            return self.decoder.decode_path(response, self._path)
         else:
-            path = [path.eval(self.config) for path in self.field_path]
-            if "*" in path:
-                extracted = dpath.util.values(response_body, path)
-            else:
-                extracted = dpath.util.get(response_body, path, default=[])
+            extracted = self._get(self.decoder.decode(response), self._path)
         if isinstance(extracted, list):
             return extracted
         elif extracted:
             return [extracted]
         else:
             return []
+
+    @staticmethod
+    def _get(response_body: Any, path: List[Any]) -> Any:
+        """
+        Returns the value at a path without wildcards, or an empty list if the path doesn't exist. Unlike dpath.util.get, it doesn't walk
+        the values outside the path
+        """
+        extracted = response_body
+        for key in path:
+            if isinstance(extracted, Mapping) and key in extracted:
+                extracted = extracted[key]
+            elif isinstance(extracted, list) and str(key).isdigit() and int(key) < len(extracted):
+                extracted = extracted[int(key)]
+            else:
+                return []
+        return extracted
@@ -24,6 +24,7 @@ class RecordFilter:
 
     def __post_init__(self, parameters: Mapping[str, Any]) -> None:
         self._filter_interpolator = InterpolatedBoolean(condition=self.condition, parameters=parameters)
+        self._depends_on_record = self._filter_interpolator.references("record")
 
     def filter_records(
         self,
@@ -33,4 +34,9 @@ class RecordFilter:
         next_page_token: Optional[Mapping[str, Any]] = None,
     ) -> List[Mapping[str, Any]]:
         kwargs = {"stream_state": stream_state, "stream_slice": stream_slice, "next_page_token": next_page_token}
+        if not self._depends_on_record:
+            # The condition has the same value for all the records of the page so it is only evaluated once
+            if records and self._filter_interpolator.eval(self.config, record=records[0], **kwargs):
+                return list(records)
+            return []
         return [record for record in records if self._filter_interpolator.eval(self.config, record=record, **kwargs)]
@@ -2,10 +2,12 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import itertools
 from dataclasses import InitVar, dataclass, field
-from typing import Any, List, Mapping, Optional
+from typing import Any, Iterable, List, Mapping, Optional
 
 import requests
+from airbyte_cdk.sources.declarative.extractors.dpath_extractor import DpathExtractor
 from airbyte_cdk.sources.declarative.extractors.http_selector import HttpSelector
 from airbyte_cdk.sources.declarative.extractors.record_extractor import RecordExtractor
 from airbyte_cdk.sources.declarative.extractors.record_filter import RecordFilter
@@ -31,9 +33,18 @@ class RecordSelector(HttpSelector):
     record_filter: Optional[RecordFilter] = None
     transformations: List[RecordTransformation] = field(default_factory=lambda: [])
 
+    STREAMED_RECORDS_BATCH_SIZE = 1000
+
     def __post_init__(self, parameters: Mapping[str, Any]) -> None:
         self._parameters = parameters
 
+    @property
+    def streams_records(self) -> bool:
+        """
+        Whether the records are extracted while the response is read, in which case `iter_records` returns them as they are extracted
+        """
+        return isinstance(self.extractor, DpathExtractor) and self.extractor.streams_records
+
     def select_records(
         self,
         response: requests.Response,
@@ -46,6 +57,27 @@ class RecordSelector(HttpSelector):
         self._transform(filtered_data, stream_state, stream_slice)
         return [Record(data, stream_slice) for data in filtered_data]
 
+    def iter_records(
+        self,
+        response: requests.Response,
+        stream_state: StreamState,
+        stream_slice: Optional[StreamSlice] = None,
+        next_page_token: Optional[Mapping[str, Any]] = None,
+    ) -> Iterable[Record]:
+        """
+        Returns the same records as `select_records`. If the records are extracted while the response is read, they are filtered and
+        transformed by batches of STREAMED_RECORDS_BATCH_SIZE records and returned batch by batch, without waiting for the whole response
+        """
+        if not isinstance(self.extractor, DpathExtractor) or not self.extractor.streams_records:
+            yield from self.select_records(response, stream_state, stream_slice, next_page_token)
+            return
+        all_data = iter(self.extractor.iter_records(response))
+        while batch := list(itertools.islice(all_data, self.STREAMED_RECORDS_BATCH_SIZE)):
+            filtered_data = self._filter(batch, stream_state, stream_slice, next_page_token)
+            self._transform(filtered_data, stream_state, stream_slice)
+            for data in filtered_data:
+                yield Record(data, stream_slice)
+
     def _filter(
         self,
         records: List[Mapping[str, Any]],
@@ -65,6 +97,12 @@ class RecordSelector(HttpSelector):
         stream_state: StreamState,
         stream_slice: Optional[StreamSlice] = None,
     ) -> None:
-        for record in records:
-            for transformation in self.transformations:
-                transformation.transform(record, config=self.config, stream_state=stream_state, stream_slice=stream_slice)
+        # Each transformation is applied to the whole page so it can evaluate the values which don't depend on the record once per page
+        for transformation in self.transformations:
+            transform_page = getattr(transformation, "transform_page", None)
+            if transform_page is not None:
+                transform_page(records, config=self.config, stream_state=stream_state, stream_slice=stream_slice)
+            else:
+                # Custom transformations don't have to extend RecordTransformation and may only implement transform
+                for record in records:
+                    transformation.transform(record, config=self.config, stream_state=stream_state, stream_slice=stream_slice)
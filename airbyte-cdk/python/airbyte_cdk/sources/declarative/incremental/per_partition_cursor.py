@@ -160,7 +160,8 @@ class PerPartitionCursor(Cursor):
 
     def get_stream_state(self) -> StreamState:
         states = []
-        for partition_tuple, cursor in self._cursor_per_partition.items():
+        # The slices of a stream can be generated, and new partitions added, while the state is read from another thread
+        for partition_tuple, cursor in list(self._cursor_per_partition.items()):
             cursor_state = cursor.get_stream_state()
             if cursor_state:
                 states.append(
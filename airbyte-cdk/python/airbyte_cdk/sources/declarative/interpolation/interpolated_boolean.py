@@ -46,3 +46,12 @@ class InterpolatedBoolean:
                 return False
             # The presence of a value is generally regarded as truthy, so we treat it as such
             return True
+
+    def references(self, variable: str) -> bool:
+        """
+        :param variable: The name of a variable of the interpolation context, e.g. `record`
+        :return: True if the evaluation may depend on the value of the variable
+        """
+        if isinstance(self.condition, bool):
+            return False
+        return self._interpolation.references(self.condition, variable) or self._interpolation.references(self._default, variable)
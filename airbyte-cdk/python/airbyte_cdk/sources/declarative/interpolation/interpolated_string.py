@@ -39,6 +39,13 @@ class InterpolatedString:
         """
         return self._interpolation.eval(self.string, config, self.default, parameters=self._parameters, **kwargs)
 
+    def references(self, variable: str) -> bool:
+        """
+        :param variable: The name of a variable of the interpolation context, e.g. `record`
+        :return: True if the evaluation may depend on the value of the variable
+        """
+        return self._interpolation.references(self.string, variable) or self._interpolation.references(self.default, variable)
+
     def __eq__(self, other):
         if not isinstance(other, InterpolatedString):
             return False
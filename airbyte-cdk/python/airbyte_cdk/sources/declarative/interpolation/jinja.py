@@ -3,17 +3,31 @@
 #
 
 import ast
-from typing import Any, Optional, Tuple, Type
+import re
+from functools import lru_cache
+from typing import Any, FrozenSet, List, Optional, Tuple, Type
 
 from airbyte_cdk.sources.declarative.interpolation.filters import filters
 from airbyte_cdk.sources.declarative.interpolation.interpolation import Interpolation
 from airbyte_cdk.sources.declarative.interpolation.macros import macros
 from airbyte_cdk.sources.declarative.types import Config
-from jinja2 import meta
+from jinja2 import Template, meta
 from jinja2.exceptions import UndefinedError
 from jinja2.sandbox import Environment
 
 
+def _create_environment(restricted_extensions: List[str], restricted_builtin_functions: List[str]) -> Environment:
+    environment = Environment()
+    environment.filters.update(**filters)
+    environment.globals.update(**macros)
+
+    for extension in restricted_extensions:
+        environment.extensions.pop(extension, None)
+    for builtin in restricted_builtin_functions:
+        environment.globals.pop(builtin, None)
+    return environment
+
+
 class JinjaInterpolation(Interpolation):
     """
     Interpolation strategy using the Jinja2 template engine.
@@ -48,15 +62,17 @@ class JinjaInterpolation(Interpolation):
     # Please add a unit test to test_jinja.py when adding a restriction.
     RESTRICTED_BUILTIN_FUNCTIONS = ["range"]  # The range function can cause very expensive computations
 
-    def __init__(self):
-        self._environment = Environment()
-        self._environment.filters.update(**filters)
-        self._environment.globals.update(**macros)
+    # Number of compiled templates kept. The cache is shared by all the instances, which evaluate a few templates each many times
+    TEMPLATE_CACHE_SIZE = 1024
 
-        for extension in self.RESTRICTED_EXTENSIONS:
-            self._environment.extensions.pop(extension, None)
-        for builtin in self.RESTRICTED_BUILTIN_FUNCTIONS:
-            self._environment.globals.pop(builtin, None)
+    # A string without any of these is rendered as is by Jinja, except for newlines which Jinja normalizes
+    _TEMPLATE_MARKERS = ("{{", "{%", "{#", "\r", "\n")
+    # Strings starting with a name can only be literals if they are one of the constants or a prefixed string such as b'' or r""
+    _NOT_A_LITERAL = re.compile(r"[ \t]*(?!(?:True|False|None)\b)(?![rRbBuU]{1,2}['\"])[^\W\d]")
+
+    # All the instances configure the environment the same way so they share it and the templates compiled with it. Keeping both out of
+    # the instances also keeps the components using them picklable
+    _ENVIRONMENT = _create_environment(RESTRICTED_EXTENSIONS, RESTRICTED_BUILTIN_FUNCTIONS)
 
     def eval(
         self,
@@ -90,7 +106,26 @@ class JinjaInterpolation(Interpolation):
         # If result is empty or resulted in an undefined error, evaluate and return the default string
         return self._literal_eval(self._eval(default, context), valid_types)
 
+    def references(self, input_str: Any, variable: str) -> bool:
+        """
+        Checks if evaluating the string can read a variable from the context, either directly or through one of its aliases. When it can't,
+        the result of the evaluation does not depend on the value of this variable.
+
+        Strings which are not templates never reference any variable while templates which can't be parsed are assumed to reference all of
+        them.
+        """
+        if not isinstance(input_str, str) or not any(marker in input_str for marker in self._TEMPLATE_MARKERS):
+            return False
+        try:
+            _, undeclared = self._compile(input_str)
+        except Exception:
+            return True
+        names = {variable, *[alias for alias, equivalent in self.ALIASES.items() if equivalent == variable]}
+        return not undeclared.isdisjoint(names)
+
     def _literal_eval(self, result, valid_types: Optional[Tuple[Type[Any]]]):
+        if isinstance(result, str) and self._NOT_A_LITERAL.match(result):
+            return result
         try:
             evaluated = ast.literal_eval(result)
         except (ValueError, SyntaxError):
@@ -100,14 +135,27 @@ class JinjaInterpolation(Interpolation):
         return result
 
     def _eval(self, s: str, context):
+        if isinstance(s, str) and not any(marker in s for marker in self._TEMPLATE_MARKERS):
+            # The string is not a jinja template so it would be rendered as is
+            return s
         try:
-            ast = self._environment.parse(s)
-            undeclared = meta.find_undeclared_variables(ast)
+            template, undeclared = self._compile(s)
             undeclared_not_in_context = {var for var in undeclared if var not in context}
             if undeclared_not_in_context:
                 raise ValueError(f"Jinja macro has undeclared variables: {undeclared_not_in_context}. Context: {context}")
-            return self._environment.from_string(s).render(context)
+            return template.render(context)
         except TypeError:
             # The string is a static value, not a jinja template
             # It can be returned as is
             return s
+
+    @staticmethod
+    @lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+    def _compile(s: str) -> Tuple[Template, FrozenSet[str]]:
+        """
+        Parses and compiles the template once for every evaluation of the same string
+        """
+        environment = JinjaInterpolation._ENVIRONMENT
+        ast = environment.parse(s)
+        undeclared = frozenset(meta.find_undeclared_variables(ast))
+        return environment.from_string(s), undeclared
@@ -6,8 +6,9 @@ import json
 import logging
 import pkgutil
 import re
+from functools import lru_cache
 from importlib import metadata
-from typing import Any, Dict, Iterator, List, Mapping, MutableMapping, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Mapping, MutableMapping, Optional, Set, Tuple, Union
 
 import yaml
 from airbyte_cdk.models import (
@@ -20,8 +21,10 @@ from airbyte_cdk.models import (
 from airbyte_cdk.sources.declarative.checks.connection_checker import ConnectionChecker
 from airbyte_cdk.sources.declarative.declarative_source import DeclarativeSource
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import CheckStream as CheckStreamModel
+from airbyte_cdk.sources.declarative.models.declarative_component_schema import ConcurrencyLevel as ConcurrencyLevelModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import DeclarativeStream as DeclarativeStreamModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import Spec as SpecModel
+from airbyte_cdk.sources.declarative.parsers.compiled_manifest_cache import CompiledManifestCache
 from airbyte_cdk.sources.declarative.parsers.manifest_component_transformer import ManifestComponentTransformer
 from airbyte_cdk.sources.declarative.parsers.manifest_reference_resolver import ManifestReferenceResolver
 from airbyte_cdk.sources.declarative.parsers.model_to_component_factory import ModelToComponentFactory
@@ -33,6 +36,24 @@ from jsonschema.exceptions import ValidationError
 from jsonschema.validators import validate
 
 
+@lru_cache(maxsize=None)
+def _load_declarative_component_schema() -> Mapping[str, Any]:
+    """
+    Loads the declarative component schema once per process. The C implementation of the YAML loader is used if it is available
+    """
+    try:
+        raw_component_schema = pkgutil.get_data("airbyte_cdk", "sources/declarative/declarative_component_schema.yaml")
+        if raw_component_schema is not None:
+            declarative_component_schema: Mapping[str, Any] = yaml.load(
+                raw_component_schema, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            )
+            return declarative_component_schema
+        else:
+            raise RuntimeError("Failed to read manifest component json schema required for validation")
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Failed to read manifest component json schema required for validation: {e}")
+
+
 class ManifestDeclarativeSource(DeclarativeSource):
     """Declarative source defined by a manifest of low-code components that define source connector behavior"""
 
@@ -44,11 +65,14 @@ class ManifestDeclarativeSource(DeclarativeSource):
         debug: bool = False,
         emit_connector_builder_messages: bool = False,
         component_factory: Optional[ModelToComponentFactory] = None,
+        compiled_manifest_cache: Optional[CompiledManifestCache] = None,
     ):
         """
         :param source_config(Mapping[str, Any]): The manifest of low-code components that describe the source connector
         :param debug(bool): True if debug mode is enabled
         :param component_factory(ModelToComponentFactory): optional factory if ModelToComponentFactory's default behaviour needs to be tweaked
+        :param compiled_manifest_cache(CompiledManifestCache): optional cache of the compiled manifests. Defaults to the cache stored in the
+          directory set by the AIRBYTE_MANIFEST_CACHE_PATH environment variable, if it is set
         """
         self.logger = logging.getLogger(f"airbyte.{self.name}")
 
@@ -57,16 +81,28 @@ class ManifestDeclarativeSource(DeclarativeSource):
         if "type" not in manifest:
             manifest["type"] = "DeclarativeSource"
 
-        resolved_source_config = ManifestReferenceResolver().preprocess_manifest(manifest)
-        propagated_source_config = ManifestComponentTransformer().propagate_types_and_parameters("", resolved_source_config, {})
-        self._source_config = propagated_source_config
         self._debug = debug
         self._emit_connector_builder_messages = emit_connector_builder_messages
         self._constructor = component_factory if component_factory else ModelToComponentFactory(emit_connector_builder_messages)
         self._message_repository = self._constructor.get_message_repository()
         self._slice_logger: SliceLogger = AlwaysLogSliceLogger() if emit_connector_builder_messages else DebugSliceLogger()
+        # Only the streams of the configured catalog are created while reading
+        self._configured_catalog: Optional[ConfiguredAirbyteCatalog] = None
+
+        cache = compiled_manifest_cache if compiled_manifest_cache else CompiledManifestCache.from_environment()
+        compiled_manifest = cache.get(manifest) if cache else None
+        if compiled_manifest is not None:
+            # The manifest was validated when it was compiled by the same version of the CDK
+            self._source_config = compiled_manifest
+            return
+
+        resolved_source_config = ManifestReferenceResolver().preprocess_manifest(manifest)
+        propagated_source_config = ManifestComponentTransformer().propagate_types_and_parameters("", resolved_source_config, {})
+        self._source_config = propagated_source_config
 
         self._validate_source()
+        if cache:
+            cache.put(manifest, self._source_config)
 
     @property
     def resolved_manifest(self) -> Mapping[str, Any]:
@@ -92,11 +128,21 @@ class ManifestDeclarativeSource(DeclarativeSource):
     def streams(self, config: Mapping[str, Any]) -> List[Stream]:
         self._emit_manifest_debug_message(extra_args={"source_name": self.name, "parsed_config": json.dumps(self._source_config)})
 
+        self._set_api_budget(config)
+        concurrency_level = self._get_concurrency_level(config)
+        configured_stream_names = (
+            {configured_stream.stream.name for configured_stream in self._configured_catalog.streams} if self._configured_catalog else None
+        )
         source_streams = [
             self._constructor.create_component(
-                DeclarativeStreamModel, stream_config, config, emit_connector_builder_messages=self._emit_connector_builder_messages
+                DeclarativeStreamModel,
+                stream_config,
+                config,
+                emit_connector_builder_messages=self._emit_connector_builder_messages,
+                concurrency_level=concurrency_level,
             )
             for stream_config in self._stream_configs(self._source_config)
+            if self._is_configured(stream_config, configured_stream_names)
         ]
 
         for stream in source_streams:
@@ -104,6 +150,24 @@ class ManifestDeclarativeSource(DeclarativeSource):
             self._apply_log_level_to_stream_logger(self.logger, stream)
         return source_streams
 
+    def _set_api_budget(self, config: Mapping[str, Any]) -> None:
+        api_budget = self._source_config.get("api_budget")
+        if not api_budget:
+            return
+        if "type" not in api_budget:
+            api_budget["type"] = "HTTPAPIBudget"
+        self._constructor.set_api_budget(api_budget, config)
+
+    def _get_concurrency_level(self, config: Mapping[str, Any]) -> int:
+        concurrency_level = self._source_config.get("concurrency_level")
+        # The connector builder expects the slices of a stream to be read in order
+        if not concurrency_level or self._emit_connector_builder_messages:
+            return 1
+        if "type" not in concurrency_level:
+            concurrency_level["type"] = "ConcurrencyLevel"
+        concurrency_level_component = self._constructor.create_component(ConcurrencyLevelModel, concurrency_level, config)
+        return concurrency_level_component.get_concurrency_level()  # type: ignore  # the factory creates a ConcurrencyLevel
+
     def spec(self, logger: logging.Logger) -> ConnectorSpecification:
         """
         Returns the connector specification (spec) as defined in the Airbyte Protocol. The spec is an object describing the possible
@@ -135,7 +199,25 @@ class ManifestDeclarativeSource(DeclarativeSource):
         state: Optional[Union[List[AirbyteStateMessage], MutableMapping[str, Any]]] = None,
     ) -> Iterator[AirbyteMessage]:
         self._configure_logger_level(logger)
-        yield from super().read(logger, config, catalog, state)
+        parent_record_cache = self._constructor.get_parent_record_cache()
+        self._configured_catalog = catalog
+        try:
+            yield from super().read(logger, config, catalog, state)
+        finally:
+            self._configured_catalog = None
+            # The parent records are only shared between the streams of a sync
+            if parent_record_cache is not None:
+                parent_record_cache.clear()
+
+    @staticmethod
+    def _is_configured(stream_config: Mapping[str, Any], configured_stream_names: Optional[Set[str]]) -> bool:
+        """
+        Returns False if the stream is not in the catalog being read. Streams whose name is not set in the manifest are always created
+        """
+        if configured_stream_names is None:
+            return True
+        name = stream_config.get("name")
+        return not isinstance(name, str) or not name or name in configured_stream_names
 
     def _configure_logger_level(self, logger: logging.Logger) -> None:
         """
@@ -148,14 +230,7 @@ class ManifestDeclarativeSource(DeclarativeSource):
         """
         Validates the connector manifest against the declarative component schema
         """
-        try:
-            raw_component_schema = pkgutil.get_data("airbyte_cdk", "sources/declarative/declarative_component_schema.yaml")
-            if raw_component_schema is not None:
-                declarative_component_schema = yaml.load(raw_component_schema, Loader=yaml.SafeLoader)
-            else:
-                raise RuntimeError("Failed to read manifest component json schema required for validation")
-        except FileNotFoundError as e:
-            raise FileNotFoundError(f"Failed to read manifest component json schema required for validation: {e}")
+        declarative_component_schema = _load_declarative_component_schema()
 
         streams = self._source_config.get("streams")
         if not streams:
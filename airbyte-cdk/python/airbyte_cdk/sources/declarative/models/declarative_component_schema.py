@@ -53,6 +53,23 @@ class CheckStream(BaseModel):
     )
 
 
+class ConcurrencyLevel(BaseModel):
+    type: Literal['ConcurrencyLevel']
+    default_concurrency: Union[int, str] = Field(
+        ...,
+        description='The number of slices of a stream read at the same time.',
+        examples=[10, "{{ config['num_workers'] or 10 }}"],
+        title='Default Concurrency',
+    )
+    max_concurrency: Optional[int] = Field(
+        None,
+        description='The maximum number of slices of a stream read at the same time, whatever the value of the default concurrency.',
+        examples=[20, 100],
+        title='Max Concurrency',
+    )
+    parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
+
+
 class ConstantBackoffStrategy(BaseModel):
     type: Literal['ConstantBackoffStrategy']
     backoff_time_in_seconds: Union[float, str] = Field(
@@ -340,6 +357,33 @@ class SessionTokenRequestBearerAuthenticator(BaseModel):
     type: Literal['Bearer']
 
 
+class HttpRequestMatcher(BaseModel):
+    type: Literal['HttpRequestMatcher']
+    method: Optional[str] = Field(
+        None,
+        description='The HTTP method of the requests. All the methods if not set.',
+        examples=['GET', 'POST'],
+        title='Method',
+    )
+    url_pattern: Optional[str] = Field(
+        None,
+        description='A regular expression searched in the URL of the requests, without the query string. All the URLs if not set.',
+        examples=['/v1/users', '^https://api\\.example\\.com/v2/'],
+        title='URL Pattern',
+    )
+    params: Optional[Dict[str, Any]] = Field(
+        None,
+        description='The query parameters the requests must have.',
+        title='Parameters',
+    )
+    headers: Optional[Dict[str, Any]] = Field(
+        None,
+        description='The headers the requests must have.',
+        title='Headers',
+    )
+    parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
+
+
 class HttpMethodEnum(Enum):
     GET = 'GET'
     POST = 'POST'
@@ -414,6 +458,15 @@ class JsonDecoder(BaseModel):
     type: Literal['JsonDecoder']
 
 
+class JsonStreamingDecoder(BaseModel):
+    type: Literal['JsonStreamingDecoder']
+    chunk_size: Optional[int] = Field(
+        65536,
+        description='The number of bytes of the response read at a time.',
+        title='Chunk Size',
+    )
+
+
 class MinMaxDatetime(BaseModel):
     type: Literal['MinMaxDatetime']
     datetime: str = Field(
@@ -559,6 +612,23 @@ class PrimaryKey(BaseModel):
     )
 
 
+class Rate(BaseModel):
+    type: Literal['Rate']
+    limit: int = Field(
+        ...,
+        description='The number of calls allowed in the interval.',
+        ge=1,
+        title='Limit',
+    )
+    interval: str = Field(
+        ...,
+        description='The interval of time, as an ISO 8601 duration.',
+        examples=['PT1S', 'PT1H'],
+        title='Interval',
+    )
+    parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
+
+
 class RecordFilter(BaseModel):
     type: Literal['RecordFilter']
     condition: Optional[str] = Field(
@@ -952,6 +1022,19 @@ class DefaultPaginator(BaseModel):
     )
     page_size_option: Optional[RequestOption] = None
     page_token_option: Optional[Union[RequestOption, RequestPath]] = None
+    max_concurrent_pages: Optional[int] = Field(
+        1,
+        description="The maximum number of pages of a slice requested at the same time once the first page is received. Records are still returned in page order. Only supported by the OffsetIncrement and PageIncrement pagination strategies, whose tokens don't depend on the previous pages. Without a total count, pages are requested until one has fewer records than the page size, so the API must return full pages until the last one.",
+        examples=[4, 10],
+        ge=1,
+        title='Max Concurrent Pages',
+    )
+    total_count: Optional[str] = Field(
+        None,
+        description='The total number of records of the slice, read from the first response, so only the pages holding records are requested when pages are requested concurrently. Requires a page size.',
+        examples=['{{ response.total }}', "{{ headers['X-Total-Count'] }}"],
+        title='Total Count',
+    )
     parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
 
 
@@ -968,7 +1051,7 @@ class DpathExtractor(BaseModel):
         ],
         title='Field Path',
     )
-    decoder: Optional[JsonDecoder] = Field(
+    decoder: Optional[Union[JsonDecoder, JsonStreamingDecoder]] = Field(
         None,
         description='Component decoding the response so records can be extracted.',
         title='Decoder',
@@ -976,6 +1059,28 @@ class DpathExtractor(BaseModel):
     parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
 
 
+class FixedWindowCallRatePolicy(BaseModel):
+    type: Literal['FixedWindowCallRatePolicy']
+    period: str = Field(
+        ...,
+        description='The duration of a window, as an ISO 8601 duration.',
+        examples=['PT1M', 'PT1H'],
+        title='Period',
+    )
+    call_limit: int = Field(
+        ...,
+        description='The number of calls allowed in a window.',
+        ge=1,
+        title='Call Limit',
+    )
+    matchers: Optional[List[HttpRequestMatcher]] = Field(
+        None,
+        description='The requests the policy applies to. The policy applies to all the requests if empty.',
+        title='Matchers',
+    )
+    parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
+
+
 class SessionTokenRequestApiKeyAuthenticator(BaseModel):
     type: Literal['ApiKey']
     inject_into: RequestOption = Field(
@@ -1011,6 +1116,21 @@ class ListPartitionRouter(BaseModel):
     parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
 
 
+class MovingWindowCallRatePolicy(BaseModel):
+    type: Literal['MovingWindowCallRatePolicy']
+    rates: List[Rate] = Field(
+        ...,
+        description='The rates which must all be respected, for example 10 calls per second and 1000 calls per hour.',
+        title='Rates',
+    )
+    matchers: Optional[List[HttpRequestMatcher]] = Field(
+        None,
+        description='The requests the policy applies to. The policy applies to all the requests if empty.',
+        title='Matchers',
+    )
+    parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
+
+
 class RecordSelector(BaseModel):
     type: Literal['RecordSelector']
     extractor: Union[CustomRecordExtractor, DpathExtractor]
@@ -1042,6 +1162,37 @@ class Spec(BaseModel):
     )
 
 
+class TokenBucketCallRatePolicy(BaseModel):
+    type: Literal['TokenBucketCallRatePolicy']
+    rate: Rate = Field(
+        ...,
+        description='The rate at which the bucket is refilled.',
+        title='Rate',
+    )
+    burst: Optional[int] = Field(
+        None,
+        description='The capacity of the bucket, which is full at first. Defaults to the limit of the rate.',
+        ge=1,
+        title='Burst',
+    )
+    matchers: Optional[List[HttpRequestMatcher]] = Field(
+        None,
+        description='The requests the policy applies to. The policy applies to all the requests if empty.',
+        title='Matchers',
+    )
+    parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
+
+
+class UnlimitedCallRatePolicy(BaseModel):
+    type: Literal['UnlimitedCallRatePolicy']
+    matchers: Optional[List[HttpRequestMatcher]] = Field(
+        None,
+        description='The requests the policy applies to. The policy applies to all the requests if empty.',
+        title='Matchers',
+    )
+    parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
+
+
 class CompositeErrorHandler(BaseModel):
     type: Literal['CompositeErrorHandler']
     error_handlers: List[Union[CompositeErrorHandler, DefaultErrorHandler]] = Field(
@@ -1052,6 +1203,38 @@ class CompositeErrorHandler(BaseModel):
     parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
 
 
+class HTTPAPIBudget(BaseModel):
+    type: Literal['HTTPAPIBudget']
+    policies: List[
+        Union[
+            FixedWindowCallRatePolicy,
+            MovingWindowCallRatePolicy,
+            TokenBucketCallRatePolicy,
+            UnlimitedCallRatePolicy,
+        ]
+    ] = Field(
+        ...,
+        description='The policies of the budget, in the order they are matched against the requests.',
+        title='Policies',
+    )
+    ratelimit_reset_header: Optional[str] = Field(
+        'X-RateLimit-Reset',
+        description='The header with the time when the rate limit of the API is reset, as a Unix timestamp or a number of seconds.',
+        title='Rate Limit Reset Header',
+    )
+    ratelimit_remaining_header: Optional[str] = Field(
+        'X-RateLimit-Remaining',
+        description='The header with the number of calls left before the rate limit of the API is reset.',
+        title='Rate Limit Remaining Header',
+    )
+    status_codes_for_ratelimit_hit: Optional[List[int]] = Field(
+        [429],
+        description='The status codes returned by the API when the rate limit is hit. No call is made until the time given by the Retry-After header of these responses.',
+        title='Status Codes For Rate Limit Hit',
+    )
+    parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
+
+
 class DeclarativeSource(BaseModel):
     class Config:
         extra = Extra.forbid
@@ -1063,6 +1246,8 @@ class DeclarativeSource(BaseModel):
     schemas: Optional[Schemas] = None
     definitions: Optional[Dict[str, Any]] = None
     spec: Optional[Spec] = None
+    concurrency_level: Optional[ConcurrencyLevel] = None
+    api_budget: Optional[HTTPAPIBudget] = None
     metadata: Optional[Dict[str, Any]] = Field(
         None,
         description='For internal Airbyte use only - DO NOT modify manually. Used by consumers of declarative manifests for storing related metadata.',
@@ -1293,6 +1478,12 @@ class SimpleRetriever(BaseModel):
         description='PartitionRouter component that describes how to partition the stream, enabling incremental syncs and checkpointing.',
         title='Partition Router',
     )
+    page_prefetch_depth: Optional[int] = Field(
+        0,
+        description='The number of pages requested in the background ahead of the page whose records are being read. The next page is requested as soon as the records of the current page are extracted, so the requests overlap with processing the records. 0 requests each page once the records of the previous page are read.',
+        ge=0,
+        title='Page Prefetch Depth',
+    )
     parameters: Optional[Dict[str, Any]] = Field(None, alias='$parameters')
 
 
@@ -0,0 +1,74 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from importlib import metadata
+from typing import Any, Dict, Mapping, Optional
+
+from airbyte_cdk.utils.constants import ENV_MANIFEST_CACHE_PATH
+
+logger = logging.getLogger("airbyte")
+
+
+class CompiledManifestCache:
+    """
+    Persists the manifests compiled by ManifestDeclarativeSource, i.e. with their references resolved, their types and parameters
+    propagated and validated against the declarative component schema, so the following invocations of the connector skip these steps.
+
+    Compiled manifests are stored as JSON files in `directory`, keyed by the hash of the manifest and the version of the CDK which compiled
+    it. A manifest which can't be serialized to JSON is never cached, and a cache entry which can't be read is compiled again.
+    """
+
+    def __init__(self, directory: str):
+        self._directory = directory
+
+    @classmethod
+    def from_environment(cls) -> Optional["CompiledManifestCache"]:
+        """
+        Returns a cache stored in the directory set by the AIRBYTE_MANIFEST_CACHE_PATH environment variable, if it is set
+        """
+        directory = os.environ.get(ENV_MANIFEST_CACHE_PATH)
+        return cls(directory) if directory else None
+
+    def get(self, manifest: Mapping[str, Any]) -> Optional[Dict[str, Any]]:
+        path = self._path(manifest)
+        if path is None:
+            return None
+        try:
+            with open(path, "r") as cache_file:
+                compiled_manifest: Dict[str, Any] = json.load(cache_file)
+                return compiled_manifest
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exception:
+            logger.warning(f"Failed to read the compiled manifest from {path}: {exception}")
+            return None
+
+    def put(self, manifest: Mapping[str, Any], compiled_manifest: Mapping[str, Any]) -> None:
+        path = self._path(manifest)
+        if path is None:
+            return
+        try:
+            serialized_compiled_manifest = json.dumps(compiled_manifest)
+        except (TypeError, ValueError):
+            return
+        try:
+            os.makedirs(self._directory, exist_ok=True)
+            # The file is written then renamed so concurrent invocations never read a partially written manifest
+            with tempfile.NamedTemporaryFile("w", dir=self._directory, suffix=".tmp", delete=False) as cache_file:
+                cache_file.write(serialized_compiled_manifest)
+            os.replace(cache_file.name, path)
+        except OSError as exception:
+            logger.warning(f"Failed to write the compiled manifest to {path}: {exception}")
+
+    def _path(self, manifest: Mapping[str, Any]) -> Optional[str]:
+        try:
+            serialized_manifest = json.dumps({"cdk_version": metadata.version("airbyte_cdk"), "manifest": manifest}, sort_keys=True)
+        except (TypeError, ValueError):
+            return None
+        return os.path.join(self._directory, f"{hashlib.sha256(serialized_manifest.encode()).hexdigest()}.json")
@@ -25,7 +25,9 @@ DEFAULT_MODEL_TYPES: Mapping[str, str] = {
     "CustomIncrementalSync.start_datetime": "MinMaxDatetime",
     "CustomIncrementalSync.start_time_option": "RequestOption",
     # DeclarativeSource
+    "DeclarativeSource.api_budget": "HTTPAPIBudget",
     "DeclarativeSource.check": "CheckStream",
+    "DeclarativeSource.concurrency_level": "ConcurrencyLevel",
     "DeclarativeSource.spec": "Spec",
     "DeclarativeSource.streams": "DeclarativeStream",
     # DeclarativeStream
@@ -38,10 +40,15 @@ DEFAULT_MODEL_TYPES: Mapping[str, str] = {
     "DefaultPaginator.page_size_option": "RequestOption",
     # DpathExtractor
     "DpathExtractor.decoder": "JsonDecoder",
+    # FixedWindowCallRatePolicy
+    "FixedWindowCallRatePolicy.matchers": "HttpRequestMatcher",
     # HttpRequester
     "HttpRequester.error_handler": "DefaultErrorHandler",
     # ListPartitionRouter
     "ListPartitionRouter.request_option": "RequestOption",
+    # MovingWindowCallRatePolicy
+    "MovingWindowCallRatePolicy.matchers": "HttpRequestMatcher",
+    "MovingWindowCallRatePolicy.rates": "Rate",
     # ParentStreamConfig
     "ParentStreamConfig.request_option": "RequestOption",
     "ParentStreamConfig.stream": "DeclarativeStream",
@@ -54,6 +61,11 @@ DEFAULT_MODEL_TYPES: Mapping[str, str] = {
     "SimpleRetriever.requester": "HttpRequester",
     # SubstreamPartitionRouter
     "SubstreamPartitionRouter.parent_stream_configs": "ParentStreamConfig",
+    # TokenBucketCallRatePolicy
+    "TokenBucketCallRatePolicy.matchers": "HttpRequestMatcher",
+    "TokenBucketCallRatePolicy.rate": "Rate",
+    # UnlimitedCallRatePolicy
+    "UnlimitedCallRatePolicy.matchers": "HttpRequestMatcher",
     # AddFields
     "AddFields.fields": "AddedFieldDefinition",
     # CustomPartitionRouter
@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import datetime
 import importlib
 import inspect
 import re
@@ -21,9 +22,10 @@ from airbyte_cdk.sources.declarative.auth.token import (
 )
 from airbyte_cdk.sources.declarative.auth.token_provider import InterpolatedStringTokenProvider, SessionTokenProvider, TokenProvider
 from airbyte_cdk.sources.declarative.checks import CheckStream
+from airbyte_cdk.sources.declarative.concurrency_level import ConcurrencyLevel, ConcurrentSliceReader
 from airbyte_cdk.sources.declarative.datetime import MinMaxDatetime
 from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
-from airbyte_cdk.sources.declarative.decoders import JsonDecoder
+from airbyte_cdk.sources.declarative.decoders import JsonDecoder, JsonStreamingDecoder
 from airbyte_cdk.sources.declarative.extractors import DpathExtractor, RecordFilter, RecordSelector
 from airbyte_cdk.sources.declarative.incremental import Cursor, CursorFactory, DatetimeBasedCursor, PerPartitionCursor
 from airbyte_cdk.sources.declarative.interpolation import InterpolatedString
@@ -35,6 +37,7 @@ from airbyte_cdk.sources.declarative.models.declarative_component_schema import
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import BearerAuthenticator as BearerAuthenticatorModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import CheckStream as CheckStreamModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import CompositeErrorHandler as CompositeErrorHandlerModel
+from airbyte_cdk.sources.declarative.models.declarative_component_schema import ConcurrencyLevel as ConcurrencyLevelModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import ConstantBackoffStrategy as ConstantBackoffStrategyModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import CursorPagination as CursorPaginationModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import CustomAuthenticator as CustomAuthenticatorModel
@@ -55,22 +58,30 @@ from airbyte_cdk.sources.declarative.models.declarative_component_schema import
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import (
     ExponentialBackoffStrategy as ExponentialBackoffStrategyModel,
 )
+from airbyte_cdk.sources.declarative.models.declarative_component_schema import FixedWindowCallRatePolicy as FixedWindowCallRatePolicyModel
+from airbyte_cdk.sources.declarative.models.declarative_component_schema import HTTPAPIBudget as HTTPAPIBudgetModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import HttpRequester as HttpRequesterModel
+from airbyte_cdk.sources.declarative.models.declarative_component_schema import HttpRequestMatcher as HttpRequestMatcherModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import HttpResponseFilter as HttpResponseFilterModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import InlineSchemaLoader as InlineSchemaLoaderModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import JsonDecoder as JsonDecoderModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import JsonFileSchemaLoader as JsonFileSchemaLoaderModel
+from airbyte_cdk.sources.declarative.models.declarative_component_schema import JsonStreamingDecoder as JsonStreamingDecoderModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import (
     LegacySessionTokenAuthenticator as LegacySessionTokenAuthenticatorModel,
 )
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import ListPartitionRouter as ListPartitionRouterModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import MinMaxDatetime as MinMaxDatetimeModel
+from airbyte_cdk.sources.declarative.models.declarative_component_schema import (
+    MovingWindowCallRatePolicy as MovingWindowCallRatePolicyModel,
+)
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import NoAuth as NoAuthModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import NoPagination as NoPaginationModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import OAuthAuthenticator as OAuthAuthenticatorModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import OffsetIncrement as OffsetIncrementModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import PageIncrement as PageIncrementModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import ParentStreamConfig as ParentStreamConfigModel
+from airbyte_cdk.sources.declarative.models.declarative_component_schema import Rate as RateModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import RecordFilter as RecordFilterModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import RecordSelector as RecordSelectorModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import RemoveFields as RemoveFieldsModel
@@ -80,10 +91,17 @@ from airbyte_cdk.sources.declarative.models.declarative_component_schema import
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import SimpleRetriever as SimpleRetrieverModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import Spec as SpecModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import SubstreamPartitionRouter as SubstreamPartitionRouterModel
+from airbyte_cdk.sources.declarative.models.declarative_component_schema import TokenBucketCallRatePolicy as TokenBucketCallRatePolicyModel
+from airbyte_cdk.sources.declarative.models.declarative_component_schema import UnlimitedCallRatePolicy as UnlimitedCallRatePolicyModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import ValueType
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import WaitTimeFromHeader as WaitTimeFromHeaderModel
 from airbyte_cdk.sources.declarative.models.declarative_component_schema import WaitUntilTimeFromHeader as WaitUntilTimeFromHeaderModel
-from airbyte_cdk.sources.declarative.partition_routers import ListPartitionRouter, SinglePartitionRouter, SubstreamPartitionRouter
+from airbyte_cdk.sources.declarative.partition_routers import (
+    ListPartitionRouter,
+    ParentRecordCache,
+    SinglePartitionRouter,
+    SubstreamPartitionRouter,
+)
 from airbyte_cdk.sources.declarative.partition_routers.substream_partition_router import ParentStreamConfig
 from airbyte_cdk.sources.declarative.requesters import HttpRequester, RequestOption
 from airbyte_cdk.sources.declarative.requesters.error_handlers import CompositeErrorHandler, DefaultErrorHandler, HttpResponseFilter
@@ -113,6 +131,16 @@ from airbyte_cdk.sources.declarative.transformations import AddFields, RecordTra
 from airbyte_cdk.sources.declarative.transformations.add_fields import AddedFieldDefinition
 from airbyte_cdk.sources.declarative.types import Config
 from airbyte_cdk.sources.message import InMemoryMessageRepository, LogAppenderMessageRepositoryDecorator, MessageRepository
+from airbyte_cdk.sources.streams.call_rate import (
+    AbstractAPIBudget,
+    FixedWindowCallRatePolicy,
+    HttpAPIBudget,
+    HttpRequestMatcher,
+    MovingWindowCallRatePolicy,
+    Rate,
+    TokenBucketCallRatePolicy,
+    UnlimitedCallRatePolicy,
+)
 from isodate import parse_duration
 from pydantic import BaseModel
 
@@ -130,6 +158,8 @@ class ModelToComponentFactory:
         emit_connector_builder_messages: bool = False,
         disable_retries: bool = False,
         message_repository: Optional[MessageRepository] = None,
+        parent_record_cache: Optional[ParentRecordCache] = None,
+        api_budget: Optional[AbstractAPIBudget] = None,
     ):
         self._init_mappings()
         self._limit_pages_fetched_per_slice = limit_pages_fetched_per_slice
@@ -139,6 +169,8 @@ class ModelToComponentFactory:
         self._message_repository = message_repository or InMemoryMessageRepository(  # type: ignore
             self._evaluate_log_level(emit_connector_builder_messages)
         )
+        self._parent_record_cache = parent_record_cache
+        self._api_budget = api_budget
 
     def _init_mappings(self) -> None:
         self.PYDANTIC_MODEL_TO_CONSTRUCTOR: Mapping[Type[BaseModel], Callable[..., Any]] = {
@@ -149,6 +181,7 @@ class ModelToComponentFactory:
             BearerAuthenticatorModel: self.create_bearer_authenticator,
             CheckStreamModel: self.create_check_stream,
             CompositeErrorHandlerModel: self.create_composite_error_handler,
+            ConcurrencyLevelModel: self.create_concurrency_level,
             ConstantBackoffStrategyModel: self.create_constant_backoff_strategy,
             CursorPaginationModel: self.create_cursor_pagination,
             CustomAuthenticatorModel: self.create_custom_component,
@@ -167,20 +200,26 @@ class ModelToComponentFactory:
             DefaultPaginatorModel: self.create_default_paginator,
             DpathExtractorModel: self.create_dpath_extractor,
             ExponentialBackoffStrategyModel: self.create_exponential_backoff_strategy,
+            FixedWindowCallRatePolicyModel: self.create_fixed_window_call_rate_policy,
             SessionTokenAuthenticatorModel: self.create_session_token_authenticator,
+            HTTPAPIBudgetModel: self.create_http_api_budget,
             HttpRequesterModel: self.create_http_requester,
+            HttpRequestMatcherModel: self.create_http_request_matcher,
             HttpResponseFilterModel: self.create_http_response_filter,
             InlineSchemaLoaderModel: self.create_inline_schema_loader,
             JsonDecoderModel: self.create_json_decoder,
+            JsonStreamingDecoderModel: self.create_json_streaming_decoder,
             JsonFileSchemaLoaderModel: self.create_json_file_schema_loader,
             ListPartitionRouterModel: self.create_list_partition_router,
             MinMaxDatetimeModel: self.create_min_max_datetime,
+            MovingWindowCallRatePolicyModel: self.create_moving_window_call_rate_policy,
             NoAuthModel: self.create_no_auth,
             NoPaginationModel: self.create_no_pagination,
             OAuthAuthenticatorModel: self.create_oauth_authenticator,
             OffsetIncrementModel: self.create_offset_increment,
             PageIncrementModel: self.create_page_increment,
             ParentStreamConfigModel: self.create_parent_stream_config,
+            RateModel: self.create_rate,
             RecordFilterModel: self.create_record_filter,
             RecordSelectorModel: self.create_record_selector,
             RemoveFieldsModel: self.create_remove_fields,
@@ -190,6 +229,8 @@ class ModelToComponentFactory:
             SimpleRetrieverModel: self.create_simple_retriever,
             SpecModel: self.create_spec,
             SubstreamPartitionRouterModel: self.create_substream_partition_router,
+            TokenBucketCallRatePolicyModel: self.create_token_bucket_call_rate_policy,
+            UnlimitedCallRatePolicyModel: self.create_unlimited_call_rate_policy,
             WaitTimeFromHeaderModel: self.create_wait_time_from_header,
             WaitUntilTimeFromHeaderModel: self.create_wait_until_time_from_header,
         }
@@ -350,6 +391,15 @@ class ModelToComponentFactory:
         ]
         return CompositeErrorHandler(error_handlers=error_handlers, parameters=model.parameters or {})
 
+    @staticmethod
+    def create_concurrency_level(model: ConcurrencyLevelModel, config: Config, **kwargs: Any) -> ConcurrencyLevel:
+        return ConcurrencyLevel(
+            default_concurrency=model.default_concurrency,
+            max_concurrency=model.max_concurrency,
+            config=config,
+            parameters=model.parameters or {},
+        )
+
     @staticmethod
     def create_constant_backoff_strategy(model: ConstantBackoffStrategyModel, config: Config, **kwargs: Any) -> ConstantBackoffStrategy:
         return ConstantBackoffStrategy(
@@ -545,7 +595,9 @@ class ModelToComponentFactory:
             parameters=model.parameters or {},
         )
 
-    def create_declarative_stream(self, model: DeclarativeStreamModel, config: Config, **kwargs: Any) -> DeclarativeStream:
+    def create_declarative_stream(
+        self, model: DeclarativeStreamModel, config: Config, concurrency_level: int = 1, **kwargs: Any
+    ) -> DeclarativeStream:
         # When constructing a declarative stream, we assemble the incremental_sync component and retriever's partition_router field
         # components if they exist into a single CartesianProductStreamSlicer. This is then passed back as an argument when constructing the
         # Retriever. This is done in the declarative stream not the retriever to support custom retrievers. The custom create methods in
@@ -579,6 +631,12 @@ class ModelToComponentFactory:
                 options["name"] = model.name
             schema_loader = DefaultSchemaLoader(config=config, parameters=options)
 
+        # Only the slices of a SimpleRetriever can be read concurrently as each thread needs its own copy of the pagination state
+        concurrent_slice_reader = (
+            ConcurrentSliceReader(concurrency_level, self._message_repository)
+            if concurrency_level > 1 and isinstance(retriever, SimpleRetriever)
+            else None
+        )
         return DeclarativeStream(
             name=model.name or "",
             primary_key=primary_key,
@@ -587,6 +645,7 @@ class ModelToComponentFactory:
             stream_cursor_field=cursor_field or "",
             config=config,
             parameters=model.parameters or {},
+            concurrent_slice_reader=concurrent_slice_reader,
         )
 
     def _merge_stream_slicers(self, model: DeclarativeStreamModel, config: Config) -> Optional[StreamSlicer]:
@@ -658,6 +717,8 @@ class ModelToComponentFactory:
         )
         pagination_strategy = self._create_component_from_model(model=model.pagination_strategy, config=config)
         if cursor_used_for_stop_condition:
+            if model.max_concurrent_pages and model.max_concurrent_pages > 1:
+                raise ValueError("Pages can't be requested concurrently when the incremental sync stops the pagination (is_data_feed)")
             pagination_strategy = StopConditionPaginationStrategyDecorator(
                 pagination_strategy, CursorStopCondition(cursor_used_for_stop_condition)
             )
@@ -669,9 +730,12 @@ class ModelToComponentFactory:
             pagination_strategy=pagination_strategy,
             url_base=url_base,
             config=config,
+            max_concurrent_pages=model.max_concurrent_pages or 1,
+            total_count=model.total_count,
             parameters=model.parameters or {},
         )
         if self._limit_pages_fetched_per_slice:
+            # PaginatorTestReadDecorator requests the pages one after the other so the number of pages requested can be limited
             return PaginatorTestReadDecorator(paginator, self._limit_pages_fetched_per_slice)
         return paginator
 
@@ -684,6 +748,23 @@ class ModelToComponentFactory:
     def create_exponential_backoff_strategy(model: ExponentialBackoffStrategyModel, config: Config) -> ExponentialBackoffStrategy:
         return ExponentialBackoffStrategy(factor=model.factor or 5, parameters=model.parameters or {}, config=config)
 
+    def create_fixed_window_call_rate_policy(
+        self, model: FixedWindowCallRatePolicyModel, config: Config, **kwargs: Any
+    ) -> FixedWindowCallRatePolicy:
+        return FixedWindowCallRatePolicy(
+            period=self._parse_timedelta(model.period),
+            call_limit=model.call_limit,
+            matchers=[self._create_component_from_model(model=matcher, config=config) for matcher in model.matchers or []],
+        )
+
+    def create_http_api_budget(self, model: HTTPAPIBudgetModel, config: Config, **kwargs: Any) -> HttpAPIBudget:
+        return HttpAPIBudget(
+            policies=[self._create_component_from_model(model=policy, config=config) for policy in model.policies],
+            ratelimit_reset_header=model.ratelimit_reset_header or "X-RateLimit-Reset",
+            ratelimit_remaining_header=model.ratelimit_remaining_header or "X-RateLimit-Remaining",
+            status_codes_for_ratelimit_hit=tuple(model.status_codes_for_ratelimit_hit or [429]),
+        )
+
     def create_http_requester(self, model: HttpRequesterModel, config: Config, *, name: str) -> HttpRequester:
         authenticator = (
             self._create_component_from_model(model=model.authenticator, config=config, url_base=model.url_base, name=name)
@@ -721,8 +802,13 @@ class ModelToComponentFactory:
             disable_retries=self._disable_retries,
             parameters=model.parameters or {},
             message_repository=self._message_repository,
+            api_budget=self._api_budget,
         )
 
+    @staticmethod
+    def create_http_request_matcher(model: HttpRequestMatcherModel, config: Config, **kwargs: Any) -> HttpRequestMatcher:
+        return HttpRequestMatcher(method=model.method, url_pattern=model.url_pattern, params=model.params, headers=model.headers)
+
     @staticmethod
     def create_http_response_filter(model: HttpResponseFilterModel, config: Config, **kwargs: Any) -> HttpResponseFilter:
         action = ResponseAction(model.action.value)
@@ -748,6 +834,12 @@ class ModelToComponentFactory:
     def create_json_decoder(model: JsonDecoderModel, config: Config, **kwargs: Any) -> JsonDecoder:
         return JsonDecoder(parameters={})
 
+    @staticmethod
+    def create_json_streaming_decoder(model: JsonStreamingDecoderModel, config: Config, **kwargs: Any) -> JsonStreamingDecoder:
+        if model.chunk_size is not None:
+            return JsonStreamingDecoder(parameters={}, chunk_size=model.chunk_size)
+        return JsonStreamingDecoder(parameters={})
+
     @staticmethod
     def create_json_file_schema_loader(model: JsonFileSchemaLoaderModel, config: Config, **kwargs: Any) -> JsonFileSchemaLoader:
         return JsonFileSchemaLoader(file_path=model.file_path or "", config=config, parameters=model.parameters or {})
@@ -781,6 +873,14 @@ class ModelToComponentFactory:
             parameters=model.parameters or {},
         )
 
+    def create_moving_window_call_rate_policy(
+        self, model: MovingWindowCallRatePolicyModel, config: Config, **kwargs: Any
+    ) -> MovingWindowCallRatePolicy:
+        return MovingWindowCallRatePolicy(
+            rates=[self._create_component_from_model(model=rate, config=config) for rate in model.rates],
+            matchers=[self._create_component_from_model(model=matcher, config=config) for matcher in model.matchers or []],
+        )
+
     @staticmethod
     def create_no_auth(model: NoAuthModel, config: Config, **kwargs: Any) -> NoAuth:
         return NoAuth(parameters=model.parameters or {})
@@ -852,6 +952,9 @@ class ModelToComponentFactory:
             parameters=model.parameters or {},
         )
 
+    def create_rate(self, model: RateModel, config: Config, **kwargs: Any) -> Rate:
+        return Rate(limit=model.limit, interval=self._parse_timedelta(model.interval))
+
     @staticmethod
     def create_record_filter(model: RecordFilterModel, config: Config, **kwargs: Any) -> RecordFilter:
         return RecordFilter(condition=model.condition or "", config=config, parameters=model.parameters or {})
@@ -913,6 +1016,9 @@ class ModelToComponentFactory:
     ) -> SimpleRetriever:
         requester = self._create_component_from_model(model=model.requester, config=config, name=name)
         record_selector = self._create_component_from_model(model=model.record_selector, config=config, transformations=transformations)
+        if isinstance(requester, HttpRequester) and isinstance(record_selector, RecordSelector) and record_selector.streams_records:
+            # The records are decoded while the responses are received instead of once they are loaded in memory
+            requester.stream_response = True
         url_base = model.requester.url_base if hasattr(model.requester, "url_base") else requester.get_url_base()
         stream_slicer = stream_slicer or SinglePartitionRouter(parameters={})
         cursor = stream_slicer if isinstance(stream_slicer, Cursor) else None
@@ -927,6 +1033,7 @@ class ModelToComponentFactory:
         )
 
         if self._limit_slices_fetched or self._emit_connector_builder_messages:
+            # Pages are not prefetched on test reads so the request and response logs of a page are emitted right before its records
             return SimpleRetrieverTestReadDecorator(
                 name=name,
                 paginator=paginator,
@@ -948,6 +1055,7 @@ class ModelToComponentFactory:
             stream_slicer=stream_slicer,
             cursor=cursor,
             config=config,
+            page_prefetch_depth=model.page_prefetch_depth or 0,
             parameters=model.parameters or {},
         )
 
@@ -972,7 +1080,11 @@ class ModelToComponentFactory:
                 ]
             )
 
-        return SubstreamPartitionRouter(parent_stream_configs=parent_stream_configs, parameters=model.parameters or {}, config=config)
+        partition_router = SubstreamPartitionRouter(
+            parent_stream_configs=parent_stream_configs, parameters=model.parameters or {}, config=config
+        )
+        partition_router.set_parent_record_cache(self._parent_record_cache)
+        return partition_router
 
     def _create_message_repository_substream_wrapper(self, model: ParentStreamConfigModel, config: Config) -> Any:
         substream_factory = ModelToComponentFactory(
@@ -985,9 +1097,27 @@ class ModelToComponentFactory:
                 self._message_repository,
                 self._evaluate_log_level(self._emit_connector_builder_messages),
             ),
+            parent_record_cache=self._parent_record_cache,
+            api_budget=self._api_budget,
         )
         return substream_factory._create_component_from_model(model=model, config=config)
 
+    def create_token_bucket_call_rate_policy(
+        self, model: TokenBucketCallRatePolicyModel, config: Config, **kwargs: Any
+    ) -> TokenBucketCallRatePolicy:
+        return TokenBucketCallRatePolicy(
+            rate=self._create_component_from_model(model=model.rate, config=config),
+            matchers=[self._create_component_from_model(model=matcher, config=config) for matcher in model.matchers or []],
+            burst=model.burst,
+        )
+
+    def create_unlimited_call_rate_policy(
+        self, model: UnlimitedCallRatePolicyModel, config: Config, **kwargs: Any
+    ) -> UnlimitedCallRatePolicy:
+        return UnlimitedCallRatePolicy(
+            matchers=[self._create_component_from_model(model=matcher, config=config) for matcher in model.matchers or []],
+        )
+
     @staticmethod
     def create_wait_time_from_header(model: WaitTimeFromHeaderModel, config: Config, **kwargs: Any) -> WaitTimeFromHeaderBackoffStrategy:
         return WaitTimeFromHeaderBackoffStrategy(header=model.header, parameters=model.parameters or {}, config=config, regex=model.regex)
@@ -1000,8 +1130,26 @@ class ModelToComponentFactory:
             header=model.header, parameters=model.parameters or {}, config=config, min_wait=model.min_wait, regex=model.regex
         )
 
+    def set_api_budget(self, component_definition: ComponentDefinition, config: Config) -> None:
+        """
+        Creates the API budget passed to the requesters created afterwards, so the requests of all the streams are counted by the same
+        policies. The budget is only created once
+        """
+        if self._api_budget is None:
+            self._api_budget = self.create_component(HTTPAPIBudgetModel, component_definition, config)
+
     def get_message_repository(self) -> MessageRepository:
         return self._message_repository
 
+    def get_parent_record_cache(self) -> Optional[ParentRecordCache]:
+        return self._parent_record_cache
+
+    @staticmethod
+    def _parse_timedelta(duration: str) -> datetime.timedelta:
+        parsed_duration = parse_duration(duration)
+        if not isinstance(parsed_duration, datetime.timedelta):
+            raise ValueError(f"Durations of call rate policies can't be expressed in months or years. Got {duration}")
+        return parsed_duration
+
     def _evaluate_log_level(self, emit_connector_builder_messages: bool) -> Level:
         return Level.DEBUG if emit_connector_builder_messages else Level.INFO
@@ -3,7 +3,8 @@
 #
 
 from airbyte_cdk.sources.declarative.partition_routers.list_partition_router import ListPartitionRouter
+from airbyte_cdk.sources.declarative.partition_routers.parent_record_cache import ParentRecordCache
 from airbyte_cdk.sources.declarative.partition_routers.single_partition_router import SinglePartitionRouter
 from airbyte_cdk.sources.declarative.partition_routers.substream_partition_router import SubstreamPartitionRouter
 
-__all__ = ["ListPartitionRouter", "SinglePartitionRouter", "SubstreamPartitionRouter"]
+__all__ = ["ListPartitionRouter", "ParentRecordCache", "SinglePartitionRouter", "SubstreamPartitionRouter"]
@@ -0,0 +1,81 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import json
+import pickle
+import tempfile
+import threading
+from typing import IO, Any, Dict, Hashable, List, Optional, Tuple, Union
+
+from airbyte_cdk.sources.declarative.types import StreamSlice
+
+_SpilledValues = Tuple[int, int]
+
+
+class ParentRecordCache:
+    """
+    Keeps the parent key values read by SubstreamPartitionRouter so child streams sharing a parent stream don't read it again.
+
+    Values are stored per parent stream, parent key and parent stream slice. Only the value of the parent key is kept for each record, not
+    the record itself. Up to `max_values_in_memory` values are kept in memory, the values of the following slices are written to a
+    temporary file and read back from it.
+
+    Parent streams are identified by name, so the cache must only be shared between streams whose parents with the same name return the
+    same records. Call `clear` at the end of the sync to release the memory and the temporary file.
+    """
+
+    DEFAULT_MAX_VALUES_IN_MEMORY = 100_000
+
+    def __init__(self, max_values_in_memory: int = DEFAULT_MAX_VALUES_IN_MEMORY):
+        self._max_values_in_memory = max_values_in_memory
+        self._values_in_memory = 0
+        self._entries: Dict[Hashable, Union[List[Any], _SpilledValues]] = {}
+        self._spill_file: Optional[IO[bytes]] = None
+        self._lock = threading.Lock()
+
+    def get(self, stream_name: str, parent_key: str, stream_slice: Optional[StreamSlice]) -> Optional[List[Any]]:
+        """
+        Returns the parent key values of the records of the parent stream slice, or None if the slice was not read yet
+        """
+        key = self._key(stream_name, parent_key, stream_slice)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or isinstance(entry, list):
+                return entry
+            offset, length = entry
+            assert self._spill_file is not None
+            self._spill_file.seek(offset)
+            values: List[Any] = pickle.loads(self._spill_file.read(length))
+            return values
+
+    def put(self, stream_name: str, parent_key: str, stream_slice: Optional[StreamSlice], values: List[Any]) -> None:
+        """
+        Stores the parent key values of all the records of a parent stream slice
+        """
+        key = self._key(stream_name, parent_key, stream_slice)
+        with self._lock:
+            if key in self._entries:
+                return
+            if self._values_in_memory + len(values) <= self._max_values_in_memory:
+                self._values_in_memory += len(values)
+                self._entries[key] = list(values)
+                return
+            if self._spill_file is None:
+                self._spill_file = tempfile.TemporaryFile()
+            data = pickle.dumps(values, protocol=pickle.HIGHEST_PROTOCOL)
+            offset = self._spill_file.seek(0, 2)
+            self._spill_file.write(data)
+            self._entries[key] = (offset, len(data))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._values_in_memory = 0
+            if self._spill_file is not None:
+                self._spill_file.close()
+                self._spill_file = None
+
+    @staticmethod
+    def _key(stream_name: str, parent_key: str, stream_slice: Optional[StreamSlice]) -> Hashable:
+        return stream_name, parent_key, json.dumps(stream_slice, sort_keys=True, default=str)
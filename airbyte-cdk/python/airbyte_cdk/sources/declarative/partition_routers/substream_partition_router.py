@@ -8,6 +8,7 @@ from typing import Any, Iterable, List, Mapping, Optional, Union
 import dpath.util
 from airbyte_cdk.models import AirbyteMessage, SyncMode, Type
 from airbyte_cdk.sources.declarative.interpolation.interpolated_string import InterpolatedString
+from airbyte_cdk.sources.declarative.partition_routers.parent_record_cache import ParentRecordCache
 from airbyte_cdk.sources.declarative.requesters.request_option import RequestOption, RequestOptionType
 from airbyte_cdk.sources.declarative.stream_slicers.stream_slicer import StreamSlicer
 from airbyte_cdk.sources.declarative.types import Config, Record, StreamSlice, StreamState
@@ -55,6 +56,13 @@ class SubstreamPartitionRouter(StreamSlicer):
         if not self.parent_stream_configs:
             raise ValueError("SubstreamPartitionRouter needs at least 1 parent stream")
         self._parameters = parameters
+        self._parent_record_cache: Optional[ParentRecordCache] = None
+
+    def set_parent_record_cache(self, parent_record_cache: Optional[ParentRecordCache]) -> None:
+        """
+        Shares the parent key values read by this router with the other routers using the same cache
+        """
+        self._parent_record_cache = parent_record_cache
 
     def get_request_params(
         self,
@@ -117,6 +125,9 @@ class SubstreamPartitionRouter(StreamSlicer):
         - parent_stream_slice: mapping representing the parent's stream slice
         - parent_record: mapping representing the parent record
         - parent_stream_name: string representing the parent stream name
+
+        If a parent record cache is set, the parent key values of the parent slices read until the end are cached and the parent slices
+        are not read again by this router or the other routers sharing the cache.
         """
         if not self.parent_stream_configs:
             yield from []
@@ -128,27 +139,40 @@ class SubstreamPartitionRouter(StreamSlicer):
                 for parent_stream_slice in parent_stream.stream_slices(
                     sync_mode=SyncMode.full_refresh, cursor_field=None, stream_state=None
                 ):
-                    empty_parent_slice = True
                     parent_slice = parent_stream_slice
-
-                    for parent_record in parent_stream.read_records(
-                        sync_mode=SyncMode.full_refresh, cursor_field=None, stream_slice=parent_stream_slice, stream_state=None
-                    ):
-                        # Skip non-records (eg AirbyteLogMessage)
-                        if isinstance(parent_record, AirbyteMessage):
-                            if parent_record.type == Type.RECORD:
-                                parent_record = parent_record.record.data
-                            else:
-                                continue
-                        elif isinstance(parent_record, Record):
-                            parent_record = parent_record.data
-                        try:
-                            stream_state_value = dpath.util.get(parent_record, parent_field)
-                        except KeyError:
-                            pass
-                        else:
-                            empty_parent_slice = False
-                            yield {stream_state_field: stream_state_value, "parent_slice": parent_slice}
-                    # If the parent slice contains no records,
-                    if empty_parent_slice:
-                        yield from []
+                    for stream_state_value in self._get_parent_key_values(parent_stream, parent_field, parent_stream_slice):
+                        yield {stream_state_field: stream_state_value, "parent_slice": parent_slice}
+
+    def _get_parent_key_values(self, parent_stream: Stream, parent_field: str, parent_stream_slice: Optional[StreamSlice]) -> Iterable[Any]:
+        if self._parent_record_cache is None:
+            yield from self._read_parent_key_values(parent_stream, parent_field, parent_stream_slice)
+            return
+
+        cached_values = self._parent_record_cache.get(parent_stream.name, parent_field, parent_stream_slice)
+        if cached_values is not None:
+            yield from cached_values
+            return
+        values = []
+        for value in self._read_parent_key_values(parent_stream, parent_field, parent_stream_slice):
+            values.append(value)
+            yield value
+        # Not reached if the slices stop being consumed before the end of the parent slice
+        self._parent_record_cache.put(parent_stream.name, parent_field, parent_stream_slice, values)
+
+    @staticmethod
+    def _read_parent_key_values(parent_stream: Stream, parent_field: str, parent_stream_slice: Optional[StreamSlice]) -> Iterable[Any]:
+        for parent_record in parent_stream.read_records(
+            sync_mode=SyncMode.full_refresh, cursor_field=None, stream_slice=parent_stream_slice, stream_state=None
+        ):
+            # Skip non-records (eg AirbyteLogMessage)
+            if isinstance(parent_record, AirbyteMessage):
+                if parent_record.type == Type.RECORD:
+                    parent_record = parent_record.record.data
+                else:
+                    continue
+            elif isinstance(parent_record, Record):
+                parent_record = parent_record.data
+            try:
+                yield dpath.util.get(parent_record, parent_field)
+            except KeyError:
+                pass
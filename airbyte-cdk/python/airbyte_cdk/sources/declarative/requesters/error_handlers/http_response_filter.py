@@ -91,7 +91,10 @@ class HttpResponseFilter:
         return self.error_message.eval(self.config, response=self._safe_response_json(response), headers=response.headers)
 
     def _response_matches_predicate(self, response: requests.Response) -> bool:
-        return self.predicate and self.predicate.eval(None, response=self._safe_response_json(response), headers=response.headers)
+        if not self.predicate or self.predicate.condition == "":
+            # An empty predicate never matches: the response is not decoded, which would read the whole body of a streamed response
+            return False
+        return self.predicate.eval(None, response=self._safe_response_json(response), headers=response.headers)
 
     def _response_contains_error_message(self, response: requests.Response) -> bool:
         if not self.error_message_contains:
@@ -7,7 +7,7 @@ import os
 import urllib
 from dataclasses import InitVar, dataclass
 from functools import lru_cache
-from typing import Any, Callable, Mapping, MutableMapping, Optional, Union
+from typing import Any, Callable, Mapping, MutableMapping, Optional, Tuple, Union
 from urllib.parse import urljoin
 
 import requests
@@ -25,9 +25,15 @@ from airbyte_cdk.sources.declarative.requesters.request_options.interpolated_req
 from airbyte_cdk.sources.declarative.requesters.requester import HttpMethod, Requester
 from airbyte_cdk.sources.declarative.types import Config, StreamSlice, StreamState
 from airbyte_cdk.sources.message import MessageRepository, NoopMessageRepository
+from airbyte_cdk.sources.streams.call_rate import AbstractAPIBudget
+from airbyte_cdk.sources.streams.http.async_transport import AiohttpTransport, AsyncHttpTransport
 from airbyte_cdk.sources.streams.http.exceptions import DefaultBackoffException, RequestBodyException, UserDefinedBackoffException
 from airbyte_cdk.sources.streams.http.http import BODY_REQUEST_METHODS
-from airbyte_cdk.sources.streams.http.rate_limiting import default_backoff_handler, user_defined_backoff_handler
+from airbyte_cdk.sources.streams.http.rate_limiting import (
+    async_user_defined_backoff_handler,
+    default_backoff_handler,
+    user_defined_backoff_handler,
+)
 from airbyte_cdk.utils.mapping_helpers import combine_mappings
 from requests.auth import AuthBase
 
@@ -46,6 +52,9 @@ class HttpRequester(Requester):
         authenticator (DeclarativeAuthenticator): Authenticator defining how to authenticate to the source
         error_handler (Optional[ErrorHandler]): Error handler defining how to detect and handle errors
         config (Config): The user-provided configuration as specified by the source's spec
+        async_http_transport (Optional[AsyncHttpTransport]): Transport sending the requests of send_request_async. An AiohttpTransport is created if not set
+        api_budget (Optional[AbstractAPIBudget]): Budget the requests wait for before being sent, shared by the requesters of all the streams of a source
+        stream_response (bool): Whether the content of the responses is read while it is received rather than loaded in memory once the response is received
     """
 
     name: str
@@ -59,6 +68,9 @@ class HttpRequester(Requester):
     error_handler: Optional[ErrorHandler] = None
     disable_retries: bool = False
     message_repository: MessageRepository = NoopMessageRepository()
+    async_http_transport: Optional[AsyncHttpTransport] = None
+    api_budget: Optional[AbstractAPIBudget] = None
+    stream_response: bool = False
 
     _DEFAULT_MAX_RETRY = 5
     _DEFAULT_RETRY_FACTOR = 5
@@ -395,7 +407,53 @@ class HttpRequester(Requester):
         request_body_json: Optional[Mapping[str, Any]] = None,
         log_formatter: Optional[Callable[[requests.Response], Any]] = None,
     ) -> Optional[requests.Response]:
-        request = self._create_prepared_request(
+        request = self._create_request(
+            stream_state, stream_slice, next_page_token, path, request_headers, request_params, request_body_data, request_body_json
+        )
+        response = self._send_with_retry(request, log_formatter=log_formatter)
+        return self._validate_response(response)
+
+    async def send_request_async(
+        self,
+        stream_state: Optional[StreamState] = None,
+        stream_slice: Optional[StreamSlice] = None,
+        next_page_token: Optional[Mapping[str, Any]] = None,
+        path: Optional[str] = None,
+        request_headers: Optional[Mapping[str, Any]] = None,
+        request_params: Optional[Mapping[str, Any]] = None,
+        request_body_data: Optional[Union[Mapping[str, Any], str]] = None,
+        request_body_json: Optional[Mapping[str, Any]] = None,
+        log_formatter: Optional[Callable[[requests.Response], Any]] = None,
+    ) -> Optional[requests.Response]:
+        """
+        Same as send_request, sending the request with the asynchronous transport of the requester. Retries wait without blocking the event
+        loop, so the requests sent from the same event loop are in flight at the same time.
+        """
+        request = self._create_request(
+            stream_state, stream_slice, next_page_token, path, request_headers, request_params, request_body_data, request_body_json
+        )
+        response = await self._send_with_retry_async(request, log_formatter=log_formatter)
+        return self._validate_response(response)
+
+    async def close_async_http_transport(self) -> None:
+        """
+        Releases the connections of the asynchronous transport of the requester, if it was used
+        """
+        if self.async_http_transport is not None:
+            await self.async_http_transport.close()
+
+    def _create_request(
+        self,
+        stream_state: Optional[StreamState],
+        stream_slice: Optional[StreamSlice],
+        next_page_token: Optional[Mapping[str, Any]],
+        path: Optional[str],
+        request_headers: Optional[Mapping[str, Any]],
+        request_params: Optional[Mapping[str, Any]],
+        request_body_data: Optional[Union[Mapping[str, Any], str]],
+        request_body_json: Optional[Mapping[str, Any]],
+    ) -> requests.PreparedRequest:
+        return self._create_prepared_request(
             path=path
             if path is not None
             else self.get_path(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
@@ -405,9 +463,6 @@ class HttpRequester(Requester):
             data=self._request_body_data(stream_state, stream_slice, next_page_token, request_body_data),
         )
 
-        response = self._send_with_retry(request, log_formatter=log_formatter)
-        return self._validate_response(response)
-
     def _send_with_retry(
         self,
         request: requests.PreparedRequest,
@@ -416,7 +471,27 @@ class HttpRequester(Requester):
         """
         Creates backoff wrappers which are responsible for retry logic
         """
+        max_tries, max_time = self._get_backoff_limits()
+        user_backoff_handler = user_defined_backoff_handler(max_tries=max_tries, max_time=max_time)(self._send)  # type: ignore # we don't pass in kwargs to the backoff handler
+        backoff_handler = default_backoff_handler(max_tries=max_tries, max_time=max_time, factor=self._DEFAULT_RETRY_FACTOR)
+        # backoff handlers wrap _send, so it will always return a response
+        return backoff_handler(user_backoff_handler)(request, log_formatter=log_formatter)  # type: ignore
+
+    async def _send_with_retry_async(
+        self,
+        request: requests.PreparedRequest,
+        log_formatter: Optional[Callable[[requests.Response], Any]] = None,
+    ) -> requests.Response:
+        """
+        Same as _send_with_retry, waiting between retries without blocking the event loop
+        """
+        max_tries, max_time = self._get_backoff_limits()
+        user_backoff_handler = async_user_defined_backoff_handler(max_tries=max_tries, max_time=max_time)(self._send_async)  # type: ignore # we don't pass in kwargs to the backoff handler
+        backoff_handler = default_backoff_handler(max_tries=max_tries, max_time=max_time, factor=self._DEFAULT_RETRY_FACTOR)
+        # backoff handlers wrap _send_async, so it will always return a response
+        return await backoff_handler(user_backoff_handler)(request, log_formatter=log_formatter)  # type: ignore
 
+    def _get_backoff_limits(self) -> Tuple[Optional[int], Optional[int]]:
         """
         Backoff package has max_tries parameter that means total number of
         tries before giving up, so if this number is 0 no calls expected to be done.
@@ -447,11 +522,7 @@ class HttpRequester(Requester):
         """
         if max_tries is not None:
             max_tries = max(0, max_tries) + 1
-
-        user_backoff_handler = user_defined_backoff_handler(max_tries=max_tries, max_time=max_time)(self._send)  # type: ignore # we don't pass in kwargs to the backoff handler
-        backoff_handler = default_backoff_handler(max_tries=max_tries, max_time=max_time, factor=self._DEFAULT_RETRY_FACTOR)
-        # backoff handlers wrap _send, so it will always return a response
-        return backoff_handler(user_backoff_handler)(request, log_formatter=log_formatter)  # type: ignore
+        return max_tries, max_time
 
     def _send(
         self,
@@ -475,12 +546,51 @@ class HttpRequester(Requester):
 
         Unexpected transient exceptions use the default backoff parameters.
         Unexpected persistent exceptions are not handled and will cause the sync to fail.
+
+        If the requester has an API budget, the request waits until it is allowed by the budget before being sent, and the budget is
+        updated from the response.
+        """
+        self.logger.debug(
+            "Making outbound API request", extra={"headers": request.headers, "url": request.url, "request_body": request.body}
+        )
+        if self.api_budget:
+            self.api_budget.acquire_call(request)
+        response: requests.Response = self._session.send(request, stream=self.stream_response)
+        if self.api_budget:
+            self.api_budget.update_from_response(request, response)
+        return self._check_response(request, response, log_formatter)
+
+    async def _send_async(
+        self,
+        request: requests.PreparedRequest,
+        log_formatter: Optional[Callable[[requests.Response], Any]] = None,
+    ) -> requests.Response:
+        """
+        Same as _send, sending the request with the asynchronous transport of the requester
         """
         self.logger.debug(
             "Making outbound API request", extra={"headers": request.headers, "url": request.url, "request_body": request.body}
         )
-        response: requests.Response = self._session.send(request)
-        self.logger.debug("Receiving response", extra={"headers": response.headers, "status": response.status_code, "body": response.text})
+        if self.async_http_transport is None:
+            self.async_http_transport = AiohttpTransport()
+        if self.api_budget:
+            await self.api_budget.acquire_call_async(request)
+        response = await self.async_http_transport.send(request)
+        if self.api_budget:
+            self.api_budget.update_from_response(request, response)
+        return self._check_response(request, response, log_formatter)
+
+    def _check_response(
+        self,
+        request: requests.PreparedRequest,
+        response: requests.Response,
+        log_formatter: Optional[Callable[[requests.Response], Any]] = None,
+    ) -> requests.Response:
+        if self.logger.isEnabledFor(logging.DEBUG):
+            # Logging the body reads the whole response, which would defeat streaming it
+            self.logger.debug(
+                "Receiving response", extra={"headers": response.headers, "status": response.status_code, "body": response.text}
+            )
         if log_formatter:
             formatter = log_formatter
             self.message_repository.log_message(
@@ -2,14 +2,18 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import itertools
+import math
 from dataclasses import InitVar, dataclass
-from typing import Any, List, Mapping, Optional, Union
+from typing import Any, Iterable, Iterator, List, Mapping, Optional, Union
 
 import requests
 from airbyte_cdk.sources.declarative.decoders.decoder import Decoder
 from airbyte_cdk.sources.declarative.decoders.json_decoder import JsonDecoder
 from airbyte_cdk.sources.declarative.interpolation.interpolated_string import InterpolatedString
 from airbyte_cdk.sources.declarative.requesters.paginators.paginator import Paginator
+from airbyte_cdk.sources.declarative.requesters.paginators.strategies.offset_increment import OffsetIncrement
+from airbyte_cdk.sources.declarative.requesters.paginators.strategies.page_increment import PageIncrement
 from airbyte_cdk.sources.declarative.requesters.paginators.strategies.pagination_strategy import PaginationStrategy
 from airbyte_cdk.sources.declarative.requesters.request_option import RequestOption, RequestOptionType
 from airbyte_cdk.sources.declarative.requesters.request_path import RequestPath
@@ -77,6 +81,27 @@ class DefaultPaginator(Paginator):
               option_type: "request_parameter"
               field_name: "page"
         ```
+
+        4.
+        * same as 3. but requests up to 4 pages at the same time once the first page is received, until all the records counted in the
+          "total" field of the first response are read
+        ```
+          paginator:
+            type: "DefaultPaginator"
+            max_concurrent_pages: 4
+            total_count: "{{ response.total }}"
+            page_size_option:
+              type: RequestOption
+              inject_into: request_parameter
+              field_name: page_size
+            pagination_strategy:
+              type: "PageIncrement"
+              page_size: 5
+            page_token_option:
+              type: RequestOption
+              option_type: "request_parameter"
+              field_name: "page"
+        ```
     Attributes:
         page_size_option (Optional[RequestOption]): the request option to set the page size. Cannot be injected in the path.
         page_token_option (Optional[RequestPath, RequestOption]): the request option to set the page token
@@ -84,6 +109,10 @@ class DefaultPaginator(Paginator):
         config (Config): connection config
         url_base (Union[InterpolatedString, str]): endpoint's base url
         decoder (Decoder): decoder to decode the response
+        max_concurrent_pages (int): the maximum number of pages requested at the same time. Only supported by the OffsetIncrement and
+          PageIncrement strategies, whose token can be computed without reading the previous pages
+        total_count (Optional[Union[InterpolatedString, str]]): the total number of records, evaluated from the first response, used to
+          request only the pages holding records. Without it, pages are requested until one has fewer records than the page size
     """
 
     pagination_strategy: PaginationStrategy
@@ -93,12 +122,26 @@ class DefaultPaginator(Paginator):
     decoder: Decoder = JsonDecoder(parameters={})
     page_size_option: Optional[RequestOption] = None
     page_token_option: Optional[Union[RequestPath, RequestOption]] = None
+    max_concurrent_pages: int = 1
+    total_count: Optional[Union[InterpolatedString, str]] = None
 
     def __post_init__(self, parameters: Mapping[str, Any]):
         if self.page_size_option and not self.pagination_strategy.get_page_size():
             raise ValueError("page_size_option cannot be set if the pagination strategy does not have a page_size")
+        if self.max_concurrent_pages < 1:
+            raise ValueError(f"The maximum number of concurrent pages must be at least 1. Got {self.max_concurrent_pages}")
+        if self.max_concurrent_pages > 1:
+            if not isinstance(self.pagination_strategy, (OffsetIncrement, PageIncrement)):
+                raise ValueError(
+                    f"Pages can only be requested concurrently with the OffsetIncrement and PageIncrement pagination strategies. "
+                    f"Got {type(self.pagination_strategy).__name__}"
+                )
+            if not self.pagination_strategy.get_page_size() and (self.total_count or isinstance(self.pagination_strategy, OffsetIncrement)):
+                raise ValueError("The pagination strategy must have a page_size to request pages concurrently")
         if isinstance(self.url_base, str):
             self.url_base = InterpolatedString(string=self.url_base, parameters=parameters)
+        if isinstance(self.total_count, str):
+            self.total_count = InterpolatedString.create(self.total_count, parameters=parameters)
         self._token = self.pagination_strategy.initial_token
 
     def next_page_token(self, response: requests.Response, last_records: List[Record]) -> Optional[Mapping[str, Any]]:
@@ -108,6 +151,28 @@ class DefaultPaginator(Paginator):
         else:
             return None
 
+    def get_max_concurrent_pages(self) -> int:
+        return self.max_concurrent_pages
+
+    def get_next_page_tokens(self, response: requests.Response) -> Iterator[Mapping[str, Any]]:
+        if not isinstance(self.pagination_strategy, (OffsetIncrement, PageIncrement)):
+            raise NotImplementedError(f"{type(self.pagination_strategy).__name__} can't compute the tokens of the next pages")
+        page_indexes: Iterable[int] = itertools.count(1)
+        total_count = self._get_total_count(response)
+        page_size = self.pagination_strategy.get_page_size()
+        if total_count is not None and page_size:
+            page_indexes = range(1, math.ceil(total_count / page_size))
+        for page_index in page_indexes:
+            self._token = self.pagination_strategy.get_page_token(page_index)
+            yield {"next_page_token": self._token}
+
+    def _get_total_count(self, response: requests.Response) -> Optional[int]:
+        if not isinstance(self.total_count, InterpolatedString):
+            return None
+        total_count = self.total_count.eval(self.config, response=self.decoder.decode(response), headers=response.headers)
+        # If the count is missing from the response, pages are requested until one isn't full
+        return int(total_count) if total_count not in (None, "") else None
+
     def path(self):
         if self._token and self.page_token_option and isinstance(self.page_token_option, RequestPath):
             # Replace url base to only return the path
@@ -4,7 +4,7 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, List, Mapping, Optional
+from typing import Any, Iterator, List, Mapping, Optional
 
 import requests
 from airbyte_cdk.sources.declarative.requesters.request_options.request_options_provider import RequestOptionsProvider
@@ -47,3 +47,23 @@ class Paginator(ABC, RequestOptionsProvider):
         :return: path to hit to fetch the next request. Returning None means the path is not defined by the next_page_token
         """
         pass
+
+    def get_max_concurrent_pages(self) -> int:
+        """
+        :return: The maximum number of pages of a slice requested at the same time. Pages are requested one after the other if 1
+        """
+        return 1
+
+    def get_next_page_tokens(self, response: requests.Response) -> Iterator[Mapping[str, Any]]:
+        """
+        Returns the tokens of the pages following the first one without reading them, so they can be requested concurrently. Only called
+        when get_max_concurrent_pages is greater than 1, after next_page_token returned a token for the first response.
+
+        The paginator is positioned on each page as its token is returned, so its path and request options are the ones of that page until
+        the next token is returned.
+
+        :param response: the response of the first page
+        :return: the tokens of the following pages, in order. Can be infinite if the number of pages isn't known: pages are then requested
+        until next_page_token returns None
+        """
+        raise NotImplementedError(f"{type(self).__name__} can't compute the tokens of the next pages without reading them")
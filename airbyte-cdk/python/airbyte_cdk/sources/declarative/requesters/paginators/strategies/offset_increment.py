@@ -77,3 +77,17 @@ class OffsetIncrement(PaginationStrategy):
             return page_size
         else:
             return self._page_size
+
+    def get_page_token(self, page_index: int) -> Optional[Any]:
+        """
+        Computes the token of a page without reading the pages before it, which is possible when every page but the last one has page_size
+        records
+
+        :param page_index: index of the page, the first page being 0
+        """
+        page_size = self.get_page_size()
+        if not page_size:
+            raise ValueError("The token of a page can't be computed without a page_size")
+        if page_index == 0:
+            return 0 if self.inject_on_first_request else None
+        return page_index * page_size
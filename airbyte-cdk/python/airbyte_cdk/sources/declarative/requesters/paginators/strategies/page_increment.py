@@ -46,3 +46,13 @@ class PageIncrement(PaginationStrategy):
 
     def get_page_size(self) -> Optional[int]:
         return self.page_size
+
+    def get_page_token(self, page_index: int) -> Optional[Any]:
+        """
+        Computes the token of a page without reading the pages before it
+
+        :param page_index: index of the page, the first page being 0
+        """
+        if page_index == 0:
+            return self.start_from_page if self.inject_on_first_request else None
+        return self.start_from_page + page_index
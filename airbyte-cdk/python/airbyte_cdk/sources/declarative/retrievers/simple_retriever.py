@@ -2,13 +2,17 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import copy
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import InitVar, dataclass, field
 from itertools import islice
-from typing import Any, Callable, Iterable, List, Mapping, Optional, Set, Tuple, Union
+from typing import Any, Callable, Deque, Iterable, Iterator, List, Mapping, Optional, Set, Tuple, Union
 
 import requests
 from airbyte_cdk.models import AirbyteMessage
 from airbyte_cdk.sources.declarative.extractors.http_selector import HttpSelector
+from airbyte_cdk.sources.declarative.extractors.record_selector import RecordSelector
 from airbyte_cdk.sources.declarative.incremental.cursor import Cursor
 from airbyte_cdk.sources.declarative.interpolation import InterpolatedString
 from airbyte_cdk.sources.declarative.partition_routers.single_partition_router import SinglePartitionRouter
@@ -20,6 +24,7 @@ from airbyte_cdk.sources.declarative.stream_slicers.stream_slicer import StreamS
 from airbyte_cdk.sources.declarative.types import Config, Record, StreamSlice, StreamState
 from airbyte_cdk.sources.http_logger import format_http_message
 from airbyte_cdk.sources.streams.core import StreamData
+from airbyte_cdk.sources.streams.http.page_prefetcher import PagePrefetcher
 from airbyte_cdk.utils.mapping_helpers import combine_mappings
 
 
@@ -44,6 +49,7 @@ class SimpleRetriever(Retriever):
         paginator (Optional[Paginator]): The paginator
         stream_slicer (Optional[StreamSlicer]): The stream slicer
         cursor (Optional[cursor]): The cursor
+        page_prefetch_depth (int): The number of pages requested in a background thread ahead of the page whose records are being read
         parameters (Mapping[str, Any]): Additional runtime parameters to be used for string interpolation
     """
 
@@ -58,11 +64,14 @@ class SimpleRetriever(Retriever):
     paginator: Optional[Paginator] = None
     stream_slicer: StreamSlicer = SinglePartitionRouter(parameters={})
     cursor: Optional[Cursor] = None
+    page_prefetch_depth: int = 0
 
     def __post_init__(self, parameters: Mapping[str, Any]) -> None:
         self._paginator = self.paginator or NoPagination(parameters=parameters)
         self._last_response: Optional[requests.Response] = None
         self._records_from_last_response: List[Record] = []
+        self._closes_slices = True
+        self._most_recent_record_from_last_slice: Optional[Record] = None
         self._parameters = parameters
         self._name = InterpolatedString(self._name, parameters=parameters) if isinstance(self._name, str) else self._name
 
@@ -224,12 +233,36 @@ class SimpleRetriever(Retriever):
             return []
 
         self._last_response = response
+        if isinstance(self.record_selector, RecordSelector) and self.record_selector.streams_records:
+            return self._select_records_while_reading(self.record_selector, response, stream_state, stream_slice, next_page_token)
         records = self.record_selector.select_records(
             response=response, stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token
         )
         self._records_from_last_response = records
         return records
 
+    def _select_records_while_reading(
+        self,
+        record_selector: RecordSelector,
+        response: requests.Response,
+        stream_state: StreamState,
+        stream_slice: Optional[StreamSlice],
+        next_page_token: Optional[Mapping[str, Any]],
+    ) -> Iterable[Record]:
+        """
+        Returns the records of the response as they are extracted. They are kept for the paginator to compute the next page token, unless
+        the stream isn't paginated: the records of a single large page are then never all held in memory
+        """
+        records: List[Record] = []
+        self._records_from_last_response = records
+        keep_records = not isinstance(self._paginator, NoPagination)
+        for record in record_selector.iter_records(
+            response=response, stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token
+        ):
+            if keep_records:
+                records.append(record)
+            yield record
+
     @property  # type: ignore
     def primary_key(self) -> Optional[Union[str, List[str], List[List[str]]]]:
         """The stream's primary key"""
@@ -253,7 +286,12 @@ class SimpleRetriever(Retriever):
     def _fetch_next_page(
         self, stream_state: Mapping[str, Any], stream_slice: Mapping[str, Any], next_page_token: Optional[Mapping[str, Any]] = None
     ) -> Optional[requests.Response]:
-        return self.requester.send_request(
+        return self.requester.send_request(**self._get_page_request_arguments(stream_state, stream_slice, next_page_token))
+
+    def _get_page_request_arguments(
+        self, stream_state: Mapping[str, Any], stream_slice: Mapping[str, Any], next_page_token: Optional[Mapping[str, Any]]
+    ) -> Mapping[str, Any]:
+        return dict(
             path=self._paginator_path(),
             stream_state=stream_state,
             stream_slice=stream_slice,
@@ -276,11 +314,33 @@ class SimpleRetriever(Retriever):
         stream_slice: Mapping[str, Any],
     ) -> Iterable[StreamData]:
         stream_state = stream_state or {}
+        if self._paginator.get_max_concurrent_pages() > 1:
+            pages = self._read_pages_concurrently(records_generator_fn, stream_state, stream_slice)
+        else:
+            pages = self._read_pages_one_by_one(records_generator_fn, stream_state, stream_slice)
+        if self.page_prefetch_depth > 0:
+            yield from PagePrefetcher[StreamData](self.page_prefetch_depth).read(pages)
+        else:
+            for page in pages:
+                yield from page
+
+        # Always return an empty generator just in case no records were ever yielded
+        yield from []
+
+    def _read_pages_one_by_one(
+        self,
+        records_generator_fn: Callable[[Optional[requests.Response], Mapping[str, Any], Mapping[str, Any]], Iterable[StreamData]],
+        stream_state: Mapping[str, Any],
+        stream_slice: Mapping[str, Any],
+    ) -> Iterator[Iterable[StreamData]]:
+        """
+        Yields the records of each page. The next page is requested once the records of the page are consumed
+        """
         pagination_complete = False
         next_page_token = None
         while not pagination_complete:
             response = self._fetch_next_page(stream_state, stream_slice, next_page_token)
-            yield from records_generator_fn(response, stream_state, stream_slice)
+            yield records_generator_fn(response, stream_state, stream_slice)
 
             if not response:
                 pagination_complete = True
@@ -289,8 +349,54 @@ class SimpleRetriever(Retriever):
                 if not next_page_token:
                     pagination_complete = True
 
-        # Always return an empty generator just in case no records were ever yielded
-        yield from []
+    def _read_pages_concurrently(
+        self,
+        records_generator_fn: Callable[[Optional[requests.Response], Mapping[str, Any], Mapping[str, Any]], Iterable[StreamData]],
+        stream_state: Mapping[str, Any],
+        stream_slice: Mapping[str, Any],
+    ) -> Iterator[Iterable[StreamData]]:
+        """
+        Yields the records of each page like _read_pages_one_by_one but once the first page is received, the next pages are requested
+        concurrently from the tokens computed by the paginator, up to its maximum number of concurrent pages. Pages are yielded in order
+        and the pagination stops at the first page for which the paginator doesn't return a next page token, as when reading the pages
+        one after the other.
+        """
+        response = self._fetch_next_page(stream_state, stream_slice)
+        yield records_generator_fn(response, stream_state, stream_slice)
+        if not response or not self._next_page_token(response):
+            return
+
+        page_tokens = self._paginator.get_next_page_tokens(response)
+        pending_pages: Deque["Future[Optional[requests.Response]]"] = deque()
+        executor = ThreadPoolExecutor(max_workers=self._paginator.get_max_concurrent_pages(), thread_name_prefix="page")
+        try:
+            self._request_next_pages(executor, pending_pages, page_tokens, stream_state, stream_slice)
+            while pending_pages:
+                response = pending_pages.popleft().result()
+                yield records_generator_fn(response, stream_state, stream_slice)
+                if not response or not self._next_page_token(response):
+                    return
+                self._request_next_pages(executor, pending_pages, page_tokens, stream_state, stream_slice)
+        finally:
+            for pending_page in pending_pages:
+                pending_page.cancel()
+            executor.shutdown(wait=True)
+
+    def _request_next_pages(
+        self,
+        executor: ThreadPoolExecutor,
+        pending_pages: Deque["Future[Optional[requests.Response]]"],
+        page_tokens: Iterator[Mapping[str, Any]],
+        stream_state: Mapping[str, Any],
+        stream_slice: Mapping[str, Any],
+    ) -> None:
+        while len(pending_pages) < self._paginator.get_max_concurrent_pages():
+            next_page_token = next(page_tokens, None)
+            if next_page_token is None:
+                return
+            # The request arguments are read right after the token is returned, while the paginator is positioned on that page
+            request_arguments = self._get_page_request_arguments(stream_state, stream_slice, next_page_token)
+            pending_pages.append(executor.submit(self.requester.send_request, **request_arguments))
 
     def read_records(
         self,
@@ -305,10 +411,29 @@ class SimpleRetriever(Retriever):
             most_recent_record_from_slice = self._get_most_recent_record(most_recent_record_from_slice, stream_data, stream_slice)
             yield stream_data
 
-        if self.cursor:
+        self._most_recent_record_from_last_slice = most_recent_record_from_slice
+        if self.cursor and self._closes_slices:
             self.cursor.close_slice(stream_slice, most_recent_record_from_slice)
         return
 
+    def copy_for_concurrent_read(self) -> "SimpleRetriever":
+        """
+        Returns a copy of the retriever with its own pagination state so it can read a slice while other slices are being read. The copy
+        shares the requester, the record selector and the cursor of the retriever but doesn't close the slices it reads: the caller gets
+        the most recent record of the slice from `most_recent_record_from_last_slice` and is responsible for closing the slice.
+        """
+        retriever = copy.copy(self)
+        retriever._paginator = copy.deepcopy(self._paginator)
+        retriever._last_response = None
+        retriever._records_from_last_response = []
+        retriever._closes_slices = False
+        retriever._most_recent_record_from_last_slice = None
+        return retriever
+
+    @property
+    def most_recent_record_from_last_slice(self) -> Optional[Record]:
+        return self._most_recent_record_from_last_slice
+
     def _get_most_recent_record(
         self, current_most_recent: Optional[Record], stream_data: StreamData, stream_slice: StreamSlice
     ) -> Optional[Record]:
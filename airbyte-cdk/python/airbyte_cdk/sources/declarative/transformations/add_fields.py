@@ -2,6 +2,7 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import copy
 from dataclasses import InitVar, dataclass, field
 from typing import Any, List, Mapping, Optional, Type, Union
 
@@ -9,6 +10,7 @@ import dpath.util
 from airbyte_cdk.sources.declarative.interpolation.interpolated_string import InterpolatedString
 from airbyte_cdk.sources.declarative.transformations import RecordTransformation
 from airbyte_cdk.sources.declarative.types import Config, FieldPointer, Record, StreamSlice, StreamState
+from dpath.exceptions import PathNotFound
 
 
 @dataclass(frozen=True)
@@ -31,6 +33,42 @@ class ParsedAddFieldDefinition:
     parameters: InitVar[Mapping[str, Any]]
 
 
+class _PathSetter:
+    """
+    Sets a value in a record the same way as `dpath.util.new`. Paths made of strings, which is always the case when they come from a manifest,
+    are walked directly instead of going through the generic dpath implementation for every record.
+    """
+
+    # Values dpath can't walk through
+    _LEAVES = (bytes, str, int, float, bool, type(None))
+
+    def __init__(self, path: FieldPointer):
+        self._path = path
+        self._is_string_path = all(isinstance(segment, str) for segment in path)
+        self._parents = list(enumerate(path[:-1]))
+        self._leaf = path[-1]
+
+    def __call__(self, record: Record, value: Any) -> None:
+        if not self._is_string_path:
+            dpath.util.new(record, self._path, value)
+            return
+
+        current = record
+        for index, segment in self._parents:
+            try:
+                current = current[segment]
+            except Exception:
+                # Like dpath, anything preventing to get the segment means it has to be created
+                current[segment] = {}
+                current = current[segment]
+            if isinstance(current, self._LEAVES):
+                raise PathNotFound(f"Path: {self._path}[{index}]")
+        current[self._leaf] = value
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, _PathSetter) and self._path == other._path
+
+
 @dataclass
 class AddFields(RecordTransformation):
     """
@@ -108,6 +146,8 @@ class AddFields(RecordTransformation):
                 self._parsed_fields.append(
                     ParsedAddFieldDefinition(add_field.path, add_field.value, value_type=add_field.value_type, parameters={})
                 )
+        self._setters = [_PathSetter(parsed_field.path) for parsed_field in self._parsed_fields]
+        self._depends_on_record = [parsed_field.value.references("record") for parsed_field in self._parsed_fields]
 
     def transform(
         self,
@@ -118,13 +158,54 @@ class AddFields(RecordTransformation):
     ) -> Record:
         if config is None:
             config = {}
-        kwargs = {"record": record, "stream_state": stream_state, "stream_slice": stream_slice}
-        for parsed_field in self._parsed_fields:
-            valid_types = (parsed_field.value_type,) if parsed_field.value_type else None
-            value = parsed_field.value.eval(config, valid_types=valid_types, **kwargs)
-            dpath.util.new(record, parsed_field.path, value)
+        for parsed_field, set_value in zip(self._parsed_fields, self._setters):
+            set_value(record, self._evaluate(parsed_field, config, record, stream_state, stream_slice))
 
         return record
 
+    def transform_page(
+        self,
+        records: List[Record],
+        config: Optional[Config] = None,
+        stream_state: Optional[StreamState] = None,
+        stream_slice: Optional[StreamSlice] = None,
+    ) -> None:
+        """
+        The values which don't reference the record are evaluated once for the whole page while the others are evaluated for each record
+        """
+        if type(self).transform is not AddFields.transform:
+            # Subclasses overriding transform expect it to be called for each record
+            super().transform_page(records, config=config, stream_state=stream_state, stream_slice=stream_slice)
+            return
+        if not records:
+            return
+        if config is None:
+            config = {}
+        page_values = {
+            index: self._evaluate(parsed_field, config, records[0], stream_state, stream_slice)
+            for index, parsed_field in enumerate(self._parsed_fields)
+            if not self._depends_on_record[index]
+        }
+        for record in records:
+            for index, (parsed_field, set_value) in enumerate(zip(self._parsed_fields, self._setters)):
+                if index in page_values:
+                    value = page_values[index]
+                    # Each record gets its own copy of mutable values as if they had been evaluated for every record
+                    value = value if isinstance(value, (str, int, float, bool, type(None))) else copy.deepcopy(value)
+                else:
+                    value = self._evaluate(parsed_field, config, record, stream_state, stream_slice)
+                set_value(record, value)
+
+    @staticmethod
+    def _evaluate(
+        parsed_field: ParsedAddFieldDefinition,
+        config: Config,
+        record: Record,
+        stream_state: Optional[StreamState],
+        stream_slice: Optional[StreamSlice],
+    ) -> Any:
+        valid_types = (parsed_field.value_type,) if parsed_field.value_type else None
+        return parsed_field.value.eval(config, valid_types=valid_types, record=record, stream_state=stream_state, stream_slice=stream_slice)
+
     def __eq__(self, other: Any) -> bool:
         return bool(self.__dict__ == other.__dict__)
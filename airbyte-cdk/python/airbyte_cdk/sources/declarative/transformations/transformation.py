@@ -4,7 +4,7 @@
 
 from abc import abstractmethod
 from dataclasses import dataclass
-from typing import Any, Mapping, Optional
+from typing import Any, List, Mapping, Optional
 
 from airbyte_cdk.sources.declarative.types import Config, Record, StreamSlice, StreamState
 
@@ -33,5 +33,24 @@ class RecordTransformation:
         :return: The transformed record
         """
 
+    def transform_page(
+        self,
+        records: List[Record],
+        config: Optional[Config] = None,
+        stream_state: Optional[StreamState] = None,
+        stream_slice: Optional[StreamSlice] = None,
+    ) -> None:
+        """
+        Transform all the records of a page in place. The default implementation calls `transform` on each record. Override it to share work
+        between the records of a page.
+
+        :param records: The records of the page
+        :param config: The user-provided configuration as specified by the source's spec
+        :param stream_state: The stream state
+        :param stream_slice: The stream slice
+        """
+        for record in records:
+            self.transform(record, config=config, stream_state=stream_state, stream_slice=stream_slice)
+
     def __eq__(self, other: object) -> bool:
         return other.__dict__ == self.__dict__
@@ -38,6 +38,7 @@ class FileBasedSource(AbstractSource, ABC):
         parsers: Mapping[Type[Any], FileTypeParser] = default_parsers,
         validation_policies: Mapping[ValidationPolicy, AbstractSchemaValidationPolicy] = DEFAULT_SCHEMA_VALIDATION_POLICIES,
         cursor_cls: Type[AbstractFileBasedCursor] = DefaultFileBasedCursor,
+        n_concurrent_file_reads: int = 1,
     ):
         self.stream_reader = stream_reader
         self.spec_class = spec_class
@@ -48,6 +49,7 @@ class FileBasedSource(AbstractSource, ABC):
         catalog = self.read_catalog(catalog_path) if catalog_path else None
         self.stream_schemas = {s.stream.name: s.stream.json_schema for s in catalog.streams} if catalog else {}
         self.cursor_cls = cursor_cls
+        self.n_concurrent_file_reads = n_concurrent_file_reads
         self.logger = logging.getLogger(f"airbyte.{self.name}")
 
     def check_connection(self, logger: logging.Logger, config: Mapping[str, Any]) -> Tuple[bool, Optional[Any]]:
@@ -106,6 +108,7 @@ class FileBasedSource(AbstractSource, ABC):
                         parsers=self.parsers,
                         validation_policy=self._validate_and_get_validation_policy(stream_config),
                         cursor=self.cursor_cls(stream_config),
+                        n_concurrent_file_reads=self.n_concurrent_file_reads,
                     )
                 )
             return streams
@@ -2,14 +2,18 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import codecs
 import csv
+import io
+import itertools
 import json
 import logging
+import threading
 from abc import ABC, abstractmethod
 from collections import defaultdict
-from functools import partial
+from functools import partial, reduce
 from io import IOBase
-from typing import Any, Callable, Dict, Generator, Iterable, List, Mapping, Optional, Set
+from typing import Any, Callable, DefaultDict, Dict, Generator, Iterable, List, Mapping, Optional, Set
 
 from airbyte_cdk.models import FailureType
 from airbyte_cdk.sources.file_based.config.csv_format import CsvFormat, CsvHeaderAutogenerated, CsvHeaderUserProvided, InferenceType
@@ -21,7 +25,17 @@ from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from airbyte_cdk.sources.file_based.schema_helpers import TYPE_PYTHON_MAPPING, SchemaType
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = pc = pa_csv = None
+
 DIALECT_NAME = "_config_dialect"
+# Number of files being read with each registered dialect
+_dialect_references: Dict[str, int] = defaultdict(int)
+_dialect_lock = threading.Lock()
 
 
 class _CsvReader:
@@ -38,16 +52,9 @@ class _CsvReader:
 
         # Formats are configured individually per-stream so a unique dialect should be registered for each stream.
         # We don't unregister the dialect because we are lazily parsing each csv file to generate records
-        # This will potentially be a problem if we ever process multiple streams concurrently
+        # Files of the same stream can be read concurrently so the dialect is only unregistered once all of them are read
         dialect_name = config.name + DIALECT_NAME
-        csv.register_dialect(
-            dialect_name,
-            delimiter=config_format.delimiter,
-            quotechar=config_format.quote_char,
-            escapechar=config_format.escape_char,
-            doublequote=config_format.double_quote,
-            quoting=csv.QUOTE_MINIMAL,
-        )
+        self._register_dialect(dialect_name, config_format)
         with stream_reader.open_file(file, file_read_mode, config_format.encoding, logger) as fp:
             headers = self._get_headers(fp, config_format, dialect_name)
 
@@ -77,6 +84,27 @@ class _CsvReader:
                     yield row
             finally:
                 # due to RecordParseError or GeneratorExit
+                self._unregister_dialect(dialect_name)
+
+    @staticmethod
+    def _register_dialect(dialect_name: str, config_format: CsvFormat) -> None:
+        with _dialect_lock:
+            csv.register_dialect(
+                dialect_name,
+                delimiter=config_format.delimiter,
+                quotechar=config_format.quote_char,
+                escapechar=config_format.escape_char,
+                doublequote=config_format.double_quote,
+                quoting=csv.QUOTE_MINIMAL,
+            )
+            _dialect_references[dialect_name] += 1
+
+    @staticmethod
+    def _unregister_dialect(dialect_name: str) -> None:
+        with _dialect_lock:
+            _dialect_references[dialect_name] -= 1
+            if _dialect_references[dialect_name] <= 0:
+                del _dialect_references[dialect_name]
                 csv.unregister_dialect(dialect_name)
 
     def _get_headers(self, fp: IOBase, config_format: CsvFormat, dialect_name: str) -> List[str]:
@@ -117,11 +145,179 @@ class _CsvReader:
             fp.readline()
 
 
+class _ArrowCsvReader:
+    """
+    Reads CSV files in blocks of columns with pyarrow's streaming CSV reader. The values are read as strings, exactly like `_CsvReader`
+    reads them, so the CsvFormat options are applied the same way afterwards.
+
+    The headers are read and the rows are skipped the same way as `_CsvReader`. Files pyarrow can't read the same way, for instance
+    because a row has the wrong number of values, are read by `_CsvReader` from the first row which was not returned yet, so the records
+    and the errors are the same as with `_CsvReader`.
+    """
+
+    DEFAULT_BLOCK_SIZE = 1 << 20
+    _ROWS_PER_FALLBACK_BLOCK = 1000
+
+    def __init__(self, csv_reader: _CsvReader, block_size: int = DEFAULT_BLOCK_SIZE):
+        self._csv_reader = csv_reader
+        self._block_size = block_size
+
+    @staticmethod
+    def is_available() -> bool:
+        return pa_csv is not None
+
+    def read_blocks(
+        self,
+        config: FileBasedStreamConfig,
+        file: RemoteFile,
+        stream_reader: AbstractFileBasedStreamReader,
+        logger: logging.Logger,
+    ) -> Generator["pa.RecordBatch", None, None]:
+        rows_read = 0
+        try:
+            for block in self._read_arrow_blocks(config, file, stream_reader, logger):
+                rows_read += block.num_rows
+                yield block
+            return
+        except Exception as exc:
+            logger.debug(f"Could not read {file.uri} with pyarrow, reading it from row {rows_read} with the csv module instead: {exc}")
+        yield from self._read_python_blocks(config, file, stream_reader, logger, rows_read)
+
+    def _read_arrow_blocks(
+        self,
+        config: FileBasedStreamConfig,
+        file: RemoteFile,
+        stream_reader: AbstractFileBasedStreamReader,
+        logger: logging.Logger,
+    ) -> Generator["pa.RecordBatch", None, None]:
+        config_format = _extract_format(config)
+        encoding = config_format.encoding or "utf8"
+        with stream_reader.open_file(file, FileReadMode.READ_BINARY, None, logger) as fp:
+            if codecs.lookup(encoding).name == "utf-8" and fp.read(len(codecs.BOM_UTF8)) == codecs.BOM_UTF8:
+                # pyarrow drops the byte order mark while the csv module reads it as part of the first value
+                raise ValueError("The file starts with a byte order mark")
+            fp.seek(0)
+            headers = self._read_headers(fp, config, config_format, encoding)
+            fp.seek(0)
+            rows_to_skip = (
+                config_format.skip_rows_before_header
+                + (1 if config_format.header_definition.has_header_row() else 0)
+                + config_format.skip_rows_after_header
+            )
+            self._skip_lines(fp, rows_to_skip, encoding)
+            reader = pa_csv.open_csv(
+                fp,
+                read_options=pa_csv.ReadOptions(column_names=headers, block_size=self._block_size, encoding=encoding),
+                parse_options=pa_csv.ParseOptions(
+                    delimiter=config_format.delimiter,
+                    quote_char=config_format.quote_char,
+                    double_quote=config_format.double_quote,
+                    escape_char=config_format.escape_char or False,
+                    newlines_in_values=True,
+                ),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={header: pa.string() for header in headers},
+                    null_values=[],
+                    true_values=[],
+                    false_values=[],
+                    strings_can_be_null=False,
+                    quoted_strings_can_be_null=False,
+                ),
+            )
+            for batch in reader:
+                yield self._to_block(batch.schema.names, [self._normalize_values(column) for column in batch.columns])
+
+    def _read_headers(self, fp: IOBase, config: FileBasedStreamConfig, config_format: CsvFormat, encoding: str) -> List[str]:
+        dialect_name = config.name + DIALECT_NAME
+        self._csv_reader._register_dialect(dialect_name, config_format)
+        text_fp = io.TextIOWrapper(fp, encoding=encoding)  # type: ignore  # fp is a binary file
+        try:
+            return self._csv_reader._get_headers(text_fp, config_format, dialect_name)
+        finally:
+            # The binary file must not be closed with its wrapper
+            text_fp.detach()
+            self._csv_reader._unregister_dialect(dialect_name)
+
+    @staticmethod
+    def _skip_lines(fp: IOBase, lines_to_skip: int, encoding: str) -> None:
+        """
+        Skip lines the way `_CsvReader._skip_rows` does. pyarrow's `skip_rows` counts rows rather than lines
+        """
+        if lines_to_skip and ("\n".encode(encoding) != b"\n" or "\r".encode(encoding) != b"\r"):
+            raise ValueError(f"Can't skip lines of a file encoded with {encoding}")
+        for _ in range(lines_to_skip):
+            line = fp.readline()
+            line = line[:-1] if line.endswith(b"\n") else line
+            if b"\r" in (line[:-1] if line.endswith(b"\r") else line):
+                # A carriage return alone ends a line in text mode
+                raise ValueError("The lines to skip are not all terminated by a line feed")
+
+    @staticmethod
+    def _normalize_values(column: "pa.Array") -> "pa.Array":
+        if pc.any(pc.match_substring(column, "\x00")).as_py():
+            # The csv module refuses NUL characters
+            raise ValueError("The file contains a NUL character")
+        if pc.any(pc.match_substring(column, "\r")).as_py():
+            # Files are read in text mode by _CsvReader which translates the line endings in quoted values
+            return pc.replace_substring_regex(column, "\r\n?", "\n")
+        return column
+
+    def _read_python_blocks(
+        self,
+        config: FileBasedStreamConfig,
+        file: RemoteFile,
+        stream_reader: AbstractFileBasedStreamReader,
+        logger: logging.Logger,
+        rows_to_skip: int,
+    ) -> Generator["pa.RecordBatch", None, None]:
+        data_generator = self._csv_reader.read_data(config, file, stream_reader, logger, FileReadMode.READ)
+        rows: List[Dict[str, Any]] = []
+        try:
+            for row in itertools.islice(data_generator, rows_to_skip, None):
+                rows.append(row)
+                if len(rows) >= self._ROWS_PER_FALLBACK_BLOCK:
+                    yield self._rows_to_block(rows)
+                    rows = []
+        except Exception:
+            # The rows read before the error are returned first so the error is raised at the same position as with _CsvReader
+            if rows:
+                yield self._rows_to_block(rows)
+            raise
+        finally:
+            data_generator.close()
+        if rows:
+            yield self._rows_to_block(rows)
+
+    @staticmethod
+    def _rows_to_block(rows: List[Dict[str, Any]]) -> "pa.RecordBatch":
+        names = list(rows[0].keys())
+        return pa.RecordBatch.from_arrays([pa.array([row[name] for row in rows], type=pa.string()) for name in names], names=names)
+
+    @staticmethod
+    def _to_block(names: List[str], columns: List["pa.Array"]) -> "pa.RecordBatch":
+        # Like a csv.DictReader, the value of a duplicated header is the last one and its position is the first one
+        column_index_by_name = {name: index for index, name in enumerate(names)}
+        if len(column_index_by_name) == len(names):
+            return pa.RecordBatch.from_arrays(columns, names=names)
+        unique_names = list(column_index_by_name.keys())
+        return pa.RecordBatch.from_arrays([columns[column_index_by_name[name]] for name in unique_names], names=unique_names)
+
+
 class CsvParser(FileTypeParser):
     _MAX_BYTES_PER_FILE_FOR_SCHEMA_INFERENCE = 1_000_000
 
-    def __init__(self, csv_reader: Optional[_CsvReader] = None):
+    # Values pyarrow casts exactly like `int` and `float` do. Any other value is cast by Python
+    _INTEGER_PATTERN = r"^-?[0-9]+$"
+    _NUMBER_PATTERN = r"^-?(?:[0-9]+(?:\.[0-9]*)?|\.[0-9]+)(?:[eE][+-]?[0-9]+)?$"
+
+    def __init__(self, csv_reader: Optional[_CsvReader] = None, use_arrow_engine: bool = False):
+        """
+        :param csv_reader: The reader used to read the rows of the files
+        :param use_arrow_engine: Read the files in blocks with pyarrow and cast them column by column. This is ignored if pyarrow is not
+            installed. Files pyarrow can't read like `csv_reader` does are read by `csv_reader`
+        """
         self._csv_reader = csv_reader if csv_reader else _CsvReader()
+        self._arrow_csv_reader = _ArrowCsvReader(self._csv_reader) if use_arrow_engine and _ArrowCsvReader.is_available() else None
 
     async def infer_schema(
         self,
@@ -142,6 +338,10 @@ class CsvParser(FileTypeParser):
             if config_format.inference_type != InferenceType.NONE
             else _DisabledTypeInferrer()
         )
+        if self._arrow_csv_reader:
+            self._infer_types_from_blocks(self._arrow_csv_reader, type_inferrer_by_field, config, file, stream_reader, logger)
+            return self._to_inferred_schema(type_inferrer_by_field, file)
+
         data_generator = self._csv_reader.read_data(config, file, stream_reader, logger, self.file_read_mode)
         read_bytes = 0
         for row in data_generator:
@@ -154,15 +354,47 @@ class CsvParser(FileTypeParser):
             if read_bytes >= self._MAX_BYTES_PER_FILE_FOR_SCHEMA_INFERENCE:
                 break
 
+        schema = self._to_inferred_schema(type_inferrer_by_field, file)
+        data_generator.close()
+        return schema
+
+    def _infer_types_from_blocks(
+        self,
+        arrow_csv_reader: "_ArrowCsvReader",
+        type_inferrer_by_field: Dict[str, "_TypeInferrer"],
+        config: FileBasedStreamConfig,
+        file: RemoteFile,
+        stream_reader: AbstractFileBasedStreamReader,
+        logger: logging.Logger,
+    ) -> None:
+        read_bytes = 0
+        blocks = arrow_csv_reader.read_blocks(config, file, stream_reader, logger)
+        for block in blocks:
+            if block.num_rows == 0:
+                continue
+            # Like when reading the rows one by one, the values are added until the row where the limit of bytes is reached
+            bytes_by_row = pc.cumulative_sum(
+                reduce(pc.add, [pc.utf8_length(column).cast(pa.int64()) for column in block.columns], block.num_columns - 1)
+            )
+            rows_over_limit = pc.indices_nonzero(pc.greater_equal(bytes_by_row, self._MAX_BYTES_PER_FILE_FOR_SCHEMA_INFERENCE - read_bytes))
+            if len(rows_over_limit) > 0:
+                block = block.slice(0, rows_over_limit[0].as_py() + 1)
+            for header, column in zip(block.schema.names, block.columns):
+                type_inferrer_by_field[header].add_values(column)
+            if len(rows_over_limit) > 0:
+                break
+            read_bytes += bytes_by_row[-1].as_py()
+        blocks.close()
+
+    @staticmethod
+    def _to_inferred_schema(type_inferrer_by_field: Dict[str, "_TypeInferrer"], file: RemoteFile) -> SchemaType:
         if not type_inferrer_by_field:
             raise AirbyteTracedException(
                 message=f"Could not infer schema as there are no rows in {file.uri}. If having an empty CSV file is expected, ignore this. "
                 f"Else, please contact Airbyte.",
                 failure_type=FailureType.config_error,
             )
-        schema = {header.strip(): {"type": type_inferred.infer()} for header, type_inferred in type_inferrer_by_field.items()}
-        data_generator.close()
-        return schema
+        return {header.strip(): {"type": type_inferred.infer()} for header, type_inferred in type_inferrer_by_field.items()}
 
     def parse_records(
         self,
@@ -178,12 +410,125 @@ class CsvParser(FileTypeParser):
             deduped_property_types = CsvParser._pre_propcess_property_types(property_types)
         else:
             deduped_property_types = {}
+        if self._arrow_csv_reader:
+            yield from self._parse_blocks(self._arrow_csv_reader, config, file, stream_reader, logger, deduped_property_types)
+            return
         cast_fn = CsvParser._get_cast_function(deduped_property_types, config_format, logger, config.schemaless)
         data_generator = self._csv_reader.read_data(config, file, stream_reader, logger, self.file_read_mode)
         for row in data_generator:
             yield CsvParser._to_nullable(cast_fn(row), deduped_property_types, config_format.null_values, config_format.strings_can_be_null)
         data_generator.close()
 
+    def _parse_blocks(
+        self,
+        arrow_csv_reader: "_ArrowCsvReader",
+        config: FileBasedStreamConfig,
+        file: RemoteFile,
+        stream_reader: AbstractFileBasedStreamReader,
+        logger: logging.Logger,
+        deduped_property_types: Mapping[str, str],
+    ) -> Iterable[Dict[str, Any]]:
+        """
+        Same as reading the rows one by one with `_cast_types` and `_to_nullable` but the values are cast one column of a block at a time
+        """
+        config_format = _extract_format(config)
+        cast = bool(deduped_property_types) and not config.schemaless
+        blocks = arrow_csv_reader.read_blocks(config, file, stream_reader, logger)
+        for block in blocks:
+            warnings_by_row: DefaultDict[int, List[str]] = defaultdict(list)
+            headers = []
+            columns = []
+            for header, column in zip(block.schema.names, block.columns):
+                prop_type = deduped_property_types.get(header)
+                if not cast:
+                    values = _to_python_values(column)
+                elif prop_type in TYPE_PYTHON_MAPPING:
+                    values = self._cast_column(header, column, prop_type, config_format, warnings_by_row)
+                else:
+                    # Like _cast_types, the columns which are not in the schema are not part of the records
+                    continue
+                if config_format.null_values and (config_format.strings_can_be_null or prop_type != "string"):
+                    self._nullify(values, column, config_format.null_values)
+                headers.append(header)
+                columns.append(values)
+
+            rows = zip(*columns) if columns else itertools.repeat((), block.num_rows)
+            for index, values in enumerate(rows):
+                if index in warnings_by_row:
+                    logger.warning(f"{FileBasedSourceError.ERROR_CASTING_VALUE.value}: {','.join(warnings_by_row[index])}")
+                yield dict(zip(headers, values))
+        blocks.close()
+
+    @classmethod
+    def _cast_column(
+        cls, header: str, column: "pa.Array", prop_type: str, config_format: CsvFormat, warnings_by_row: DefaultDict[int, List[str]]
+    ) -> List[Any]:
+        _, python_type = TYPE_PYTHON_MAPPING[prop_type]
+        if python_type == int:
+            return cls._cast_column_with_arrow(header, column, prop_type, pa.int64(), cls._INTEGER_PATTERN, int, warnings_by_row)
+        if python_type == float:
+            return cls._cast_column_with_arrow(header, column, prop_type, pa.float64(), cls._NUMBER_PATTERN, float, warnings_by_row)
+        if python_type == bool:
+            true_values = pc.is_in(column, value_set=pa.array(list(config_format.true_values), type=pa.string()))
+            false_values = pc.is_in(column, value_set=pa.array(list(config_format.false_values), type=pa.string()))
+            if len(column) == 0 or pc.all(pc.or_(true_values, false_values)).as_py():
+                return _to_python_values(true_values)
+            cast_fn: Callable[[str], Any] = partial(
+                _value_to_bool, true_values=config_format.true_values, false_values=config_format.false_values
+            )
+        elif python_type == dict:
+            # we don't re-use _value_to_object here because we type the column as object as long as there is only one object
+            cast_fn = json.loads
+        elif python_type == list:
+            cast_fn = _value_to_list
+        elif python_type is None:
+            cast_fn = _value_to_null
+        else:
+            return _to_python_values(column)
+        return cls._cast_values(header, _to_python_values(column), prop_type, cast_fn, warnings_by_row)
+
+    @classmethod
+    def _cast_column_with_arrow(
+        cls,
+        header: str,
+        column: "pa.Array",
+        prop_type: str,
+        arrow_type: "pa.DataType",
+        pattern: str,
+        python_type: type,
+        warnings_by_row: DefaultDict[int, List[str]],
+    ) -> List[Any]:
+        if len(column) > 0 and pc.all(pc.match_substring_regex(column, pattern)).as_py():
+            try:
+                return _to_python_values(column.cast(arrow_type))
+            except pa.ArrowInvalid:
+                # out of the range of arrow_type
+                pass
+        return cls._cast_values(
+            header, _to_python_values(column), prop_type, partial(_value_to_python_type, python_type=python_type), warnings_by_row
+        )
+
+    @staticmethod
+    def _cast_values(
+        header: str, values: List[str], prop_type: str, cast_fn: Callable[[str], Any], warnings_by_row: DefaultDict[int, List[str]]
+    ) -> List[Any]:
+        cast_values: List[Any] = []
+        for index, value in enumerate(values):
+            try:
+                cast_values.append(cast_fn(value))
+            except ValueError:
+                cast_values.append(value)
+                warnings_by_row[index].append(_format_warning(header, value, prop_type))
+        return cast_values
+
+    @staticmethod
+    def _nullify(values: List[Any], column: "pa.Array", null_values: Set[str]) -> None:
+        null_value_indices = pc.indices_nonzero(pc.is_in(column, value_set=pa.array(list(null_values), type=pa.string())))
+        for index in _to_python_values(null_value_indices):
+            # Values which were cast are not null values even if their string representation is
+            if isinstance(values[index], str):
+                values[index] = None
+
     @property
     def file_read_mode(self) -> FileReadMode:
         return FileReadMode.READ
@@ -211,7 +556,7 @@ class CsvParser(FileTypeParser):
 
     @staticmethod
     def _value_is_none(value: Any, deduped_property_type: Optional[str], null_values: Set[str], strings_can_be_null: bool) -> bool:
-        return value in null_values and (strings_can_be_null or deduped_property_type != "string")
+        return isinstance(value, str) and value in null_values and (strings_can_be_null or deduped_property_type != "string")
 
     @staticmethod
     def _pre_propcess_property_types(property_types: Dict[str, Any]) -> Mapping[str, str]:
@@ -309,6 +654,10 @@ class _TypeInferrer(ABC):
     def add_value(self, value: Any) -> None:
         pass
 
+    def add_values(self, values: "pa.Array") -> None:
+        for value in _to_python_values(values):
+            self.add_value(value)
+
     @abstractmethod
     def infer(self) -> str:
         pass
@@ -318,6 +667,9 @@ class _DisabledTypeInferrer(_TypeInferrer):
     def add_value(self, value: Any) -> None:
         pass
 
+    def add_values(self, values: "pa.Array") -> None:
+        pass
+
     def infer(self) -> str:
         return "string"
 
@@ -338,6 +690,9 @@ class _JsonTypeInferrer(_TypeInferrer):
     def add_value(self, value: Any) -> None:
         self._values.add(value)
 
+    def add_values(self, values: "pa.Array") -> None:
+        self._values.update(_to_python_values(pc.unique(values)))
+
     def infer(self) -> str:
         types_by_value = {value: self._infer_type(value) for value in self._values}
         types_excluding_null_values = [types for types in types_by_value.values() if self._NULL_TYPE not in types]
@@ -413,6 +768,19 @@ def _value_to_python_type(value: str, python_type: type) -> Any:
     return python_type(value)
 
 
+def _value_to_null(value: str) -> None:
+    if value == "":
+        return None
+    raise ValueError(f"Value {value} is not a valid null value")
+
+
+def _to_python_values(array: "pa.Array") -> List[Any]:
+    if array.null_count:
+        return array.to_pylist()  # type: ignore  # pyarrow is not typed
+    # Much faster than to_pylist which creates a pyarrow scalar for each value
+    return array.to_numpy(zero_copy_only=False).tolist()  # type: ignore  # pyarrow is not typed
+
+
 def _format_warning(key: str, value: str, expected_type: Optional[Any]) -> str:
     return f"{key}: value={value},expected_type={expected_type}"
 
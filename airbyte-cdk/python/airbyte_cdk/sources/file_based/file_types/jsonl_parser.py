@@ -4,7 +4,10 @@
 
 import json
 import logging
-from typing import Any, Dict, Iterable, Mapping, Optional, Union
+import re
+from bisect import bisect_right
+from itertools import accumulate
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
 from airbyte_cdk.sources.file_based.exceptions import FileBasedSourceError, RecordParseError
@@ -13,6 +16,15 @@ from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileTypeP
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from airbyte_cdk.sources.file_based.schema_helpers import PYTHON_TYPE_MAPPING, SchemaType, merge_schemas
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson deserializes integers over 64 bits as floats, so documents with floats this big are deserialized with the stdlib json module
+_MAX_ORJSON_INTEGER = 2**63
+_NO_RECORD = object()
+
 
 class JsonlParser(FileTypeParser):
 
@@ -48,8 +60,9 @@ class JsonlParser(FileTypeParser):
     ) -> Iterable[Dict[str, Any]]:
         """
         This code supports parsing json objects over multiple lines even though this does not align with the JSONL format. This is for
-        backward compatibility reasons i.e. the previous source-s3 parser did support this. The drawback is:
-        * performance as the way we support json over multiple lines is very brute forced
+        backward compatibility reasons i.e. the previous source-s3 parser did support this. The drawbacks are:
+        * performance as the lines of json objects over multiple lines are buffered and decoded together, which is slower than decoding
+          one line at a time
         * given that we don't have `newlines_in_values` config to scope the possible inputs, we might parse the whole file before knowing if
           the input is improperly formatted or if the json is over multiple lines
 
@@ -87,23 +100,17 @@ class JsonlParser(FileTypeParser):
             has_warned_for_multiline_json_object = False
             yielded_at_least_once = False
 
-            accumulator = None
-            for line in fp:
-                if not accumulator:
-                    accumulator = self._instantiate_accumulator(line)
-                read_bytes += len(line)
-                accumulator += line  # type: ignore [operator]  # In reality, it's either bytes or string and we add the same type
-                try:
-                    record = json.loads(accumulator)
+            for line_length, record in self._decode_lines(fp):
+                read_bytes += line_length
+                if record is _NO_RECORD:
+                    had_json_parsing_error = True
+                else:
                     if had_json_parsing_error and not has_warned_for_multiline_json_object:
                         logger.warning(f"File at {file.uri} is using multiline JSON. Performance could be greatly reduced")
                         has_warned_for_multiline_json_object = True
 
                     yield record
                     yielded_at_least_once = True
-                    accumulator = self._instantiate_accumulator(line)
-                except json.JSONDecodeError:
-                    had_json_parsing_error = True
 
                 if read_limit and yielded_at_least_once and read_bytes >= self.MAX_BYTES_PER_FILE_FOR_SCHEMA_INFERENCE:
                     logger.warning(
@@ -115,9 +122,142 @@ class JsonlParser(FileTypeParser):
             if had_json_parsing_error and not yielded_at_least_once:
                 raise RecordParseError(FileBasedSourceError.ERROR_PARSING_RECORD)
 
+    @classmethod
+    def _decode_lines(cls, lines: Iterable[Union[bytes, str]]) -> Iterable[Tuple[int, Any]]:
+        """
+        Yields the length of each line along with the JSON document ending on this line, or _NO_RECORD if no document ends on it.
+
+        A document is made of the consecutive lines which parse as one JSON document once concatenated, starting right after the previous
+        document. Lines holding a whole document are decoded on their own. The lines of a document spanning several lines are buffered and
+        the buffer is decoded with `raw_decode` each time its size doubles, so the time spent decoding is linear in the size of the file.
+        """
+        lines = iter(lines)
+        pending = _PendingLines()
+        for line in lines:
+            if not pending:
+                record = cls._decode_line(line)
+                if record is not _NO_RECORD:
+                    yield len(line), record
+                    continue
+            pending.append(line)
+            if pending.is_worth_decoding():
+                yield from pending.decode(final=False)
+                if pending.is_undecodable:
+                    break
+        yield from pending.decode(final=True)
+        # Once a document can't be decoded, no following line can be part of a document
+        for line in lines:
+            yield len(line), _NO_RECORD
+
     @staticmethod
-    def _instantiate_accumulator(line: Union[bytes, str]) -> Union[bytes, str]:
+    def _decode_line(line: Union[bytes, str]) -> Any:
+        if orjson is not None and isinstance(line, str):
+            try:
+                record = orjson.loads(line)
+                if not _has_big_float(record):
+                    return record
+            except orjson.JSONDecodeError:
+                # orjson is stricter than the stdlib json module (e.g. NaN) so we fall back on the latter
+                pass
+        try:
+            return json.loads(line)
+        except json.JSONDecodeError:
+            return _NO_RECORD
+
+
+def _has_big_float(value: Any) -> bool:
+    value_type = type(value)
+    if value_type is float:
+        return not -_MAX_ORJSON_INTEGER < value < _MAX_ORJSON_INTEGER
+    if value_type is dict:
+        value = value.values()
+    elif value_type is not list:
+        return False
+    for item in value:
+        item_type = type(item)
+        if (item_type is float or item_type is dict or item_type is list) and _has_big_float(item):
+            return True
+    return False
+
+
+class _PendingLines:
+    """
+    The lines read since the last document was decoded
+    """
+
+    _DECODER = json.JSONDecoder()
+    _WHITESPACES = re.compile(r"[ \t\n\r]*")
+
+    def __init__(self) -> None:
+        self._lines: List[str] = []
+        self._lengths: List[int] = []
+        self._size = 0
+        self._size_at_next_decoding = 0
+        self._encoding: Optional[str] = None
+        self.is_undecodable = False
+
+    def __bool__(self) -> bool:
+        return bool(self._lines)
+
+    def append(self, line: Union[bytes, str]) -> None:
+        self._lengths.append(len(line))
         if isinstance(line, bytes):
-            return bytes("", json.detect_encoding(line))
-        elif isinstance(line, str):
-            return ""
+            if self._encoding is None:
+                self._encoding = json.detect_encoding(line)
+            line = line.decode(self._encoding, "surrogatepass")
+        self._lines.append(line)
+        self._size += len(line)
+
+    def is_worth_decoding(self) -> bool:
+        return self._size >= self._size_at_next_decoding
+
+    def decode(self, final: bool) -> Iterable[Tuple[int, Any]]:
+        """
+        Yields the lines of the documents which can be decoded. Unless `final` is set, the lines of a document which could be completed by
+        the next lines are kept.
+        """
+        buffer = "".join(self._lines)
+        line_ends = list(accumulate(len(line) for line in self._lines))
+        decoded_lines = 0
+        position = 0
+        while True:
+            start = self._WHITESPACES.match(buffer, position).end()  # type: ignore  # the pattern matches the empty string
+            if start == len(buffer):
+                break
+            try:
+                record, end = self._DECODER.raw_decode(buffer, start)
+            except json.JSONDecodeError as exc:
+                # Unless the error is on the last line, the next lines can't make this document valid
+                self.is_undecodable = final or buffer.find("\n", exc.pos) != -1
+                break
+            last_line = bisect_right(line_ends, end - 1)
+            if type(record) in (int, float):
+                # Lines which don't end with a line feed can split a number, in which case the document ends with the first part
+                record, end, last_line = self._decode_split_number(buffer, start, line_ends, last_line) or (record, end, last_line)
+            if self._WHITESPACES.match(buffer, end, line_ends[last_line]).end() < line_ends[last_line]:  # type: ignore
+                # The document is followed by something else on its last line
+                self.is_undecodable = True
+                break
+            for length in self._lengths[decoded_lines:last_line]:
+                yield length, _NO_RECORD
+            yield self._lengths[last_line], record
+            decoded_lines = last_line + 1
+            position = line_ends[last_line]
+
+        if final or self.is_undecodable:
+            for length in self._lengths[decoded_lines:]:
+                yield length, _NO_RECORD
+            decoded_lines = len(self._lines)
+        del self._lines[:decoded_lines]
+        del self._lengths[:decoded_lines]
+        self._size = sum(len(line) for line in self._lines)
+        self._size_at_next_decoding = 2 * self._size
+
+    @staticmethod
+    def _decode_split_number(buffer: str, start: int, line_ends: List[int], last_line: int) -> Optional[Tuple[Any, int, int]]:
+        for line in range(bisect_right(line_ends, start), last_line):
+            try:
+                return json.loads(buffer[start : line_ends[line]]), line_ends[line], line
+            except json.JSONDecodeError:
+                pass
+        return None
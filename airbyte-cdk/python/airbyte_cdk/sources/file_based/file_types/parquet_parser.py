@@ -10,7 +10,7 @@ from urllib.parse import unquote
 
 import pyarrow as pa
 import pyarrow.parquet as pq
-from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig, ParquetFormat
+from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig, ParquetFormat, ValidationPolicy
 from airbyte_cdk.sources.file_based.exceptions import ConfigValidationError, FileBasedSourceError
 from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFileBasedStreamReader, FileReadMode
 from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileTypeParser
@@ -22,6 +22,13 @@ from pyarrow import Scalar
 class ParquetParser(FileTypeParser):
 
     ENCODING = None
+    DEFAULT_BATCH_SIZE = 10_000
+
+    def __init__(self, batch_size: int = DEFAULT_BATCH_SIZE):
+        """
+        :param batch_size: The maximum number of rows read and converted at once
+        """
+        self._batch_size = batch_size
 
     async def infer_schema(
         self,
@@ -61,16 +68,37 @@ class ParquetParser(FileTypeParser):
         with stream_reader.open_file(file, self.file_read_mode, self.ENCODING, logger) as fp:
             reader = pq.ParquetFile(fp)
             partition_columns = {x.split("=")[0]: x.split("=")[1] for x in self._extract_partitions(file.uri)}
-            for row_group in range(reader.num_row_groups):
-                batch = reader.read_row_group(row_group)
-                for row in range(batch.num_rows):
-                    yield {
-                        **{
-                            column: ParquetParser._to_output_value(batch.column(column)[row], parquet_format)
-                            for column in batch.column_names
-                        },
-                        **partition_columns,
-                    }
+            columns = self._get_columns_to_read(config, reader.schema_arrow, discovered_schema)
+            for batch in reader.iter_batches(batch_size=self._batch_size, columns=columns):
+                # The values are converted column by column and the records are only built once all the columns of the batch are converted
+                column_names = batch.schema.names
+                column_values = [ParquetParser._to_output_values(column, parquet_format) for column in batch.columns]
+                if not column_values:
+                    for _ in range(batch.num_rows):
+                        yield dict(partition_columns)
+                    continue
+                for row in zip(*column_values):
+                    record = dict(zip(column_names, row))
+                    if partition_columns:
+                        record.update(partition_columns)
+                    yield record
+
+    @staticmethod
+    def _get_columns_to_read(
+        config: FileBasedStreamConfig, parquet_schema: pa.Schema, discovered_schema: Optional[Mapping[str, SchemaType]]
+    ) -> Optional[List[str]]:
+        """
+        Only the columns of the configured catalog are read. All of them are read if the stream is schemaless or if the validation policy
+        needs to see the columns which are not in the catalog to decide whether to emit the record.
+        """
+        if not discovered_schema or config.schemaless or config.validation_policy != ValidationPolicy.emit_record:
+            return None
+        properties = discovered_schema.get("properties")
+        if not isinstance(properties, Mapping):
+            return None
+        columns = [name for name in parquet_schema.names if name in properties]
+        # When none of the columns are in the catalog, the records are still emitted with all their columns
+        return columns or None
 
     @staticmethod
     def _extract_partitions(filepath: str) -> List[str]:
@@ -80,6 +108,35 @@ class ParquetParser(FileTypeParser):
     def file_read_mode(self) -> FileReadMode:
         return FileReadMode.READ_BINARY
 
+    @staticmethod
+    def _to_output_values(parquet_values: pa.Array, parquet_format: ParquetFormat) -> List[Any]:
+        """
+        Convert a pyarrow array to the values that can be output by the source. This is the same conversion as `_to_output_value` applied on
+        the whole column at once, except that null values are always output as None.
+        """
+        parquet_type = parquet_values.type
+        if pa.types.is_dictionary(parquet_type):
+            return [ParquetParser._to_output_value(parquet_value, parquet_format) for parquet_value in parquet_values]
+        if pa.types.is_null(parquet_type):
+            return [None] * len(parquet_values)
+
+        values = parquet_values.to_pylist()
+        if pa.types.is_time(parquet_type) or pa.types.is_timestamp(parquet_type) or pa.types.is_date(parquet_type):
+            return [None if value is None else value.isoformat() for value in values]
+        if parquet_type == pa.month_day_nano_interval():
+            return [None if value is None else list(value) for value in values]
+        if ParquetParser._is_binary(parquet_type):
+            return [None if value is None else value.decode("utf-8") for value in values]
+        if pa.types.is_decimal(parquet_type):
+            if parquet_format.decimal_as_float:
+                return values
+            return [None if value is None else str(value) for value in values]
+        if pa.types.is_map(parquet_type):
+            return [None if value is None else dict(value) for value in values]
+        if pa.types.is_duration(parquet_type):
+            return [None if value is None else ParquetParser._duration_to_output(value, parquet_type.unit) for value in values]
+        return values
+
     @staticmethod
     def _to_output_value(parquet_value: Scalar, parquet_format: ParquetFormat) -> Any:
         """
@@ -120,21 +177,27 @@ class ParquetParser(FileTypeParser):
 
         # Convert duration to seconds, then convert to the appropriate unit
         if pa.types.is_duration(parquet_value.type):
-            duration = parquet_value.as_py()
-            duration_seconds = duration.total_seconds()
-            if parquet_value.type.unit == "s":
-                return duration_seconds
-            elif parquet_value.type.unit == "ms":
-                return duration_seconds * 1000
-            elif parquet_value.type.unit == "us":
-                return duration_seconds * 1_000_000
-            elif parquet_value.type.unit == "ns":
-                return duration_seconds * 1_000_000_000 + duration.nanoseconds
-            else:
-                raise ValueError(f"Unknown duration unit: {parquet_value.type.unit}")
+            return ParquetParser._duration_to_output(parquet_value.as_py(), parquet_value.type.unit)
         else:
             return parquet_value.as_py()
 
+    @staticmethod
+    def _duration_to_output(duration: Any, unit: str) -> float:
+        """
+        Convert a duration to seconds, then convert to the appropriate unit
+        """
+        duration_seconds = duration.total_seconds()
+        if unit == "s":
+            return duration_seconds
+        elif unit == "ms":
+            return duration_seconds * 1000
+        elif unit == "us":
+            return duration_seconds * 1_000_000
+        elif unit == "ns":
+            return duration_seconds * 1_000_000_000 + duration.nanoseconds
+        else:
+            raise ValueError(f"Unknown duration unit: {unit}")
+
     @staticmethod
     def parquet_type_to_schema_type(parquet_type: pa.DataType, parquet_format: ParquetFormat) -> Mapping[str, str]:
         """
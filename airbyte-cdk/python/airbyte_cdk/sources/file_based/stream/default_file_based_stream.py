@@ -5,9 +5,10 @@
 import asyncio
 import itertools
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from functools import cache
-from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Set, Union
+from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Union
 
 from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, FailureType, Level
 from airbyte_cdk.models import Type as MessageType
@@ -21,10 +22,12 @@ from airbyte_cdk.sources.file_based.exceptions import (
     SchemaInferenceError,
     StopSyncPerValidationPolicy,
 )
+from airbyte_cdk.sources.file_based.file_types.file_type_parser import Record
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from airbyte_cdk.sources.file_based.schema_helpers import SchemaType, merge_schemas, schemaless_schema
 from airbyte_cdk.sources.file_based.stream import AbstractFileBasedStream
 from airbyte_cdk.sources.file_based.stream.cursor import AbstractFileBasedCursor
+from airbyte_cdk.sources.file_based.stream.file_prefetcher import FilePrefetcher
 from airbyte_cdk.sources.file_based.types import StreamSlice
 from airbyte_cdk.sources.streams import IncrementalMixin
 from airbyte_cdk.sources.streams.core import JsonSchema
@@ -43,9 +46,15 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
     ab_file_name_col = "_ab_source_file_url"
     airbyte_columns = [ab_last_mod_col, ab_file_name_col]
 
-    def __init__(self, cursor: AbstractFileBasedCursor, **kwargs: Any):
+    def __init__(self, cursor: AbstractFileBasedCursor, n_concurrent_file_reads: int = 1, **kwargs: Any):
+        """
+        :param cursor: The cursor tracking the files that were synced
+        :param n_concurrent_file_reads: The number of files opened and parsed at the same time when reading records. The records are still
+        emitted file by file, in order, so the state is the same as when reading the files one at a time.
+        """
         super().__init__(**kwargs)
         self._cursor = cursor
+        self._prefetcher = FilePrefetcher(self._parse_file, n_concurrent_file_reads) if n_concurrent_file_reads > 1 else None
 
     @property
     def state(self) -> MutableMapping[str, Any]:
@@ -66,6 +75,10 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
         files_to_read = self._cursor.get_files_to_sync(all_files, self.logger)
         sorted_files_to_read = sorted(files_to_read, key=lambda f: (f.last_modified, f.uri))
         slices = [{"files": list(group[1])} for group in itertools.groupby(sorted_files_to_read, lambda f: f.last_modified)]
+        if self._prefetcher:
+            # The slices are read in order so the files of the next slices can be parsed while reading the current one
+            self._prefetcher.close()
+            self._prefetcher.schedule(sorted_files_to_read)
         return slices
 
     def read_records_from_slice(self, stream_slice: StreamSlice) -> Iterable[AirbyteMessage]:
@@ -87,7 +100,12 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
             n_skipped = line_no = 0
 
             try:
-                for record in parser.parse_records(self.config, file, self.stream_reader, self.logger, schema):
+                records = (
+                    self._prefetcher.read(file)
+                    if self._prefetcher
+                    else parser.parse_records(self.config, file, self.stream_reader, self.logger, schema)
+                )
+                for record in records:
                     line_no += 1
                     if self.config.schemaless:
                         record = {"data": record}
@@ -141,6 +159,9 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
                         ),
                     )
 
+    def _parse_file(self, file: RemoteFile) -> Iterable[Record]:
+        return self.get_parser().parse_records(self.config, file, self.stream_reader, self.logger, self.catalog_schema)
+
     @property
     def cursor_field(self) -> Union[str, List[str]]:
         """
@@ -234,26 +255,60 @@ class DefaultFileBasedStream(AbstractFileBasedStream, IncrementalMixin):
 
         Each file type has a corresponding `infer_schema` handler.
         Dispatch on file type.
+
+        The parsers open and read the files synchronously, so every file is inferred in its own event loop on a pool of
+        `n_concurrent_requests` threads. The schemas of the files are then merged in file order.
         """
-        base_schema: SchemaType = {}
-        pending_tasks: Set[asyncio.tasks.Task[SchemaType]] = set()
-
-        n_started, n_files = 0, len(files)
-        files_iterator = iter(files)
-        while pending_tasks or n_started < n_files:
-            while len(pending_tasks) <= self._discovery_policy.n_concurrent_requests and (file := next(files_iterator, None)):
-                pending_tasks.add(asyncio.create_task(self._infer_file_schema(file)))
-                n_started += 1
-            # Return when the first task is completed so that we can enqueue a new task as soon as the
-            # number of concurrent tasks drops below the number allowed.
-            done, pending_tasks = await asyncio.wait(pending_tasks, return_when=asyncio.FIRST_COMPLETED)
-            for task in done:
+        if not files:
+            return {}
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=max(self._discovery_policy.n_concurrent_requests, 1)) as executor:
+            results = await asyncio.gather(
+                *[loop.run_in_executor(executor, self._infer_file_schema_in_thread, file) for file in files], return_exceptions=True
+            )
+
+        schemas: List[SchemaType] = []
+        for result in results:
+            if isinstance(result, Exception):
+                self._log_schema_inference_error(result)
+            else:
+                schemas.append(result)
+        return self._merge_schemas(schemas)
+
+    def _merge_schemas(self, schemas: List[SchemaType]) -> SchemaType:
+        """
+        Merge the schemas pairwise in a balanced tree so the merged schema is not copied once per file. If some schemas can't be merged,
+        they are merged one at a time instead so only the schemas conflicting with the ones before them are logged and skipped.
+        """
+        try:
+            return self._merge_schemas_in_tree(schemas)
+        except Exception:
+            base_schema: SchemaType = {}
+            for schema in schemas:
                 try:
-                    base_schema = merge_schemas(base_schema, task.result())
+                    base_schema = merge_schemas(base_schema, schema)
                 except Exception as exc:
-                    self.logger.error(f"An error occurred inferring the schema. \n {traceback.format_exc()}", exc_info=exc)
-
-        return base_schema
+                    self._log_schema_inference_error(exc)
+            return base_schema
+
+    @classmethod
+    def _merge_schemas_in_tree(cls, schemas: List[SchemaType]) -> SchemaType:
+        if not schemas:
+            return {}
+        if len(schemas) == 1:
+            # Merging into an empty schema validates the types of the schema
+            return merge_schemas({}, schemas[0])
+        middle = len(schemas) // 2
+        return merge_schemas(cls._merge_schemas_in_tree(schemas[:middle]), cls._merge_schemas_in_tree(schemas[middle:]))
+
+    def _log_schema_inference_error(self, exc: BaseException) -> None:
+        self.logger.error(
+            f"An error occurred inferring the schema. \n {''.join(traceback.format_exception(type(exc), exc, exc.__traceback__))}",
+            exc_info=exc,
+        )
+
+    def _infer_file_schema_in_thread(self, file: RemoteFile) -> SchemaType:
+        return asyncio.run(self._infer_file_schema(file))
 
     async def _infer_file_schema(self, file: RemoteFile) -> SchemaType:
         try:
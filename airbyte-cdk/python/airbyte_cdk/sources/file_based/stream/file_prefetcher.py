@@ -0,0 +1,154 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+from collections import deque
+from queue import Full, Queue
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Set
+
+from airbyte_cdk.sources.file_based.file_types.file_type_parser import Record
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+
+_DONE = object()
+
+
+class _Failure:
+    def __init__(self, exception: Exception):
+        self.exception = exception
+
+
+class _PrefetchedFile:
+    """
+    The records of a file parsed by a background thread. The records are sent in batches through a bounded queue, so at most
+    `max_batches * batch_size` records of the file are held in memory until they are read.
+    """
+
+    _POLL_INTERVAL_SECONDS = 0.1
+
+    def __init__(self, file: RemoteFile, batch_size: int, max_batches: int):
+        self.file = file
+        self._batch_size = batch_size
+        self._queue: Queue[Any] = Queue(maxsize=max_batches)
+        self._stopped = threading.Event()
+
+    def fill(self, parse: Callable[[RemoteFile], Iterable[Record]]) -> None:
+        batch: List[Record] = []
+        try:
+            for record in parse(self.file):
+                batch.append(record)
+                if len(batch) >= self._batch_size:
+                    if not self._put(batch):
+                        return
+                    batch = []
+            if batch and not self._put(batch):
+                return
+            self._put(_DONE)
+        except Exception as exc:
+            # The records parsed before the error are sent first so the reader sees the error at the same position as when parsing
+            if not batch or self._put(batch):
+                self._put(_Failure(exc))
+
+    def records(self) -> Iterator[Record]:
+        while True:
+            item = self._queue.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.exception
+            yield from item
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def _put(self, item: Any) -> bool:
+        while not self._stopped.is_set():
+            try:
+                self._queue.put(item, timeout=self._POLL_INTERVAL_SECONDS)
+                return True
+            except Full:
+                continue
+        return False
+
+
+class FilePrefetcher:
+    """
+    Parses the files expected to be read next in background threads so opening and parsing them overlaps with reading the current file.
+
+    The files are scheduled in the order they will be read. Reading a file returns its records in the order the parser yields them,
+    including the error raised by the parser if any. Up to `n_concurrent_files` files are parsed at once: the one being read and the next
+    scheduled ones. A file which is read without having been scheduled is parsed on demand.
+
+    If the records of a file are not read until the end, the prefetching is stopped and files read afterwards are parsed on demand.
+    The threads are daemon threads so a file which was prefetched but never read can't prevent the process from exiting.
+    """
+
+    DEFAULT_BATCH_SIZE = 100
+    DEFAULT_MAX_BATCHES_PER_FILE = 10
+
+    def __init__(
+        self,
+        parse: Callable[[RemoteFile], Iterable[Record]],
+        n_concurrent_files: int,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_batches_per_file: int = DEFAULT_MAX_BATCHES_PER_FILE,
+    ):
+        """
+        :param parse: Parses a file and yields its records, typically a call to `FileTypeParser.parse_records`
+        :param n_concurrent_files: The maximum number of files parsed at the same time, including the one being read
+        :param batch_size: The number of records sent together from the parsing thread
+        :param max_batches_per_file: The number of batches of a file kept in memory before its parsing thread waits for them to be read
+        """
+        self._parse = parse
+        self._n_concurrent_files = n_concurrent_files
+        self._batch_size = batch_size
+        self._max_batches_per_file = max_batches_per_file
+        self._upcoming: Deque[RemoteFile] = deque()
+        self._upcoming_uris: Set[str] = set()
+        self._started: Dict[str, _PrefetchedFile] = {}
+
+    def schedule(self, files: Iterable[RemoteFile]) -> None:
+        for file in files:
+            self._upcoming.append(file)
+            self._upcoming_uris.add(file.uri)
+
+    def read(self, file: RemoteFile) -> Iterator[Record]:
+        prefetched = self._started.pop(file.uri, None)
+        if prefetched is None:
+            if file.uri in self._upcoming_uris:
+                # The files scheduled before this one won't be read anymore
+                while self._upcoming[0].uri != file.uri:
+                    self._upcoming_uris.discard(self._upcoming.popleft().uri)
+                self._upcoming_uris.discard(self._upcoming.popleft().uri)
+            prefetched = self._start(file)
+        self._prefetch_upcoming_files()
+
+        try:
+            yield from prefetched.records()
+        except GeneratorExit:
+            self.close()
+            raise
+        finally:
+            prefetched.stop()
+
+    def close(self) -> None:
+        """
+        Stop parsing the prefetched files and forget the scheduled ones
+        """
+        for prefetched in self._started.values():
+            prefetched.stop()
+        self._started.clear()
+        self._upcoming.clear()
+        self._upcoming_uris.clear()
+
+    def _prefetch_upcoming_files(self) -> None:
+        # One of the concurrent files is the one being read
+        while self._upcoming and len(self._started) < self._n_concurrent_files - 1:
+            file = self._upcoming.popleft()
+            self._upcoming_uris.discard(file.uri)
+            self._started[file.uri] = self._start(file)
+
+    def _start(self, file: RemoteFile) -> _PrefetchedFile:
+        prefetched = _PrefetchedFile(file, self._batch_size, self._max_batches_per_file)
+        threading.Thread(target=prefetched.fill, args=(self._parse,), name=f"prefetch-{file.uri}", daemon=True).start()
+        return prefetched
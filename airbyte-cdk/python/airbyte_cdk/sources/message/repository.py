@@ -84,8 +84,12 @@ class InMemoryMessageRepository(MessageRepository):
             )
 
     def consume_queue(self) -> Iterable[AirbyteMessage]:
-        while self._message_queue:
-            yield self._message_queue.popleft()
+        # The queue can be consumed by several threads so it is only checked through popleft, which is atomic
+        while True:
+            try:
+                yield self._message_queue.popleft()
+            except IndexError:
+                return
 
 
 class LogAppenderMessageRepositoryDecorator(MessageRepository):
@@ -0,0 +1,552 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import asyncio
+import dataclasses
+import datetime
+import email.utils
+import logging
+import math
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any, Deque, List, Mapping, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+
+logger = logging.getLogger("airbyte")
+
+# Values of the rate limit reset headers above this are Unix timestamps, below it they are a number of seconds to wait
+_MIN_RESET_TIMESTAMP = 1_000_000_000
+
+
+@dataclasses.dataclass
+class Rate:
+    """
+    A number of calls allowed in an interval of time
+    """
+
+    limit: int
+    interval: datetime.timedelta
+
+    def __str__(self) -> str:
+        return f"{self.limit} calls per {self.interval}"
+
+
+class CallRateLimitHit(Exception):
+    """
+    Raised when a call can't be made without exceeding the rate of its policy
+    """
+
+    def __init__(self, error: str, item: Any, weight: int, rate: str, time_to_wait: datetime.timedelta):
+        """
+        :param error: A description of the error
+        :param item: The request which hit the limit
+        :param weight: The number of calls the request counts for
+        :param rate: The description of the rate which was hit
+        :param time_to_wait: The time to wait before the call can be made
+        """
+        super().__init__(error)
+        self.item = item
+        self.weight = weight
+        self.rate = rate
+        self.time_to_wait = time_to_wait
+
+
+class RequestMatcher(ABC):
+    """
+    Selects the requests a call rate policy applies to
+    """
+
+    @abstractmethod
+    def __call__(self, request: Any) -> bool:
+        """
+        :return: True if the policy applies to the request
+        """
+
+
+class HttpRequestMatcher(RequestMatcher):
+    """
+    Matches the HTTP requests with the given method, URL, query parameters and headers. The request can have other query parameters and
+    headers
+    """
+
+    def __init__(
+        self,
+        method: Optional[str] = None,
+        url_pattern: Optional[str] = None,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, Any]] = None,
+    ):
+        """
+        :param method: The HTTP method of the requests, all the methods if None
+        :param url_pattern: A regular expression searched in the URL of the requests without its query string, all the URLs if None
+        :param params: The query parameters the requests must have
+        :param headers: The headers the requests must have
+        """
+        self._method = method.upper() if method else None
+        self._url_pattern = re.compile(url_pattern) if url_pattern else None
+        self._params = {str(name): str(value) for name, value in (params or {}).items()}
+        self._headers = {str(name).lower(): str(value) for name, value in (headers or {}).items()}
+
+    def __call__(self, request: Any) -> bool:
+        if isinstance(request, requests.Request):
+            request = request.prepare()
+        if not isinstance(request, requests.PreparedRequest):
+            return False
+
+        if self._method and str(request.method).upper() != self._method:
+            return False
+        url = urlsplit(request.url or "")
+        if self._url_pattern and not self._url_pattern.search(url._replace(query="", fragment="").geturl()):
+            return False
+        if self._params:
+            params = dict(parse_qsl(url.query, keep_blank_values=True))
+            if any(params.get(name) != value for name, value in self._params.items()):
+                return False
+        if self._headers:
+            headers = {name.lower(): value for name, value in request.headers.items()}
+            if any(headers.get(name) != value for name, value in self._headers.items()):
+                return False
+        return True
+
+
+class AbstractCallRatePolicy(ABC):
+    """
+    Limits the rate of the calls it applies to. Policies are shared by the threads making the calls
+    """
+
+    @abstractmethod
+    def matches(self, request: Any) -> bool:
+        """
+        :return: True if the policy applies to the request
+        """
+
+    @abstractmethod
+    def try_acquire(self, request: Any, weight: int) -> None:
+        """
+        Counts a call if it can be made now
+
+        :param request: The request of the call
+        :param weight: The number of calls the request counts for
+        :raises CallRateLimitHit: if the call can't be made now
+        """
+
+    @abstractmethod
+    def update(self, available_calls: Optional[int], call_reset_ts: Optional[datetime.datetime]) -> None:
+        """
+        Updates the policy with the rate limit state returned by the API, as the calls of other processes count as well
+
+        :param available_calls: The number of calls which can still be made, None if unknown
+        :param call_reset_ts: When the number of available calls is reset, None if unknown
+        """
+
+
+class BaseCallRatePolicy(AbstractCallRatePolicy, ABC):
+    """
+    Serializes the calls to the policy and blocks all the calls when the API returns that no call is available until a reset time
+    """
+
+    def __init__(self, matchers: List[RequestMatcher]):
+        """
+        :param matchers: The requests the policy applies to, all the requests if empty
+        """
+        self._matchers = matchers
+        self._lock = threading.Lock()
+        self._blocked_until: Optional[float] = None
+
+    def matches(self, request: Any) -> bool:
+        return not self._matchers or any(matcher(request) for matcher in self._matchers)
+
+    def try_acquire(self, request: Any, weight: int) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if self._blocked_until is not None and now < self._blocked_until:
+                raise CallRateLimitHit(
+                    error="No call is available until the rate limit of the API is reset",
+                    item=request,
+                    weight=weight,
+                    rate="the rate limit of the API",
+                    time_to_wait=datetime.timedelta(seconds=self._blocked_until - now),
+                )
+            self._try_acquire(now, request, weight)
+
+    def update(self, available_calls: Optional[int], call_reset_ts: Optional[datetime.datetime]) -> None:
+        with self._lock:
+            now = time.monotonic()
+            reset_in = max((call_reset_ts - datetime.datetime.now(datetime.timezone.utc)).total_seconds(), 0.0) if call_reset_ts else None
+            if available_calls is not None and available_calls <= 0 and reset_in is not None:
+                self._blocked_until = now + reset_in
+            self._update(now, available_calls, reset_in)
+
+    @abstractmethod
+    def _try_acquire(self, now: float, request: Any, weight: int) -> None:
+        """
+        Called with the lock of the policy held
+
+        :param now: The current time.monotonic()
+        """
+
+    @abstractmethod
+    def _update(self, now: float, available_calls: Optional[int], reset_in: Optional[float]) -> None:
+        """
+        Called with the lock of the policy held
+
+        :param now: The current time.monotonic()
+        :param reset_in: The number of seconds before the number of available calls is reset, None if unknown
+        """
+
+    @staticmethod
+    def _check_weight(weight: int, capacity: int) -> None:
+        if weight > capacity:
+            raise ValueError(f"A call of weight {weight} can never be made by a policy allowing {capacity} calls at most")
+
+
+class UnlimitedCallRatePolicy(BaseCallRatePolicy):
+    """
+    Doesn't limit the calls it applies to, unless the API returns that no call is available. Useful to exclude some requests from the other
+    policies of a budget
+    """
+
+    def _try_acquire(self, now: float, request: Any, weight: int) -> None:
+        pass
+
+    def _update(self, now: float, available_calls: Optional[int], reset_in: Optional[float]) -> None:
+        pass
+
+
+class FixedWindowCallRatePolicy(BaseCallRatePolicy):
+    """
+    Allows call_limit calls per period, the number of available calls being reset at the end of each period
+    """
+
+    def __init__(
+        self,
+        period: datetime.timedelta,
+        call_limit: int,
+        matchers: List[RequestMatcher],
+        next_reset_ts: Optional[datetime.datetime] = None,
+    ):
+        """
+        :param period: The duration of a window
+        :param call_limit: The number of calls allowed in a window
+        :param matchers: The requests the policy applies to, all the requests if empty
+        :param next_reset_ts: The end of the current window, a period from now if None
+        """
+        super().__init__(matchers)
+        if period.total_seconds() <= 0 or call_limit < 1:
+            raise ValueError(f"The period and call limit of a fixed window must be positive. Got {period} and {call_limit}")
+        self._period = period.total_seconds()
+        self._call_limit = call_limit
+        self._calls_left = call_limit
+        reset_in = (next_reset_ts - datetime.datetime.now(datetime.timezone.utc)).total_seconds() if next_reset_ts else self._period
+        self._next_reset = time.monotonic() + reset_in
+
+    def _try_acquire(self, now: float, request: Any, weight: int) -> None:
+        self._check_weight(weight, self._call_limit)
+        if now >= self._next_reset:
+            elapsed_periods = math.floor((now - self._next_reset) / self._period) + 1
+            self._next_reset += elapsed_periods * self._period
+            self._calls_left = self._call_limit
+        if self._calls_left < weight:
+            raise CallRateLimitHit(
+                error="No call is left in the current window",
+                item=request,
+                weight=weight,
+                rate=f"{self._call_limit} calls per {datetime.timedelta(seconds=self._period)}",
+                time_to_wait=datetime.timedelta(seconds=self._next_reset - now),
+            )
+        self._calls_left -= weight
+
+    def _update(self, now: float, available_calls: Optional[int], reset_in: Optional[float]) -> None:
+        if available_calls is None:
+            return
+        if reset_in is not None:
+            # The window of the API is the one which counts
+            self._next_reset = now + reset_in
+            self._calls_left = min(max(available_calls, 0), self._call_limit)
+        else:
+            self._calls_left = min(self._calls_left, max(available_calls, 0))
+
+
+class MovingWindowCallRatePolicy(BaseCallRatePolicy):
+    """
+    Allows the calls as long as none of the rates is exceeded over the interval of time preceding the call
+    """
+
+    def __init__(self, rates: List[Rate], matchers: List[RequestMatcher]):
+        """
+        :param rates: The rates which must all be respected, e.g. 10 calls per second and 1000 calls per hour
+        :param matchers: The requests the policy applies to, all the requests if empty
+        """
+        super().__init__(matchers)
+        if not rates or any(rate.limit < 1 or rate.interval.total_seconds() <= 0 for rate in rates):
+            raise ValueError(f"A moving window needs rates with a positive limit and interval. Got {rates}")
+        self._rates = sorted(rates, key=lambda rate: rate.interval)
+        self._max_interval = self._rates[-1].interval.total_seconds()
+        # The time of each call, oldest first
+        self._calls: Deque[float] = deque()
+
+    def _try_acquire(self, now: float, request: Any, weight: int) -> None:
+        self._check_weight(weight, min(rate.limit for rate in self._rates))
+        self._forget_calls_before(now - self._max_interval)
+        for rate in self._rates:
+            calls_in_window = self._get_calls_in_window(now, rate)
+            if len(calls_in_window) + weight > rate.limit:
+                # The call can be made once enough calls are out of the window
+                call_leaving_window = calls_in_window[len(calls_in_window) + weight - rate.limit - 1]
+                raise CallRateLimitHit(
+                    error="The rate of the calls would be exceeded",
+                    item=request,
+                    weight=weight,
+                    rate=str(rate),
+                    time_to_wait=datetime.timedelta(seconds=call_leaving_window + rate.interval.total_seconds() - now),
+                )
+        self._calls.extend([now] * weight)
+
+    def _update(self, now: float, available_calls: Optional[int], reset_in: Optional[float]) -> None:
+        if available_calls is None:
+            return
+        self._forget_calls_before(now - self._max_interval)
+        local_available_calls = min(rate.limit - len(self._get_calls_in_window(now, rate)) for rate in self._rates)
+        if available_calls < local_available_calls:
+            # The calls made by other processes are counted as if they were made now
+            self._calls.extend([now] * (local_available_calls - max(available_calls, 0)))
+
+    def _get_calls_in_window(self, now: float, rate: Rate) -> List[float]:
+        window_start = now - rate.interval.total_seconds()
+        return [call for call in self._calls if call > window_start]
+
+    def _forget_calls_before(self, timestamp: float) -> None:
+        while self._calls and self._calls[0] <= timestamp:
+            self._calls.popleft()
+
+
+class TokenBucketCallRatePolicy(BaseCallRatePolicy):
+    """
+    Each call takes a token from a bucket refilled continuously at the given rate. Calls can be made in bursts as long as there are tokens
+    in the bucket
+    """
+
+    def __init__(self, rate: Rate, matchers: List[RequestMatcher], burst: Optional[int] = None):
+        """
+        :param rate: The rate at which the bucket is refilled
+        :param matchers: The requests the policy applies to, all the requests if empty
+        :param burst: The capacity of the bucket, the limit of the rate if None. The bucket is full at first
+        """
+        super().__init__(matchers)
+        if rate.limit < 1 or rate.interval.total_seconds() <= 0 or (burst is not None and burst < 1):
+            raise ValueError(f"A token bucket needs a positive rate and burst. Got {rate} and {burst}")
+        self._tokens_per_second = rate.limit / rate.interval.total_seconds()
+        self._capacity = burst or rate.limit
+        self._tokens = float(self._capacity)
+        self._last_refill = time.monotonic()
+        self._rate = rate
+
+    def _try_acquire(self, now: float, request: Any, weight: int) -> None:
+        self._check_weight(weight, self._capacity)
+        self._refill(now)
+        if self._tokens < weight:
+            raise CallRateLimitHit(
+                error="The bucket doesn't have enough tokens",
+                item=request,
+                weight=weight,
+                rate=str(self._rate),
+                time_to_wait=datetime.timedelta(seconds=(weight - self._tokens) / self._tokens_per_second),
+            )
+        self._tokens -= weight
+
+    def _update(self, now: float, available_calls: Optional[int], reset_in: Optional[float]) -> None:
+        if available_calls is None:
+            return
+        self._refill(now)
+        self._tokens = min(self._tokens, float(max(available_calls, 0)))
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self._capacity, self._tokens + (now - self._last_refill) * self._tokens_per_second)
+        self._last_refill = now
+
+
+class AbstractAPIBudget(ABC):
+    """
+    Paces the calls made to an API so they don't exceed its rate limits. A budget is meant to be shared by all the streams of a source, and
+    all the threads or tasks reading them, so the calls of all the streams are counted together
+    """
+
+    @abstractmethod
+    def acquire_call(self, request: Any, block: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        Waits until the request can be made according to its policy, then counts it
+
+        :param request: The request to make
+        :param block: Raises CallRateLimitHit instead of waiting if False
+        :param timeout: The maximum number of seconds to wait, None to wait as long as needed
+        :raises CallRateLimitHit: if the call can't be made within the timeout
+        """
+
+    @abstractmethod
+    async def acquire_call_async(self, request: Any, timeout: Optional[float] = None) -> None:
+        """
+        Same as acquire_call, waiting without blocking the event loop
+        """
+
+    @abstractmethod
+    def get_matching_policy(self, request: Any) -> Optional[AbstractCallRatePolicy]:
+        """
+        :return: The policy the request counts for, None if no policy applies to it
+        """
+
+    @abstractmethod
+    def update_from_response(self, request: Any, response: Any) -> None:
+        """
+        Updates the policy of the request with the rate limit state returned by the API
+
+        :param request: The request made
+        :param response: The response of the API
+        """
+
+
+class APIBudget(AbstractAPIBudget):
+    """
+    Applies the first policy matching each request. Requests matching no policy aren't limited
+    """
+
+    def __init__(self, policies: List[AbstractCallRatePolicy], maximum_attempts_to_acquire: int = 100000):
+        """
+        :param policies: The policies of the budget, in the order they are matched
+        :param maximum_attempts_to_acquire: The maximum number of times a call waits for its policy before CallRateLimitHit is raised
+        """
+        self._policies = policies
+        self._maximum_attempts_to_acquire = maximum_attempts_to_acquire
+
+    def get_matching_policy(self, request: Any) -> Optional[AbstractCallRatePolicy]:
+        for policy in self._policies:
+            if policy.matches(request):
+                return policy
+        return None
+
+    def acquire_call(self, request: Any, block: bool = True, timeout: Optional[float] = None) -> None:
+        policy = self.get_matching_policy(request)
+        if policy is None:
+            return
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        for _ in range(self._maximum_attempts_to_acquire):
+            time_to_wait = self._try_acquire(policy, request, block, deadline)
+            if time_to_wait is None:
+                return
+            time.sleep(time_to_wait)
+        self._raise_too_many_attempts(request)
+
+    async def acquire_call_async(self, request: Any, timeout: Optional[float] = None) -> None:
+        policy = self.get_matching_policy(request)
+        if policy is None:
+            return
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        for _ in range(self._maximum_attempts_to_acquire):
+            time_to_wait = self._try_acquire(policy, request, True, deadline)
+            if time_to_wait is None:
+                return
+            await asyncio.sleep(time_to_wait)
+        self._raise_too_many_attempts(request)
+
+    def update_from_response(self, request: Any, response: Any) -> None:
+        pass
+
+    @staticmethod
+    def _try_acquire(policy: AbstractCallRatePolicy, request: Any, block: bool, deadline: Optional[float]) -> Optional[float]:
+        """
+        :return: None if the call was counted, the number of seconds to wait before trying again otherwise
+        """
+        try:
+            policy.try_acquire(request, weight=1)
+            return None
+        except CallRateLimitHit as exc:
+            time_to_wait = exc.time_to_wait.total_seconds()
+            if not block or (deadline is not None and time.monotonic() + time_to_wait > deadline):
+                raise
+            logger.debug(f"Call rate limit of {exc.rate} reached. Waiting {time_to_wait:.2f} seconds before sending the request")
+            return time_to_wait
+
+    def _raise_too_many_attempts(self, request: Any) -> None:
+        raise CallRateLimitHit(
+            error=f"The call couldn't be made after {self._maximum_attempts_to_acquire} attempts",
+            item=request,
+            weight=1,
+            rate="",
+            time_to_wait=datetime.timedelta(0),
+        )
+
+
+class HttpAPIBudget(APIBudget):
+    """
+    Updates the policies from the rate limit headers of the HTTP responses, and considers that no call is available when the API returns a
+    rate limit status code, until the time given by the Retry-After header
+    """
+
+    def __init__(
+        self,
+        ratelimit_reset_header: str = "X-RateLimit-Reset",
+        ratelimit_remaining_header: str = "X-RateLimit-Remaining",
+        status_codes_for_ratelimit_hit: Tuple[int, ...] = (requests.codes.too_many_requests,),
+        **kwargs: Any,
+    ):
+        """
+        :param ratelimit_reset_header: The header with the time when the rate limit is reset, as a Unix timestamp or a number of seconds
+        :param ratelimit_remaining_header: The header with the number of calls left before the rate limit is reset
+        :param status_codes_for_ratelimit_hit: The status codes returned by the API when the rate limit is hit
+        :param kwargs: The arguments of APIBudget
+        """
+        super().__init__(**kwargs)
+        self._ratelimit_reset_header = ratelimit_reset_header
+        self._ratelimit_remaining_header = ratelimit_remaining_header
+        self._status_codes_for_ratelimit_hit = tuple(status_codes_for_ratelimit_hit)
+
+    def update_from_response(self, request: Any, response: Any) -> None:
+        if not isinstance(response, requests.Response):
+            return
+        policy = self.get_matching_policy(request)
+        if policy is None:
+            return
+        available_calls = self.get_calls_left_from_response(response)
+        reset_ts = self.get_reset_ts_from_response(response)
+        if available_calls is not None or reset_ts is not None:
+            policy.update(available_calls=available_calls, call_reset_ts=reset_ts)
+
+    def get_reset_ts_from_response(self, response: requests.Response) -> Optional[datetime.datetime]:
+        now = datetime.datetime.now(datetime.timezone.utc)
+        if response.status_code in self._status_codes_for_ratelimit_hit and response.headers.get("Retry-After"):
+            retry_after = response.headers["Retry-After"]
+            try:
+                return now + datetime.timedelta(seconds=float(retry_after))
+            except ValueError:
+                try:
+                    retry_at = email.utils.parsedate_to_datetime(retry_after)
+                    return retry_at if retry_at.tzinfo else retry_at.replace(tzinfo=datetime.timezone.utc)
+                except (TypeError, ValueError):
+                    logger.warning(f"Could not parse the Retry-After header: {retry_after}")
+        reset = response.headers.get(self._ratelimit_reset_header)
+        if reset:
+            try:
+                reset_value = float(reset)
+            except ValueError:
+                logger.warning(f"Could not parse the {self._ratelimit_reset_header} header: {reset}")
+                return None
+            if reset_value >= _MIN_RESET_TIMESTAMP:
+                return datetime.datetime.fromtimestamp(reset_value, tz=datetime.timezone.utc)
+            return now + datetime.timedelta(seconds=reset_value)
+        return None
+
+    def get_calls_left_from_response(self, response: requests.Response) -> Optional[int]:
+        if response.status_code in self._status_codes_for_ratelimit_hit:
+            return 0
+        remaining = response.headers.get(self._ratelimit_remaining_header)
+        if remaining:
+            try:
+                return int(float(remaining))
+            except ValueError:
+                logger.warning(f"Could not parse the {self._ratelimit_remaining_header} header: {remaining}")
+        return None
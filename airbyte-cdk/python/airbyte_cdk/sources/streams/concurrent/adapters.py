@@ -6,7 +6,7 @@ import copy
 import json
 import logging
 from functools import lru_cache
-from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
+from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Type, Union
 
 from airbyte_cdk.models import AirbyteStream, SyncMode
 from airbyte_cdk.sources import AbstractSource, Source
@@ -27,7 +27,7 @@ from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partitio
 from airbyte_cdk.sources.streams.concurrent.partitions.partition_generator import PartitionGenerator
 from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
 from airbyte_cdk.sources.streams.concurrent.thread_based_concurrent_stream import ThreadBasedConcurrentStream
-from airbyte_cdk.sources.streams.core import StreamData
+from airbyte_cdk.sources.streams.core import StreamData, is_record_batch, record_batch_to_list
 from airbyte_cdk.sources.utils.schema_helpers import InternalConfig
 from airbyte_cdk.sources.utils.slice_logger import SliceLogger
 from deprecated.classic import deprecated
@@ -55,12 +55,15 @@ class StreamFacade(Stream):
         max_workers: int,
         state: Optional[MutableMapping[str, Any]],
         cursor: Cursor,
+        concurrent_stream_class: Type[ThreadBasedConcurrentStream] = ThreadBasedConcurrentStream,
     ) -> Stream:
         """
         Create a ConcurrentStream from a Stream object.
         :param source: The source
         :param stream: The stream
         :param max_workers: The maximum number of worker thread to use
+        :param concurrent_stream_class: The concurrent stream implementation. Use ProcessBasedConcurrentStream for CPU-bound streams, in which
+          case the stream must be picklable
         :return:
         """
         pk = cls._get_primary_key_from_stream(stream.primary_key)
@@ -73,7 +76,7 @@ class StreamFacade(Stream):
 
         message_repository = source.message_repository
         return StreamFacade(
-            ThreadBasedConcurrentStream(
+            concurrent_stream_class(
                 partition_generator=StreamPartitionGenerator(
                     stream,
                     message_repository,
@@ -295,6 +298,12 @@ class StreamPartition(Partition):
                     data_to_return = dict(record_data)
                     self._stream.transformer.transform(data_to_return, self._stream.get_json_schema())
                     yield Record(data_to_return)
+                elif is_record_batch(record_data):
+                    schema = self._stream.get_json_schema()
+                    for batch_record_data in record_batch_to_list(record_data):  # type: ignore  # we know record_data is a batch
+                        data_to_return = dict(batch_record_data)
+                        self._stream.transformer.transform(data_to_return, schema)
+                        yield Record(data_to_return)
                 else:
                     self._message_repository.emit_message(record_data)
         except Exception as e:
@@ -0,0 +1,109 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import sys
+import time
+from dataclasses import dataclass
+from queue import Full, Queue
+from typing import Any, Optional
+
+from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
+from airbyte_cdk.sources.streams.concurrent.partitions.types import QueueItem
+
+
+@dataclass
+class QueueMetrics:
+    """
+    Metrics describing how the queue was used. A queue that is often full means the consumer is the bottleneck and adding workers won't
+    help while a queue that is always almost empty means the workers are the bottleneck.
+
+    :param max_depth: The maximum number of items that were in the queue at the same time
+    :param max_size_in_bytes: The maximum estimated size of the items that were in the queue at the same time
+    :param blocked_puts: The number of times a producer had to wait because the queue was full
+    :param blocked_time_seconds: The total time producers spent waiting because the queue was full
+    """
+
+    max_depth: int = 0
+    max_size_in_bytes: int = 0
+    blocked_puts: int = 0
+    blocked_time_seconds: float = 0.0
+
+
+class BoundedQueue(Queue[QueueItem]):
+    """
+    A queue bounded by a number of items and optionally by the estimated size of the records it contains. Producers putting an item in a full
+    queue block until the consumer makes room for it, which applies backpressure on the workers reading partitions.
+
+    The size of a record is estimated as the shallow size of its data and of its top-level values. This is an approximation meant to keep
+    the memory usage in check, not an exact accounting. An item is always accepted in an empty queue, so a single record bigger than the
+    limit can't block the producers forever.
+
+    Once the queue is closed, puts return immediately without adding the item. The consumer closes the queue when it stops consuming so the
+    producers are never left waiting.
+    """
+
+    def __init__(self, max_size: int, max_size_in_bytes: Optional[int] = None):
+        super().__init__(maxsize=max_size)
+        self._max_size_in_bytes = max_size_in_bytes
+        self._size_in_bytes = 0
+        self._closed = False
+        self._metrics = QueueMetrics()
+
+    @property
+    def metrics(self) -> QueueMetrics:
+        return self._metrics
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def put(self, item: QueueItem, block: bool = True, timeout: Optional[float] = None) -> None:
+        item_size = self._estimate_size(item) if self._max_size_in_bytes is not None else 0
+        with self.not_full:
+            if self._is_full(item_size):
+                if not block:
+                    raise Full
+                blocked_at = time.monotonic()
+                deadline = blocked_at + timeout if timeout is not None else None
+                while self._is_full(item_size):
+                    remaining = deadline - time.monotonic() if deadline is not None else None
+                    if remaining is not None and remaining <= 0.0:
+                        raise Full
+                    self.not_full.wait(remaining)
+                self._metrics.blocked_puts += 1
+                self._metrics.blocked_time_seconds += time.monotonic() - blocked_at
+            if self._closed:
+                return
+            self._put((item, item_size))
+            self._size_in_bytes += item_size
+            self._metrics.max_depth = max(self._metrics.max_depth, self._qsize())
+            self._metrics.max_size_in_bytes = max(self._metrics.max_size_in_bytes, self._size_in_bytes)
+            self.unfinished_tasks += 1
+            self.not_empty.notify()
+
+    def close(self) -> None:
+        """
+        Release the producers waiting on the queue and discard any item put from now on
+        """
+        with self.not_full:
+            self._closed = True
+            self.not_full.notify_all()
+
+    def _get(self) -> QueueItem:
+        item, item_size = self.queue.popleft()
+        self._size_in_bytes -= item_size
+        return item
+
+    def _is_full(self, item_size: int) -> bool:
+        if self._closed or self._qsize() == 0:
+            return False
+        if 0 < self.maxsize <= self._qsize():
+            return True
+        return self._max_size_in_bytes is not None and self._size_in_bytes + item_size > self._max_size_in_bytes
+
+    @staticmethod
+    def _estimate_size(item: Any) -> int:
+        if isinstance(item, Record):
+            return sys.getsizeof(item.data) + sum(sys.getsizeof(value) for value in item.data.values())
+        return 0
@@ -3,8 +3,11 @@
 #
 
 from queue import Queue
+from typing import Iterable, Optional
 
+from airbyte_cdk.sources.streams.concurrent.bounded_queue import BoundedQueue
 from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
+from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
 from airbyte_cdk.sources.streams.concurrent.partitions.types import PartitionCompleteSentinel, QueueItem
 
 
@@ -25,14 +28,27 @@ class PartitionReader:
         When all the partitions are added to the queue, a sentinel is added to the queue to indicate that all the partitions have been generated.
 
         If an exception is encountered, the exception will be caught and put in the queue.
+        If the queue is closed, the records would be discarded so the partition is not read any further.
 
         This method is meant to be called from a thread.
         :param partition: The partition to read data from
         :return: None
         """
+        records: Optional[Iterable[Record]] = None
         try:
-            for record in partition.read():
+            records = partition.read()
+            for record in records:
                 self._queue.put(record)
+                if self._is_queue_closed():
+                    return
             self._queue.put(PartitionCompleteSentinel(partition))
         except Exception as e:
             self._queue.put(e)
+        finally:
+            close = getattr(records, "close", None)
+            if close:
+                # Stops reading the partition right away rather than once the generator is garbage collected
+                close()
+
+    def _is_queue_closed(self) -> bool:
+        return isinstance(self._queue, BoundedQueue) and self._queue.closed
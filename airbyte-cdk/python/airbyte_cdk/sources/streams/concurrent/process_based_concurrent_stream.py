@@ -0,0 +1,133 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from logging import Logger
+from queue import Queue
+from typing import Any, Iterable, List, Mapping, Optional
+
+from airbyte_cdk.sources.message import MessageRepository
+from airbyte_cdk.sources.streams.concurrent.availability_strategy import AbstractAvailabilityStrategy
+from airbyte_cdk.sources.streams.concurrent.cursor import Cursor, NoopCursor
+from airbyte_cdk.sources.streams.concurrent.partition_reader import PartitionReader
+from airbyte_cdk.sources.streams.concurrent.partitions.partition_generator import PartitionGenerator
+from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
+from airbyte_cdk.sources.streams.concurrent.partitions.types import QueueItem
+from airbyte_cdk.sources.streams.concurrent.process_partition_reader import ProcessPartitionReader, initialize_worker_process
+from airbyte_cdk.sources.streams.concurrent.thread_based_concurrent_stream import ThreadBasedConcurrentStream
+from airbyte_cdk.sources.utils.slice_logger import SliceLogger
+
+
+class ProcessBasedConcurrentStream(ThreadBasedConcurrentStream):
+    """
+    A concurrent stream reading its partitions in worker processes instead of threads so CPU-bound partitions (JSON decoding, schema
+    normalization, file parsing) are not limited by the GIL.
+
+    Partitions are generated, scheduled, observed by the cursor and closed in the main process exactly like with a ThreadBasedConcurrentStream.
+    Only `Partition.read` runs in a worker process: its records are sent back in batches of `batch_size` records on a multiprocessing queue
+    shared by the worker processes and relayed to the record queue by a thread of the main process.
+
+    Restrictions:
+    - Partitions must be picklable, which includes the stream and the objects it holds.
+    - The partitions must emit their messages on the same message repository as the stream. The messages they emit while being read in a
+      worker process are sent back and emitted on the stream's message repository.
+    - The state of the partition objects is not sent back to the main process: anything a partition mutates on itself or on the objects it
+      holds while being read is lost.
+    """
+
+    # Number of record batches per worker process which can be waiting to be relayed before the worker processes block
+    DEFAULT_MAX_BATCHES_IN_FLIGHT = 10
+    DEFAULT_START_METHOD = "forkserver"
+
+    def __init__(
+        self,
+        partition_generator: PartitionGenerator,
+        max_workers: int,
+        name: str,
+        json_schema: Mapping[str, Any],
+        availability_strategy: AbstractAvailabilityStrategy,
+        primary_key: List[str],
+        cursor_field: Optional[str],
+        slice_logger: SliceLogger,
+        logger: Logger,
+        message_repository: MessageRepository,
+        timeout_seconds: int = ThreadBasedConcurrentStream.DEFAULT_TIMEOUT_SECONDS,
+        max_concurrent_tasks: int = ThreadBasedConcurrentStream.DEFAULT_MAX_QUEUE_SIZE,
+        cursor: Cursor = NoopCursor(),
+        namespace: Optional[str] = None,
+        max_record_queue_size: int = ThreadBasedConcurrentStream.DEFAULT_MAX_RECORD_QUEUE_SIZE,
+        max_record_queue_size_in_bytes: Optional[int] = None,
+        max_processes: Optional[int] = None,
+        batch_size: int = ProcessPartitionReader.DEFAULT_BATCH_SIZE,
+        start_method: str = DEFAULT_START_METHOD,
+    ):
+        """
+        :param max_workers: The number of partitions read at the same time, which is also the number of threads relaying their records
+        :param max_processes: The number of worker processes. Defaults to max_workers
+        :param batch_size: The number of records sent together from a worker process
+        :param start_method: The multiprocessing start method used to create the worker processes
+        """
+        super().__init__(
+            partition_generator,
+            max_workers,
+            name,
+            json_schema,
+            availability_strategy,
+            primary_key,
+            cursor_field,
+            slice_logger,
+            logger,
+            message_repository,
+            timeout_seconds,
+            max_concurrent_tasks,
+            cursor=cursor,
+            namespace=namespace,
+            max_record_queue_size=max_record_queue_size,
+            max_record_queue_size_in_bytes=max_record_queue_size_in_bytes,
+        )
+        self._max_processes = max_processes or max_workers
+        self._batch_size = batch_size
+        self._start_method = start_method
+        self._process_pool: Optional[Executor] = None
+        self._channel: Optional[Any] = None
+        self._partition_reader: Optional[ProcessPartitionReader] = None
+
+    def read(self) -> Iterable[Record]:
+        # Worker processes are forked from a single-threaded server process rather than from this process which runs threads already
+        context = multiprocessing.get_context(self._start_method)
+        # The worker processes block once the batches they sent are not relayed fast enough
+        channel = context.Queue(maxsize=self.DEFAULT_MAX_BATCHES_IN_FLIGHT * self._max_processes)
+        process_pool = ProcessPoolExecutor(
+            max_workers=self._max_processes, mp_context=context, initializer=initialize_worker_process, initargs=(channel,)
+        )
+        self._channel = channel
+        self._process_pool = process_pool
+        completed = False
+        try:
+            yield from super().read()
+            completed = True
+        finally:
+            if completed:
+                if self._partition_reader:
+                    self._partition_reader.close()
+                process_pool.shutdown(wait=True)
+            else:
+                # The read failed or was stopped early: the partitions being read are not waited for since their records would be
+                # dropped anyway. The worker processes are terminated and the partitions that did not start yet are cancelled
+                if self._partition_reader:
+                    self._partition_reader.stop()
+                process_pool.shutdown(wait=False, cancel_futures=True)
+            channel.close()
+            self._partition_reader = None
+            self._process_pool = None
+            self._channel = None
+
+    def _create_partition_reader(self, queue: Queue[QueueItem]) -> PartitionReader:
+        if self._process_pool is None or self._channel is None:
+            raise RuntimeError("The process pool is only available while the stream is being read. This is indicative of a bug in the CDK.")
+        self._partition_reader = ProcessPartitionReader(
+            queue, self._process_pool, self._channel, self._message_repository, self._batch_size
+        )
+        return self._partition_reader
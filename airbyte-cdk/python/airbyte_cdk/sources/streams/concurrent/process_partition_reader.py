@@ -0,0 +1,228 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import itertools
+import os
+import pickle
+import signal
+import threading
+from concurrent.futures import Executor
+from queue import Empty, Queue
+from typing import Any, Dict, List, Set
+
+from airbyte_cdk.models import AirbyteMessage
+from airbyte_cdk.sources.message import MessageRepository
+from airbyte_cdk.sources.streams.concurrent.partition_reader import PartitionReader
+from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
+from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
+from airbyte_cdk.sources.streams.concurrent.partitions.types import PartitionCompleteSentinel, QueueItem
+
+_WORKER_STARTED = "worker_started"
+_RECORDS = "records"
+_MESSAGES = "messages"
+_DONE = "done"
+_ERROR = "error"
+
+# The channel of the worker process, set by initialize_worker_process
+_channel: Any = None
+
+
+def _picklable_exception(exception: Exception) -> Exception:
+    try:
+        pickle.loads(pickle.dumps(exception))
+        return exception
+    except Exception:
+        return RuntimeError(f"{type(exception).__name__}: {exception}")
+
+
+def initialize_worker_process(channel: Any) -> None:
+    """
+    Initializer of the worker processes. A multiprocessing queue can't be pickled with the partitions so the channel is passed once to each
+    worker process when it starts
+    """
+    global _channel
+    _channel = channel
+    channel.put((None, _WORKER_STARTED, os.getpid()))
+
+
+def read_partition_in_process(partition_id: int, partition: Partition, message_repository: MessageRepository, batch_size: int) -> None:
+    """
+    Reads a partition in a worker process and sends its output on the channel as (partition_id, kind, payload) tuples:
+    * (_RECORDS, list): a batch of records
+    * (_MESSAGES, list): the messages emitted on the message repository while reading the records that were sent before
+    * (_DONE, None): all the records of the partition were sent
+    * (_ERROR, exception): reading the partition failed
+
+    The partition and the message repository are pickled together so the partition emits its messages on this copy of the repository. Its
+    queue is drained before reading since it contains the messages that were in the parent repository when the partition was submitted.
+    """
+    channel = _channel
+
+    def _send_messages() -> None:
+        messages: List[AirbyteMessage] = list(message_repository.consume_queue())
+        if messages:
+            channel.put((partition_id, _MESSAGES, messages))
+
+    try:
+        for _ in message_repository.consume_queue():
+            pass
+        batch: List[Record] = []
+        for record in partition.read():
+            batch.append(record)
+            if len(batch) >= batch_size:
+                channel.put((partition_id, _RECORDS, batch))
+                batch = []
+                _send_messages()
+        if batch:
+            channel.put((partition_id, _RECORDS, batch))
+        _send_messages()
+        channel.put((partition_id, _DONE, None))
+    except Exception as e:
+        _send_messages()
+        channel.put((partition_id, _ERROR, _picklable_exception(e)))
+
+
+class _RunningPartition:
+    def __init__(self, partition: Partition) -> None:
+        self.partition = partition
+        self.done = threading.Event()
+
+
+class ProcessPartitionReader(PartitionReader):
+    """
+    Reads partitions in worker processes and puts the records in the queue.
+
+    `process_partition` is meant to be called from a thread: it submits the partition to the process pool and waits for it to be read. The
+    worker processes send their output on a single multiprocessing queue, the channel, which the process pool must pass to
+    `initialize_worker_process`. A relay thread started with the reader puts the records of each batch in the queue one at a time so the
+    consumer sees the same items as with a PartitionReader. Messages emitted on the message repository by the partition in the worker process
+    are re-emitted on the message repository of this process.
+
+    `close` must be called once the partitions are read. `stop` is called instead when the stream stops reading before all the partitions
+    were read: the output of the partitions is not relayed anymore and the worker processes are terminated instead of running until the end
+    of their partition.
+    """
+
+    DEFAULT_BATCH_SIZE = 1000
+    _POLL_INTERVAL_SECONDS = 1.0
+
+    def __init__(
+        self,
+        queue: Queue[QueueItem],
+        process_pool: Executor,
+        channel: Any,
+        message_repository: MessageRepository,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        """
+        :param queue: The queue to put the records in.
+        :param process_pool: The pool of processes reading the partitions, initialized with initialize_worker_process and the channel
+        :param channel: The multiprocessing queue the worker processes send the output of the partitions on
+        :param message_repository: The message repository the messages emitted while reading the partitions are sent to
+        :param batch_size: The number of records sent together from the worker process
+        """
+        super().__init__(queue)
+        self._process_pool = process_pool
+        self._channel = channel
+        self._message_repository = message_repository
+        self._batch_size = batch_size
+        self._closed = threading.Event()
+        self._stopped = threading.Event()
+        self._lock = threading.Lock()
+        self._partition_ids = itertools.count()
+        self._running_partitions: Dict[int, _RunningPartition] = {}
+        self._worker_pids: Set[int] = set()
+        # Daemon thread since it can be blocked on a channel left in an unknown state by a terminated worker process
+        self._relay_thread = threading.Thread(target=self._relay, name="process-partition-reader-relay", daemon=True)
+        self._relay_thread.start()
+
+    def close(self) -> None:
+        """
+        Stops the relay thread once the output of the worker processes is relayed
+        """
+        self._closed.set()
+
+    def stop(self) -> None:
+        """
+        Stops relaying the output of the partitions and terminates the worker processes. The process pool can't be used afterwards
+        """
+        with self._lock:
+            self._stopped.set()
+            for pid in self._worker_pids:
+                self._terminate(pid)
+        self.close()
+
+    def process_partition(self, partition: Partition) -> None:
+        running_partition = _RunningPartition(partition)
+        with self._lock:
+            partition_id = next(self._partition_ids)
+            self._running_partitions[partition_id] = running_partition
+        try:
+            future = self._process_pool.submit(
+                read_partition_in_process, partition_id, partition, self._message_repository, self._batch_size
+            )
+            while not running_partition.done.wait(self._POLL_INTERVAL_SECONDS):
+                if self._stopped.is_set() or future.cancelled():
+                    # The stream stopped reading before this partition was read
+                    return
+                if future.done() and future.exception() is not None:
+                    # The worker process died without being able to report the error, e.g. it was killed or the partition can't be pickled
+                    raise future.exception()  # type: ignore  # we know the exception is not None
+        except Exception as e:
+            if not self._stopped.is_set():
+                self._queue.put(e)
+        finally:
+            with self._lock:
+                del self._running_partitions[partition_id]
+
+    def _relay(self) -> None:
+        while True:
+            try:
+                partition_id, kind, payload = self._channel.get(timeout=self._POLL_INTERVAL_SECONDS)
+            except Empty:
+                if self._closed.is_set():
+                    return
+                continue
+            except Exception as e:
+                # The output of a partition could not be unpickled, e.g. its records hold a class which can't be imported
+                if not self._stopped.is_set():
+                    self._queue.put(e)
+                continue
+
+            if kind == _WORKER_STARTED:
+                self._register_worker(payload)
+                continue
+            with self._lock:
+                running_partition = self._running_partitions.get(partition_id)
+            if running_partition is None or self._stopped.is_set():
+                # The partition is not waited for anymore so its output is dropped
+                continue
+            if kind == _RECORDS:
+                for record in payload:
+                    self._queue.put(record)
+            elif kind == _MESSAGES:
+                for message in payload:
+                    self._message_repository.emit_message(message)
+            elif kind == _DONE:
+                self._queue.put(PartitionCompleteSentinel(running_partition.partition))
+                running_partition.done.set()
+            else:
+                self._queue.put(payload)
+                running_partition.done.set()
+
+    def _register_worker(self, pid: int) -> None:
+        with self._lock:
+            if self._stopped.is_set():
+                # The worker process started after the reader was stopped
+                self._terminate(pid)
+            else:
+                self._worker_pids.add(pid)
+
+    @staticmethod
+    def _terminate(pid: int) -> None:
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except ProcessLookupError:
+            # The worker process already exited
+            pass
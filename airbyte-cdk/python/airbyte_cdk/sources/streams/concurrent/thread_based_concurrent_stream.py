@@ -3,17 +3,19 @@
 #
 
 import concurrent
-import time
+import warnings
+from collections import deque
 from concurrent.futures import Future
 from functools import lru_cache
 from logging import Logger
 from queue import Queue
-from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
+from typing import Any, Deque, Dict, Iterable, List, Mapping, Optional
 
 from airbyte_cdk.models import AirbyteStream, SyncMode
 from airbyte_cdk.sources.message import MessageRepository
 from airbyte_cdk.sources.streams.concurrent.abstract_stream import AbstractStream
 from airbyte_cdk.sources.streams.concurrent.availability_strategy import AbstractAvailabilityStrategy, StreamAvailability
+from airbyte_cdk.sources.streams.concurrent.bounded_queue import BoundedQueue, QueueMetrics
 from airbyte_cdk.sources.streams.concurrent.cursor import Cursor, NoopCursor
 from airbyte_cdk.sources.streams.concurrent.partition_enqueuer import PartitionEnqueuer
 from airbyte_cdk.sources.streams.concurrent.partition_reader import PartitionReader
@@ -28,6 +30,7 @@ class ThreadBasedConcurrentStream(AbstractStream):
 
     DEFAULT_TIMEOUT_SECONDS = 900
     DEFAULT_MAX_QUEUE_SIZE = 10_000
+    DEFAULT_MAX_RECORD_QUEUE_SIZE = 10_000
     DEFAULT_SLEEP_TIME = 0.1
 
     def __init__(
@@ -47,6 +50,8 @@ class ThreadBasedConcurrentStream(AbstractStream):
         sleep_time: float = DEFAULT_SLEEP_TIME,
         cursor: Cursor = NoopCursor(),
         namespace: Optional[str] = None,
+        max_record_queue_size: int = DEFAULT_MAX_RECORD_QUEUE_SIZE,
+        max_record_queue_size_in_bytes: Optional[int] = None,
     ):
         self._stream_partition_generator = partition_generator
         self._max_workers = max_workers
@@ -61,9 +66,15 @@ class ThreadBasedConcurrentStream(AbstractStream):
         self._message_repository = message_repository
         self._timeout_seconds = timeout_seconds
         self._max_concurrent_tasks = max_concurrent_tasks
-        self._sleep_time = sleep_time
+        if sleep_time != self.DEFAULT_SLEEP_TIME:
+            # Partitions are submitted as running tasks complete so the main thread never sleeps. The parameter is kept so the positional
+            # arguments following it still work
+            warnings.warn("sleep_time is deprecated and ignored by ThreadBasedConcurrentStream", DeprecationWarning, stacklevel=2)
         self._cursor = cursor
         self._namespace = namespace
+        self._max_record_queue_size = max_record_queue_size
+        self._max_record_queue_size_in_bytes = max_record_queue_size_in_bytes
+        self._record_queue_metrics: Optional[QueueMetrics] = None
 
     def read(self) -> Iterable[Record]:
         """
@@ -75,73 +86,90 @@ class ThreadBasedConcurrentStream(AbstractStream):
           - The future will add the partitions to process on a work queue.
         2. Continuously poll work from the work queue until all partitions are generated and processed
           - If the next work item is an Exception, stop the threadpool and raise it.
-          - If the next work item is a partition, submit a future to process it.
+          - If the next work item is a partition, add it to the pending partitions and submit as many pending partitions as the number of
+            concurrent tasks allows.
             - The future will add the records to emit on the work queue.
-            - Add the partitions to the partitions_to_done dict so we know it needs to complete for the sync to succeed.
+            - Add the partitions to the running partitions so we know it needs to complete for the sync to succeed.
           - If the next work item is a record, yield the record.
           - If the next work item is PARTITIONS_GENERATED_SENTINEL, all the partitions were generated.
           - If the next work item is a PartitionCompleteSentinel, a partition is done processing.
-            - Update the value in partitions_to_done to True so we know the partition is completed.
+            - Remove the partition from the running partitions and submit the next pending partitions in its place.
+
+        The main thread never waits for a task slot: a task slot is released when the main thread gets the sentinel marking the end of the task
+        so the bookkeeping for every work item is O(1) regardless of the number of partitions.
         """
         self._logger.debug(f"Processing stream slices for {self.name}")
-        futures: List[Future[Any]] = []
-        queue: Queue[QueueItem] = Queue()
+        # The queue is bounded so the workers wait for the main thread to emit the records instead of accumulating them in memory
+        queue = BoundedQueue(self._max_record_queue_size, self._max_record_queue_size_in_bytes)
         partition_generator = PartitionEnqueuer(queue, PARTITIONS_GENERATED_SENTINEL)
-        partition_reader = PartitionReader(queue)
-
-        self._submit_task(futures, partition_generator.generate_partitions, self._stream_partition_generator)
-
-        # True -> partition is done
-        # False -> partition is not done
-        partitions_to_done: Dict[Partition, bool] = {}
-
-        finished_partitions = False
-        while record_or_partition_or_exception := queue.get(block=True, timeout=self._timeout_seconds):
-            if isinstance(record_or_partition_or_exception, Exception):
-                # An exception was raised while processing the stream
-                # Stop the threadpool and raise it
-                self._stop_and_raise_exception(record_or_partition_or_exception)
-            elif record_or_partition_or_exception == PARTITIONS_GENERATED_SENTINEL:
-                # All partitions were generated
-                finished_partitions = True
-            elif isinstance(record_or_partition_or_exception, PartitionCompleteSentinel):
-                # All records for a partition were generated
-                if record_or_partition_or_exception.partition not in partitions_to_done:
-                    raise RuntimeError(
-                        f"Received sentinel for partition {record_or_partition_or_exception.partition} that was not in partitions. This is indicative of a bug in the CDK. Please contact support.partitions:\n{partitions_to_done}"
-                    )
-                partitions_to_done[record_or_partition_or_exception.partition] = True
-                self._cursor.close_partition(record_or_partition_or_exception.partition)
-            elif isinstance(record_or_partition_or_exception, Record):
-                # Emit records
-                yield record_or_partition_or_exception
-                self._cursor.observe(record_or_partition_or_exception)
-            elif isinstance(record_or_partition_or_exception, Partition):
-                # A new partition was generated and must be processed
-                partitions_to_done[record_or_partition_or_exception] = False
-                if self._slice_logger.should_log_slice_message(self._logger):
-                    self._message_repository.emit_message(
-                        self._slice_logger.create_slice_log_message(record_or_partition_or_exception.to_slice())
-                    )
-                self._submit_task(futures, partition_reader.process_partition, record_or_partition_or_exception)
-            if finished_partitions and all(partitions_to_done.values()):
-                # All partitions were generated and process. We're done here
-                break
-        self._check_for_errors(futures)
-
-    def _submit_task(self, futures: List[Future[Any]], function: Callable[..., Any], *args: Any) -> None:
-        # Submit a task to the threadpool, waiting if there are too many pending tasks
-        self._wait_while_too_many_pending_futures(futures)
-        futures.append(self._threadpool.submit(function, *args))
-
-    def _wait_while_too_many_pending_futures(self, futures: List[Future[Any]]) -> None:
-        # Wait until the number of pending tasks is < self._max_concurrent_tasks
-        while True:
-            pending_futures = [f for f in futures if not f.done()]
-            if len(pending_futures) < self._max_concurrent_tasks:
-                break
-            self._logger.info("Main thread is sleeping because the task queue is full...")
-            time.sleep(self._sleep_time)
+        partition_reader = self._create_partition_reader(queue)
+
+        partition_generation_future = self._threadpool.submit(partition_generator.generate_partitions, self._stream_partition_generator)
+
+        # Partitions generated but not submitted yet because too many tasks are running
+        pending_partitions: Deque[Partition] = deque()
+        # Partitions submitted whose PartitionCompleteSentinel was not received yet. The futures of completed partitions are not kept around
+        # so the memory and the garbage collection cost don't grow with the number of partitions
+        running_partitions: Dict[Partition, Future[Any]] = {}
+
+        try:
+            finished_partitions = False
+            while record_or_partition_or_exception := queue.get(block=True, timeout=self._timeout_seconds):
+                if isinstance(record_or_partition_or_exception, Record):
+                    # Emit records
+                    yield record_or_partition_or_exception
+                    self._cursor.observe(record_or_partition_or_exception)
+                    # Records are the vast majority of the work items and can't complete the stream
+                    continue
+                elif isinstance(record_or_partition_or_exception, Exception):
+                    # An exception was raised while processing the stream
+                    # Stop the threadpool and raise it
+                    self._stop_and_raise_exception(record_or_partition_or_exception)
+                elif record_or_partition_or_exception == PARTITIONS_GENERATED_SENTINEL:
+                    # All partitions were generated
+                    finished_partitions = True
+                elif isinstance(record_or_partition_or_exception, PartitionCompleteSentinel):
+                    # All records for a partition were generated
+                    if record_or_partition_or_exception.partition not in running_partitions:
+                        raise RuntimeError(
+                            f"Received sentinel for partition {record_or_partition_or_exception.partition} that was not in partitions. This is indicative of a bug in the CDK. Please contact support.partitions:\n{running_partitions}"
+                        )
+                    del running_partitions[record_or_partition_or_exception.partition]
+                    self._cursor.close_partition(record_or_partition_or_exception.partition)
+                elif isinstance(record_or_partition_or_exception, Partition):
+                    # A new partition was generated and must be processed
+                    pending_partitions.append(record_or_partition_or_exception)
+                    if self._slice_logger.should_log_slice_message(self._logger):
+                        self._message_repository.emit_message(
+                            self._slice_logger.create_slice_log_message(record_or_partition_or_exception.to_slice())
+                        )
+                self._submit_pending_partitions(partition_reader, pending_partitions, running_partitions, finished_partitions)
+                if finished_partitions and not pending_partitions and not running_partitions:
+                    # All partitions were generated and process. We're done here
+                    break
+        finally:
+            # Unblock the workers waiting for room in the queue whether the stream was fully read or not
+            queue.close()
+            self._record_queue_metrics = queue.metrics
+            self._logger.debug(f"Record queue metrics for stream {self.name}: {queue.metrics}")
+        self._check_for_errors([partition_generation_future, *running_partitions.values()])
+
+    def _create_partition_reader(self, queue: Queue[QueueItem]) -> PartitionReader:
+        return PartitionReader(queue)
+
+    def _submit_pending_partitions(
+        self,
+        partition_reader: PartitionReader,
+        pending_partitions: Deque[Partition],
+        running_partitions: Dict[Partition, Future[Any]],
+        finished_partitions: bool,
+    ) -> None:
+        # The partition generation counts as a running task until all the partitions were generated
+        running_tasks = len(running_partitions) + (0 if finished_partitions else 1)
+        while pending_partitions and running_tasks < self._max_concurrent_tasks:
+            partition = pending_partitions.popleft()
+            running_partitions[partition] = self._threadpool.submit(partition_reader.process_partition, partition)
+            running_tasks += 1
 
     def _check_for_errors(self, futures: List[Future[Any]]) -> None:
         exceptions_from_futures = [f for f in [future.exception() for future in futures] if f is not None]
@@ -155,13 +183,26 @@ class ThreadBasedConcurrentStream(AbstractStream):
                 self._stop_and_raise_exception(exception)
 
     def _stop_and_raise_exception(self, exception: BaseException) -> None:
-        self._threadpool.shutdown(wait=False, cancel_futures=True)
+        self.shutdown()
         raise exception
 
+    def shutdown(self) -> None:
+        """
+        Releases the threads of the stream without waiting for the running partitions. The stream can't be read afterwards
+        """
+        self._threadpool.shutdown(wait=False, cancel_futures=True)
+
     @property
     def name(self) -> str:
         return self._name
 
+    @property
+    def record_queue_metrics(self) -> Optional[QueueMetrics]:
+        """
+        Metrics of the record queue for the last read of the stream. None if the stream was never read
+        """
+        return self._record_queue_metrics
+
     def check_availability(self) -> StreamAvailability:
         return self._availability_strategy.check_availability(self._logger)
 
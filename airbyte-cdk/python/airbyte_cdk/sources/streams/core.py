@@ -8,7 +8,7 @@ import logging
 import typing
 from abc import ABC, abstractmethod
 from functools import lru_cache
-from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
+from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Protocol, Sequence, Tuple, Union
 
 import airbyte_cdk.sources.utils.casing as casing
 from airbyte_cdk.models import AirbyteMessage, AirbyteStream, SyncMode
@@ -24,14 +24,38 @@ if typing.TYPE_CHECKING:
     from airbyte_cdk.sources import Source
     from airbyte_cdk.sources.streams.availability_strategy import AvailabilityStrategy
 
+
+class ArrowLikeBatch(Protocol):
+    """
+    A columnar batch of records such as a pyarrow.RecordBatch or a pyarrow.Table
+    """
+
+    def to_pylist(self) -> List[Mapping[str, Any]]:
+        ...
+
+
+# A batch of records. Every record of the batch is emitted with the same `emitted_at`
+RecordBatch = Union[Sequence[Mapping[str, Any]], ArrowLikeBatch]
+
 # A stream's read method can return one of the following types:
 # Mapping[str, Any]: The content of an AirbyteRecordMessage
 # AirbyteMessage: An AirbyteMessage. Could be of any type
-StreamData = Union[Mapping[str, Any], AirbyteMessage]
+# RecordBatch: The contents of many AirbyteRecordMessages
+StreamData = Union[Mapping[str, Any], AirbyteMessage, RecordBatch]
 
 JsonSchema = Mapping[str, Any]
 
 
+def is_record_batch(data: Any) -> bool:
+    return isinstance(data, (list, tuple)) or callable(getattr(data, "to_pylist", None))
+
+
+def record_batch_to_list(batch: RecordBatch) -> List[Mapping[str, Any]]:
+    if isinstance(batch, (list, tuple)):
+        return list(batch)
+    return batch.to_pylist()  # type: ignore  # the batch is known to be an ArrowLikeBatch
+
+
 def package_name_from_class(cls: object) -> str:
     """Find the package name given a class name"""
     module = inspect.getmodule(cls)
@@ -154,6 +178,30 @@ class Stream(ABC):
                 cursor_field=cursor_field or None,
             )
             for record_data_or_message in records:
+                if is_record_batch(record_data_or_message):
+                    # The batch is split where a state message has to be emitted or where the limit is reached so the output is the same as
+                    # if the records had been read one by one
+                    batch = record_batch_to_list(record_data_or_message)
+                    batch_start, batch_end = 0, 0
+                    limit_reached = False
+                    for record_data in batch:
+                        batch_end += 1
+                        stream_state = self.get_updated_state(stream_state, record_data)
+                        checkpoint_interval = self.state_checkpoint_interval
+                        record_counter += 1
+                        limit_reached = internal_config.is_limit_reached(record_counter)
+                        if checkpoint_interval and record_counter % checkpoint_interval == 0:
+                            yield batch[batch_start:batch_end]
+                            batch_start = batch_end
+                            yield self._checkpoint_state(stream_state, state_manager, per_stream_state_enabled)
+                        if limit_reached:
+                            break
+                    if batch_start < batch_end:
+                        yield batch[batch_start:batch_end]
+                    if limit_reached:
+                        break
+                    continue
+
                 yield record_data_or_message
                 if isinstance(record_data_or_message, Mapping) or (
                     hasattr(record_data_or_message, "type") and record_data_or_message.type == MessageType.RECORD
@@ -0,0 +1,138 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import asyncio
+import datetime
+import ssl
+from abc import ABC, abstractmethod
+from typing import Any, Optional, Tuple, Union
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+try:
+    import aiohttp
+    import yarl
+except ImportError:
+    aiohttp = yarl = None
+
+
+class AsyncHttpTransport(ABC):
+    """
+    Sends the requests of HttpStream and HttpRequester from an asyncio event loop, so many requests can be in flight without a thread for
+    each of them.
+
+    Requests are prepared by the requests session of the stream, so they are authenticated the same way as the synchronous ones, and the
+    responses are returned as requests.Response, so they go through the same error handling. Transient errors must be raised as the
+    requests exceptions retried by default_backoff_handler: requests.ConnectionError, requests.Timeout or requests.ChunkedEncodingError.
+    """
+
+    @abstractmethod
+    async def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        """
+        :param request: The request to send
+        :param kwargs: The arguments of requests.Session.send: timeout, verify, proxies, cert and allow_redirects
+        :return: The response, with its content read
+        """
+
+    async def close(self) -> None:
+        """
+        Releases the connections of the transport
+        """
+
+
+class AiohttpTransport(AsyncHttpTransport):
+    """
+    Sends requests with aiohttp, which is installed with the async-http extra of the CDK. A connection pool is created for each event loop
+    the transport is used from.
+    """
+
+    def __init__(self, limit: int = 100, limit_per_host: int = 0):
+        """
+        :param limit: The maximum number of open connections
+        :param limit_per_host: The maximum number of open connections to the same host, 0 for no limit
+        """
+        if aiohttp is None:
+            raise ImportError("aiohttp is required to send requests asynchronously. Install it with the async-http extra of airbyte-cdk")
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        session = await self._get_session()
+        start = datetime.datetime.now()
+        url = request.url or ""
+        proxies = kwargs.get("proxies") or {}
+        try:
+            async with session.request(
+                str(request.method),
+                yarl.URL(url, encoded=True),
+                headers=dict(request.headers),
+                data=request.body,
+                allow_redirects=kwargs.get("allow_redirects", True),
+                proxy=proxies.get(yarl.URL(url).scheme) or proxies.get("all"),
+                timeout=self._timeout(kwargs.get("timeout")),
+                ssl=self._ssl(kwargs.get("verify", True), kwargs.get("cert")),
+            ) as aiohttp_response:
+                content = await aiohttp_response.read()
+        except asyncio.TimeoutError as exception:
+            raise requests.exceptions.ReadTimeout(exception, request=request) from exception
+        except aiohttp.ClientPayloadError as exception:
+            raise requests.exceptions.ChunkedEncodingError(exception, request=request) from exception
+        except aiohttp.ClientConnectionError as exception:
+            raise requests.exceptions.ConnectionError(exception, request=request) from exception
+
+        response = requests.Response()
+        response.status_code = aiohttp_response.status
+        response.reason = aiohttp_response.reason or ""
+        response.headers = CaseInsensitiveDict(
+            {name: ", ".join(aiohttp_response.headers.getall(name)) for name in aiohttp_response.headers.keys()}
+        )
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = str(aiohttp_response.url)
+        response.request = request
+        response.elapsed = datetime.datetime.now() - start
+        response._content = content
+        return response
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+            self._loop = None
+
+    async def _get_session(self) -> "aiohttp.ClientSession":
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            # aiohttp sessions can't be used from another event loop than the one they were created in
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self._limit, limit_per_host=self._limit_per_host),
+                # The cookies of the requests session are already set on the prepared requests
+                cookie_jar=aiohttp.DummyCookieJar(),
+            )
+            self._loop = loop
+        return self._session
+
+    @staticmethod
+    def _timeout(timeout: Union[None, float, Tuple[Optional[float], Optional[float]]]) -> "aiohttp.ClientTimeout":
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return aiohttp.ClientTimeout(total=None, sock_connect=connect, sock_read=read)
+        return aiohttp.ClientTimeout(total=None, sock_connect=timeout, sock_read=timeout)
+
+    @staticmethod
+    def _ssl(verify: Union[bool, str], cert: Union[None, str, Tuple[str, str]]) -> Union[None, bool, ssl.SSLContext]:
+        if verify is False:
+            return False
+        if verify is True and cert is None:
+            # The default certificate verification of aiohttp
+            return None
+        context = ssl.create_default_context(cafile=verify if isinstance(verify, str) else None)
+        if isinstance(cert, tuple):
+            context.load_cert_chain(*cert)
+        elif cert:
+            context.load_cert_chain(cert)
+        return context
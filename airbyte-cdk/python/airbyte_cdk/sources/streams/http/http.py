@@ -8,22 +8,25 @@ import os
 import urllib
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Callable, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
+from typing import Any, AsyncIterator, Callable, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Tuple, Union
 from urllib.parse import urljoin
 
 import requests
 import requests_cache
 from airbyte_cdk.models import SyncMode
 from airbyte_cdk.sources.streams.availability_strategy import AvailabilityStrategy
+from airbyte_cdk.sources.streams.call_rate import AbstractAPIBudget
 from airbyte_cdk.sources.streams.core import Stream, StreamData
 from airbyte_cdk.sources.streams.http.availability_strategy import HttpAvailabilityStrategy
 from airbyte_cdk.sources.utils.types import JsonType
 from airbyte_cdk.utils.constants import ENV_REQUEST_CACHE_PATH
 from requests.auth import AuthBase
 
+from .async_transport import AiohttpTransport, AsyncHttpTransport
 from .auth.core import HttpAuthenticator, NoAuth
 from .exceptions import DefaultBackoffException, RequestBodyException, UserDefinedBackoffException
-from .rate_limiting import default_backoff_handler, user_defined_backoff_handler
+from .page_prefetcher import PagePrefetcher
+from .rate_limiting import async_user_defined_backoff_handler, default_backoff_handler, user_defined_backoff_handler
 
 # list of all possible HTTP methods which can be used for sending of request bodies
 BODY_REQUEST_METHODS = ("GET", "POST", "PUT", "PATCH")
@@ -38,7 +41,13 @@ class HttpStream(Stream, ABC):
     page_size: Optional[int] = None  # Use this variable to define page size for API http requests with pagination support
 
     # TODO: remove legacy HttpAuthenticator authenticator references
-    def __init__(self, authenticator: Optional[Union[AuthBase, HttpAuthenticator]] = None):
+    def __init__(self, authenticator: Optional[Union[AuthBase, HttpAuthenticator]] = None, api_budget: Optional[AbstractAPIBudget] = None):
+        """
+        :param authenticator: Authenticates the requests of the stream
+        :param api_budget: Paces the requests of the stream. Pass the same budget to all the streams of a source so their requests are
+          counted together
+        """
+        self._api_budget = api_budget
         if self.use_cache:
             self._session = self.request_cache()
         else:
@@ -49,6 +58,7 @@ class HttpStream(Stream, ABC):
             self._session.auth = authenticator
         elif authenticator:
             self._authenticator = authenticator
+        self._async_http_transport: Optional[AsyncHttpTransport] = None
 
     @property
     def cache_filename(self) -> str:
@@ -76,6 +86,13 @@ class HttpStream(Stream, ABC):
             sqlite_path = "file::memory:?cache=shared"
         return requests_cache.CachedSession(sqlite_path, backend="sqlite")  # type: ignore # there are no typeshed stubs for requests_cache
 
+    def create_async_http_transport(self) -> AsyncHttpTransport:
+        """
+        Override if needed. Creates the transport sending the requests of read_records_async, aiohttp by default. It is created the first
+        time a request is sent asynchronously. Return the same transport from several streams to share its connections.
+        """
+        return AiohttpTransport()
+
     def clear_cache(self) -> None:
         """
         clear cached requests for current session, can be called any time
@@ -118,6 +135,16 @@ class HttpStream(Stream, ABC):
         """
         return 60 * 10
 
+    @property
+    def page_prefetch_depth(self) -> int:
+        """
+        Override if needed. Specifies the number of pages requested in a background thread ahead of the page whose records are being read.
+        Each page is parsed and its next page token computed in that thread as soon as it is received, so parse_response and next_page_token
+        must not depend on the records of the previous pages being processed downstream. Return 0 to request each page once the records of
+        the previous one are read.
+        """
+        return 0
+
     @property
     def retry_factor(self) -> float:
         """
@@ -340,12 +367,37 @@ class HttpStream(Stream, ABC):
 
         Unexpected transient exceptions use the default backoff parameters.
         Unexpected persistent exceptions are not handled and will cause the sync to fail.
+
+        If the stream has an API budget, the request waits until it is allowed by the budget before being sent, and the budget is updated
+        from the response.
         """
         self.logger.debug(
             "Making outbound API request", extra={"headers": request.headers, "url": request.url, "request_body": request.body}
         )
+        if self._api_budget:
+            self._api_budget.acquire_call(request)
         response: requests.Response = self._session.send(request, **request_kwargs)
+        if self._api_budget:
+            self._api_budget.update_from_response(request, response)
+        return self._check_response(request, response)
 
+    async def _send_async(self, request: requests.PreparedRequest, request_kwargs: Mapping[str, Any]) -> requests.Response:
+        """
+        Same as _send, sending the request with the asynchronous transport of the stream
+        """
+        self.logger.debug(
+            "Making outbound API request", extra={"headers": request.headers, "url": request.url, "request_body": request.body}
+        )
+        if self._async_http_transport is None:
+            self._async_http_transport = self.create_async_http_transport()
+        if self._api_budget:
+            await self._api_budget.acquire_call_async(request)
+        response = await self._async_http_transport.send(request, **request_kwargs)
+        if self._api_budget:
+            self._api_budget.update_from_response(request, response)
+        return self._check_response(request, response)
+
+    def _check_response(self, request: requests.PreparedRequest, response: requests.Response) -> requests.Response:
         # Evaluation of response.text can be heavy, for example, if streaming a large response
         # Do it only in debug mode
         if self.logger.isEnabledFor(logging.DEBUG):
@@ -374,7 +426,21 @@ class HttpStream(Stream, ABC):
         """
         Creates backoff wrappers which are responsible for retry logic
         """
+        max_tries, max_time = self._get_backoff_limits()
+        user_backoff_handler = user_defined_backoff_handler(max_tries=max_tries, max_time=max_time)(self._send)
+        backoff_handler = default_backoff_handler(max_tries=max_tries, max_time=max_time, factor=self.retry_factor)
+        return backoff_handler(user_backoff_handler)(request, request_kwargs)
 
+    async def _send_request_async(self, request: requests.PreparedRequest, request_kwargs: Mapping[str, Any]) -> requests.Response:
+        """
+        Same as _send_request, waiting between retries without blocking the event loop
+        """
+        max_tries, max_time = self._get_backoff_limits()
+        user_backoff_handler = async_user_defined_backoff_handler(max_tries=max_tries, max_time=max_time)(self._send_async)
+        backoff_handler = default_backoff_handler(max_tries=max_tries, max_time=max_time, factor=self.retry_factor)
+        return await backoff_handler(user_backoff_handler)(request, request_kwargs)
+
+    def _get_backoff_limits(self) -> Tuple[Optional[int], Optional[int]]:
         """
         Backoff package has max_tries parameter that means total number of
         tries before giving up, so if this number is 0 no calls expected to be done.
@@ -405,10 +471,7 @@ class HttpStream(Stream, ABC):
         """
         if max_tries is not None:
             max_tries = max(0, max_tries) + 1
-
-        user_backoff_handler = user_defined_backoff_handler(max_tries=max_tries, max_time=max_time)(self._send)
-        backoff_handler = default_backoff_handler(max_tries=max_tries, max_time=max_time, factor=self.retry_factor)
-        return backoff_handler(user_backoff_handler)(request, request_kwargs)
+        return max_tries, max_time
 
     @classmethod
     def parse_response_error_message(cls, response: requests.Response) -> Optional[str]:
@@ -472,6 +535,39 @@ class HttpStream(Stream, ABC):
             lambda req, res, state, _slice: self.parse_response(res, stream_slice=_slice, stream_state=state), stream_slice, stream_state
         )
 
+    async def read_records_async(
+        self,
+        sync_mode: SyncMode,
+        cursor_field: Optional[List[str]] = None,
+        stream_slice: Optional[Mapping[str, Any]] = None,
+        stream_state: Optional[Mapping[str, Any]] = None,
+    ) -> AsyncIterator[StreamData]:
+        """
+        Reads the records of a slice like read_records does by default, sending the requests with the asynchronous transport of the stream,
+        so the requests of the slices and streams read from the same event loop are in flight at the same time. The requests are retried
+        the same way as the synchronous ones. The authenticator is called from the event loop, so the token refreshes of OAuth
+        authenticators block it while they run.
+        """
+        stream_state = stream_state or {}
+        pagination_complete = False
+        next_page_token = None
+        while not pagination_complete:
+            request, response = await self._fetch_next_page_async(stream_slice, stream_state, next_page_token)
+            for record in self.parse_response(response, stream_slice=stream_slice, stream_state=stream_state):
+                yield record
+
+            next_page_token = self.next_page_token(response)
+            if not next_page_token:
+                pagination_complete = True
+
+    async def close_async_http_transport(self) -> None:
+        """
+        Releases the connections of the asynchronous transport of the stream, if it was used
+        """
+        if self._async_http_transport is not None:
+            await self._async_http_transport.close()
+            self._async_http_transport = None
+
     def _read_pages(
         self,
         records_generator_fn: Callable[
@@ -481,25 +577,63 @@ class HttpStream(Stream, ABC):
         stream_state: Optional[Mapping[str, Any]] = None,
     ) -> Iterable[StreamData]:
         stream_state = stream_state or {}
+        pages = self._read_pages_one_by_one(records_generator_fn, stream_slice, stream_state)
+        if self.page_prefetch_depth > 0:
+            yield from PagePrefetcher[StreamData](self.page_prefetch_depth).read(pages)
+        else:
+            for page in pages:
+                yield from page
+
+        # Always return an empty generator just in case no records were ever yielded
+        yield from []
+
+    def _read_pages_one_by_one(
+        self,
+        records_generator_fn: Callable[
+            [requests.PreparedRequest, requests.Response, Mapping[str, Any], Optional[Mapping[str, Any]]], Iterable[StreamData]
+        ],
+        stream_slice: Optional[Mapping[str, Any]],
+        stream_state: Mapping[str, Any],
+    ) -> Iterator[Iterable[StreamData]]:
+        """
+        Yields the records of each page. The next page is requested once the records of the page are consumed
+        """
         pagination_complete = False
         next_page_token = None
         while not pagination_complete:
             request, response = self._fetch_next_page(stream_slice, stream_state, next_page_token)
-            yield from records_generator_fn(request, response, stream_state, stream_slice)
+            yield records_generator_fn(request, response, stream_state, stream_slice)
 
             next_page_token = self.next_page_token(response)
             if not next_page_token:
                 pagination_complete = True
 
-        # Always return an empty generator just in case no records were ever yielded
-        yield from []
-
     def _fetch_next_page(
         self,
         stream_slice: Optional[Mapping[str, Any]] = None,
         stream_state: Optional[Mapping[str, Any]] = None,
         next_page_token: Optional[Mapping[str, Any]] = None,
     ) -> Tuple[requests.PreparedRequest, requests.Response]:
+        request, request_kwargs = self._create_page_request(stream_slice, stream_state, next_page_token)
+        response = self._send_request(request, request_kwargs)
+        return request, response
+
+    async def _fetch_next_page_async(
+        self,
+        stream_slice: Optional[Mapping[str, Any]] = None,
+        stream_state: Optional[Mapping[str, Any]] = None,
+        next_page_token: Optional[Mapping[str, Any]] = None,
+    ) -> Tuple[requests.PreparedRequest, requests.Response]:
+        request, request_kwargs = self._create_page_request(stream_slice, stream_state, next_page_token)
+        response = await self._send_request_async(request, request_kwargs)
+        return request, response
+
+    def _create_page_request(
+        self,
+        stream_slice: Optional[Mapping[str, Any]] = None,
+        stream_state: Optional[Mapping[str, Any]] = None,
+        next_page_token: Optional[Mapping[str, Any]] = None,
+    ) -> Tuple[requests.PreparedRequest, Mapping[str, Any]]:
         request_headers = self.request_headers(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token)
         request = self._create_prepared_request(
             path=self.path(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
@@ -509,9 +643,7 @@ class HttpStream(Stream, ABC):
             data=self.request_body_data(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token),
         )
         request_kwargs = self.request_kwargs(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token)
-
-        response = self._send_request(request, request_kwargs)
-        return request, response
+        return request, request_kwargs
 
 
 class HttpSubStream(HttpStream, ABC):
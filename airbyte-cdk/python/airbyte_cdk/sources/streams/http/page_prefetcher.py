@@ -0,0 +1,85 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+from queue import Queue
+from typing import Any, Generic, Iterable, Iterator, List, TypeVar
+
+T = TypeVar("T")
+
+_DONE = object()
+
+
+class _Failure:
+    def __init__(self, exception: Exception):
+        self.exception = exception
+
+
+class PagePrefetcher(Generic[T]):
+    """
+    Requests the next pages of a paginated read in a background thread while the records of the current page are being read.
+
+    The pages are read from a generator which requests a page, yields its records and computes the token of the next page once they are
+    consumed, as the `_read_pages` loops do. The background thread consumes the records of each page as soon as the page is received, so
+    the token of the next page is computed and the next page requested while the records are read downstream. Up to `depth` pages are
+    requested ahead of the page being read.
+
+    Records are returned in the order of the pages, and an error raised while requesting or parsing a page is raised once the records
+    received before it are read, so retries and stop conditions behave as when reading the pages one after the other. If the records are
+    not read until the end, no other page is requested.
+    """
+
+    _POLL_INTERVAL_SECONDS = 0.1
+
+    def __init__(self, depth: int):
+        """
+        :param depth: The maximum number of pages requested ahead of the page being read
+        """
+        if depth < 1:
+            raise ValueError(f"The prefetch depth must be at least 1. Got {depth}")
+        self._depth = depth
+
+    def read(self, pages: Iterator[Iterable[T]]) -> Iterator[T]:
+        """
+        :param pages: Yields the records of each page. Advancing it requests the next page
+        """
+        queue: Queue[Any] = Queue()
+        pages_ahead = threading.Semaphore(self._depth)
+        stopped = threading.Event()
+
+        def fetch() -> None:
+            records: List[T] = []
+            try:
+                while self._acquire(pages_ahead, stopped):
+                    page = next(pages, _DONE)
+                    if page is _DONE:
+                        queue.put(_DONE)
+                        return
+                    records.extend(page)  # type: ignore  # page is not _DONE
+                    queue.put(records)
+                    records = []
+            except Exception as exc:
+                # The records parsed before the error are read first so the error is raised at the same position as without prefetching
+                if records:
+                    queue.put(records)
+                queue.put(_Failure(exc))
+
+        threading.Thread(target=fetch, name="page-prefetch", daemon=True).start()
+        try:
+            while True:
+                item = queue.get()
+                if item is _DONE:
+                    return
+                if isinstance(item, _Failure):
+                    raise item.exception
+                pages_ahead.release()
+                yield from item
+        finally:
+            stopped.set()
+
+    def _acquire(self, pages_ahead: threading.Semaphore, stopped: threading.Event) -> bool:
+        while not stopped.is_set():
+            if pages_ahead.acquire(timeout=self._POLL_INTERVAL_SECONDS):
+                return True
+        return False
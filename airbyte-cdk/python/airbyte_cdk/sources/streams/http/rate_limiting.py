@@ -2,10 +2,11 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import asyncio
 import logging
 import sys
 import time
-from typing import Any, Callable, Mapping, Optional
+from typing import Any, Awaitable, Callable, Mapping, Optional, TypeVar
 
 import backoff
 from requests import PreparedRequest, RequestException, Response, codes, exceptions
@@ -24,11 +25,17 @@ logger = logging.getLogger("airbyte")
 
 
 SendRequestCallableType = Callable[[PreparedRequest, Mapping[str, Any]], Response]
+AsyncSendRequestCallableType = Callable[[PreparedRequest, Mapping[str, Any]], Awaitable[Response]]
+SendRequestCallable = TypeVar("SendRequestCallable", SendRequestCallableType, AsyncSendRequestCallableType)
 
 
 def default_backoff_handler(
     max_tries: Optional[int], factor: float, max_time: Optional[int] = None, **kwargs: Any
-) -> Callable[[SendRequestCallableType], SendRequestCallableType]:
+) -> Callable[[SendRequestCallable], SendRequestCallable]:
+    """
+    Retries transient errors with an exponential backoff. Coroutines are retried as well, waiting with asyncio.sleep
+    """
+
     def log_retry_attempt(details: Mapping[str, Any]) -> None:
         _, exc, _ = sys.exc_info()
         if isinstance(exc, RequestException) and exc.response:
@@ -66,14 +73,42 @@ def user_defined_backoff_handler(
     max_tries: Optional[int], max_time: Optional[int] = None, **kwargs: Any
 ) -> Callable[[SendRequestCallableType], SendRequestCallableType]:
     def sleep_on_ratelimit(details: Mapping[str, Any]) -> None:
-        _, exc, _ = sys.exc_info()
-        if isinstance(exc, UserDefinedBackoffException):
-            if exc.response:
-                logger.info(f"Status code: {exc.response.status_code}, Response Content: {exc.response.content}")
-            retry_after = exc.backoff
-            logger.info(f"Retrying. Sleeping for {retry_after} seconds")
+        retry_after = _get_retry_after()
+        if retry_after is not None:
             time.sleep(retry_after + 1)  # extra second to cover any fractions of second
 
+    return _user_defined_backoff(sleep_on_ratelimit, max_tries, max_time, **kwargs)
+
+
+def async_user_defined_backoff_handler(
+    max_tries: Optional[int], max_time: Optional[int] = None, **kwargs: Any
+) -> Callable[[AsyncSendRequestCallableType], AsyncSendRequestCallableType]:
+    """
+    Same as user_defined_backoff_handler for coroutines: the event loop keeps sending other requests while waiting
+    """
+
+    async def sleep_on_ratelimit(details: Mapping[str, Any]) -> None:
+        retry_after = _get_retry_after()
+        if retry_after is not None:
+            await asyncio.sleep(retry_after + 1)  # extra second to cover any fractions of second
+
+    return _user_defined_backoff(sleep_on_ratelimit, max_tries, max_time, **kwargs)
+
+
+def _get_retry_after() -> Optional[float]:
+    _, exc, _ = sys.exc_info()
+    if isinstance(exc, UserDefinedBackoffException):
+        if exc.response:
+            logger.info(f"Status code: {exc.response.status_code}, Response Content: {exc.response.content}")
+        retry_after: float = exc.backoff
+        logger.info(f"Retrying. Sleeping for {retry_after} seconds")
+        return retry_after
+    return None
+
+
+def _user_defined_backoff(
+    sleep_on_ratelimit: Callable[[Mapping[str, Any]], Any], max_tries: Optional[int], max_time: Optional[int], **kwargs: Any
+) -> Callable[[SendRequestCallable], SendRequestCallable]:
     def log_give_up(details: Mapping[str, Any]) -> None:
         _, exc, _ = sys.exc_info()
         if isinstance(exc, RequestException):
@@ -3,11 +3,11 @@
 #
 
 import datetime
-from typing import Any, Mapping
+from typing import Any, List, Mapping
 
 from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, AirbyteRecordMessage, AirbyteTraceMessage
 from airbyte_cdk.models import Type as MessageType
-from airbyte_cdk.sources.streams.core import StreamData
+from airbyte_cdk.sources.streams.core import RecordBatch, StreamData, record_batch_to_list
 from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
 
 
@@ -28,11 +28,35 @@ def stream_data_to_airbyte_message(
         # taken unless configured. See
         # docs/connector-development/cdk-python/schemas.md for details.
         transformer.transform(data, schema)  # type: ignore
-        message = AirbyteRecordMessage(stream=stream_name, data=data, emitted_at=now_millis)
-        return AirbyteMessage(type=MessageType.RECORD, record=message)
+        # The fields are known to be valid so we skip the pydantic validation which is expensive given it is done for every record
+        message = AirbyteRecordMessage.construct(stream=stream_name, data=data, emitted_at=now_millis)
+        return AirbyteMessage.construct(type=MessageType.RECORD, record=message)
     elif isinstance(data_or_message, AirbyteTraceMessage):
         return AirbyteMessage(type=MessageType.TRACE, trace=data_or_message)
     elif isinstance(data_or_message, AirbyteLogMessage):
         return AirbyteMessage(type=MessageType.LOG, log=data_or_message)
     else:
         raise ValueError(f"Unexpected type for data_or_message: {type(data_or_message)}: {data_or_message}")
+
+
+def record_batch_to_airbyte_messages(
+    stream_name: str,
+    batch: RecordBatch,
+    transformer: TypeTransformer = TypeTransformer(TransformConfig.NoTransform),
+    schema: Mapping[str, Any] = None,
+) -> List[AirbyteMessage]:
+    """
+    Converts a batch of records to RECORD messages. The records are transformed the same way as by `stream_data_to_airbyte_message` but the
+    whole batch shares the same `emitted_at`.
+    """
+    if schema is None:
+        schema = {}
+
+    now_millis = int(datetime.datetime.now().timestamp() * 1000)
+    messages = []
+    for record_data in record_batch_to_list(batch):
+        data = dict(record_data)
+        transformer.transform(data, schema)  # type: ignore
+        message = AirbyteRecordMessage.construct(stream=stream_name, data=data, emitted_at=now_millis)
+        messages.append(AirbyteMessage.construct(type=MessageType.RECORD, record=message))
+    return messages
@@ -2,12 +2,16 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import json
 import logging
+from collections import deque
 from distutils.util import strtobool
 from enum import Flag, auto
-from typing import Any, Callable, Dict, Mapping, Optional
+from typing import Any, Callable, Deque, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import urljoin
 
-from jsonschema import Draft7Validator, ValidationError, validators
+from jsonschema import Draft7Validator, RefResolver, ValidationError, validators
+from jsonschema.exceptions import UndefinedTypeCheck, UnknownType
 
 json_to_python_simple = {"string": str, "number": float, "integer": int, "boolean": bool, "null": type(None)}
 json_to_python = {**json_to_python_simple, **{"object": dict, "array": list}}
@@ -15,6 +19,17 @@ python_to_json = {v: k for k, v in json_to_python.items()}
 
 logger = logging.getLogger("airbyte")
 
+# The path of a value within a record, as a linked list of (key, parent path) tuples so it is only materialized when an error is logged
+_Path = Optional[Tuple[Any, Any]]
+# Normalizes the value of a record in place, logging the values which don't match the schema
+_CompiledSchema = Callable[[Any, _Path], None]
+
+
+class _NotCompilableSchemaError(Exception):
+    """
+    Raised when a schema uses a construct the compiled normalization does not handle the same way as the jsonschema validator
+    """
+
 
 class TransformConfig(Flag):
     """
@@ -42,14 +57,27 @@ class TypeTransformer:
 
     _custom_normalizer: Optional[Callable[[Any, Dict[str, Any]], Any]] = None
 
-    def __init__(self, config: TransformConfig):
+    # Maximum number of compiled schemas kept in memory
+    MAX_COMPILED_SCHEMAS = 32
+
+    def __init__(self, config: TransformConfig, compiled: bool = True):
         """
         Initialize TypeTransformer instance.
         :param config Transform config that would be applied to object
+        :param compiled If set, schemas are compiled to a tree of converters the first time they are used, which is much faster than walking
+        the schema with the jsonschema validator for every record. The output is the same. Schemas using constructs the compiled mode does not
+        support, e.g. boolean subschemas or tuple validation, fall back to the validator. Compiled schemas are cached by content so streams
+        returning a new but equal schema for each record compile it only once. A schema must not be modified once it has been used to
+        transform records.
         """
         if TransformConfig.NoTransform in config and config != TransformConfig.NoTransform:
             raise Exception("NoTransform option cannot be combined with other flags.")
         self._config = config
+        self._compiled = compiled
+        # Keyed by the schema serialized with sorted keys
+        self._compiled_schemas: Dict[str, Optional[_CompiledSchema]] = {}
+        # The last schema used and its compiled schema, which saves serializing the schema when a stream reuses the same instance
+        self._last_compiled_schema: Optional[Tuple[Mapping[str, Any], Optional[_CompiledSchema]]] = None
         all_validators = {
             key: self.__get_normalizer(key, orig_validator)
             for key, orig_validator in Draft7Validator.VALIDATORS.items()
@@ -70,6 +98,8 @@ class TypeTransformer:
         if TransformConfig.CustomSchemaNormalization not in self._config:
             raise Exception("Please set TransformConfig.CustomSchemaNormalization config before registering custom normalizer")
         self._custom_normalizer = normalization_callback
+        self._compiled_schemas.clear()
+        self._last_compiled_schema = None
         return normalization_callback
 
     def __normalize(self, original_item: Any, subschema: Dict[str, Any]) -> Any:
@@ -180,6 +210,11 @@ class TypeTransformer:
         """
         if TransformConfig.NoTransform in self._config:
             return
+        if self._compiled:
+            compiled_schema = self.__get_compiled_schema(schema)
+            if compiled_schema is not None:
+                compiled_schema(record, None)
+                return
         normalizer = self._normalizer(schema)
         for e in normalizer.iter_errors(record):
             """
@@ -188,9 +223,284 @@ class TypeTransformer:
             """
             logger.warning(self.get_error_message(e))
 
+    def __get_compiled_schema(self, schema: Mapping[str, Any]) -> Optional[_CompiledSchema]:
+        last_compiled_schema = self._last_compiled_schema
+        if last_compiled_schema is not None and last_compiled_schema[0] is schema:
+            return last_compiled_schema[1]
+
+        try:
+            key: Optional[str] = json.dumps(schema, sort_keys=True)
+        except (TypeError, ValueError):
+            # Schemas which can't be serialized are compiled again each time they are used
+            key = None
+        if key is not None and key in self._compiled_schemas:
+            compiled_schema = self._compiled_schemas[key]
+        else:
+            compiled_schema = self.__compile_schema(schema)
+            if key is not None:
+                if len(self._compiled_schemas) >= self.MAX_COMPILED_SCHEMAS:
+                    self._compiled_schemas.clear()
+                self._compiled_schemas[key] = compiled_schema
+        self._last_compiled_schema = (schema, compiled_schema)
+        return compiled_schema
+
+    def __compile_schema(self, schema: Mapping[str, Any]) -> Optional[_CompiledSchema]:
+        try:
+            return _SchemaCompiler(self, schema).compile()
+        except Exception:
+            # Broken or unsupported schemas are handled by the validator which fails the same way as before, if it fails at all
+            return None
+
     def get_error_message(self, e: ValidationError) -> str:
         instance_json_type = python_to_json[type(e.instance)]
         key_path = "." + ".".join(map(str, e.path))
         return (
             f"Failed to transform value {repr(e.instance)} of type '{instance_json_type}' to '{e.validator_value}', key path: '{key_path}'"
         )
+
+
+class _SchemaCompiler:
+    """
+    Turns a schema into a tree of closures applying the same normalization as the jsonschema validator created by TypeTransformer: for each
+    `properties` or `items` keyword, the values of the instance are normalized against their subschema before being visited, and values not
+    matching a `type` keyword are logged. Every other keyword is ignored. The keywords of a subschema are applied in the same order as the
+    validator so warnings are logged in the same order too.
+    """
+
+    def __init__(self, transformer: TypeTransformer, schema: Mapping[str, Any]):
+        self._transformer = transformer
+        self._schema = schema
+        self._validator_class = transformer._normalizer
+        self._resolver = RefResolver.from_schema(schema, id_of=self._validator_class.ID_OF)
+        self._compiled: Dict[Tuple[int, str], _CompiledSchema] = {}
+
+    def compile(self) -> _CompiledSchema:
+        return self._compile(self._schema, self._resolver.resolution_scope)
+
+    def _compile(self, subschema: Any, scope: str) -> _CompiledSchema:
+        if not isinstance(subschema, dict):
+            raise _NotCompilableSchemaError(f"Unsupported subschema: {subschema}")
+        key = (id(subschema), scope)
+        if key in self._compiled:
+            return self._compiled[key]
+
+        steps: List[_CompiledSchema] = []
+
+        def apply_steps(instance: Any, path: _Path) -> None:
+            for step in steps:
+                step(instance, path)
+
+        # Registered before compiling the children so recursive schemas reference this node instead of being compiled forever
+        self._compiled[key] = apply_steps
+
+        schema_id = self._validator_class.ID_OF(subschema)
+        if schema_id:
+            scope = urljoin(scope, schema_id)
+        if "$ref" in subschema:
+            if subschema["$ref"] is None:
+                raise _NotCompilableSchemaError("$ref can't be null")
+            # Like the validator, any keyword next to $ref is ignored
+            ref_scope, resolved = self._resolve(subschema["$ref"], scope)
+            steps.append(self._compile(resolved, ref_scope))
+            return apply_steps
+
+        for keyword, value in subschema.items():
+            if keyword == "properties":
+                steps.append(self._compile_properties(value, scope))
+            elif keyword == "items":
+                steps.append(self._compile_items(value, scope))
+            elif keyword == "type":
+                steps.append(self._compile_type(value, subschema))
+        if len(steps) == 1:
+            # Saves a function call for each value. Recursive references to this node still go through apply_steps which is equivalent
+            self._compiled[key] = steps[0]
+            return steps[0]
+        return apply_steps
+
+    def _compile_properties(self, properties: Any, scope: str) -> _CompiledSchema:
+        if not isinstance(properties, dict):
+            raise _NotCompilableSchemaError(f"Unsupported properties: {properties}")
+        normalizers = []
+        children = []
+        for name, subschema in properties.items():
+            normalizer = self._compile_normalizer(self._resolve_for_normalization(subschema, scope))
+            if normalizer is not None:
+                normalizers.append((name, normalizer))
+            children.append((name, self._compile(subschema, scope)))
+
+        def apply_properties(instance: Any, path: _Path) -> None:
+            if not isinstance(instance, dict):
+                return
+            for name, normalize in normalizers:
+                if name in instance:
+                    instance[name] = normalize(instance[name])
+            for name, child in children:
+                if name in instance:
+                    child(instance[name], (name, path))
+
+        return apply_properties
+
+    def _compile_items(self, items: Any, scope: str) -> _CompiledSchema:
+        if not isinstance(items, dict):
+            raise _NotCompilableSchemaError(f"Unsupported items: {items}")
+        normalize = self._compile_normalizer(self._resolve_for_normalization(items, scope))
+        child = self._compile(items, scope)
+
+        def apply_items(instance: Any, path: _Path) -> None:
+            if not isinstance(instance, list):
+                return
+            if normalize is not None:
+                for index, item in enumerate(instance):
+                    instance[index] = normalize(item)
+            for index, item in enumerate(instance):
+                child(item, (index, path))
+
+        return apply_items
+
+    def _compile_type(self, types: Any, subschema: Mapping[str, Any]) -> _CompiledSchema:
+        expected_types = [types] if isinstance(types, str) else types
+        if not isinstance(expected_types, list):
+            raise _NotCompilableSchemaError(f"Unsupported type: {types}")
+        type_checks = [self._compile_type_check(expected_type) for expected_type in expected_types]
+        transformer = self._transformer
+
+        def check_type(instance: Any, path: _Path) -> None:
+            for type_check in type_checks:
+                if type_check(instance):
+                    return
+            error = ValidationError(
+                f"{instance!r} is not of type {', '.join(repr(expected_type) for expected_type in expected_types)}",
+                validator="type",
+                validator_value=types,
+                instance=instance,
+                schema=subschema,
+                path=_materialize_path(path),
+            )
+            logger.warning(transformer.get_error_message(error))
+
+        return check_type
+
+    def _compile_type_check(self, expected_type: Any) -> Callable[[Any], bool]:
+        type_checker = self._validator_class.TYPE_CHECKER
+        root_schema = self._schema
+        try:
+            type_checker.is_type(None, expected_type)
+        except (UndefinedTypeCheck, TypeError):
+
+            def check_unknown_type(instance: Any) -> bool:
+                # The validator only fails once it checks a value against the unknown type
+                raise UnknownType(expected_type, instance, root_schema)
+
+            return check_unknown_type
+        return lambda instance: type_checker.is_type(instance, expected_type)  # type: ignore  # is_type is not annotated
+
+    def _compile_normalizer(self, subschema: Any) -> Optional[Callable[[Any], Any]]:
+        """
+        :return: A function equivalent to TypeTransformer.__normalize for the subschema, or None if the normalization never changes the value
+        """
+        converters = []
+        if TransformConfig.DefaultSchemaNormalization in self._transformer._config:
+            default_converter = self._compile_default_converter(subschema)
+            if default_converter is not None:
+                converters.append(default_converter)
+        custom_normalizer = self._transformer._custom_normalizer
+        if custom_normalizer:
+            converters.append(lambda value: custom_normalizer(value, subschema))
+
+        if not converters:
+            return None
+        if len(converters) == 1:
+            return converters[0]
+        first_converter, second_converter = converters
+        return lambda value: second_converter(first_converter(value))
+
+    def _compile_default_converter(self, subschema: Any) -> Optional[Callable[[Any], Any]]:
+        """
+        :return: A function equivalent to TypeTransformer.default_convert for the subschema, or None if it never changes the value
+        """
+        default_convert = type(self._transformer).default_convert
+        generic_converter = lambda value: default_convert(value, subschema)  # noqa: E731
+        if default_convert is not TypeTransformer.default_convert or not isinstance(subschema, dict):
+            return generic_converter
+        target_type = subschema.get("type", [])
+        if not isinstance(target_type, (str, list)):
+            return generic_converter
+
+        nullable = "null" in target_type
+        if isinstance(target_type, list):
+            target_type = [t for t in target_type if t != "null"]
+            if len(target_type) != 1:
+                return None
+            target_type = target_type[0]
+
+        convert: Callable[[Any], Any]
+        # Values which already have this type are returned as is since the conversion would return an equal value
+        converted_type: Optional[type] = None
+        if target_type == "string":
+            convert, converted_type = str, str
+        elif target_type == "number":
+            convert, converted_type = float, float
+        elif target_type == "integer":
+            convert, converted_type = int, int
+        elif target_type == "boolean":
+            convert, converted_type = _to_boolean, bool
+        elif target_type == "array":
+            items = subschema.get("items", {})
+            if not isinstance(items, dict):
+                return generic_converter
+            try:
+                item_types = set(items.get("type", set()))
+            except TypeError:
+                return generic_converter
+            if not item_types.issubset(json_to_python_simple):
+                return None
+            convert = _wrap_simple_value_in_list
+        else:
+            return None
+
+        def convert_value(value: Any) -> Any:
+            if type(value) is converted_type:
+                return value
+            if value is None and nullable:
+                return None
+            try:
+                return convert(value)
+            except (ValueError, TypeError):
+                return value
+
+        return convert_value
+
+    def _resolve(self, ref: str, scope: str) -> Tuple[str, Any]:
+        self._resolver.push_scope(scope)
+        try:
+            return self._resolver.resolve(ref)  # type: ignore  # resolve returns a (url, resolved) tuple
+        finally:
+            self._resolver.pop_scope()
+
+    def _resolve_for_normalization(self, subschema: Any, scope: str) -> Any:
+        # Like the validator, a single level of $ref is resolved to find the subschema values are normalized against
+        if not isinstance(subschema, dict):
+            raise _NotCompilableSchemaError(f"Unsupported subschema: {subschema}")
+        if "$ref" in subschema:
+            return self._resolve(subschema["$ref"], scope)[1]
+        return subschema
+
+
+def _materialize_path(path: _Path) -> Deque[Any]:
+    keys: Deque[Any] = deque()
+    while path is not None:
+        key, path = path
+        keys.appendleft(key)
+    return keys
+
+
+def _to_boolean(value: Any) -> bool:
+    if isinstance(value, str):
+        return strtobool(value) == 1
+    return bool(value)
+
+
+def _wrap_simple_value_in_list(value: Any) -> Any:
+    if type(value) in json_to_python_simple.values():
+        return [value]
+    return value
@@ -3,3 +3,5 @@
 #
 
 ENV_REQUEST_CACHE_PATH = "REQUEST_CACHE_PATH"
+ENV_MESSAGE_SERIALIZATION_MODE = "AIRBYTE_MESSAGE_SERIALIZATION_MODE"
+ENV_MANIFEST_CACHE_PATH = "AIRBYTE_MANIFEST_CACHE_PATH"
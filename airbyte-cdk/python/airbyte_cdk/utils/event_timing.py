@@ -32,12 +32,17 @@ class EventTimer:
         self.count += 1
         self.stack.insert(0, self.events[name])
 
-    def finish_event(self):
+    def finish_event(self, name=None):
         """
         Finish the current event and pop it from the stack.
+        :param name: Finish this event instead of the current one, for events which don't follow a LIFO pattern
         """
 
-        if self.stack:
+        if name is not None and name in self.events and self.events[name] in self.stack:
+            event = self.events[name]
+            self.stack.remove(event)
+            event.finish()
+        elif name is None and self.stack:
             event = self.stack.pop(0)
             event.finish()
         else:
@@ -70,6 +75,9 @@ class Event:
         return float("+inf")
 
     def __str__(self):
+        if not self.end:
+            # Events being timed in other threads are reported before they finish
+            return f"{self.name} not finished"
         return f"{self.name} {datetime.timedelta(seconds=self.duration)}"
 
     def finish(self):
@@ -0,0 +1,106 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import json
+import logging
+import re
+from typing import Any, BinaryIO, Iterable, Optional, TextIO, Union
+
+from airbyte_cdk.models import AirbyteMessage, AirbyteRecordMessage, Type
+from pydantic import ValidationError
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger("airbyte")
+
+_RECORD_REQUIRED_FIELDS = frozenset({"stream", "data", "emitted_at"})
+
+
+# orjson deserializes integers over 64 bits as floats, so lines which could contain one are deserialized with the stdlib json module
+_LONG_NUMBER = re.compile(rb"[0-9]{19}")
+
+
+def _loads(line: bytes) -> Any:
+    if orjson is not None and not _LONG_NUMBER.search(line):
+        try:
+            return orjson.loads(line)
+        except ValueError:
+            # orjson is stricter than the stdlib json module (e.g. NaN) so we fall back on the latter
+            pass
+    return json.loads(line)
+
+
+class AirbyteMessageReader:
+    """
+    Parses the AirbyteMessages sent by the platform on stdin, one JSON document per line.
+
+    The input is read in large binary chunks that are split on newlines without being decoded to str, then each line is decoded using orjson
+    if it is installed. RECORD messages are built using `construct`, which skips the pydantic validation, unless `validate_records` is set.
+    Every other message type goes through the pydantic model validation. Lines which can't be deserialized as AirbyteMessages are logged and
+    ignored.
+
+    Text streams, such as the io.TextIOWrapper destinations used to read stdin with, are accepted as well: their chunks are encoded back to
+    UTF-8 before being split.
+    """
+
+    DEFAULT_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+
+    def __init__(self, validate_records: bool = False, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self._validate_records = validate_records
+        self._chunk_size = chunk_size
+
+    def read(self, input_stream: Union[BinaryIO, TextIO]) -> Iterable[AirbyteMessage]:
+        for line in self._split_lines(input_stream):
+            message = self._parse(line)
+            if message is not None:
+                yield message
+
+    def _split_lines(self, input_stream: Union[BinaryIO, TextIO]) -> Iterable[bytes]:
+        # read1 returns as soon as some bytes are available so messages are not held back until a full chunk has been received
+        read_chunk = getattr(input_stream, "read1", input_stream.read)
+        remainder = b""
+        while True:
+            chunk = read_chunk(self._chunk_size)
+            if not chunk:
+                break
+            if isinstance(chunk, str):
+                chunk = chunk.encode("utf-8")
+            lines = chunk.split(b"\n")
+            if remainder:
+                lines[0] = remainder + lines[0]
+            remainder = lines.pop()
+            yield from lines
+        if remainder:
+            yield remainder
+
+    def _parse(self, line: bytes) -> Optional[AirbyteMessage]:
+        try:
+            raw_message = _loads(line)
+        except ValueError:
+            self._log_ignored_input(line)
+            return None
+
+        if not self._validate_records and self._is_well_formed_record(raw_message):
+            record = AirbyteRecordMessage.construct(**raw_message["record"])
+            return AirbyteMessage.construct(**{**raw_message, "type": Type.RECORD, "record": record})
+
+        try:
+            return AirbyteMessage.parse_obj(raw_message)
+        except ValidationError:
+            self._log_ignored_input(line)
+            return None
+
+    @staticmethod
+    def _is_well_formed_record(raw_message: Any) -> bool:
+        if not isinstance(raw_message, dict) or raw_message.get("type") != Type.RECORD.value:
+            return False
+        record = raw_message.get("record")
+        return isinstance(record, dict) and _RECORD_REQUIRED_FIELDS <= record.keys() and isinstance(record["data"], dict)
+
+    @staticmethod
+    def _log_ignored_input(line: bytes) -> None:
+        logger.info(f"ignoring input which can't be deserialized as Airbyte Message: {line.decode('utf-8', errors='replace')}")
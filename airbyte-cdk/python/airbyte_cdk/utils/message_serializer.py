@@ -0,0 +1,91 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import json
+import logging
+import os
+from enum import Enum
+from typing import Any, Dict, Optional
+
+from airbyte_cdk.models import AirbyteMessage, Type
+from airbyte_cdk.utils.constants import ENV_MESSAGE_SERIALIZATION_MODE
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger("airbyte")
+
+_RECORD_MESSAGE_FIELDS = frozenset({"type", "record"})
+
+
+class SerializationMode(Enum):
+    """
+    PYDANTIC: every message goes through `AirbyteMessage.json(exclude_unset=True)`.
+    JSON: RECORD messages are dumped straight from the record data with the stdlib json module. The output is byte-identical
+      to the PYDANTIC mode.
+    ORJSON: like JSON but dumps RECORD messages with orjson. The output is the same JSON document but in orjson's compact
+      representation (no whitespace between tokens, non-ASCII characters are not escaped). Falls back to JSON if orjson is not
+      installed.
+    """
+
+    PYDANTIC = "pydantic"
+    JSON = "json"
+    ORJSON = "orjson"
+
+
+class AirbyteMessageSerializer:
+    """
+    Serializes AirbyteMessages to the JSON strings emitted on stdout.
+
+    RECORD messages are the vast majority of the messages emitted by a sync, so they bypass the pydantic machinery and their
+    envelope is written directly from the record dict. Every other message type is serialized using pydantic.
+    """
+
+    def __init__(self, mode: SerializationMode = SerializationMode.JSON):
+        if mode == SerializationMode.ORJSON and orjson is None:
+            logger.warning("orjson is not installed. Falling back to json serialization of records.")
+            mode = SerializationMode.JSON
+        self._mode = mode
+
+    @classmethod
+    def from_environment(cls) -> "AirbyteMessageSerializer":
+        mode = os.environ.get(ENV_MESSAGE_SERIALIZATION_MODE, SerializationMode.JSON.value)
+        return cls(SerializationMode(mode.casefold()))
+
+    @property
+    def mode(self) -> SerializationMode:
+        return self._mode
+
+    def serialize(self, message: AirbyteMessage) -> str:
+        if self._mode != SerializationMode.PYDANTIC:
+            record_envelope = self._record_envelope(message)
+            if record_envelope is not None:
+                return self._dumps(record_envelope)
+        return message.json(exclude_unset=True)
+
+    def _dumps(self, envelope: Dict[str, Any]) -> str:
+        if self._mode == SerializationMode.ORJSON:
+            try:
+                return orjson.dumps(envelope, default=AirbyteMessage.__json_encoder__, option=orjson.OPT_NON_STR_KEYS).decode()
+            except TypeError:
+                # orjson is stricter than the stdlib json module (e.g. integers over 64 bits) so we fall back on the latter
+                pass
+        return json.dumps(envelope, default=AirbyteMessage.__json_encoder__)
+
+    @staticmethod
+    def _record_envelope(message: AirbyteMessage) -> Optional[Dict[str, Any]]:
+        """
+        Builds the dict that `message.json(exclude_unset=True)` would dump for a RECORD message. Only the fields that were set are
+        kept and the fields keep their declaration order. Returns None if the message is not a plain RECORD message.
+        """
+        if message.type != Type.RECORD or message.__fields_set__ != _RECORD_MESSAGE_FIELDS:
+            return None
+        record = message.record
+        fields_set = record.__fields_set__
+        return {
+            "type": Type.RECORD.value,
+            "record": {name: value for name, value in record.__dict__.items() if name in fields_set},
+        }
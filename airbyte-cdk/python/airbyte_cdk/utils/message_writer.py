@@ -0,0 +1,74 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import sys
+import time
+from types import TracebackType
+from typing import List, Optional, TextIO, Type
+
+# Serialized messages always start with their type, see `AirbyteMessageSerializer` and `AirbyteMessage.json`
+_STATE_MESSAGE_PREFIXES = ('{"type": "STATE"', '{"type":"STATE"')
+
+
+class BufferedMessageWriter:
+    """
+    Writes serialized AirbyteMessages to stdout in batches instead of printing them one at a time.
+
+    Messages are accumulated in memory and the buffer is encoded and written in one go to the binary buffer underlying the output stream
+    when it grows over `max_buffer_size` bytes or when a message is written more than `max_buffer_age` seconds after the last flush. To
+    preserve checkpointing semantics, the buffer is always flushed right after a STATE message so the state is never held back once it is
+    emitted, as well as when the writer is closed.
+
+    The buffer age is only checked when a message is written: while the source is not emitting, buffered messages stay in memory until the
+    next write, the next STATE message or the end of the sync.
+    """
+
+    DEFAULT_MAX_BUFFER_SIZE = 1024 * 1024  # 1 MiB
+    DEFAULT_MAX_BUFFER_AGE = 1.0  # in seconds
+
+    def __init__(
+        self,
+        output: Optional[TextIO] = None,
+        max_buffer_size: int = DEFAULT_MAX_BUFFER_SIZE,
+        max_buffer_age: float = DEFAULT_MAX_BUFFER_AGE,
+    ):
+        self._output = output if output is not None else sys.stdout
+        self._max_buffer_size = max_buffer_size
+        self._max_buffer_age = max_buffer_age
+        self._buffer: List[str] = []
+        self._buffer_size = 0
+        self._last_flush = time.monotonic()
+
+    def write(self, message: str) -> None:
+        self._buffer.append(message)
+        # The size is counted in characters which is a close enough approximation of the encoded size for JSON
+        self._buffer_size += len(message) + 1
+        if (
+            self._buffer_size >= self._max_buffer_size
+            or message.startswith(_STATE_MESSAGE_PREFIXES)
+            or time.monotonic() - self._last_flush >= self._max_buffer_age
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        if self._buffer:
+            data = "\n".join(self._buffer) + "\n"
+            self._buffer.clear()
+            self._buffer_size = 0
+            binary_output = getattr(self._output, "buffer", None)
+            if binary_output is None:
+                self._output.write(data)
+                self._output.flush()
+            else:
+                # Logs are still printed directly to the text stream so it needs to be flushed first to keep the lines from being interleaved
+                self._output.flush()
+                binary_output.write(data.encode("utf-8"))
+                binary_output.flush()
+        self._last_flush = time.monotonic()
+
+    def __enter__(self) -> "BufferedMessageWriter":
+        return self
+
+    def __exit__(self, exc_type: Optional[Type[BaseException]], exc_val: Optional[BaseException], exc_tb: Optional[TracebackType]) -> None:
+        self.flush()
@@ -0,0 +1,115 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Measures the duration of reading the slices of an HttpStream with read_records, one slice after the other, and with read_records_async,
+all the slices from the same event loop. Requests are sent to a local aiohttp server which waits a fixed latency before each response.
+
+Usage: python benchmarks/benchmark_async_http.py [--slices 200] [--latency 0.05]
+"""
+
+import argparse
+import asyncio
+import threading
+import time
+from typing import Any, Iterable, List, Mapping, Optional
+
+import requests
+from aiohttp import web
+from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.streams.http import HttpStream
+from airbyte_cdk.sources.streams.http.async_transport import AiohttpTransport, AsyncHttpTransport
+
+
+class SlicedHttpStream(HttpStream):
+    primary_key = None
+
+    def __init__(self, url_base: str, number_of_slices: int, transport: AsyncHttpTransport):
+        super().__init__()
+        self._url_base = url_base
+        self._number_of_slices = number_of_slices
+        self._transport = transport
+
+    @property
+    def url_base(self) -> str:
+        return self._url_base
+
+    def path(self, **kwargs: Any) -> str:
+        return "items"
+
+    def request_params(self, stream_slice: Optional[Mapping[str, Any]] = None, **kwargs: Any) -> Mapping[str, Any]:
+        return stream_slice or {}
+
+    def stream_slices(self, **kwargs: Any) -> Iterable[Optional[Mapping[str, Any]]]:
+        return [{"slice": i} for i in range(self._number_of_slices)]
+
+    def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
+        return None
+
+    def parse_response(self, response: requests.Response, **kwargs: Any) -> Iterable[Mapping[str, Any]]:
+        yield from response.json()["items"]
+
+    def create_async_http_transport(self) -> AsyncHttpTransport:
+        return self._transport
+
+
+def start_server(latency: float) -> str:
+    async def items(request: web.Request) -> web.Response:
+        await asyncio.sleep(latency)
+        return web.json_response({"items": [{"slice": request.query["slice"], "id": i} for i in range(10)]})
+
+    started = threading.Event()
+    urls: List[str] = []
+
+    def serve() -> None:
+        loop = asyncio.new_event_loop()
+        app = web.Application()
+        app.router.add_get("/items", items)
+        runner = web.AppRunner(app)
+        loop.run_until_complete(runner.setup())
+        site = web.TCPSite(runner, "localhost", 0)
+        loop.run_until_complete(site.start())
+        port = site._server.sockets[0].getsockname()[1]  # type: ignore
+        urls.append(f"http://localhost:{port}/")
+        started.set()
+        loop.run_forever()
+
+    threading.Thread(target=serve, daemon=True).start()
+    started.wait()
+    return urls[0]
+
+
+async def read_all_slices_async(stream: HttpStream) -> int:
+    async def read_slice(stream_slice: Optional[Mapping[str, Any]]) -> int:
+        return len([record async for record in stream.read_records_async(SyncMode.full_refresh, stream_slice=stream_slice)])
+
+    counts = await asyncio.gather(*(read_slice(stream_slice) for stream_slice in stream.stream_slices(sync_mode=SyncMode.full_refresh)))
+    await stream.close_async_http_transport()
+    return sum(counts)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--slices", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds waited by the server before each response")
+    args = parser.parse_args()
+
+    url_base = start_server(args.latency)
+    stream = SlicedHttpStream(url_base, args.slices, AiohttpTransport())
+
+    start = time.perf_counter()
+    records = sum(
+        1
+        for stream_slice in stream.stream_slices(sync_mode=SyncMode.full_refresh)
+        for _ in stream.read_records(SyncMode.full_refresh, stream_slice=stream_slice)
+    )
+    print(f"read_records: read {records} records of {args.slices} slices in {time.perf_counter() - start:.2f}s")
+
+    start = time.perf_counter()
+    records = asyncio.run(read_all_slices_async(stream))
+    print(f"read_records_async: read {records} records of {args.slices} slices in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Measures the time and the number of rate limited responses when several streams read the same API at the same time, without an API budget
+and with an API budget shared by the streams. The API is simulated: it allows a number of calls per fixed window and returns 429 with a
+Retry-After header until the end of the window once the limit is hit, as many APIs do. Without a budget, the streams send requests until
+they are rate limited then back off; with a budget, the requests wait locally for their turn and are never rejected.
+
+Usage: python benchmarks/benchmark_call_rate.py [--streams 4] [--pages 25] [--calls-per-second 20]
+"""
+
+import argparse
+import datetime
+import json
+import logging
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterable, List, Mapping, Optional
+from unittest.mock import patch
+
+import requests
+from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.streams.call_rate import AbstractAPIBudget, FixedWindowCallRatePolicy, HttpAPIBudget
+from airbyte_cdk.sources.streams.http import HttpStream
+
+
+class SimulatedAPI:
+    def __init__(self, calls_per_second: int):
+        self._calls_per_second = calls_per_second
+        self._lock = threading.Lock()
+        self._window = -1
+        self._calls_in_window = 0
+        self.rate_limited_responses = 0
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        response = requests.Response()
+        response.request = request
+        with self._lock:
+            now = time.monotonic()
+            window = math.floor(now)
+            if window != self._window:
+                self._window = window
+                self._calls_in_window = 0
+            if self._calls_in_window >= self._calls_per_second:
+                self.rate_limited_responses += 1
+                response.status_code = 429
+                response.headers["Retry-After"] = str(window + 1 - now)
+                return response
+            self._calls_in_window += 1
+            calls_left = self._calls_per_second - self._calls_in_window
+        response.status_code = 200
+        response.headers["X-RateLimit-Remaining"] = str(calls_left)
+        response.headers["X-RateLimit-Reset"] = str(window + 1 - now)
+        response._content = json.dumps({"records": [{"id": 1}]}).encode()
+        return response
+
+
+class PaginatedStream(HttpStream):
+    url_base = "https://api.example.com/"
+    primary_key = "id"
+
+    def __init__(self, pages: int, api_budget: Optional[AbstractAPIBudget]):
+        super().__init__(api_budget=api_budget)
+        self._pages = pages
+
+    def path(self, **kwargs: Any) -> str:
+        return "records"
+
+    def request_params(self, next_page_token: Optional[Mapping[str, Any]] = None, **kwargs: Any) -> Mapping[str, Any]:
+        return next_page_token or {"page": 1}
+
+    def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
+        page = int(response.request.url.split("page=")[1])
+        return {"page": page + 1} if page < self._pages else None
+
+    def parse_response(self, response: requests.Response, **kwargs: Any) -> Iterable[Mapping[str, Any]]:
+        yield from response.json()["records"]
+
+    def backoff_time(self, response: requests.Response) -> Optional[float]:
+        retry_after = response.headers.get("Retry-After")
+        return float(retry_after) if retry_after else None
+
+    @property
+    def max_retries(self) -> Optional[int]:
+        return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--streams", type=int, default=4)
+    parser.add_argument("--pages", type=int, default=25, help="The number of pages, so of requests, of each stream")
+    parser.add_argument("--calls-per-second", type=int, default=20, help="The rate limit of the simulated API")
+    args = parser.parse_args()
+    # The backoff logs of the streams are printed on stdout with the results otherwise
+    logging.disable(logging.INFO)
+
+    for use_budget in [False, True]:
+        api = SimulatedAPI(args.calls_per_second)
+        api_budget = (
+            HttpAPIBudget(
+                policies=[FixedWindowCallRatePolicy(period=datetime.timedelta(seconds=1), call_limit=args.calls_per_second, matchers=[])]
+            )
+            if use_budget
+            else None
+        )
+        streams: List[PaginatedStream] = [PaginatedStream(args.pages, api_budget) for _ in range(args.streams)]
+        with patch.object(requests.Session, "send", side_effect=api.send), ThreadPoolExecutor(max_workers=args.streams) as executor:
+            start = time.perf_counter()
+            records = sum(executor.map(lambda stream: sum(1 for _ in stream.read_records(SyncMode.full_refresh)), streams))
+            elapsed = time.perf_counter() - start
+        print(
+            f"{'with' if use_budget else 'without'} API budget: read {records} records in {elapsed:.2f}s, "
+            f"{api.rate_limited_responses} rate limited responses"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Measures the record throughput of a ThreadBasedConcurrentStream as the number of partitions grows. Every partition returns the same number
+of records so the throughput should not depend on the number of partitions.
+
+Usage: python benchmarks/benchmark_concurrent_stream_partitions.py [--partitions 1000 10000 50000] [--records-per-partition 10]
+"""
+
+import argparse
+import logging
+import time
+from typing import Any, Iterable, Mapping, Optional
+
+from airbyte_cdk.sources.message import NoopMessageRepository
+from airbyte_cdk.sources.streams.concurrent.availability_strategy import STREAM_AVAILABLE, AbstractAvailabilityStrategy, StreamAvailability
+from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
+from airbyte_cdk.sources.streams.concurrent.partitions.partition_generator import PartitionGenerator
+from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
+from airbyte_cdk.sources.streams.concurrent.thread_based_concurrent_stream import ThreadBasedConcurrentStream
+from airbyte_cdk.sources.utils.slice_logger import DebugSliceLogger
+
+
+class AlwaysAvailableStrategy(AbstractAvailabilityStrategy):
+    def check_availability(self, logger: logging.Logger) -> StreamAvailability:
+        return STREAM_AVAILABLE
+
+
+class SyntheticPartition(Partition):
+    def __init__(self, partition_id: int, number_of_records: int):
+        self._partition_id = partition_id
+        self._number_of_records = number_of_records
+
+    def read(self) -> Iterable[Record]:
+        for record_id in range(self._number_of_records):
+            yield Record({"partition": self._partition_id, "id": record_id})
+
+    def to_slice(self) -> Optional[Mapping[str, Any]]:
+        return {"partition": self._partition_id}
+
+    def __hash__(self) -> int:
+        return hash(self._partition_id)
+
+
+class SyntheticPartitionGenerator(PartitionGenerator):
+    def __init__(self, number_of_partitions: int, records_per_partition: int):
+        self._number_of_partitions = number_of_partitions
+        self._records_per_partition = records_per_partition
+
+    def generate(self) -> Iterable[Partition]:
+        for partition_id in range(self._number_of_partitions):
+            yield SyntheticPartition(partition_id, self._records_per_partition)
+
+
+def run(number_of_partitions: int, records_per_partition: int, max_workers: int) -> None:
+    logger = logging.getLogger("benchmark")
+    stream = ThreadBasedConcurrentStream(
+        partition_generator=SyntheticPartitionGenerator(number_of_partitions, records_per_partition),
+        max_workers=max_workers,
+        name="synthetic",
+        json_schema={},
+        availability_strategy=AlwaysAvailableStrategy(),
+        primary_key=[],
+        cursor_field=None,
+        slice_logger=DebugSliceLogger(),
+        logger=logger,
+        message_repository=NoopMessageRepository(),
+    )
+    start = time.perf_counter()
+    number_of_records = sum(1 for _ in stream.read())
+    elapsed = time.perf_counter() - start
+    print(f"{number_of_partitions:>8} partitions: {number_of_records / elapsed:>12,.0f} records/sec ({elapsed:.2f}s)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--partitions", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    parser.add_argument("--records-per-partition", type=int, default=10)
+    parser.add_argument("--max-workers", type=int, default=10)
+    args = parser.parse_args()
+
+    for number_of_partitions in args.partitions:
+        run(number_of_partitions, args.records_per_partition, args.max_workers)
+
+
+if __name__ == "__main__":
+    main()
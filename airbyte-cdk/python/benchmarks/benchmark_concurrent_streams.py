@@ -0,0 +1,90 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Measures the duration of AbstractSource.read on a catalog of independent streams as max_concurrent_streams grows. Every stream reads a few
+pages of records and waits a fixed latency before each page, as if it was waiting for the responses of an API.
+
+Usage: python benchmarks/benchmark_concurrent_streams.py [--streams 40] [--pages 5] [--latency 0.05] [--max-concurrent-streams 1 4 10]
+"""
+
+import argparse
+import logging
+import time
+from typing import Any, Iterable, List, Mapping, Optional, Tuple
+
+from airbyte_cdk.models import ConfiguredAirbyteCatalog, ConfiguredAirbyteStream, DestinationSyncMode, SyncMode
+from airbyte_cdk.models import Type as MessageType
+from airbyte_cdk.sources import AbstractSource
+from airbyte_cdk.sources.streams import Stream
+
+
+class LatencyBoundStream(Stream):
+    primary_key = None
+
+    def __init__(self, name: str, pages: int, latency: float):
+        self._name = name
+        self._pages = pages
+        self._latency = latency
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def read_records(self, *args: Any, **kwargs: Any) -> Iterable[Mapping[str, Any]]:
+        for page in range(self._pages):
+            time.sleep(self._latency)
+            for record_id in range(100):
+                yield {"page": page, "id": record_id}
+
+    def get_json_schema(self) -> Mapping[str, Any]:
+        return {}
+
+
+class BenchmarkSource(AbstractSource):
+    def __init__(self, streams: List[Stream], max_concurrent_streams: int):
+        self._streams = streams
+        self._max_concurrent_streams = max_concurrent_streams
+
+    def check_connection(self, logger: logging.Logger, config: Mapping[str, Any]) -> Tuple[bool, Optional[Any]]:
+        return True, None
+
+    def streams(self, config: Mapping[str, Any]) -> List[Stream]:
+        return self._streams
+
+    @property
+    def max_concurrent_streams(self) -> int:
+        return self._max_concurrent_streams
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--streams", type=int, default=40)
+    parser.add_argument("--pages", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds waited before each page")
+    parser.add_argument("--max-concurrent-streams", type=int, nargs="+", default=[1, 4, 10])
+    args = parser.parse_args()
+
+    logger = logging.getLogger("benchmark")
+    logger.setLevel(logging.WARNING)
+    streams: List[Stream] = [LatencyBoundStream(f"stream_{i}", args.pages, args.latency) for i in range(args.streams)]
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(
+                stream=stream.as_airbyte_stream(), sync_mode=SyncMode.full_refresh, destination_sync_mode=DestinationSyncMode.overwrite
+            )
+            for stream in streams
+        ]
+    )
+
+    for max_concurrent_streams in args.max_concurrent_streams:
+        source = BenchmarkSource(streams, max_concurrent_streams)
+        start = time.perf_counter()
+        records = sum(1 for message in source.read(logger, {}, catalog) if message.type == MessageType.RECORD)
+        elapsed = time.perf_counter() - start
+        print(f"max_concurrent_streams={max_concurrent_streams}: read {records} records of {args.streams} streams in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Measures the throughput of CsvParser.parse_records and CsvParser.infer_schema with the csv module and with the pyarrow engine. The file
+has integer, number, boolean, string and nullable columns and is served from memory, so only decoding and casting are measured.
+
+Usage: python benchmarks/benchmark_csv_parser.py [--rows 1000000]
+"""
+
+import argparse
+import asyncio
+import datetime
+import io
+import time
+from typing import Any, Mapping
+from unittest.mock import Mock
+
+from airbyte_cdk.sources.file_based.config.csv_format import CsvFormat, InferenceType
+from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
+from airbyte_cdk.sources.file_based.file_based_stream_reader import FileReadMode
+from airbyte_cdk.sources.file_based.file_types import CsvParser
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+
+SCHEMA: Mapping[str, Any] = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "integer"},
+        "score": {"type": "number"},
+        "active": {"type": "boolean"},
+        "name": {"type": "string"},
+        "updated_at": {"type": "string"},
+        "comment": {"type": ["null", "string"]},
+    },
+}
+
+
+def generate_file(number_of_rows: int) -> bytes:
+    lines = ["id,score,active,name,updated_at,comment"]
+    for i in range(number_of_rows):
+        comment = "" if i % 3 else f'"a comment, with a delimiter {i}"'
+        lines.append(f"{i},{i / 7},{'true' if i % 2 else 'false'},name {i % 1000},2023-01-01T00:00:{i % 60:02d}Z,{comment}")
+    return "\n".join(lines).encode("utf8")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    data = generate_file(args.rows)
+    stream_reader = Mock()
+    stream_reader.open_file.side_effect = lambda file, mode, encoding, logger: (
+        io.BytesIO(data) if mode == FileReadMode.READ_BINARY else io.TextIOWrapper(io.BytesIO(data), encoding=encoding)
+    )
+    config = FileBasedStreamConfig(
+        name="benchmark", file_type="csv", format=CsvFormat(null_values={""}, inference_type=InferenceType.PRIMITIVE_TYPES_ONLY)
+    )
+    file = RemoteFile(uri="benchmark.csv", last_modified=datetime.datetime.now())
+
+    for engine, use_arrow_engine in [("csv", False), ("pyarrow", True)]:
+        csv_parser = CsvParser(use_arrow_engine=use_arrow_engine)
+
+        start = time.perf_counter()
+        rows = sum(1 for _ in csv_parser.parse_records(config, file, stream_reader, Mock(), SCHEMA))
+        elapsed = time.perf_counter() - start
+        print(f"{engine}: parsed {rows} rows in {elapsed:.2f}s: {rows / elapsed:,.0f} rows/s")
+
+        start = time.perf_counter()
+        asyncio.run(csv_parser.infer_schema(config, file, stream_reader, Mock()))
+        print(f"{engine}: inferred the schema in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Measures the time to read an incremental declarative stream with one slice per day, with and without a concurrency level. The API is
+simulated: each request waits for the given latency then returns a page of records, so the concurrency of the requests is what is measured.
+
+Usage: python benchmarks/benchmark_declarative_concurrency.py [--days 60] [--latency 0.1] [--concurrency-level 8]
+"""
+
+import argparse
+import datetime
+import json
+import logging
+import time
+from typing import Any, Mapping, Optional
+from unittest.mock import patch
+
+import requests
+from airbyte_cdk.models import AirbyteStream, ConfiguredAirbyteCatalog, ConfiguredAirbyteStream, DestinationSyncMode, SyncMode, Type
+from airbyte_cdk.sources.declarative.manifest_declarative_source import ManifestDeclarativeSource
+from airbyte_cdk.sources.declarative.retrievers.simple_retriever import SimpleRetriever
+
+
+def build_manifest(days: int, concurrency_level: Optional[int]) -> Mapping[str, Any]:
+    end_date = datetime.date(2023, 1, 1) + datetime.timedelta(days=days - 1)
+    manifest = {
+        "version": "0.34.2",
+        "type": "DeclarativeSource",
+        "check": {"type": "CheckStream", "stream_names": ["benchmark"]},
+        "streams": [
+            {
+                "type": "DeclarativeStream",
+                "name": "benchmark",
+                "primary_key": [],
+                "schema_loader": {"type": "InlineSchemaLoader", "schema": {"type": "object", "properties": {}}},
+                "incremental_sync": {
+                    "type": "DatetimeBasedCursor",
+                    "cursor_field": "updated_at",
+                    "datetime_format": "%Y-%m-%d",
+                    "start_datetime": "2023-01-01",
+                    "end_datetime": end_date.isoformat(),
+                    "step": "P1D",
+                    "cursor_granularity": "P1D",
+                },
+                "retriever": {
+                    "type": "SimpleRetriever",
+                    "requester": {"type": "HttpRequester", "url_base": "https://example.com", "path": "/records", "http_method": "GET"},
+                    "record_selector": {"type": "RecordSelector", "extractor": {"type": "DpathExtractor", "field_path": ["records"]}},
+                    "paginator": {"type": "NoPagination"},
+                },
+            }
+        ],
+        "spec": {"connection_specification": {"type": "object", "properties": {}}, "type": "Spec"},
+    }
+    if concurrency_level:
+        manifest["concurrency_level"] = {"type": "ConcurrencyLevel", "default_concurrency": concurrency_level}
+    return manifest
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--days", type=int, default=60)
+    parser.add_argument("--latency", type=float, default=0.1, help="The time in seconds each simulated request takes")
+    parser.add_argument("--concurrency-level", type=int, default=8)
+    args = parser.parse_args()
+
+    def fetch_page(stream_state: Any, stream_slice: Any, next_page_token: Any) -> requests.Response:
+        time.sleep(args.latency)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps({"records": [{"updated_at": stream_slice["start_time"], "id": i} for i in range(100)]}).encode()
+        response.request = requests.Request("GET", "https://example.com/records").prepare()
+        return response
+
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(
+                stream=AirbyteStream(name="benchmark", json_schema={}, supported_sync_modes=[SyncMode.incremental]),
+                sync_mode=SyncMode.incremental,
+                destination_sync_mode=DestinationSyncMode.append,
+            )
+        ]
+    )
+    logger = logging.getLogger("airbyte")
+    # The logs of the sync are printed on stdout with the results otherwise
+    logger.setLevel(logging.WARNING)
+    for concurrency_level in [None, args.concurrency_level]:
+        source = ManifestDeclarativeSource(source_config=build_manifest(args.days, concurrency_level))
+        with patch.object(SimpleRetriever, "_fetch_next_page", side_effect=fetch_page):
+            start = time.perf_counter()
+            records = sum(1 for message in source.read(logger, {}, catalog, None) if message.type == Type.RECORD)
+            elapsed = time.perf_counter() - start
+        print(f"concurrency level {concurrency_level or 1}: read {records} records in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
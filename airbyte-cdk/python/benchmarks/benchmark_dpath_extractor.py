@@ -0,0 +1,60 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Measures the time and the peak memory allocated by DpathExtractor.extract_records on a generated page of records, with the JsonDecoder
+and with the JsonStreamingDecoder, next to the time dpath.util.get takes to look up the records in the decoded page. The page is served
+from memory, so only decoding and extraction are measured.
+
+Usage: python benchmarks/benchmark_dpath_extractor.py [--records 100000]
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+
+import dpath.util
+import requests
+from airbyte_cdk.sources.declarative.decoders import JsonDecoder, JsonStreamingDecoder
+from airbyte_cdk.sources.declarative.extractors import DpathExtractor
+
+
+def generate_page(number_of_records: int) -> bytes:
+    records = [
+        {"id": i, "name": f"name {i}", "score": i / 7, "tags": ["a", "b", "c"], "address": {"city": "city", "zip": f"{i % 100000:05d}"}}
+        for i in range(number_of_records)
+    ]
+    return json.dumps({"meta": {"count": number_of_records, "next": "cursor"}, "data": records}).encode("utf-8")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=100_000)
+    args = parser.parse_args()
+
+    response = requests.Response()
+    response._content = generate_page(args.records)
+    print(f"page of {len(response.content) / 1024 / 1024:.1f} MiB")
+
+    start = time.perf_counter()
+    dpath.util.get(response.json(), ["data"])
+    print(f"json.loads + dpath.util.get: {time.perf_counter() - start:.2f}s")
+
+    for decoder in [JsonDecoder(parameters={}), JsonStreamingDecoder(parameters={})]:
+        extractor = DpathExtractor(field_path=["data"], config={}, decoder=decoder, parameters={})
+        tracemalloc.start()
+        start = time.perf_counter()
+        records = extractor.extract_records(response)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f"{type(decoder).__name__}: extracted {len(records)} records in {elapsed:.2f}s, peak allocations {peak / 1024 / 1024:.0f} MiB"
+        )
+        del records
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Measures the time taken by DefaultFileBasedCursor to select the files to sync and to record them once synced, with a full history. The
+state is emitted after each file as DefaultFileBasedStream does.
+
+Usage: python benchmarks/benchmark_file_based_cursor.py [--history-size 10000] [--files 20000]
+"""
+
+import argparse
+import logging
+import time
+from datetime import datetime, timedelta
+
+from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
+from airbyte_cdk.sources.file_based.config.jsonl_format import JsonlFormat
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+from airbyte_cdk.sources.file_based.stream.cursor import DefaultFileBasedCursor
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--history-size", type=int, default=DefaultFileBasedCursor.DEFAULT_MAX_HISTORY_SIZE)
+    parser.add_argument("--files", type=int, default=20_000)
+    args = parser.parse_args()
+
+    DefaultFileBasedCursor.DEFAULT_MAX_HISTORY_SIZE = args.history_size
+    cursor = DefaultFileBasedCursor(FileBasedStreamConfig(name="benchmark", file_type="jsonl", format=JsonlFormat()))
+    start_date = datetime(2023, 1, 1)
+    cursor.set_initial_state(
+        {
+            "history": {
+                f"history_{i}.jsonl": (start_date + timedelta(seconds=i)).strftime(DefaultFileBasedCursor.DATE_TIME_FORMAT)
+                for i in range(args.history_size)
+            }
+        }
+    )
+    # Half of the files are already in the history, the other half were modified since
+    files = [
+        RemoteFile(
+            uri=f"history_{i}.jsonl" if i % 2 else f"new_{i}.jsonl",
+            last_modified=start_date + timedelta(seconds=i if i % 2 else args.history_size + i),
+        )
+        for i in range(args.files)
+    ]
+
+    start = time.perf_counter()
+    files_to_sync = list(cursor.get_files_to_sync(files, logging.getLogger("benchmark")))
+    selected = time.perf_counter() - start
+    for file in files_to_sync:
+        cursor.add_file(file)
+        cursor.get_state()
+    elapsed = time.perf_counter() - start
+    print(f"selected {len(files_to_sync)} of {len(files)} files in {selected:.2f}s, synced them in {elapsed - selected:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Measures the time taken to infer the schema of a file-based stream for different values of `n_concurrent_requests`. The files are JSONL
+files served from memory by a stream reader which sleeps before opening each of them to simulate the latency of an object store.
+
+Usage: python benchmarks/benchmark_file_based_discover.py [--files 100] [--records-per-file 1000] [--latency 0.05] [--concurrency 1 5 10 20]
+"""
+
+import argparse
+import io
+import json
+import logging
+import time
+from datetime import datetime
+from io import IOBase
+from typing import Iterable, List, Optional
+from unittest.mock import Mock
+
+from airbyte_cdk.sources.file_based.config.abstract_file_based_spec import AbstractFileBasedSpec
+from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
+from airbyte_cdk.sources.file_based.config.jsonl_format import JsonlFormat
+from airbyte_cdk.sources.file_based.discovery_policy import AbstractDiscoveryPolicy
+from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFileBasedStreamReader, FileReadMode
+from airbyte_cdk.sources.file_based.file_types import JsonlParser
+from airbyte_cdk.sources.file_based.file_types.file_type_parser import FileTypeParser
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+from airbyte_cdk.sources.file_based.schema_validation_policies import DEFAULT_SCHEMA_VALIDATION_POLICIES
+from airbyte_cdk.sources.file_based.stream import DefaultFileBasedStream
+from airbyte_cdk.sources.file_based.stream.cursor import DefaultFileBasedCursor
+
+
+class SlowInMemoryStreamReader(AbstractFileBasedStreamReader):
+    def __init__(self, number_of_files: int, records_per_file: int, latency: float):
+        super().__init__()
+        self._latency = latency
+        self._files = [RemoteFile(uri=f"file_{i}.jsonl", last_modified=datetime(2023, 1, 1)) for i in range(number_of_files)]
+        self._content = "\n".join(
+            json.dumps({"id": i, "name": f"name {i}", "score": i / 3, "active": i % 2 == 0, "tags": None}) for i in range(records_per_file)
+        )
+
+    @property
+    def config(self) -> Optional[AbstractFileBasedSpec]:
+        return self._config
+
+    @config.setter
+    def config(self, value: AbstractFileBasedSpec) -> None:
+        self._config = value
+
+    def get_matching_files(self, globs: List[str], prefix: Optional[str], logger: logging.Logger) -> Iterable[RemoteFile]:
+        return self._files
+
+    def open_file(self, file: RemoteFile, mode: FileReadMode, encoding: Optional[str], logger: logging.Logger) -> IOBase:
+        time.sleep(self._latency)
+        return io.StringIO(self._content)
+
+
+class FixedDiscoveryPolicy(AbstractDiscoveryPolicy):
+    def __init__(self, n_concurrent_requests: int, max_n_files: int):
+        self._n_concurrent_requests = n_concurrent_requests
+        self._max_n_files = max_n_files
+
+    @property
+    def n_concurrent_requests(self) -> int:
+        return self._n_concurrent_requests
+
+    def get_max_n_files_for_schema_inference(self, parser: FileTypeParser) -> int:
+        return self._max_n_files
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=100)
+    parser.add_argument("--records-per-file", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds slept before opening each file")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 5, 10, 20])
+    args = parser.parse_args()
+
+    stream_reader = SlowInMemoryStreamReader(args.files, args.records_per_file, args.latency)
+    config = FileBasedStreamConfig(name="benchmark", file_type="jsonl", format=JsonlFormat(), globs=["*.jsonl"])
+    for n_concurrent_requests in args.concurrency:
+        stream = DefaultFileBasedStream(
+            config=config,
+            catalog_schema=None,
+            stream_reader=stream_reader,
+            availability_strategy=Mock(),
+            discovery_policy=FixedDiscoveryPolicy(n_concurrent_requests, args.files),
+            parsers={JsonlFormat: JsonlParser()},
+            validation_policy=DEFAULT_SCHEMA_VALIDATION_POLICIES[config.validation_policy],
+            cursor=DefaultFileBasedCursor(config),
+        )
+        start = time.perf_counter()
+        schema = stream.get_json_schema()
+        elapsed = time.perf_counter() - start
+        print(
+            f"n_concurrent_requests={n_concurrent_requests}: inferred {len(schema['properties'])} columns from {args.files} files in {elapsed:.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
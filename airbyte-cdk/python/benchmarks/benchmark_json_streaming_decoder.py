@@ -0,0 +1,109 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Measures the time until the first record, the total time and the peak memory allocated when a SimpleRetriever reads a large page with the
+JsonDecoder and with the JsonStreamingDecoder. The page is served by a local HTTP server so the streaming decoder reads the response while
+it is received. The records are counted and dropped as they are read, as the source would write them to stdout.
+
+The peak memory is measured with tracemalloc in a separate read since tracing the allocations slows the decoding down.
+
+Usage: python benchmarks/benchmark_json_streaming_decoder.py [--records 500000]
+"""
+
+import argparse
+import json
+import threading
+import time
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Mapping, Optional, Tuple
+
+from airbyte_cdk.sources.declarative.models.declarative_component_schema import SimpleRetriever as SimpleRetrieverModel
+from airbyte_cdk.sources.declarative.parsers.model_to_component_factory import ModelToComponentFactory
+from airbyte_cdk.sources.declarative.retrievers import SimpleRetriever
+
+
+def generate_page(number_of_records: int) -> bytes:
+    records = [
+        {"id": i, "name": f"name {i}", "score": i / 7, "tags": ["a", "b", "c"], "address": {"city": "city", "zip": f"{i % 100000:05d}"}}
+        for i in range(number_of_records)
+    ]
+    return json.dumps({"meta": {"count": number_of_records}, "data": records}).encode("utf-8")
+
+
+def serve(page: bytes) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(page)))
+            self.end_headers()
+            self.wfile.write(page)
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def create_retriever(url_base: str, decoder: Mapping[str, Any]) -> SimpleRetriever:
+    retriever = ModelToComponentFactory().create_component(
+        model_type=SimpleRetrieverModel,
+        component_definition={
+            "type": "SimpleRetriever",
+            "record_selector": {
+                "type": "RecordSelector",
+                "extractor": {"type": "DpathExtractor", "field_path": ["data"], "decoder": decoder},
+            },
+            "requester": {"type": "HttpRequester", "url_base": url_base, "path": "/page"},
+        },
+        config={},
+        name="benchmark",
+        primary_key="id",
+        stream_slicer=None,
+        transformations=[],
+    )
+    assert isinstance(retriever, SimpleRetriever)
+    return retriever
+
+
+def read(retriever: SimpleRetriever) -> Tuple[int, Optional[float], float]:
+    start = time.perf_counter()
+    first_record_latency = None
+    number_of_records = 0
+    for _ in retriever.read_records(stream_slice={}):
+        if first_record_latency is None:
+            first_record_latency = time.perf_counter() - start
+        number_of_records += 1
+    return number_of_records, first_record_latency, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=500_000)
+    args = parser.parse_args()
+
+    page = generate_page(args.records)
+    print(f"page of {len(page) / 1024 / 1024:.1f} MiB")
+    server = serve(page)
+    url_base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    for decoder in [{"type": "JsonDecoder"}, {"type": "JsonStreamingDecoder"}]:
+        number_of_records, first_record_latency, elapsed = read(create_retriever(url_base, decoder))
+        tracemalloc.start()
+        read(create_retriever(url_base, decoder))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f"{decoder['type']:>20}: {number_of_records} records, first record after {first_record_latency or 0:.2f}s, "
+            f"{elapsed:.2f}s in total, peak memory {peak / 1024 / 1024:,.1f} MiB"
+        )
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Measures the throughput of JsonlParser.parse_records on a file with one JSON object per line and on the same objects pretty-printed over
+several lines. The files are served from memory so only splitting and decoding the documents are measured.
+
+Usage: python benchmarks/benchmark_jsonl_parser.py [--records 100000] [--keys-per-record 20]
+"""
+
+import argparse
+import io
+import json
+import time
+from unittest.mock import MagicMock, Mock
+
+from airbyte_cdk.sources.file_based.file_types import JsonlParser
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=100_000)
+    parser.add_argument("--keys-per-record", type=int, default=20)
+    args = parser.parse_args()
+
+    records = [
+        {f"key_{key}": f"value {i} {key}" if key % 2 else i * key for key in range(args.keys_per_record)} for i in range(args.records)
+    ]
+    for layout, indent in [("one object per line", None), ("multiline objects", 2)]:
+        content = "\n".join(json.dumps(record, indent=indent) for record in records)
+        stream_reader = MagicMock()
+        stream_reader.open_file.return_value.__enter__.side_effect = lambda: io.StringIO(content)
+
+        start = time.perf_counter()
+        parsed = sum(1 for _ in JsonlParser().parse_records(Mock(), Mock(), stream_reader, Mock(), None))
+        elapsed = time.perf_counter() - start
+        print(
+            f"{layout}: parsed {parsed} records ({len(content) / 1024 / 1024:.0f} MiB) in {elapsed:.2f}s: {parsed / elapsed:,.0f} records/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
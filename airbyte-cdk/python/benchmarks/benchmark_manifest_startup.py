@@ -0,0 +1,113 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Measures the startup time of ManifestDeclarativeSource: creating the source from a manifest then creating the streams of a catalog, as
+every spec, check, discover and read invocation does. Each invocation runs in a new process, without a compiled manifest cache then with
+one, the first invocation filling the cache. The manifest has generated streams sharing definitions through references.
+
+Usage: python benchmarks/benchmark_manifest_startup.py [--streams 100] [--catalog-streams 1] [--invocations 5]
+"""
+
+import argparse
+import copy
+import multiprocessing
+import tempfile
+import time
+from typing import Any, List, Mapping, Optional
+
+from airbyte_cdk.models import AirbyteStream, ConfiguredAirbyteCatalog, ConfiguredAirbyteStream, DestinationSyncMode, SyncMode
+from airbyte_cdk.sources.declarative.manifest_declarative_source import ManifestDeclarativeSource
+from airbyte_cdk.sources.declarative.parsers.compiled_manifest_cache import CompiledManifestCache
+
+_BASE_STREAM = {
+    "type": "DeclarativeStream",
+    "primary_key": "id",
+    "schema_loader": {"type": "InlineSchemaLoader", "schema": {"type": "object", "properties": {"id": {"type": "integer"}}}},
+    "incremental_sync": {
+        "type": "DatetimeBasedCursor",
+        "cursor_field": "updated_at",
+        "datetime_format": "%Y-%m-%d",
+        "start_datetime": "{{ config['start_date'] }}",
+        "step": "P30D",
+        "cursor_granularity": "P1D",
+    },
+    "retriever": {
+        "type": "SimpleRetriever",
+        "requester": {"$ref": "#/definitions/requester"},
+        "record_selector": {"type": "RecordSelector", "extractor": {"type": "DpathExtractor", "field_path": ["data"]}},
+        "paginator": {
+            "type": "DefaultPaginator",
+            "page_token_option": {"type": "RequestOption", "inject_into": "request_parameter", "field_name": "cursor"},
+            "pagination_strategy": {"type": "CursorPagination", "cursor_value": "{{ response.next }}"},
+        },
+    },
+}
+
+
+def build_manifest(number_of_streams: int) -> Mapping[str, Any]:
+    streams = []
+    for i in range(number_of_streams):
+        stream = copy.deepcopy(_BASE_STREAM)
+        stream["$parameters"] = {"name": f"stream_{i}", "path": f"/stream_{i}"}
+        streams.append(stream)
+    return {
+        "version": "0.50.0",
+        "type": "DeclarativeSource",
+        "definitions": {
+            "requester": {
+                "type": "HttpRequester",
+                "url_base": "https://example.com",
+                "path": "{{ parameters.path }}",
+                "authenticator": {"type": "BearerAuthenticator", "api_token": "{{ config['api_key'] }}"},
+            }
+        },
+        "check": {"type": "CheckStream", "stream_names": ["stream_0"]},
+        "streams": streams,
+        "spec": {"connection_specification": {"type": "object", "properties": {}}, "type": "Spec"},
+    }
+
+
+def invoke(manifest: Mapping[str, Any], catalog_streams: List[str], cache_directory: Optional[str], durations: Any) -> None:
+    start = time.perf_counter()
+    cache = CompiledManifestCache(cache_directory) if cache_directory else None
+    source = ManifestDeclarativeSource(source_config=manifest, compiled_manifest_cache=cache)
+    # Set as ManifestDeclarativeSource.read does, so only the streams of the catalog are created without reading them
+    source._configured_catalog = ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(
+                stream=AirbyteStream(name=name, json_schema={}, supported_sync_modes=[SyncMode.full_refresh]),
+                sync_mode=SyncMode.full_refresh,
+                destination_sync_mode=DestinationSyncMode.append,
+            )
+            for name in catalog_streams
+        ]
+    )
+    source.streams({"api_key": "key", "start_date": "2023-01-01"})
+    durations.put(time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--streams", type=int, default=100)
+    parser.add_argument("--catalog-streams", type=int, default=1, help="The number of streams of the catalog being read")
+    parser.add_argument("--invocations", type=int, default=5)
+    args = parser.parse_args()
+
+    manifest = build_manifest(args.streams)
+    catalog_streams = [f"stream_{i}" for i in range(args.catalog_streams)]
+    with tempfile.TemporaryDirectory() as cache_directory:
+        for name, directory in [("no cache", None), ("compiled manifest cache", cache_directory)]:
+            durations: Any = multiprocessing.Queue()
+            for _ in range(args.invocations):
+                # Each invocation runs in a new process, as the connector does, so nothing is shared in memory between invocations
+                process = multiprocessing.Process(target=invoke, args=(manifest, catalog_streams, directory, durations))
+                process.start()
+                process.join()
+            times = [durations.get() for _ in range(args.invocations)]
+            print(f"{name}: first invocation {times[0]:.3f}s, following invocations {min(times[1:] or times):.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Compares the throughput of printing messages one at a time with the throughput of the BufferedMessageWriter used by `launch`.
+
+Usage: python benchmarks/benchmark_message_writer.py [--records 1000000] [--output /dev/null]
+"""
+
+import argparse
+import io
+import time
+from typing import Callable, Iterable
+
+from airbyte_cdk.sources.utils.record_helper import stream_data_to_airbyte_message
+from airbyte_cdk.utils.message_serializer import AirbyteMessageSerializer
+from airbyte_cdk.utils.message_writer import BufferedMessageWriter
+
+
+def synthetic_messages(number_of_records: int) -> Iterable[str]:
+    serializer = AirbyteMessageSerializer()
+    message = serializer.serialize(
+        stream_data_to_airbyte_message("synthetic", {"id": 1, "name": "airbyte", "updated_at": "2023-01-01T00:00:00Z", "amount": 12.5})
+    )
+    for _ in range(number_of_records):
+        yield message
+
+
+def print_messages(output: io.TextIOWrapper, messages: Iterable[str]) -> None:
+    for message in messages:
+        print(message, file=output, flush=True)
+
+
+def buffered_messages(output: io.TextIOWrapper, messages: Iterable[str]) -> None:
+    with BufferedMessageWriter(output) as writer:
+        for message in messages:
+            writer.write(message)
+
+
+def run(name: str, write: Callable[[io.TextIOWrapper, Iterable[str]], None], output_path: str, number_of_records: int) -> None:
+    with open(output_path, "wb") as binary_output:
+        output = io.TextIOWrapper(binary_output, encoding="utf-8")
+        start = time.perf_counter()
+        write(output, synthetic_messages(number_of_records))
+        output.flush()
+        elapsed = time.perf_counter() - start
+    print(f"{name:>10}: {number_of_records / elapsed:>12,.0f} messages/sec ({elapsed:.2f}s)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--records", type=int, default=1_000_000)
+    parser.add_argument("--output", type=str, default="/dev/null")
+    args = parser.parse_args()
+
+    run("print", print_messages, args.output, args.records)
+    run("buffered", buffered_messages, args.output, args.records)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Measures the duration of reading the pages of an HttpStream as the page prefetch depth grows. Each request waits a fixed latency, as if it
+was waiting for the response of an API, and each record is serialized as an AirbyteMessage the way records are sent downstream.
+
+Usage: python benchmarks/benchmark_page_prefetch.py [--pages 50] [--records-per-page 2000] [--latency 0.05] [--depths 0 1 2]
+"""
+
+import argparse
+import time
+from typing import Any, Iterable, Mapping, Optional
+
+import requests
+from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.streams.http import HttpStream
+from airbyte_cdk.sources.utils.record_helper import stream_data_to_airbyte_message
+from airbyte_cdk.utils.message_serializer import AirbyteMessageSerializer
+
+
+class LatencyBoundHttpStream(HttpStream):
+    url_base = "https://example.com/"
+    primary_key = None
+
+    def __init__(self, pages: int, records_per_page: int, latency: float, depth: int):
+        super().__init__()
+        self._pages = pages
+        self._records_per_page = records_per_page
+        self._latency = latency
+        self._depth = depth
+
+    @property
+    def page_prefetch_depth(self) -> int:
+        return self._depth
+
+    def path(self, **kwargs: Any) -> str:
+        return "items"
+
+    def _send_request(self, request: requests.PreparedRequest, request_kwargs: Mapping[str, Any]) -> requests.Response:
+        time.sleep(self._latency)
+        response = requests.Response()
+        response.status_code = 200
+        response.url = str(request.url)
+        return response
+
+    def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
+        page = int(response.url.rsplit("=", 1)[-1]) if "page=" in response.url else 0
+        return {"page": page + 1} if page + 1 < self._pages else None
+
+    def request_params(self, next_page_token: Optional[Mapping[str, Any]] = None, **kwargs: Any) -> Mapping[str, Any]:
+        return next_page_token or {}
+
+    def parse_response(self, response: requests.Response, **kwargs: Any) -> Iterable[Mapping[str, Any]]:
+        for i in range(self._records_per_page):
+            yield {"id": i, "name": f"record {i}", "updated_at": "2023-01-01T00:00:00Z"}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=50)
+    parser.add_argument("--records-per-page", type=int, default=2000)
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds waited by each request")
+    parser.add_argument("--depths", type=int, nargs="+", default=[0, 1, 2])
+    args = parser.parse_args()
+
+    serializer = AirbyteMessageSerializer()
+    for depth in args.depths:
+        stream = LatencyBoundHttpStream(args.pages, args.records_per_page, args.latency, depth)
+        start = time.perf_counter()
+        records = 0
+        for record in stream.read_records(SyncMode.full_refresh):
+            serializer.serialize(stream_data_to_airbyte_message(stream.name, record))
+            records += 1
+        print(f"page_prefetch_depth={depth}: read {records} records of {args.pages} pages in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Measures the time to read a declarative stream paginated with PageIncrement, requesting the pages one after the other and requesting up to
+max_concurrent_pages pages at the same time, with and without a total count. The API is simulated: each request waits for the given latency
+then returns a page of records, so the concurrency of the requests is what is measured.
+
+Usage: python benchmarks/benchmark_paginator_fan_out.py [--pages 100] [--latency 0.05] [--max-concurrent-pages 8]
+"""
+
+import argparse
+import json
+import logging
+import time
+from typing import Any, Mapping, Optional
+from unittest.mock import patch
+
+import requests
+from airbyte_cdk.models import AirbyteStream, ConfiguredAirbyteCatalog, ConfiguredAirbyteStream, DestinationSyncMode, SyncMode, Type
+from airbyte_cdk.sources.declarative.manifest_declarative_source import ManifestDeclarativeSource
+from airbyte_cdk.sources.declarative.requesters.http_requester import HttpRequester
+
+PAGE_SIZE = 100
+
+
+def build_manifest(max_concurrent_pages: int, total_count: Optional[str]) -> Mapping[str, Any]:
+    paginator = {
+        "type": "DefaultPaginator",
+        "page_token_option": {"type": "RequestOption", "inject_into": "request_parameter", "field_name": "page"},
+        "pagination_strategy": {"type": "PageIncrement", "page_size": PAGE_SIZE, "start_from_page": 1},
+        "max_concurrent_pages": max_concurrent_pages,
+    }
+    if total_count:
+        paginator["total_count"] = total_count
+    return {
+        "version": "0.34.2",
+        "type": "DeclarativeSource",
+        "check": {"type": "CheckStream", "stream_names": ["benchmark"]},
+        "streams": [
+            {
+                "type": "DeclarativeStream",
+                "name": "benchmark",
+                "primary_key": [],
+                "schema_loader": {"type": "InlineSchemaLoader", "schema": {"type": "object", "properties": {}}},
+                "retriever": {
+                    "type": "SimpleRetriever",
+                    "requester": {"type": "HttpRequester", "url_base": "https://example.com", "path": "/records", "http_method": "GET"},
+                    "record_selector": {"type": "RecordSelector", "extractor": {"type": "DpathExtractor", "field_path": ["records"]}},
+                    "paginator": paginator,
+                },
+            }
+        ],
+        "spec": {"connection_specification": {"type": "object", "properties": {}}, "type": "Spec"},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.05, help="The time in seconds each simulated request takes")
+    parser.add_argument("--max-concurrent-pages", type=int, default=8)
+    args = parser.parse_args()
+    # The last page isn't full so the pagination stops there without a total count
+    total_records = args.pages * PAGE_SIZE - 1
+
+    def send_request(**kwargs: Any) -> requests.Response:
+        time.sleep(args.latency)
+        page = kwargs["request_params"].get("page", 1)
+        response = requests.Response()
+        response.status_code = 200
+        ids = range((page - 1) * PAGE_SIZE, min(page * PAGE_SIZE, total_records))
+        response._content = json.dumps({"records": [{"id": i} for i in ids], "total": total_records}).encode()
+        response.request = requests.Request("GET", "https://example.com/records").prepare()
+        return response
+
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(
+                stream=AirbyteStream(name="benchmark", json_schema={}, supported_sync_modes=[SyncMode.full_refresh]),
+                sync_mode=SyncMode.full_refresh,
+                destination_sync_mode=DestinationSyncMode.overwrite,
+            )
+        ]
+    )
+    logger = logging.getLogger("airbyte")
+    # The logs of the sync are printed on stdout with the results otherwise
+    logger.setLevel(logging.WARNING)
+    for max_concurrent_pages, total_count in [
+        (1, None),
+        (args.max_concurrent_pages, None),
+        (args.max_concurrent_pages, "{{ response.total }}"),
+    ]:
+        source = ManifestDeclarativeSource(source_config=build_manifest(max_concurrent_pages, total_count))
+        with patch.object(HttpRequester, "send_request", side_effect=send_request) as send_request_mock:
+            start = time.perf_counter()
+            records = sum(1 for message in source.read(logger, {}, catalog, None) if message.type == Type.RECORD)
+            elapsed = time.perf_counter() - start
+        print(
+            f"max concurrent pages {max_concurrent_pages}, total count {'set' if total_count else 'not set'}: "
+            f"read {records} records with {send_request_mock.call_count} requests in {elapsed:.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Measures the throughput and the peak memory usage of ParquetParser.parse_records on a generated file. The file has integer, float, string,
+timestamp, decimal and boolean columns, spread across several row groups. It is written to a temporary directory once and read from disk.
+
+Usage: python benchmarks/benchmark_parquet_parser.py [--rows 10000000] [--batch-size 10000] [--projected]
+"""
+
+import argparse
+import datetime
+import decimal
+import multiprocessing
+import os
+import resource
+import tempfile
+import time
+from typing import Any, Mapping, Optional
+from unittest.mock import Mock
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
+from airbyte_cdk.sources.file_based.config.parquet_format import ParquetFormat
+from airbyte_cdk.sources.file_based.file_types import ParquetParser
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+
+_CHUNK_SIZE = 1_000_000
+
+
+def write_file(path: str, number_of_rows: int) -> None:
+    schema = pa.schema(
+        [
+            ("id", pa.int64()),
+            ("score", pa.float64()),
+            ("name", pa.string()),
+            ("updated_at", pa.timestamp("ms")),
+            ("amount", pa.decimal128(10, 2)),
+            ("active", pa.bool_()),
+        ]
+    )
+    with pq.ParquetWriter(path, schema) as writer:
+        for start in range(0, number_of_rows, _CHUNK_SIZE):
+            ids = range(start, min(start + _CHUNK_SIZE, number_of_rows))
+            writer.write_table(
+                pa.table(
+                    {
+                        "id": pa.array(ids, type=pa.int64()),
+                        "score": pa.array([i / 7 for i in ids], type=pa.float64()),
+                        "name": pa.array([f"name {i % 1000}" for i in ids], type=pa.string()),
+                        "updated_at": pa.array(
+                            [datetime.datetime(2023, 1, 1) + datetime.timedelta(seconds=i) for i in ids], type=pa.timestamp("ms")
+                        ),
+                        "amount": pa.array([decimal.Decimal(i % 100_000) / 100 for i in ids], type=pa.decimal128(10, 2)),
+                        "active": pa.array([i % 2 == 0 for i in ids], type=pa.bool_()),
+                    },
+                    schema=schema,
+                )
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--batch-size", type=int, default=ParquetParser.DEFAULT_BATCH_SIZE)
+    parser.add_argument(
+        "--projected", action="store_true", help="Only read the columns id and updated_at, as if they were the only ones in the catalog"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "benchmark.parquet")
+        # The file is written by another process so the peak memory usage of this process is the one of reading it
+        writer = multiprocessing.Process(target=write_file, args=(path, args.rows))
+        writer.start()
+        writer.join()
+        rss_before_read = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+        stream_reader = Mock()
+        stream_reader.open_file.side_effect = lambda *_: open(path, "rb")
+        config = FileBasedStreamConfig(name="benchmark", file_type="parquet", format=ParquetFormat())
+        discovered_schema: Optional[Mapping[str, Any]] = (
+            {"type": "object", "properties": {"id": {"type": "integer"}, "updated_at": {"type": "string"}}} if args.projected else None
+        )
+        file = RemoteFile(uri=path, last_modified=datetime.datetime.now())
+        parquet_parser = ParquetParser(batch_size=args.batch_size)
+
+        start = time.perf_counter()
+        rows = sum(1 for _ in parquet_parser.parse_records(config, file, stream_reader, Mock(), discovered_schema))
+        elapsed = time.perf_counter() - start
+
+    # ru_maxrss is in kilobytes on Linux
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"parsed {rows} rows in {elapsed:.2f}s: {rows / elapsed:,.0f} rows/s")
+    print(f"peak RSS: {peak_rss / 1024:.0f} MiB ({rss_before_read / 1024:.0f} MiB before reading)")
+
+
+if __name__ == "__main__":
+    main()
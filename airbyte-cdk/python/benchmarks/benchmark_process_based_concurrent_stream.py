@@ -0,0 +1,125 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Compares the record throughput of a ThreadBasedConcurrentStream and a ProcessBasedConcurrentStream reading CPU-bound partitions. Every
+partition decodes a JSON page and normalizes its records against a schema with a TypeTransformer, which holds the GIL the whole time.
+
+The threads can't read more than one partition at a time so the process-based stream should scale with the number of cores, minus the cost
+of pickling the records back to the main process. On a single core, the process-based stream is expected to be slower than the thread-based
+one: the number of cores available is printed with the results.
+
+Usage: python benchmarks/benchmark_process_based_concurrent_stream.py [--partitions 16] [--records-per-partition 20000] [--max-workers 4]
+"""
+
+import argparse
+import json
+import logging
+import os
+import time
+from typing import Any, Iterable, Mapping, Optional, Type
+
+from airbyte_cdk.sources.message import NoopMessageRepository
+from airbyte_cdk.sources.streams.concurrent.availability_strategy import STREAM_AVAILABLE, AbstractAvailabilityStrategy, StreamAvailability
+from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
+from airbyte_cdk.sources.streams.concurrent.partitions.partition_generator import PartitionGenerator
+from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
+from airbyte_cdk.sources.streams.concurrent.process_based_concurrent_stream import ProcessBasedConcurrentStream
+from airbyte_cdk.sources.streams.concurrent.thread_based_concurrent_stream import ThreadBasedConcurrentStream
+from airbyte_cdk.sources.utils.slice_logger import DebugSliceLogger
+from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "integer"},
+        "name": {"type": "string"},
+        "amount": {"type": "number"},
+        "active": {"type": "boolean"},
+        "tags": {"type": "array", "items": {"type": "string"}},
+        "address": {"type": "object", "properties": {"city": {"type": "string"}, "zip": {"type": "string"}}},
+    },
+}
+
+
+class AlwaysAvailableStrategy(AbstractAvailabilityStrategy):
+    def check_availability(self, logger: logging.Logger) -> StreamAvailability:
+        return STREAM_AVAILABLE
+
+
+class CpuBoundPartition(Partition):
+    def __init__(self, partition_id: int, number_of_records: int):
+        self._partition_id = partition_id
+        self._number_of_records = number_of_records
+
+    def read(self) -> Iterable[Record]:
+        page = json.dumps(
+            [
+                {
+                    "id": str(record_id),
+                    "name": record_id,
+                    "amount": str(record_id * 1.5),
+                    "active": "true",
+                    "tags": [record_id, record_id + 1],
+                    "address": {"city": "Montreal", "zip": record_id},
+                }
+                for record_id in range(self._number_of_records)
+            ]
+        )
+        transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+        for data in json.loads(page):
+            transformer.transform(data, SCHEMA)
+            yield Record(data)
+
+    def to_slice(self) -> Optional[Mapping[str, Any]]:
+        return {"partition": self._partition_id}
+
+    def __hash__(self) -> int:
+        return hash(self._partition_id)
+
+
+class CpuBoundPartitionGenerator(PartitionGenerator):
+    def __init__(self, number_of_partitions: int, records_per_partition: int):
+        self._number_of_partitions = number_of_partitions
+        self._records_per_partition = records_per_partition
+
+    def generate(self) -> Iterable[Partition]:
+        for partition_id in range(self._number_of_partitions):
+            yield CpuBoundPartition(partition_id, self._records_per_partition)
+
+
+def run(stream_class: Type[ThreadBasedConcurrentStream], number_of_partitions: int, records_per_partition: int, max_workers: int) -> None:
+    stream = stream_class(
+        partition_generator=CpuBoundPartitionGenerator(number_of_partitions, records_per_partition),
+        max_workers=max_workers,
+        name="cpu_bound",
+        json_schema=SCHEMA,
+        availability_strategy=AlwaysAvailableStrategy(),
+        primary_key=[],
+        cursor_field=None,
+        slice_logger=DebugSliceLogger(),
+        logger=logging.getLogger("benchmark"),
+        message_repository=NoopMessageRepository(),
+        timeout_seconds=3600,
+    )
+    start = time.perf_counter()
+    number_of_records = sum(1 for _ in stream.read())
+    elapsed = time.perf_counter() - start
+    print(f"{stream_class.__name__:>30}: {number_of_records / elapsed:>12,.0f} records/sec ({elapsed:.2f}s)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--partitions", type=int, default=16)
+    parser.add_argument("--records-per-partition", type=int, default=20_000)
+    parser.add_argument("--max-workers", type=int, default=4)
+    args = parser.parse_args()
+
+    print(f"{os.cpu_count()} cores, {args.partitions} partitions of {args.records_per_partition} records, {args.max_workers} workers")
+    for stream_class in [ThreadBasedConcurrentStream, ProcessBasedConcurrentStream]:
+        run(stream_class, args.partitions, args.records_per_partition, args.max_workers)
+
+
+if __name__ == "__main__":
+    main()
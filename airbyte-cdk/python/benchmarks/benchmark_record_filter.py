@@ -0,0 +1,60 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+"""
+Measures the throughput of a RecordFilter evaluating a typical incremental condition and of an AddFields transformation adding a value from
+the config and a value from the record. Both are dominated by the Jinja interpolation.
+
+Usage: python benchmarks/benchmark_record_filter.py [--records 100000] [--page-size 100]
+"""
+
+import argparse
+import time
+from typing import Any, List, Mapping
+
+from airbyte_cdk.sources.declarative.extractors.record_filter import RecordFilter
+from airbyte_cdk.sources.declarative.transformations import AddFields
+from airbyte_cdk.sources.declarative.transformations.add_fields import AddedFieldDefinition
+
+ADDED_FIELDS = [
+    AddedFieldDefinition(path=["shop", "id"], value="{{ config['shop_id'] }}", value_type=None, parameters={}),
+    AddedFieldDefinition(path=["updated_date"], value="{{ record['updated_at'][:10] }}", value_type=None, parameters={}),
+]
+CONDITION = "{{ record['updated_at'] >= stream_state.get('updated_at', config['start_date']) and record['status'] != 'deleted' }}"
+
+
+def synthetic_pages(number_of_records: int, page_size: int) -> List[List[Mapping[str, Any]]]:
+    records = [
+        {"id": i, "updated_at": f"2023-01-{i % 28 + 1:02d}T00:00:00Z", "status": "deleted" if i % 10 == 0 else "active"}
+        for i in range(number_of_records)
+    ]
+    return [records[start : start + page_size] for start in range(0, number_of_records, page_size)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=100_000)
+    parser.add_argument("--page-size", type=int, default=100)
+    args = parser.parse_args()
+
+    config = {"start_date": "2023-01-01T00:00:00Z", "shop_id": 42}
+    record_filter = RecordFilter(parameters={}, config=config, condition=CONDITION)
+    stream_state = {"updated_at": "2023-01-15T00:00:00Z"}
+    pages = synthetic_pages(args.records, args.page_size)
+
+    start = time.perf_counter()
+    kept = sum(len(record_filter.filter_records(page, stream_state=stream_state)) for page in pages)
+    elapsed = time.perf_counter() - start
+    print(f"filtered {args.records} records ({kept} kept) in {elapsed:.2f}s: {args.records / elapsed:,.0f} records/s")
+
+    add_fields = AddFields(fields=ADDED_FIELDS, parameters={})
+    start = time.perf_counter()
+    for page in pages:
+        add_fields.transform_page(page, config=config, stream_state=stream_state)
+    elapsed = time.perf_counter() - start
+    print(f"added fields to {args.records} records in {elapsed:.2f}s: {args.records / elapsed:,.0f} records/s")
+
+
+if __name__ == "__main__":
+    main()
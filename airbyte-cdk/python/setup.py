@@ -16,6 +16,7 @@ README = (HERE / "README.md").read_text()
 avro_dependency = "avro~=1.11.2"
 fastavro_dependency = "fastavro~=1.8.0"
 pyarrow_dependency = "pyarrow==12.0.1"
+aiohttp_dependency = "aiohttp~=3.8"
 
 langchain_dependency = "langchain==0.0.271"
 openai_dependency = "openai[embeddings]==0.27.9"
@@ -95,6 +96,7 @@ setup(
             "pytest-mock",
             "requests-mock",
             "pytest-httpserver",
+            aiohttp_dependency,
             "pandas==2.0.3",
             pyarrow_dependency,
             langchain_dependency,
@@ -114,5 +116,6 @@ setup(
             *unstructured_dependencies,
         ],
         "vector-db-based": [langchain_dependency, openai_dependency, cohere_dependency, tiktoken_dependency],
+        "async-http": [aiohttp_dependency],
     },
 )
@@ -241,3 +241,16 @@ class TestRun:
     def test_run_cmd_with_incorrect_args_fails(self, args, destination: Destination):
         with pytest.raises(Exception):
             list(destination.run_cmd(parsed_args=argparse.Namespace(**args)))
+
+    @pytest.mark.parametrize(
+        "input_stream_type",
+        [
+            pytest.param(io.BytesIO, id="test_binary_stream"),
+            pytest.param(lambda content: io.TextIOWrapper(io.BytesIO(content)), id="test_text_stream"),
+        ],
+    )
+    def test_parse_input_stream(self, input_stream_type, destination: Destination):
+        messages = [_wrapped(_record("s1", {"k1": "v1"})), _wrapped(_state({"k1": "v1"}))]
+        input_stream = input_stream_type("\n".join(message.json(exclude_unset=True) for message in messages).encode("utf-8"))
+
+        assert list(destination._parse_input_stream(input_stream)) == messages
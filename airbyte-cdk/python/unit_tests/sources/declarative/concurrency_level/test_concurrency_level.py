@@ -0,0 +1,43 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import pytest
+from airbyte_cdk.sources.declarative.concurrency_level import ConcurrencyLevel
+
+
+@pytest.mark.parametrize(
+    "default_concurrency, max_concurrency, config, expected_concurrency_level",
+    [
+        pytest.param(4, None, {}, 4, id="test_static_concurrency_level"),
+        pytest.param("{{ config['num_workers'] }}", None, {"num_workers": 8}, 8, id="test_interpolated_concurrency_level"),
+        pytest.param("{{ config['num_workers'] }}", 5, {"num_workers": 8}, 5, id="test_concurrency_level_is_capped"),
+        pytest.param("{{ config.get('num_workers', 2) }}", 5, {}, 2, id="test_interpolated_default_concurrency_level"),
+    ],
+)
+def test_get_concurrency_level(default_concurrency, max_concurrency, config, expected_concurrency_level):
+    concurrency_level = ConcurrencyLevel(
+        default_concurrency=default_concurrency, max_concurrency=max_concurrency, config=config, parameters={}
+    )
+
+    assert concurrency_level.get_concurrency_level() == expected_concurrency_level
+
+
+@pytest.mark.parametrize(
+    "default_concurrency, config",
+    [
+        pytest.param(0, {}, id="test_zero"),
+        pytest.param("{{ config['num_workers'] }}", {"num_workers": -1}, id="test_negative"),
+        pytest.param("{{ config['num_workers'] }}", {"num_workers": "many"}, id="test_not_an_integer"),
+    ],
+)
+def test_given_invalid_concurrency_level_when_get_concurrency_level_then_raise(default_concurrency, config):
+    concurrency_level = ConcurrencyLevel(default_concurrency=default_concurrency, max_concurrency=None, config=config, parameters={})
+
+    with pytest.raises(ValueError):
+        concurrency_level.get_concurrency_level()
+
+
+def test_given_invalid_max_concurrency_then_raise():
+    with pytest.raises(ValueError):
+        ConcurrencyLevel(default_concurrency=1, max_concurrency=0, config={}, parameters={})
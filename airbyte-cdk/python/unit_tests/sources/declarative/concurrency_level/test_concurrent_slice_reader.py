@@ -0,0 +1,163 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import logging
+import threading
+import time
+from typing import Any, Iterable, List, Mapping, Optional
+from unittest.mock import Mock
+
+import pytest
+from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, Level, Type
+from airbyte_cdk.sources.declarative.concurrency_level import ConcurrentSliceReader
+from airbyte_cdk.sources.declarative.types import Record
+from airbyte_cdk.sources.message import InMemoryMessageRepository
+
+_LOGGER = logging.getLogger("airbyte")
+
+
+class _Cursor:
+    def __init__(self) -> None:
+        self.closed_slices: List[Mapping[str, Any]] = []
+        self.most_recent_records: List[Optional[Record]] = []
+
+    def close_slice(self, stream_slice: Mapping[str, Any], most_recent_record: Optional[Record]) -> None:
+        self.closed_slices.append(stream_slice)
+        self.most_recent_records.append(most_recent_record)
+
+
+class _Retriever:
+    """
+    Returns `records_per_slice` records for each slice. The first slice is only read once all the other slices are read
+    """
+
+    def __init__(self, cursor: _Cursor, number_of_slices: int, records_per_slice: int = 2):
+        self.cursor = cursor
+        self._records_per_slice = records_per_slice
+        self._other_slices_read = threading.Semaphore(0)
+        self._number_of_slices = number_of_slices
+        self._local = threading.local()
+
+    def copy_for_concurrent_read(self) -> "_Retriever":
+        return self
+
+    def read_records(self, stream_slice: Mapping[str, Any]) -> Iterable[Any]:
+        if stream_slice["index"] == 0:
+            for _ in range(self._number_of_slices - 1):
+                assert self._other_slices_read.acquire(timeout=5)
+        yield AirbyteMessage(type=Type.LOG, log=AirbyteLogMessage(level=Level.INFO, message=f"slice {stream_slice['index']}"))
+        for i in range(self._records_per_slice):
+            record = Record({"slice": stream_slice["index"], "record": i}, stream_slice)
+            self._local.most_recent_record = record
+            yield record
+        if stream_slice["index"] != 0:
+            self._other_slices_read.release()
+
+    @property
+    def most_recent_record_from_last_slice(self) -> Optional[Record]:
+        return getattr(self._local, "most_recent_record", None)
+
+
+def _slices(number_of_slices: int) -> List[Mapping[str, Any]]:
+    return [{"index": i} for i in range(number_of_slices)]
+
+
+@pytest.mark.parametrize("concurrency_level", [2, 4])
+def test_slices_are_closed_in_order(concurrency_level):
+    cursor = _Cursor()
+    retriever = _Retriever(cursor, number_of_slices=4)
+    reader = ConcurrentSliceReader(concurrency_level, InMemoryMessageRepository())
+
+    records = list(reader.read(retriever, "stream", _slices(4), _LOGGER, Mock()))  # type: ignore  # _Retriever behaves as a SimpleRetriever
+
+    assert sorted((dict(record) for record in records), key=lambda record: (record["slice"], record["record"])) == [
+        {"slice": i, "record": j} for i in range(4) for j in range(2)
+    ]
+    assert cursor.closed_slices == _slices(4)
+    assert [record.data if record else None for record in cursor.most_recent_records] == [{"slice": i, "record": 1} for i in range(4)]
+
+
+def test_given_first_slice_is_read_last_then_state_is_checkpointed_once_it_is_closed():
+    cursor = _Cursor()
+    retriever = _Retriever(cursor, number_of_slices=4)
+    reader = ConcurrentSliceReader(4, InMemoryMessageRepository())
+    closed_slices_at_checkpoint: List[int] = []
+
+    def _checkpoint() -> AirbyteMessage:
+        closed_slices_at_checkpoint.append(len(cursor.closed_slices))
+        return AirbyteMessage(type=Type.STATE)
+
+    output = list(reader.read(retriever, "stream", _slices(4), _LOGGER, Mock(), checkpoint=_checkpoint))  # type: ignore
+
+    # No slice can be closed before the first one is read, which is after the records of all the other slices
+    assert closed_slices_at_checkpoint == [4]
+    assert isinstance(output[-1], AirbyteMessage) and output[-1].type == Type.STATE
+
+
+def test_given_no_slices_then_state_is_checkpointed():
+    checkpoint = Mock(return_value=AirbyteMessage(type=Type.STATE))
+    reader = ConcurrentSliceReader(2, InMemoryMessageRepository())
+
+    output = list(reader.read(_Retriever(_Cursor(), 0), "stream", [], _LOGGER, Mock(), checkpoint=checkpoint))  # type: ignore
+
+    assert output == [checkpoint.return_value]
+
+
+def test_non_record_messages_are_emitted_on_the_message_repository():
+    message_repository = InMemoryMessageRepository()
+    reader = ConcurrentSliceReader(2, message_repository)
+
+    slice_logger = Mock()
+    slice_logger.should_log_slice_message.return_value = False
+
+    list(reader.read(_Retriever(_Cursor(), 2), "stream", _slices(2), _LOGGER, slice_logger))  # type: ignore
+
+    assert sorted(message.log.message for message in message_repository.consume_queue()) == ["slice 0", "slice 1"]
+
+
+class _EndlessRetriever:
+    """
+    Paginates forever, counting the pages it requested
+    """
+
+    def __init__(self) -> None:
+        self.cursor = _Cursor()
+        self.pages = 0
+        self.closed_slices = 0
+        self.most_recent_record_from_last_slice = None
+
+    def copy_for_concurrent_read(self) -> "_EndlessRetriever":
+        return self
+
+    def read_records(self, stream_slice: Mapping[str, Any]) -> Iterable[Any]:
+        try:
+            while True:
+                self.pages += 1
+                yield Record({"slice": stream_slice["index"], "page": self.pages}, stream_slice)
+        finally:
+            self.closed_slices += 1
+
+
+def test_given_read_is_stopped_early_then_slices_stop_paginating_and_threads_are_released():
+    retriever = _EndlessRetriever()
+    reader = ConcurrentSliceReader(2, InMemoryMessageRepository())
+    threads_before_read = threading.active_count()
+
+    records = reader.read(retriever, "stream", _slices(2), _LOGGER, Mock())  # type: ignore  # _EndlessRetriever behaves as a SimpleRetriever
+    next(iter(records))
+    records.close()  # type: ignore  # read returns a generator
+
+    deadline = time.monotonic() + 5
+    while (retriever.closed_slices < 2 or threading.active_count() > threads_before_read) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert retriever.closed_slices == 2
+    assert threading.active_count() == threads_before_read
+    pages = retriever.pages
+    time.sleep(0.1)
+    assert retriever.pages == pages
+
+
+def test_given_concurrency_level_below_one_then_raise():
+    with pytest.raises(ValueError):
+        ConcurrentSliceReader(0, InMemoryMessageRepository())
@@ -0,0 +1,95 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import json
+
+import pytest
+import requests
+from airbyte_cdk.sources.declarative.decoders.json_streaming_decoder import JsonStreamingDecoder
+
+
+@pytest.mark.parametrize(
+    "response_body, path, expected_values",
+    [
+        pytest.param('{"data": [1234567, 89, -1.5e10, true, null]}', ["data"], [1234567, 89, -1.5e10, True, None], id="test_scalars"),
+        pytest.param('{"data": ["é€😀", "\\u00e9\\"]"]}', ["data"], ["é€😀", 'é"]'], id="test_multibyte_characters_and_escapes"),
+        pytest.param('  {\n "a" : {"data": 1},\t"data" : [ ] }  ', ["data"], [], id="test_empty_array_and_whitespaces"),
+        pytest.param('{"data": {"id": 12345678901234567890}}', ["data"], [{"id": 12345678901234567890}], id="test_object"),
+        pytest.param('{"data": 0}', ["data"], [], id="test_empty_value"),
+        pytest.param("[[1, 2], [3, 4]]", ["1"], [3, 4], id="test_array_index"),
+        pytest.param('{"data": [1, 2]}', ["data", "records"], [], id="test_path_into_array"),
+        pytest.param("", ["data"], [], id="test_empty_response"),
+        pytest.param("<html>not json</html>", ["data"], [], id="test_not_json"),
+        pytest.param('{"data": [1, 2]', [], [], id="test_truncated_document"),
+    ],
+)
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 1 << 16])
+def test_decode_path(requests_mock, response_body, path, expected_values, chunk_size):
+    requests_mock.register_uri("GET", "https://airbyte.io/", content=response_body.encode("utf-8"))
+    response = requests.get("https://airbyte.io/", stream=True)
+
+    assert list(JsonStreamingDecoder(parameters={}, chunk_size=chunk_size).decode_path(response, path)) == expected_values
+
+
+def test_given_byte_order_mark_when_decode_path_then_it_is_ignored(requests_mock):
+    requests_mock.register_uri(
+        "GET", "https://airbyte.io/", content=b'\xef\xbb\xbf{"data": [1]}', headers={"Content-Type": "application/json"}
+    )
+    response = requests.get("https://airbyte.io/", stream=True)
+
+    assert list(JsonStreamingDecoder(parameters={}, chunk_size=2).decode_path(response, ["data"])) == [1]
+
+
+def test_given_invalid_item_when_decode_path_then_raise_after_valid_items(requests_mock):
+    requests_mock.register_uri("GET", "https://airbyte.io/", text='{"data": [{"id": 1}, {"id": }]}')
+    response = requests.get("https://airbyte.io/", stream=True)
+    values = iter(JsonStreamingDecoder(parameters={}, chunk_size=4).decode_path(response, ["data"]))
+
+    assert next(values) == {"id": 1}
+    with pytest.raises(json.JSONDecodeError):
+        next(values)
+
+
+def test_decode(requests_mock):
+    requests_mock.register_uri("GET", "https://airbyte.io/", text='{"healthcheck": {"status": "ok"}}')
+    response = requests.get("https://airbyte.io/")
+
+    assert JsonStreamingDecoder(parameters={}).decode(response) == {"healthcheck": {"status": "ok"}}
+
+
+@pytest.mark.parametrize(
+    "response_body, path, expected_document",
+    [
+        pytest.param(
+            '{"meta": {"next": "abc"}, "data": [{"id": 1}, {"id": 2}], "count": 2}',
+            ["data"],
+            {"meta": {"next": "abc"}, "data": [], "count": 2},
+            id="test_records_array",
+        ),
+        pytest.param('{"data": {"id": 1}, "next": "abc"}', ["data"], {"data": {"id": 1}, "next": "abc"}, id="test_single_record"),
+        pytest.param(
+            '{"a": [0, {"data": [1]}, 2], "b": 3}', ["a", "1", "data"], {"a": [0, {"data": []}, 2], "b": 3}, id="test_nested_path"
+        ),
+        pytest.param('{"a": {"b": 1}, "next": "abc"}', ["a", "data"], {"a": {"b": 1}, "next": "abc"}, id="test_missing_path"),
+        pytest.param('{"a": 1, "next": "abc"}', ["a", "data"], {"a": 1, "next": "abc"}, id="test_path_into_scalar"),
+        pytest.param("[1, 2]", [], [], id="test_records_at_root"),
+    ],
+)
+def test_given_streamed_response_when_records_are_read_then_response_content_is_the_rest_of_the_document(
+    requests_mock, response_body, path, expected_document
+):
+    requests_mock.register_uri("GET", "https://airbyte.io/", text=response_body)
+    response = requests.get("https://airbyte.io/", stream=True)
+
+    list(JsonStreamingDecoder(parameters={}, chunk_size=3).decode_path(response, path))
+
+    assert JsonStreamingDecoder(parameters={}).decode(response) == expected_document
+
+
+def test_given_streamed_response_is_not_json_when_records_are_read_then_response_is_decoded_as_empty(requests_mock):
+    requests_mock.register_uri("GET", "https://airbyte.io/", text='{"data": [1, 2], "next": }')
+    response = requests.get("https://airbyte.io/", stream=True)
+
+    assert list(JsonStreamingDecoder(parameters={}).decode_path(response, ["data"])) == [1, 2]
+    assert JsonStreamingDecoder(parameters={}).decode(response) == {}
@@ -7,12 +7,14 @@ import json
 import pytest
 import requests
 from airbyte_cdk.sources.declarative.decoders.json_decoder import JsonDecoder
+from airbyte_cdk.sources.declarative.decoders.json_streaming_decoder import JsonStreamingDecoder
 from airbyte_cdk.sources.declarative.extractors.dpath_extractor import DpathExtractor
 
 config = {"field": "record_array"}
 parameters = {"parameters_field": "record_array"}
 
 decoder = JsonDecoder(parameters={})
+streaming_decoder = JsonStreamingDecoder(parameters={}, chunk_size=3)
 
 
 @pytest.mark.parametrize(
@@ -31,6 +33,17 @@ decoder = JsonDecoder(parameters={})
             [{"id": 1}, {"id": 2}],
         ),
         ("test_field_does_not_exist", ["record"], {"id": 1}, []),
+        ("test_nested_field_does_not_exist", ["data", "records"], {"data": [{"records": [{"id": 1}]}]}, []),
+        ("test_empty_record", ["data"], {"data": {}}, []),
+        ("test_null_record", ["data"], {"data": None}, []),
+        ("test_array_index", ["data", "1", "records"], {"data": [{"records": [{"id": 1}]}, {"records": [{"id": 2}]}]}, [{"id": 2}]),
+        ("test_array_index_out_of_range", ["data", "2"], {"data": [{"id": 1}, {"id": 2}]}, []),
+        (
+            "test_field_after_other_fields",
+            ["data"],
+            {"meta": {"next": 'a } string ] with "', "numbers": [1.5, -2e3]}, "data": [{"id": 1}], "after": True},
+            [{"id": 1}],
+        ),
         ("test_nested_list", ["list", "*", "item"], {"list": [{"item": {"id": "1"}}]}, [{"id": "1"}]),
         (
             "test_complex_nested_list",
@@ -41,12 +54,40 @@ decoder = JsonDecoder(parameters={})
     ],
 )
 def test_dpath_extractor(test_name, field_path, body, expected_records):
-    extractor = DpathExtractor(field_path=field_path, config=config, decoder=decoder, parameters=parameters)
+    for extractor_decoder in [decoder, streaming_decoder]:
+        extractor = DpathExtractor(field_path=list(field_path), config=config, decoder=extractor_decoder, parameters=parameters)
+
+        response = create_response(body)
+        actual_records = extractor.extract_records(response)
+
+        assert actual_records == expected_records
+
+
+def test_given_streaming_decoder_when_iter_records_then_records_are_decoded_while_reading():
+    body = b'{"data": [{"id": 1}, {"id": 2}, not json'
+    response = requests.Response()
+    response.raw = _Body(body)
+    extractor = DpathExtractor(field_path=["data"], config=config, decoder=JsonStreamingDecoder(parameters={}, chunk_size=4), parameters={})
+
+    records = iter(extractor.iter_records(response))
+
+    assert next(records) == {"id": 1}
+    assert response.raw.read_bytes < len(body)
+    assert next(records) == {"id": 2}
+    with pytest.raises(json.JSONDecodeError):
+        next(records)
+
 
-    response = create_response(body)
-    actual_records = extractor.extract_records(response)
+class _Body:
+    def __init__(self, body: bytes):
+        self._body = body
+        self.read_bytes = 0
 
-    assert actual_records == expected_records
+    def stream(self, chunk_size, decode_content):
+        while self.read_bytes < len(self._body):
+            chunk = self._body[self.read_bytes : self.read_bytes + chunk_size]
+            self.read_bytes += len(chunk)
+            yield chunk
 
 
 def create_response(body):
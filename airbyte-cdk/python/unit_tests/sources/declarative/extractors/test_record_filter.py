@@ -2,8 +2,11 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+from unittest.mock import patch
+
 import pytest
 from airbyte_cdk.sources.declarative.extractors.record_filter import RecordFilter
+from airbyte_cdk.sources.declarative.interpolation.jinja import JinjaInterpolation
 
 
 @pytest.mark.parametrize(
@@ -39,6 +42,18 @@ from airbyte_cdk.sources.declarative.extractors.record_filter import RecordFilte
             [{"id": 1, "created_at": "06-06-21"}, {"id": 2, "created_at": "06-07-21"}, {"id": 3, "created_at": "06-08-21"}],
             [{"id": 3, "created_at": "06-08-21"}],
         ),
+        (
+            "test_filter_not_referencing_the_record_keeps_all_records",
+            "{{ stream_state['created_at'] < stream_slice['last_seen'] }}",
+            [{"id": 1}, {"id": 2}],
+            [{"id": 1}, {"id": 2}],
+        ),
+        (
+            "test_filter_not_referencing_the_record_removes_all_records",
+            "{{ config['response_override'] == 'keep' }}",
+            [{"id": 1}, {"id": 2}],
+            [],
+        ),
     ],
 )
 def test_record_filter(test_name, filter_template, records, expected_records):
@@ -53,3 +68,21 @@ def test_record_filter(test_name, filter_template, records, expected_records):
         records, stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token
     )
     assert actual_records == expected_records
+
+
+@pytest.mark.parametrize(
+    "condition, expected_evaluations",
+    [
+        pytest.param("{{ stream_state['created_at'] > '06-01-21' }}", 1, id="test_condition_not_referencing_the_record"),
+        pytest.param("{{ record['id'] > 1 }}", 3, id="test_condition_referencing_the_record"),
+    ],
+)
+def test_record_filter_evaluates_conditions_not_referencing_the_record_once_per_page(condition, expected_evaluations):
+    record_filter = RecordFilter(config={}, condition=condition, parameters={})
+    records = [{"id": 1}, {"id": 2}, {"id": 3}]
+
+    with patch.object(JinjaInterpolation, "eval", side_effect=JinjaInterpolation.eval, autospec=True) as interpolation_eval:
+        record_filter.filter_records(records, stream_state={"created_at": "06-06-21"})
+        record_filter.filter_records([], stream_state={"created_at": "06-06-21"})
+
+    assert interpolation_eval.call_count == expected_evaluations
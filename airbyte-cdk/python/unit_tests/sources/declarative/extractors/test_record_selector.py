@@ -3,11 +3,12 @@
 #
 
 import json
-from unittest.mock import Mock, call
+from unittest.mock import Mock
 
 import pytest
 import requests
 from airbyte_cdk.sources.declarative.decoders.json_decoder import JsonDecoder
+from airbyte_cdk.sources.declarative.decoders.json_streaming_decoder import JsonStreamingDecoder
 from airbyte_cdk.sources.declarative.extractors.dpath_extractor import DpathExtractor
 from airbyte_cdk.sources.declarative.extractors.record_filter import RecordFilter
 from airbyte_cdk.sources.declarative.extractors.record_selector import RecordSelector
@@ -87,12 +88,48 @@ def test_record_filter(test_name, field_path, filter_template, body, expected_da
         response=response, stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token
     )
     assert actual_records == [Record(data, stream_slice) for data in expected_data]
-    calls = []
-    for record in expected_data:
-        calls.append(call(record, config=config, stream_state=stream_state, stream_slice=stream_slice))
     for transformation in transformations:
-        assert transformation.transform.call_count == len(expected_data)
-        transformation.transform.assert_has_calls(calls)
+        transformation.transform_page.assert_called_once_with(
+            expected_data, config=config, stream_state=stream_state, stream_slice=stream_slice
+        )
+
+
+def test_transformations_without_transform_page_are_applied_to_each_record():
+    class _Transformation:
+        # Custom transformations don't have to extend RecordTransformation
+        def transform(self, record, config=None, stream_state=None, stream_slice=None):
+            record["transformed"] = True
+
+    config = {}
+    stream_slice = {"last_seen": "06-10-21"}
+    extractor = DpathExtractor(field_path=["data"], decoder=JsonDecoder(parameters={}), config=config, parameters={})
+    record_selector = RecordSelector(extractor=extractor, transformations=[_Transformation()], config=config, parameters={})
+
+    actual_records = record_selector.select_records(
+        response=create_response({"data": [{"id": 1}, {"id": 2}]}), stream_state={}, stream_slice=stream_slice
+    )
+
+    assert actual_records == [Record({"id": 1, "transformed": True}, stream_slice), Record({"id": 2, "transformed": True}, stream_slice)]
+
+
+def test_given_streaming_decoder_when_iter_records_then_records_are_filtered_and_transformed_by_batches(requests_mock):
+    requests_mock.register_uri("GET", "https://airbyte.io/", json={"data": [{"id": i} for i in range(5)]})
+    config = {}
+    stream_slice = {"last_seen": "06-10-21"}
+    transformation = Mock(spec=RecordTransformation)
+    extractor = DpathExtractor(field_path=["data"], decoder=JsonStreamingDecoder(parameters={}, chunk_size=4), config=config, parameters={})
+    record_filter = RecordFilter(config=config, condition="{{ record['id'] != 3 }}", parameters={})
+    record_selector = RecordSelector(
+        extractor=extractor, record_filter=record_filter, transformations=[transformation], config=config, parameters={}
+    )
+    record_selector.STREAMED_RECORDS_BATCH_SIZE = 2
+
+    response = requests.get("https://airbyte.io/", stream=True)
+    actual_records = list(record_selector.iter_records(response=response, stream_state={}, stream_slice=stream_slice))
+
+    assert record_selector.streams_records
+    assert actual_records == [Record({"id": i}, stream_slice) for i in [0, 1, 2, 4]]
+    assert [call.args[0] for call in transformation.transform_page.call_args_list] == [[{"id": 0}, {"id": 1}], [{"id": 2}], [{"id": 4}]]
 
 
 def create_response(body):
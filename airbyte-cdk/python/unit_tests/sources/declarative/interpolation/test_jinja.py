@@ -3,6 +3,8 @@
 #
 
 import datetime
+import pickle
+from unittest.mock import patch
 
 import pytest
 from airbyte_cdk.sources.declarative.interpolation.jinja import JinjaInterpolation
@@ -238,3 +240,39 @@ def test_macros_examples(template_string, expected_value):
     # If you change the expected output, you must also change the expected output in declarative_component_schema.yaml
     now_utc = interpolation.eval(template_string, {})
     assert now_utc == expected_value
+
+
+def test_templates_are_compiled_once():
+    template = "{{ record['id'] + 0 }}"
+    environment = JinjaInterpolation._ENVIRONMENT
+    with patch.object(environment, "from_string", wraps=environment.from_string) as from_string:
+        # Each interpolated string has its own instance so the compiled templates are shared by all of them
+        values = [JinjaInterpolation().eval(template, {}, record={"id": i}) for i in range(10)]
+
+    assert values == list(range(10))
+    from_string.assert_called_once_with(template)
+
+
+def test_interpolation_is_picklable():
+    jinja_interpolation = JinjaInterpolation()
+    jinja_interpolation.eval("{{ config['field'] }}", {"field": "value"})
+
+    unpickled_interpolation = pickle.loads(pickle.dumps(jinja_interpolation))
+
+    assert unpickled_interpolation.eval("{{ config['field'] }}", {"field": "value"}) == "value"
+
+
+@pytest.mark.parametrize(
+    "input_string, expected_value",
+    [
+        pytest.param("static value", "static value", id="test_static_string_is_returned_as_is"),
+        pytest.param("static value\n", "static value", id="test_trailing_newline_is_removed_like_jinja"),
+        pytest.param("first\r\nsecond", "first\nsecond", id="test_newlines_are_normalized_like_jinja"),
+        pytest.param("{# a comment #}value", "value", id="test_comments_are_removed"),
+        pytest.param("True # a comment", True, id="test_literal_with_comment"),
+        pytest.param("b'bytes'", b"bytes", id="test_prefixed_string_literal"),
+        pytest.param("Truely", "Truely", id="test_name_starting_like_a_literal"),
+    ],
+)
+def test_static_strings_are_evaluated_like_templates(input_string, expected_value):
+    assert interpolation.eval(input_string, {}) == expected_value
@@ -0,0 +1,60 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import os
+from unittest.mock import patch
+
+from airbyte_cdk.sources.declarative.parsers.compiled_manifest_cache import CompiledManifestCache
+
+_MANIFEST = {"version": "0.34.2", "streams": [{"name": "stream"}]}
+_COMPILED_MANIFEST = {"version": "0.34.2", "type": "DeclarativeSource", "streams": [{"type": "DeclarativeStream", "name": "stream"}]}
+
+
+def test_given_manifest_not_compiled_when_get_then_return_none(tmp_path):
+    assert CompiledManifestCache(str(tmp_path)).get(_MANIFEST) is None
+
+
+def test_given_compiled_manifest_when_get_then_return_it(tmp_path):
+    CompiledManifestCache(str(tmp_path / "cache")).put(_MANIFEST, _COMPILED_MANIFEST)
+
+    assert CompiledManifestCache(str(tmp_path / "cache")).get(_MANIFEST) == _COMPILED_MANIFEST
+    assert CompiledManifestCache(str(tmp_path / "cache")).get({**_MANIFEST, "version": "0.34.3"}) is None
+
+
+@patch("importlib.metadata.version")
+def test_given_manifest_compiled_by_other_cdk_version_when_get_then_return_none(version, tmp_path):
+    cache = CompiledManifestCache(str(tmp_path))
+    version.return_value = "0.50.0"
+    cache.put(_MANIFEST, _COMPILED_MANIFEST)
+
+    version.return_value = "0.51.0"
+    assert cache.get(_MANIFEST) is None
+
+
+def test_given_corrupted_cache_file_when_get_then_return_none(tmp_path):
+    cache = CompiledManifestCache(str(tmp_path))
+    cache.put(_MANIFEST, _COMPILED_MANIFEST)
+    for file_name in os.listdir(tmp_path):
+        (tmp_path / file_name).write_text("{not json")
+
+    assert cache.get(_MANIFEST) is None
+
+
+def test_given_manifest_not_serializable_then_it_is_not_cached(tmp_path):
+    manifest = {**_MANIFEST, "not_serializable": object()}
+    cache = CompiledManifestCache(str(tmp_path))
+
+    cache.put(manifest, _COMPILED_MANIFEST)
+
+    assert cache.get(manifest) is None
+    assert os.listdir(tmp_path) == []
+
+
+def test_from_environment(monkeypatch, tmp_path):
+    monkeypatch.delenv("AIRBYTE_MANIFEST_CACHE_PATH", raising=False)
+    assert CompiledManifestCache.from_environment() is None
+
+    monkeypatch.setenv("AIRBYTE_MANIFEST_CACHE_PATH", str(tmp_path))
+    CompiledManifestCache.from_environment().put(_MANIFEST, _COMPILED_MANIFEST)  # type: ignore  # the variable is set
+    assert CompiledManifestCache(str(tmp_path)).get(_MANIFEST) == _COMPILED_MANIFEST
@@ -7,6 +7,7 @@
 import datetime
 
 import pytest
+import requests
 from airbyte_cdk.models import Level
 from airbyte_cdk.sources.declarative.auth import DeclarativeOauth2Authenticator
 from airbyte_cdk.sources.declarative.auth.token import (
@@ -19,7 +20,7 @@ from airbyte_cdk.sources.declarative.auth.token_provider import SessionTokenProv
 from airbyte_cdk.sources.declarative.checks import CheckStream
 from airbyte_cdk.sources.declarative.datetime import MinMaxDatetime
 from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
-from airbyte_cdk.sources.declarative.decoders import JsonDecoder
+from airbyte_cdk.sources.declarative.decoders import JsonDecoder, JsonStreamingDecoder
 from airbyte_cdk.sources.declarative.extractors import DpathExtractor, RecordFilter, RecordSelector
 from airbyte_cdk.sources.declarative.incremental import DatetimeBasedCursor, PerPartitionCursor
 from airbyte_cdk.sources.declarative.interpolation import InterpolatedString
@@ -30,6 +31,8 @@ from airbyte_cdk.sources.declarative.models import CustomPartitionRouter as Cust
 from airbyte_cdk.sources.declarative.models import DatetimeBasedCursor as DatetimeBasedCursorModel
 from airbyte_cdk.sources.declarative.models import DeclarativeStream as DeclarativeStreamModel
 from airbyte_cdk.sources.declarative.models import DefaultPaginator as DefaultPaginatorModel
+from airbyte_cdk.sources.declarative.models import DpathExtractor as DpathExtractorModel
+from airbyte_cdk.sources.declarative.models import HTTPAPIBudget as HTTPAPIBudgetModel
 from airbyte_cdk.sources.declarative.models import HttpRequester as HttpRequesterModel
 from airbyte_cdk.sources.declarative.models import ListPartitionRouter as ListPartitionRouterModel
 from airbyte_cdk.sources.declarative.models import OAuthAuthenticator as OAuthAuthenticatorModel
@@ -40,7 +43,12 @@ from airbyte_cdk.sources.declarative.models import SubstreamPartitionRouter as S
 from airbyte_cdk.sources.declarative.parsers.manifest_component_transformer import ManifestComponentTransformer
 from airbyte_cdk.sources.declarative.parsers.manifest_reference_resolver import ManifestReferenceResolver
 from airbyte_cdk.sources.declarative.parsers.model_to_component_factory import ModelToComponentFactory
-from airbyte_cdk.sources.declarative.partition_routers import ListPartitionRouter, SinglePartitionRouter, SubstreamPartitionRouter
+from airbyte_cdk.sources.declarative.partition_routers import (
+    ListPartitionRouter,
+    ParentRecordCache,
+    SinglePartitionRouter,
+    SubstreamPartitionRouter,
+)
 from airbyte_cdk.sources.declarative.requesters import HttpRequester
 from airbyte_cdk.sources.declarative.requesters.error_handlers import CompositeErrorHandler, DefaultErrorHandler, HttpResponseFilter
 from airbyte_cdk.sources.declarative.requesters.error_handlers.backoff_strategies import (
@@ -50,7 +58,7 @@ from airbyte_cdk.sources.declarative.requesters.error_handlers.backoff_strategie
     WaitUntilTimeFromHeaderBackoffStrategy,
 )
 from airbyte_cdk.sources.declarative.requesters.error_handlers.response_action import ResponseAction
-from airbyte_cdk.sources.declarative.requesters.paginators import DefaultPaginator
+from airbyte_cdk.sources.declarative.requesters.paginators import DefaultPaginator, PaginatorTestReadDecorator
 from airbyte_cdk.sources.declarative.requesters.paginators.strategies import (
     CursorPaginationStrategy,
     OffsetIncrement,
@@ -68,6 +76,14 @@ from airbyte_cdk.sources.declarative.stream_slicers import CartesianProductStrea
 from airbyte_cdk.sources.declarative.transformations import AddFields, RemoveFields
 from airbyte_cdk.sources.declarative.transformations.add_fields import AddedFieldDefinition
 from airbyte_cdk.sources.declarative.yaml_declarative_source import YamlDeclarativeSource
+from airbyte_cdk.sources.streams.call_rate import (
+    FixedWindowCallRatePolicy,
+    HttpAPIBudget,
+    MovingWindowCallRatePolicy,
+    Rate,
+    TokenBucketCallRatePolicy,
+    UnlimitedCallRatePolicy,
+)
 from airbyte_cdk.sources.streams.http.requests_native_auth.oauth import SingleUseRefreshTokenOauth2Authenticator
 from unit_tests.sources.declarative.parsers.testing_components import TestingCustomSubstreamPartitionRouter, TestingSomeComponent
 
@@ -488,6 +504,53 @@ def test_create_substream_partition_router():
     assert partition_router.parent_stream_configs[1].request_option is None
 
 
+def test_given_parent_record_cache_when_create_substream_partition_router_then_cache_is_shared_with_parent_routers():
+    content = """
+    retriever:
+      requester:
+        type: "HttpRequester"
+        path: "kek"
+        url_base: "https://airbyte.io"
+      record_selector:
+        extractor:
+          field_path: []
+    grandparent:
+      type: DeclarativeStream
+      name: "grandparent"
+      retriever: "#/retriever"
+    parent:
+      type: DeclarativeStream
+      name: "parent"
+      retriever:
+        $ref: "#/retriever"
+        partition_router:
+          type: SubstreamPartitionRouter
+          parent_stream_configs:
+            - stream: "#/grandparent"
+              parent_key: id
+              partition_field: grandparent_id
+    partition_router:
+      type: SubstreamPartitionRouter
+      parent_stream_configs:
+        - stream: "#/parent"
+          parent_key: id
+          partition_field: parent_id
+    """
+    parsed_manifest = YamlDeclarativeSource._parse(content)
+    resolved_manifest = resolver.preprocess_manifest(parsed_manifest)
+    partition_router_manifest = transformer.propagate_types_and_parameters("", resolved_manifest["partition_router"], {})
+    parent_record_cache = ParentRecordCache()
+
+    partition_router = ModelToComponentFactory(parent_record_cache=parent_record_cache).create_component(
+        model_type=SubstreamPartitionRouterModel, component_definition=partition_router_manifest, config=input_config
+    )
+
+    assert partition_router._parent_record_cache is parent_record_cache
+    parent_partition_router = partition_router.parent_stream_configs[0].stream.retriever.stream_slicer
+    assert isinstance(parent_partition_router, SubstreamPartitionRouter)
+    assert parent_partition_router._parent_record_cache is parent_record_cache
+
+
 def test_datetime_based_cursor():
     content = """
     incremental:
@@ -752,6 +815,26 @@ def test_create_record_selector(test_name, record_selector, expected_runtime_sel
     assert selector.record_filter.condition == "{{ record['id'] > stream_state['id'] }}"
 
 
+def test_create_dpath_extractor_with_streaming_decoder():
+    content = """
+    extractor:
+      type: DpathExtractor
+      field_path: ["data"]
+      decoder:
+        type: JsonStreamingDecoder
+        chunk_size: 1024
+    """
+    parsed_manifest = YamlDeclarativeSource._parse(content)
+    resolved_manifest = resolver.preprocess_manifest(parsed_manifest)
+    extractor_manifest = transformer.propagate_types_and_parameters("", resolved_manifest["extractor"], {})
+
+    extractor = factory.create_component(model_type=DpathExtractorModel, component_definition=extractor_manifest, config=input_config)
+
+    assert isinstance(extractor, DpathExtractor)
+    assert isinstance(extractor.decoder, JsonStreamingDecoder)
+    assert extractor.decoder.chunk_size == 1024
+
+
 @pytest.mark.parametrize(
     "test_name, error_handler, expected_backoff_strategy_type",
     [
@@ -1079,6 +1162,40 @@ def test_create_default_paginator():
     assert isinstance(paginator.page_token_option, RequestPath)
 
 
+def test_create_default_paginator_with_concurrent_pages():
+    content = """
+      paginator:
+        type: "DefaultPaginator"
+        max_concurrent_pages: 4
+        total_count: "{{ response.total }}"
+        page_token_option:
+          type: RequestOption
+          inject_into: request_parameter
+          field_name: page
+        pagination_strategy:
+          type: "PageIncrement"
+          page_size: 50
+    """
+    parsed_manifest = YamlDeclarativeSource._parse(content)
+    resolved_manifest = resolver.preprocess_manifest(parsed_manifest)
+    paginator_manifest = transformer.propagate_types_and_parameters("", resolved_manifest["paginator"], {})
+
+    paginator = factory.create_component(
+        model_type=DefaultPaginatorModel, component_definition=paginator_manifest, config=input_config, url_base="https://airbyte.io"
+    )
+
+    assert isinstance(paginator, DefaultPaginator)
+    assert paginator.get_max_concurrent_pages() == 4
+    assert paginator.total_count.string == "{{ response.total }}"
+
+    builder_paginator = ModelToComponentFactory(limit_pages_fetched_per_slice=5).create_component(
+        model_type=DefaultPaginatorModel, component_definition=paginator_manifest, config=input_config, url_base="https://airbyte.io"
+    )
+
+    assert isinstance(builder_paginator, PaginatorTestReadDecorator)
+    assert builder_paginator.get_max_concurrent_pages() == 1
+
+
 @pytest.mark.parametrize(
     "manifest, field_name, expected_value, expected_error",
     [
@@ -1689,6 +1806,58 @@ def test_simple_retriever_emit_log_messages():
     assert connector_builder_factory._message_repository._log_level == Level.DEBUG
 
 
+@pytest.mark.parametrize(
+    "emit_connector_builder_messages, expected_page_prefetch_depth",
+    [pytest.param(False, 2, id="test_read"), pytest.param(True, 0, id="test_connector_builder_read_does_not_prefetch")],
+)
+def test_simple_retriever_page_prefetch_depth(emit_connector_builder_messages, expected_page_prefetch_depth):
+    simple_retriever_model = {
+        "type": "SimpleRetriever",
+        "record_selector": {"type": "RecordSelector", "extractor": {"type": "DpathExtractor", "field_path": []}},
+        "requester": {"type": "HttpRequester", "name": "list", "url_base": "orange.com", "path": "/v1/api"},
+        "page_prefetch_depth": 2,
+    }
+
+    retriever = ModelToComponentFactory(emit_connector_builder_messages=emit_connector_builder_messages).create_component(
+        model_type=SimpleRetrieverModel,
+        component_definition=simple_retriever_model,
+        config={},
+        name="Test",
+        primary_key="id",
+        stream_slicer=None,
+        transformations=[],
+    )
+
+    assert retriever.page_prefetch_depth == expected_page_prefetch_depth
+
+
+@pytest.mark.parametrize(
+    "decoder, expected_stream_response",
+    [
+        pytest.param({"type": "JsonDecoder"}, False, id="test_json_decoder"),
+        pytest.param({"type": "JsonStreamingDecoder"}, True, id="test_json_streaming_decoder"),
+    ],
+)
+def test_simple_retriever_streams_responses_with_streaming_decoder(decoder, expected_stream_response):
+    simple_retriever_model = {
+        "type": "SimpleRetriever",
+        "record_selector": {"type": "RecordSelector", "extractor": {"type": "DpathExtractor", "field_path": ["data"], "decoder": decoder}},
+        "requester": {"type": "HttpRequester", "name": "list", "url_base": "orange.com", "path": "/v1/api"},
+    }
+
+    retriever = ModelToComponentFactory().create_component(
+        model_type=SimpleRetrieverModel,
+        component_definition=simple_retriever_model,
+        config={},
+        name="Test",
+        primary_key="id",
+        stream_slicer=None,
+        transformations=[],
+    )
+
+    assert retriever.requester.stream_response == expected_stream_response
+
+
 def test_ignore_retry():
     requester_model = {
         "type": "HttpRequester",
@@ -1706,3 +1875,140 @@ def test_ignore_retry():
     )
 
     assert requester.max_retries == 0
+
+
+def test_create_http_api_budget():
+    content = """
+    api_budget:
+      type: HTTPAPIBudget
+      ratelimit_remaining_header: "X-Calls-Left"
+      status_codes_for_ratelimit_hit: [429, 503]
+      policies:
+        - type: MovingWindowCallRatePolicy
+          rates:
+            - limit: 10
+              interval: PT1S
+            - limit: 1000
+              interval: PT1H
+          matchers:
+            - method: GET
+              url_pattern: "/v1/users"
+        - type: TokenBucketCallRatePolicy
+          rate:
+            limit: 60
+            interval: PT1M
+          burst: 5
+        - type: FixedWindowCallRatePolicy
+          period: PT1H
+          call_limit: 100
+        - type: UnlimitedCallRatePolicy
+    """
+    parsed_manifest = YamlDeclarativeSource._parse(content)
+    resolved_manifest = resolver.preprocess_manifest(parsed_manifest)
+    resolved_manifest["type"] = "DeclarativeSource"
+    api_budget_manifest = transformer.propagate_types_and_parameters("", resolved_manifest["api_budget"], {})
+
+    api_budget = factory.create_component(model_type=HTTPAPIBudgetModel, component_definition=api_budget_manifest, config=input_config)
+
+    assert isinstance(api_budget, HttpAPIBudget)
+    assert api_budget._ratelimit_remaining_header == "X-Calls-Left"
+    assert api_budget._ratelimit_reset_header == "X-RateLimit-Reset"
+    assert api_budget._status_codes_for_ratelimit_hit == (429, 503)
+    moving_window, token_bucket, fixed_window, unlimited = api_budget._policies
+    assert isinstance(moving_window, MovingWindowCallRatePolicy)
+    assert moving_window._rates == [
+        Rate(limit=10, interval=datetime.timedelta(seconds=1)),
+        Rate(limit=1000, interval=datetime.timedelta(hours=1)),
+    ]
+    assert moving_window.matches(requests.Request("GET", "https://api.example.com/v1/users?page=2").prepare())
+    assert not moving_window.matches(requests.Request("POST", "https://api.example.com/v1/users").prepare())
+    assert isinstance(token_bucket, TokenBucketCallRatePolicy)
+    assert token_bucket._capacity == 5
+    assert token_bucket._tokens_per_second == 1
+    assert isinstance(fixed_window, FixedWindowCallRatePolicy)
+    assert fixed_window._period == 3600
+    assert fixed_window._call_limit == 100
+    assert isinstance(unlimited, UnlimitedCallRatePolicy)
+
+
+def test_given_api_budget_then_requesters_share_it():
+    requester_model = {"type": "HttpRequester", "name": "list", "url_base": "orange.com", "path": "/v1/api"}
+    budget_factory = ModelToComponentFactory()
+    budget_factory.set_api_budget(
+        {"type": "HTTPAPIBudget", "policies": [{"type": "FixedWindowCallRatePolicy", "period": "PT1M", "call_limit": 10}]}, config={}
+    )
+
+    requesters = [
+        budget_factory.create_component(model_type=HttpRequesterModel, component_definition=requester_model, config={}, name=name)
+        for name in ["first", "second"]
+    ]
+
+    assert isinstance(requesters[0].api_budget, HttpAPIBudget)
+    assert requesters[0].api_budget is requesters[1].api_budget
+    assert (
+        factory.create_component(model_type=HttpRequesterModel, component_definition=requester_model, config={}, name="Test").api_budget
+        is None
+    )
+
+
+def test_given_api_budget_when_create_substream_partition_router_then_parent_requesters_share_it():
+    content = """
+    retriever:
+      requester:
+        type: "HttpRequester"
+        path: "kek"
+        url_base: "https://airbyte.io"
+      record_selector:
+        extractor:
+          field_path: []
+    grandparent:
+      type: DeclarativeStream
+      name: "grandparent"
+      retriever: "#/retriever"
+    parent:
+      type: DeclarativeStream
+      name: "parent"
+      retriever:
+        $ref: "#/retriever"
+        partition_router:
+          type: SubstreamPartitionRouter
+          parent_stream_configs:
+            - stream: "#/grandparent"
+              parent_key: id
+              partition_field: grandparent_id
+    partition_router:
+      type: SubstreamPartitionRouter
+      parent_stream_configs:
+        - stream: "#/parent"
+          parent_key: id
+          partition_field: parent_id
+    """
+    parsed_manifest = YamlDeclarativeSource._parse(content)
+    resolved_manifest = resolver.preprocess_manifest(parsed_manifest)
+    partition_router_manifest = transformer.propagate_types_and_parameters("", resolved_manifest["partition_router"], {})
+    budget_factory = ModelToComponentFactory()
+    budget_factory.set_api_budget(
+        {"type": "HTTPAPIBudget", "policies": [{"type": "FixedWindowCallRatePolicy", "period": "PT1M", "call_limit": 10}]}, config={}
+    )
+
+    partition_router = budget_factory.create_component(
+        model_type=SubstreamPartitionRouterModel, component_definition=partition_router_manifest, config=input_config
+    )
+
+    parent_stream = partition_router.parent_stream_configs[0].stream
+    grandparent_stream = parent_stream.retriever.stream_slicer.parent_stream_configs[0].stream
+    assert isinstance(parent_stream.retriever.requester.api_budget, HttpAPIBudget)
+    assert parent_stream.retriever.requester.api_budget is budget_factory._api_budget
+    assert grandparent_stream.retriever.requester.api_budget is budget_factory._api_budget
+
+
+def test_call_rate_policy_durations_in_months_are_not_supported():
+    with pytest.raises(ValueError):
+        factory.create_component(
+            model_type=HTTPAPIBudgetModel,
+            component_definition={
+                "type": "HTTPAPIBudget",
+                "policies": [{"type": "FixedWindowCallRatePolicy", "period": "P1M", "call_limit": 10}],
+            },
+            config={},
+        )
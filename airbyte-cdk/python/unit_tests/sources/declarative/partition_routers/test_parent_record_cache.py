@@ -0,0 +1,38 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+from airbyte_cdk.sources.declarative.partition_routers.parent_record_cache import ParentRecordCache
+
+
+def test_values_over_the_memory_limit_are_read_from_disk():
+    cache = ParentRecordCache(max_values_in_memory=3)
+
+    cache.put("parent", "id", {"page": 1}, [1, 2])
+    cache.put("parent", "id", {"page": 2}, [3, 4])
+    cache.put("parent", "id", {"page": 3}, [{"nested": (5, "6")}])
+
+    assert cache.get("parent", "id", {"page": 1}) == [1, 2]
+    assert cache.get("parent", "id", {"page": 2}) == [3, 4]
+    assert cache.get("parent", "id", {"page": 3}) == [{"nested": (5, "6")}]
+    assert cache._spill_file is not None
+
+
+def test_entries_are_keyed_by_stream_parent_key_and_slice():
+    cache = ParentRecordCache()
+    cache.put("parent", "id", {"a": 1, "b": 2}, [1])
+
+    assert cache.get("parent", "id", {"b": 2, "a": 1}) == [1]
+    assert cache.get("parent", "id", {"a": 1}) is None
+    assert cache.get("parent", "other_id", {"a": 1, "b": 2}) is None
+    assert cache.get("other_parent", "id", {"a": 1, "b": 2}) is None
+
+
+def test_clear():
+    cache = ParentRecordCache(max_values_in_memory=0)
+    cache.put("parent", "id", None, [1])
+
+    cache.clear()
+
+    assert cache.get("parent", "id", None) is None
+    assert cache._spill_file is None
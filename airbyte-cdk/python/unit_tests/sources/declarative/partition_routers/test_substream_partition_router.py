@@ -6,6 +6,7 @@ from typing import Any, Iterable, List, Mapping, Optional, Union
 
 import pytest as pytest
 from airbyte_cdk.models import AirbyteMessage, AirbyteRecordMessage, SyncMode, Type
+from airbyte_cdk.sources.declarative.partition_routers.parent_record_cache import ParentRecordCache
 from airbyte_cdk.sources.declarative.partition_routers.substream_partition_router import ParentStreamConfig, SubstreamPartitionRouter
 from airbyte_cdk.sources.declarative.requesters.request_option import RequestOption, RequestOptionType
 from airbyte_cdk.sources.declarative.types import Record
@@ -321,3 +322,69 @@ def test_given_record_is_record_object_when_stream_slices_then_use_record_data()
 
     slices = list(partition_router.stream_slices())
     assert slices == [{"partition_field": "record value", "parent_slice": parent_slice}]
+
+
+class CountingMockStream(MockStream):
+    def __init__(self, slices, records, name):
+        super().__init__(slices, records, name)
+        self.read_slices = []
+
+    def read_records(
+        self,
+        sync_mode: SyncMode,
+        cursor_field: List[str] = None,
+        stream_slice: Mapping[str, Any] = None,
+        stream_state: Mapping[str, Any] = None,
+    ) -> Iterable[Mapping[str, Any]]:
+        self.read_slices.append(stream_slice)
+        yield from super().read_records(sync_mode, cursor_field, stream_slice, stream_state)
+
+
+def _create_router(parent_stream: Stream, partition_field: str, cache: ParentRecordCache) -> SubstreamPartitionRouter:
+    partition_router = SubstreamPartitionRouter(
+        parent_stream_configs=[
+            ParentStreamConfig(stream=parent_stream, parent_key="id", partition_field=partition_field, parameters={}, config={})
+        ],
+        parameters={},
+        config={},
+    )
+    partition_router.set_parent_record_cache(cache)
+    return partition_router
+
+
+@pytest.mark.parametrize("max_values_in_memory", [ParentRecordCache.DEFAULT_MAX_VALUES_IN_MEMORY, 0])
+def test_given_parent_record_cache_when_stream_slices_then_parent_is_read_once_per_slice(max_values_in_memory):
+    cache = ParentRecordCache(max_values_in_memory=max_values_in_memory)
+    first_parent = CountingMockStream(parent_slices, all_parent_data, "parent")
+    second_parent = CountingMockStream(parent_slices, all_parent_data, "parent")
+
+    first_slices = list(_create_router(first_parent, "first_id", cache).stream_slices())
+    second_slices = list(_create_router(second_parent, "second_id", cache).stream_slices())
+
+    assert first_slices == list(_create_router(MockStream(parent_slices, all_parent_data, "parent"), "first_id", None).stream_slices())
+    assert second_slices == [{"second_id": s["first_id"], "parent_slice": s["parent_slice"]} for s in first_slices]
+    assert first_parent.read_slices == parent_slices
+    assert second_parent.read_slices == []
+
+
+def test_given_parent_slice_not_read_until_the_end_then_it_is_not_cached():
+    cache = ParentRecordCache()
+    first_parent = CountingMockStream(parent_slices, all_parent_data, "parent")
+    second_parent = CountingMockStream(parent_slices, all_parent_data, "parent")
+
+    slices = _create_router(first_parent, "first_id", cache).stream_slices()
+    next(slices)
+    slices.close()
+    list(_create_router(second_parent, "first_id", cache).stream_slices())
+
+    assert second_parent.read_slices == parent_slices
+
+
+def test_given_other_parent_stream_then_parent_record_cache_is_not_used():
+    cache = ParentRecordCache()
+    list(_create_router(MockStream(parent_slices, all_parent_data, "parent"), "first_id", cache).stream_slices())
+    other_parent = CountingMockStream(parent_slices, all_parent_data, "other_parent")
+
+    list(_create_router(other_parent, "first_id", cache).stream_slices())
+
+    assert other_parent.read_slices == parent_slices
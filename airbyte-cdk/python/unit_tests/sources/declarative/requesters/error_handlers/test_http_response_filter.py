@@ -119,3 +119,12 @@ def test_matches(requests_mock, action, http_codes, predicate, error_contains, b
         assert actual_response_status.error_message == expected_response_status.error_message
     else:
         assert actual_response_status is None
+
+
+def test_given_no_predicate_when_matches_then_response_is_not_decoded(requests_mock):
+    requests_mock.register_uri("GET", "https://airbyte.io/", json={"data": [1, 2]})
+    response = requests.get("https://airbyte.io/", stream=True)
+    response_filter = HttpResponseFilter(action=ResponseAction.IGNORE, config={}, parameters={})
+
+    assert response_filter.matches(response) is None
+    assert response._content is False
@@ -17,6 +17,7 @@ from airbyte_cdk.sources.declarative.requesters.paginators.default_paginator imp
 )
 from airbyte_cdk.sources.declarative.requesters.paginators.strategies.cursor_pagination_strategy import CursorPaginationStrategy
 from airbyte_cdk.sources.declarative.requesters.paginators.strategies.offset_increment import OffsetIncrement
+from airbyte_cdk.sources.declarative.requesters.paginators.strategies.page_increment import PageIncrement
 from airbyte_cdk.sources.declarative.requesters.request_path import RequestPath
 
 
@@ -245,3 +246,91 @@ def test_paginator_with_page_option_no_page_size():
             url_base=MagicMock(),
             parameters={},
         ),
+
+
+def _response(body, headers=None) -> requests.Response:
+    response = requests.Response()
+    response.headers = headers or {}
+    response._content = json.dumps(body).encode("utf-8")
+    return response
+
+
+@pytest.mark.parametrize(
+    "total_count, body, headers, expected_number_of_next_pages",
+    [
+        pytest.param("{{ response.total }}", {"total": 9}, {}, 4, id="test_total_count_from_response"),
+        pytest.param("{{ response.total }}", {"total": 10}, {}, 4, id="test_total_count_multiple_of_page_size"),
+        pytest.param("{{ headers['X-Total-Count'] }}", {}, {"X-Total-Count": "3"}, 1, id="test_total_count_from_headers"),
+        pytest.param("{{ response.total }}", {"total": 2}, {}, 0, id="test_total_count_on_first_page"),
+    ],
+)
+def test_get_next_page_tokens_with_total_count(total_count, body, headers, expected_number_of_next_pages):
+    page_token_request_option = RequestOption(inject_into=RequestOptionType.request_parameter, field_name="offset", parameters={})
+    paginator = DefaultPaginator(
+        OffsetIncrement(config={}, page_size=2, parameters={}),
+        config={},
+        url_base="https://airbyte.io",
+        parameters={},
+        page_token_option=page_token_request_option,
+        max_concurrent_pages=3,
+        total_count=total_count,
+    )
+
+    request_params = []
+    for next_page_token in paginator.get_next_page_tokens(_response(body, headers)):
+        request_params.append((next_page_token, paginator.get_request_params()))
+
+    assert request_params == [({"next_page_token": 2 * page}, {"offset": 2 * page}) for page in range(1, expected_number_of_next_pages + 1)]
+
+
+def test_get_next_page_tokens_are_not_bounded_if_the_total_count_is_missing():
+    paginator = DefaultPaginator(
+        PageIncrement(page_size=2, parameters={}, start_from_page=1),
+        config={},
+        url_base="https://airbyte.io",
+        parameters={},
+        max_concurrent_pages=3,
+        total_count="{{ response.total }}",
+    )
+
+    next_page_tokens = paginator.get_next_page_tokens(_response({}))
+
+    assert [next(next_page_tokens)["next_page_token"] for _ in range(100)] == list(range(2, 102))
+
+
+@pytest.mark.parametrize(
+    "pagination_strategy, total_count",
+    [
+        pytest.param(
+            CursorPaginationStrategy(page_size=2, cursor_value="{{ response.next }}", config={}, parameters={}), None, id="test_cursor"
+        ),
+        pytest.param(OffsetIncrement(config={}, page_size=None, parameters={}), None, id="test_offset_without_page_size"),
+        pytest.param(PageIncrement(page_size=None, parameters={}), "{{ response.total }}", id="test_total_count_without_page_size"),
+    ],
+)
+def test_concurrent_pages_are_not_supported(pagination_strategy, total_count):
+    with pytest.raises(ValueError):
+        DefaultPaginator(
+            pagination_strategy,
+            config={},
+            url_base="https://airbyte.io",
+            parameters={},
+            max_concurrent_pages=2,
+            total_count=total_count,
+        )
+
+
+def test_pages_are_requested_one_after_the_other_by_default():
+    paginator = DefaultPaginator(
+        OffsetIncrement(config={}, page_size=2, parameters={}), config={}, url_base="https://airbyte.io", parameters={}
+    )
+
+    assert paginator.get_max_concurrent_pages() == 1
+    concurrent_paginator = DefaultPaginator(
+        OffsetIncrement(config={}, page_size=2, parameters={}),
+        config={},
+        url_base="https://airbyte.io",
+        parameters={},
+        max_concurrent_pages=4,
+    )
+    assert PaginatorTestReadDecorator(concurrent_paginator).get_max_concurrent_pages() == 1
@@ -56,3 +56,32 @@ def test_offset_increment_paginator_strategy_initial_token(inject_on_first_reque
     paginator_strategy = OffsetIncrement(page_size=20, parameters={}, config={}, inject_on_first_request=inject_on_first_request)
 
     assert paginator_strategy.initial_token == expected_initial_token
+
+
+@pytest.mark.parametrize(
+    "inject_on_first_request, page_index, expected_token",
+    [
+        pytest.param(False, 0, None, id="test_first_page_without_inject"),
+        pytest.param(True, 0, 0, id="test_first_page_with_inject"),
+        pytest.param(False, 3, 60, id="test_next_page"),
+    ],
+)
+def test_offset_increment_paginator_strategy_get_page_token(inject_on_first_request, page_index, expected_token):
+    paginator_strategy = OffsetIncrement(page_size=20, parameters={}, config={}, inject_on_first_request=inject_on_first_request)
+
+    assert paginator_strategy.get_page_token(page_index) == expected_token
+
+
+def test_offset_increment_paginator_strategy_get_page_token_matches_next_page_token():
+    paginator_strategy = OffsetIncrement(page_size=2, parameters={}, config={})
+
+    for page_index in range(1, 4):
+        next_page_token = paginator_strategy.next_page_token(requests.Response(), [{"id": 0}, {"id": 1}])
+        assert next_page_token == paginator_strategy.get_page_token(page_index)
+
+
+def test_offset_increment_paginator_strategy_get_page_token_without_page_size():
+    paginator_strategy = OffsetIncrement(page_size=None, parameters={}, config={})
+
+    with pytest.raises(ValueError):
+        paginator_strategy.get_page_token(1)
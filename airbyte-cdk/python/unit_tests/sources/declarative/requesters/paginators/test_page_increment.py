@@ -54,3 +54,28 @@ def test_page_increment_paginator_strategy_initial_token(
     )
 
     assert paginator_strategy.initial_token == expected_initial_token
+
+
+@pytest.mark.parametrize(
+    "inject_on_first_request, start_from_page, page_index, expected_token",
+    [
+        pytest.param(False, 1, 0, None, id="test_first_page_without_inject"),
+        pytest.param(True, 1, 0, 1, id="test_first_page_with_inject"),
+        pytest.param(False, 1, 3, 4, id="test_page_start_from_1"),
+        pytest.param(False, 0, 3, 3, id="test_page_start_from_0"),
+    ],
+)
+def test_page_increment_paginator_strategy_get_page_token(inject_on_first_request, start_from_page, page_index, expected_token):
+    paginator_strategy = PageIncrement(
+        page_size=20, parameters={}, start_from_page=start_from_page, inject_on_first_request=inject_on_first_request
+    )
+
+    assert paginator_strategy.get_page_token(page_index) == expected_token
+
+
+def test_page_increment_paginator_strategy_get_page_token_matches_next_page_token():
+    paginator_strategy = PageIncrement(page_size=2, parameters={}, start_from_page=1)
+
+    for page_index in range(1, 4):
+        next_page_token = paginator_strategy.next_page_token(requests.Response(), [{"id": 0}, {"id": 1}])
+        assert next_page_token == paginator_strategy.get_page_token(page_index)
@@ -2,10 +2,11 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import asyncio
 from http import HTTPStatus
 from typing import Any, Mapping, Optional
 from unittest import mock
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 from urllib.parse import parse_qs, urlparse
 
 import pytest as pytest
@@ -19,6 +20,8 @@ from airbyte_cdk.sources.declarative.requesters.error_handlers.error_handler imp
 from airbyte_cdk.sources.declarative.requesters.http_requester import HttpMethod, HttpRequester
 from airbyte_cdk.sources.declarative.requesters.request_options import InterpolatedRequestOptionsProvider
 from airbyte_cdk.sources.declarative.types import Config
+from airbyte_cdk.sources.streams.call_rate import AbstractAPIBudget
+from airbyte_cdk.sources.streams.http.async_transport import AsyncHttpTransport
 from airbyte_cdk.sources.streams.http.exceptions import DefaultBackoffException, RequestBodyException, UserDefinedBackoffException
 from requests import PreparedRequest
 
@@ -164,6 +167,16 @@ def test_basic_send_request():
     assert sent_request.body is None
 
 
+@pytest.mark.parametrize("stream_response", [False, True])
+def test_send_request_streams_response(stream_response):
+    requester = create_requester()
+    requester.stream_response = stream_response
+
+    requester.send_request()
+
+    assert requester._session.send.call_args_list[0][1]["stream"] == stream_response
+
+
 @pytest.mark.parametrize(
     "provider_data, provider_json, param_data, param_json, authenticator_data, authenticator_json, expected_exception, expected_body",
     [
@@ -849,3 +862,93 @@ def test_log_requests(should_log, status_code, should_throw):
     if should_log:
         assert repository.log_message.call_args_list[0].args[1]() == "formatted_response"
         formatter.assert_called_once_with(response)
+
+
+def _create_requester_with_async_transport(status_codes, error_handler=None):
+    requester = create_requester(error_handler=error_handler)
+    responses = []
+    for status_code in status_codes:
+        response = requests.Response()
+        response.status_code = status_code
+        response.request = requests.Request()
+        responses.append(response)
+    requester.async_http_transport = MagicMock(spec=AsyncHttpTransport)
+    requester.async_http_transport.send = AsyncMock(side_effect=responses)
+    return requester
+
+
+def _run_until_complete(coroutine):
+    # asyncio.run would leave the main thread without an event loop, which breaks the tests calling asyncio.get_event_loop afterwards
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def test_send_request_async():
+    options_provider = MagicMock()
+    options_provider.get_request_headers.return_value = {"my_header": "my_value"}
+    requester = _create_requester_with_async_transport([200])
+    requester._request_options_provider = options_provider
+
+    response = _run_until_complete(requester.send_request_async())
+
+    assert response.status_code == 200
+    sent_request: PreparedRequest = requester.async_http_transport.send.call_args_list[0][0][0]
+    assert sent_request.method == "GET"
+    assert sent_request.url == "https://example.com/deals"
+    assert sent_request.headers["my_header"] == "my_value"
+    requester._session.send.assert_not_called()
+
+
+def test_send_request_async_waits_for_user_defined_backoff(mocker):
+    sleep = mocker.patch("asyncio.sleep", AsyncMock())
+    requester = _create_requester_with_async_transport([429, 200])
+    requester._backoff_time = lambda _: 0.5
+
+    response = _run_until_complete(requester.send_request_async())
+
+    assert response.status_code == 200
+    sleep.assert_any_await(1.5)
+    assert requester.async_http_transport.send.call_count == 2
+
+
+def test_send_request_async_gives_up_after_max_retries(mocker):
+    mocker.patch("asyncio.sleep", AsyncMock())
+    requester = _create_requester_with_async_transport([500] * 10)
+
+    with pytest.raises(DefaultBackoffException):
+        _run_until_complete(requester.send_request_async())
+    assert requester.async_http_transport.send.call_count == requester.max_retries + 1
+
+
+def test_send_request_async_validates_response():
+    requester = _create_requester_with_async_transport([404], error_handler=DefaultErrorHandler(parameters={}, config={}, max_retries=0))
+
+    with pytest.raises(ReadException):
+        _run_until_complete(requester.send_request_async())
+
+
+def test_send_request_acquires_the_api_budget_and_updates_it_with_the_response():
+    requester = create_requester()
+    requester.api_budget = MagicMock(spec=AbstractAPIBudget)
+
+    response = requester.send_request()
+
+    sent_request: PreparedRequest = requester._session.send.call_args_list[0][0][0]
+    requester.api_budget.acquire_call.assert_called_once_with(sent_request)
+    requester.api_budget.update_from_response.assert_called_once_with(sent_request, response)
+
+
+def test_send_request_async_acquires_the_api_budget_and_updates_it_with_the_response():
+    requester = _create_requester_with_async_transport([200])
+    requester.api_budget = MagicMock(spec=AbstractAPIBudget)
+    requester.api_budget.acquire_call_async = AsyncMock()
+
+    response = _run_until_complete(requester.send_request_async())
+
+    sent_request: PreparedRequest = requester.async_http_transport.send.call_args_list[0][0][0]
+    requester.api_budget.acquire_call_async.assert_awaited_once_with(sent_request)
+    requester.api_budget.update_from_response.assert_called_once_with(sent_request, response)
+    requester.api_budget.acquire_call.assert_not_called()
@@ -2,16 +2,23 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import json
+import threading
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 import requests
 from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, Level, SyncMode, Type
 from airbyte_cdk.sources.declarative.auth.declarative_authenticator import NoAuth
+from airbyte_cdk.sources.declarative.decoders import JsonStreamingDecoder
+from airbyte_cdk.sources.declarative.extractors import DpathExtractor, RecordSelector
 from airbyte_cdk.sources.declarative.incremental import Cursor, DatetimeBasedCursor
 from airbyte_cdk.sources.declarative.partition_routers import SinglePartitionRouter
+from airbyte_cdk.sources.declarative.requesters import HttpRequester
 from airbyte_cdk.sources.declarative.requesters.error_handlers.response_status import ResponseStatus
-from airbyte_cdk.sources.declarative.requesters.request_option import RequestOptionType
+from airbyte_cdk.sources.declarative.requesters.paginators import DefaultPaginator
+from airbyte_cdk.sources.declarative.requesters.paginators.strategies import CursorPaginationStrategy, PageIncrement
+from airbyte_cdk.sources.declarative.requesters.request_option import RequestOption, RequestOptionType
 from airbyte_cdk.sources.declarative.requesters.requester import HttpMethod
 from airbyte_cdk.sources.declarative.retrievers.simple_retriever import SimpleRetriever, SimpleRetrieverTestReadDecorator
 from airbyte_cdk.sources.declarative.types import Record
@@ -493,3 +500,193 @@ def test_emit_log_request_response_messages(mocker):
 
     assert requester.send_request.call_args_list[0][1]["log_formatter"] is not None
     assert requester.send_request.call_args_list[0][1]["log_formatter"](response) == format_http_message_mock.return_value
+
+
+@pytest.mark.parametrize("page_prefetch_depth", [0, 1, 3])
+def test_page_prefetch_depth_reads_the_same_records(page_prefetch_depth):
+    pages = [[Record({"id": page * 2 + i}, {}) for i in range(2)] for page in range(3)] + [[Record({"id": 6}, {})]]
+    responses = []
+    for page in pages:
+        response = requests.Response()
+        response.status_code = 200
+        responses.append(response)
+    records_by_response = {id(response): page for response, page in zip(responses, pages)}
+
+    requester = MagicMock()
+    requester.send_request.side_effect = responses
+    record_selector = MagicMock()
+    record_selector.select_records.side_effect = lambda response, **kwargs: records_by_response[id(response)]
+    paginator = MagicMock()
+    paginator.path.return_value = None
+    paginator.get_max_concurrent_pages.return_value = 1
+    paginator.next_page_token.side_effect = (
+        lambda response, last_records: {"after": last_records[-1]["id"]} if len(last_records) == 2 else None
+    )
+
+    retriever = SimpleRetriever(
+        name="stream_name",
+        primary_key=primary_key,
+        requester=requester,
+        paginator=paginator,
+        record_selector=record_selector,
+        page_prefetch_depth=page_prefetch_depth,
+        parameters={},
+        config={},
+    )
+
+    assert [record["id"] for record in retriever.read_records(stream_slice={})] == list(range(7))
+    assert [call.kwargs["next_page_token"] for call in requester.send_request.call_args_list] == [
+        None,
+        {"after": 1},
+        {"after": 3},
+        {"after": 5},
+    ]
+
+
+def _paginated_api(number_of_records: int, page_size: int, on_request=lambda page: None):
+    def send_request(**kwargs):
+        page = kwargs["request_params"].get("page", 1)
+        on_request(page)
+        response = requests.Response()
+        response.status_code = 200
+        items = [{"id": i} for i in range((page - 1) * page_size, min(page * page_size, number_of_records))]
+        response._content = json.dumps({"items": items, "total": number_of_records}).encode("utf-8")
+        return response
+
+    requester = MagicMock()
+    requester.send_request.side_effect = send_request
+    return requester
+
+
+def _concurrent_paginator(max_concurrent_pages: int, total_count=None) -> DefaultPaginator:
+    return DefaultPaginator(
+        PageIncrement(page_size=2, parameters={}, start_from_page=1),
+        config={},
+        url_base="https://airbyte.io",
+        parameters={},
+        page_token_option=RequestOption(inject_into=RequestOptionType.request_parameter, field_name="page", parameters={}),
+        max_concurrent_pages=max_concurrent_pages,
+        total_count=total_count,
+    )
+
+
+def _items_selector():
+    record_selector = MagicMock()
+    record_selector.select_records.side_effect = lambda response, stream_slice, **kwargs: [
+        Record(item, stream_slice) for item in response.json()["items"]
+    ]
+    return record_selector
+
+
+@pytest.mark.parametrize(
+    "total_count, number_of_records, max_requested_page",
+    [
+        pytest.param("{{ response.total }}", 7, 4, id="test_total_count"),
+        pytest.param("{{ response.total }}", 8, 4, id="test_total_count_multiple_of_page_size"),
+        # The pages requested with the last one are not read
+        pytest.param(None, 7, 6, id="test_without_total_count_until_a_page_is_not_full"),
+        pytest.param("{{ response.total }}", 1, 1, id="test_single_page"),
+    ],
+)
+def test_pages_requested_concurrently_are_read_in_order(total_count, number_of_records, max_requested_page):
+    requested_pages = []
+    retriever = SimpleRetriever(
+        name="stream_name",
+        primary_key=primary_key,
+        requester=_paginated_api(number_of_records, 2, requested_pages.append),
+        paginator=_concurrent_paginator(3, total_count),
+        record_selector=_items_selector(),
+        parameters={},
+        config={},
+    )
+
+    assert [record["id"] for record in retriever.read_records(stream_slice={})] == list(range(number_of_records))
+    last_page = (number_of_records + 1) // 2
+    assert set(range(1, last_page + 1)) <= set(requested_pages) <= set(range(1, max_requested_page + 1))
+
+
+def test_pages_following_the_first_one_are_requested_at_the_same_time():
+    barrier = threading.Barrier(3, timeout=5)
+
+    def wait_for_other_pages(page):
+        if page > 1:
+            # Raises BrokenBarrierError if the 3 pages after the first one are not requested at the same time
+            barrier.wait()
+
+    retriever = SimpleRetriever(
+        name="stream_name",
+        primary_key=primary_key,
+        requester=_paginated_api(8, 2, wait_for_other_pages),
+        paginator=_concurrent_paginator(3, "{{ response.total }}"),
+        record_selector=_items_selector(),
+        parameters={},
+        config={},
+    )
+
+    assert [record["id"] for record in retriever.read_records(stream_slice={})] == list(range(8))
+
+
+def test_given_a_page_requested_concurrently_fails_then_the_records_of_the_previous_pages_are_read_first():
+    def fail_on_page_3(page):
+        if page == 3:
+            raise requests.exceptions.ConnectionError("An error")
+
+    retriever = SimpleRetriever(
+        name="stream_name",
+        primary_key=primary_key,
+        requester=_paginated_api(10, 2, fail_on_page_3),
+        paginator=_concurrent_paginator(3),
+        record_selector=_items_selector(),
+        parameters={},
+        config={},
+    )
+
+    read_records = []
+    with pytest.raises(requests.exceptions.ConnectionError):
+        for record in retriever.read_records(stream_slice={}):
+            read_records.append(record["id"])
+
+    assert read_records == [0, 1, 2, 3]
+
+
+@pytest.mark.parametrize("page_prefetch_depth", [0, 1])
+def test_given_streaming_decoder_when_read_records_then_paginator_reads_the_rest_of_the_streamed_response(
+    requests_mock, page_prefetch_depth
+):
+    requests_mock.get(
+        "https://airbyte.io/items",
+        [
+            {"json": {"data": [{"id": 1}, {"id": 2}], "next": "abc"}},
+            {"json": {"data": [{"id": 3}], "next": None}},
+        ],
+    )
+    requester = HttpRequester(
+        name="stream_name",
+        url_base="https://airbyte.io",
+        path="items",
+        http_method=HttpMethod.GET,
+        config={},
+        parameters={},
+        stream_response=True,
+    )
+    extractor = DpathExtractor(field_path=["data"], decoder=JsonStreamingDecoder(parameters={}, chunk_size=4), config={}, parameters={})
+    paginator = DefaultPaginator(
+        pagination_strategy=CursorPaginationStrategy(cursor_value="{{ response.next }}", config={}, parameters={}),
+        page_token_option=RequestOption(inject_into=RequestOptionType.request_parameter, field_name="cursor", parameters={}),
+        url_base="https://airbyte.io",
+        config={},
+        parameters={},
+    )
+    retriever = SimpleRetriever(
+        name="stream_name",
+        primary_key=primary_key,
+        requester=requester,
+        paginator=paginator,
+        record_selector=RecordSelector(extractor=extractor, config={}, parameters={}),
+        page_prefetch_depth=page_prefetch_depth,
+        parameters={},
+        config={},
+    )
+
+    assert [record["id"] for record in retriever.read_records(stream_slice={})] == [1, 2, 3]
+    assert [request.qs.get("cursor") for request in requests_mock.request_history] == [None, ["abc"]]
@@ -6,7 +6,7 @@ import json
 import logging
 import os
 import sys
-from typing import Any, List, Mapping
+from typing import Any, List, Mapping, Optional
 from unittest.mock import call, patch
 
 import pytest
@@ -25,7 +25,10 @@ from airbyte_cdk.models import (
 )
 from airbyte_cdk.sources.declarative.declarative_stream import DeclarativeStream
 from airbyte_cdk.sources.declarative.manifest_declarative_source import ManifestDeclarativeSource
+from airbyte_cdk.sources.declarative.parsers.compiled_manifest_cache import CompiledManifestCache
+from airbyte_cdk.sources.declarative.parsers.manifest_reference_resolver import ManifestReferenceResolver
 from airbyte_cdk.sources.declarative.retrievers.simple_retriever import SimpleRetriever
+from airbyte_cdk.sources.streams.call_rate import HttpAPIBudget
 from jsonschema.exceptions import ValidationError
 
 logger = logging.getLogger("airbyte")
@@ -1138,3 +1141,173 @@ def _run_read(manifest: Mapping[str, Any], stream_name: str) -> List[AirbyteMess
         ]
     )
     return list(source.read(logger, {}, catalog, {}))
+
+
+def _incremental_manifest(concurrency_level: Optional[Mapping[str, Any]]) -> Mapping[str, Any]:
+    manifest = {
+        "version": "0.34.2",
+        "type": "DeclarativeSource",
+        "check": {"type": "CheckStream", "stream_names": ["Rates"]},
+        "streams": [
+            {
+                "type": "DeclarativeStream",
+                "name": "Rates",
+                "primary_key": [],
+                "schema_loader": {"type": "InlineSchemaLoader", "schema": {"type": "object", "properties": {}}},
+                "incremental_sync": {
+                    "type": "DatetimeBasedCursor",
+                    "cursor_field": "updated_at",
+                    "datetime_format": "%Y-%m-%d",
+                    "start_datetime": "2023-01-01",
+                    "end_datetime": "2023-01-10",
+                    "step": "P1D",
+                    "cursor_granularity": "P1D",
+                },
+                "retriever": {
+                    "type": "SimpleRetriever",
+                    "requester": {
+                        "type": "HttpRequester",
+                        "url_base": "https://api.apilayer.com",
+                        "path": "/exchangerates_data/latest",
+                        "http_method": "GET",
+                    },
+                    "record_selector": {"type": "RecordSelector", "extractor": {"type": "DpathExtractor", "field_path": ["rates"]}},
+                    "paginator": {"type": "NoPagination"},
+                },
+            }
+        ],
+        "spec": {
+            "connection_specification": {"$schema": "http://json-schema.org/draft-07/schema#", "type": "object", "properties": {}},
+            "documentation_url": "https://example.org",
+            "type": "Spec",
+        },
+    }
+    if concurrency_level:
+        manifest["concurrency_level"] = concurrency_level
+    return manifest
+
+
+def _fetch_page_of_slice(stream_state, stream_slice, next_page_token):
+    return _create_page({"rates": [{"updated_at": stream_slice["start_time"], "value": i} for i in range(3)]})
+
+
+def _run_incremental_read(manifest: Mapping[str, Any], config: Mapping[str, Any]) -> List[AirbyteMessage]:
+    source = ManifestDeclarativeSource(source_config=manifest)
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(
+                stream=AirbyteStream(name="Rates", json_schema={}, supported_sync_modes=[SyncMode.full_refresh, SyncMode.incremental]),
+                sync_mode=SyncMode.incremental,
+                destination_sync_mode=DestinationSyncMode.append,
+            )
+        ]
+    )
+    with patch.object(SimpleRetriever, "_fetch_next_page", side_effect=_fetch_page_of_slice):
+        return list(source.read(logger, config, catalog, None))
+
+
+def test_given_concurrency_level_when_read_then_records_and_state_match_sequential_read():
+    concurrency_level = {"type": "ConcurrencyLevel", "default_concurrency": "{{ config['num_workers'] }}", "max_concurrency": 4}
+
+    sequential_output = _run_incremental_read(_incremental_manifest(None), {})
+    concurrent_output = _run_incremental_read(_incremental_manifest(concurrency_level), {"num_workers": 8})
+
+    def _records(output: List[AirbyteMessage]) -> List[Mapping[str, Any]]:
+        return sorted(
+            (message.record.data for message in output if message.type == Type.RECORD), key=lambda r: (r["updated_at"], r["value"])
+        )
+
+    def _states(output: List[AirbyteMessage]) -> List[Mapping[str, Any]]:
+        return [message.state.stream.stream_state.dict() for message in output if message.type == Type.STATE]
+
+    assert len(_records(concurrent_output)) == 30
+    assert _records(concurrent_output) == _records(sequential_output)
+    assert _states(concurrent_output)[-1] == _states(sequential_output)[-1] == {"updated_at": "2023-01-10"}
+    # The state only moves forward, checkpointing slices closed in order
+    assert [state["updated_at"] for state in _states(concurrent_output)] == sorted(
+        state["updated_at"] for state in _states(concurrent_output)
+    )
+
+
+@pytest.mark.parametrize(
+    "concurrency_level, emit_connector_builder_messages, expects_concurrent_reader",
+    [
+        pytest.param(None, False, False, id="test_no_concurrency_level"),
+        pytest.param({"type": "ConcurrencyLevel", "default_concurrency": 1}, False, False, id="test_concurrency_level_of_one"),
+        pytest.param({"type": "ConcurrencyLevel", "default_concurrency": 2}, False, True, id="test_concurrency_level"),
+        pytest.param({"type": "ConcurrencyLevel", "default_concurrency": 2}, True, False, id="test_connector_builder"),
+    ],
+)
+def test_concurrent_slice_reader_is_set_on_streams(concurrency_level, emit_connector_builder_messages, expects_concurrent_reader):
+    source = ManifestDeclarativeSource(
+        source_config=_incremental_manifest(concurrency_level), emit_connector_builder_messages=emit_connector_builder_messages
+    )
+
+    stream = source.streams({})[0]
+
+    assert isinstance(stream, DeclarativeStream)
+    assert (stream.concurrent_slice_reader is not None) == expects_concurrent_reader
+
+
+def test_given_compiled_manifest_cache_when_create_source_again_then_manifest_is_not_compiled(tmp_path):
+    cache = CompiledManifestCache(str(tmp_path))
+    manifest = _incremental_manifest(None)
+    compiled_source = ManifestDeclarativeSource(source_config=manifest, compiled_manifest_cache=cache)
+
+    with patch.object(ManifestReferenceResolver, "preprocess_manifest") as preprocess_manifest, patch.object(
+        ManifestDeclarativeSource, "_validate_source"
+    ) as validate_source:
+        source = ManifestDeclarativeSource(source_config=manifest, compiled_manifest_cache=cache)
+
+    preprocess_manifest.assert_not_called()
+    validate_source.assert_not_called()
+    assert source.resolved_manifest == compiled_source.resolved_manifest
+    assert [stream.name for stream in source.streams({})] == ["Rates"]
+
+
+def test_when_read_then_only_streams_of_the_catalog_are_created():
+    manifest = _incremental_manifest(None)
+    manifest["streams"].append({**manifest["streams"][0], "name": "NotInCatalog"})
+    source = ManifestDeclarativeSource(source_config=manifest)
+    created_streams: List[str] = []
+    create_component = source._constructor.create_component
+
+    def _create_component(model_type, component_definition, config, **kwargs):
+        created_streams.append(component_definition["name"])
+        return create_component(model_type, component_definition, config, **kwargs)
+
+    with patch.object(source._constructor, "create_component", side_effect=_create_component), patch.object(
+        SimpleRetriever, "_fetch_next_page", side_effect=_fetch_page_of_slice
+    ):
+        catalog = ConfiguredAirbyteCatalog(
+            streams=[
+                ConfiguredAirbyteStream(
+                    stream=AirbyteStream(name="Rates", json_schema={}, supported_sync_modes=[SyncMode.full_refresh]),
+                    sync_mode=SyncMode.full_refresh,
+                    destination_sync_mode=DestinationSyncMode.append,
+                )
+            ]
+        )
+        records = [message for message in source.read(logger, {}, catalog, None) if message.type == Type.RECORD]
+
+    assert created_streams == ["Rates"]
+    assert len(records) == 30
+    assert [stream.name for stream in source.streams({})] == ["Rates", "NotInCatalog"]
+
+
+def test_given_api_budget_then_the_requesters_of_all_the_streams_share_it():
+    manifest = _incremental_manifest(None)
+    manifest["streams"].append({**manifest["streams"][0], "name": "OtherRates"})
+    manifest["api_budget"] = {
+        "policies": [
+            {"type": "TokenBucketCallRatePolicy", "rate": {"limit": 10, "interval": "PT1S"}, "matchers": [{"url_pattern": "/latest"}]}
+        ]
+    }
+    source = ManifestDeclarativeSource(source_config=manifest)
+
+    streams = source.streams({})
+
+    api_budgets = [stream.retriever.requester.api_budget for stream in streams]
+    assert isinstance(api_budgets[0], HttpAPIBudget)
+    assert api_budgets[0] is api_budgets[1]
+    assert source.streams({})[0].retriever.requester.api_budget is api_budgets[0]
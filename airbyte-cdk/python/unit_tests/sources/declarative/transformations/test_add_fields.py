@@ -2,9 +2,13 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import copy
 from typing import Any, List, Mapping, Optional, Tuple
+from unittest.mock import patch
 
+import dpath.util
 import pytest
+from airbyte_cdk.sources.declarative.interpolation.jinja import JinjaInterpolation
 from airbyte_cdk.sources.declarative.transformations import AddFields
 from airbyte_cdk.sources.declarative.transformations.add_fields import AddedFieldDefinition
 from airbyte_cdk.sources.declarative.types import FieldPointer
@@ -132,4 +136,70 @@ def test_add_fields(
     expected: Mapping[str, Any],
 ):
     inputs = [AddedFieldDefinition(path=v[0], value=v[1], value_type=field_type, parameters={}) for v in field]
+    page = [copy.deepcopy(input_record)]
     assert AddFields(fields=inputs, parameters={"alas": "i live"}).transform(input_record, **kwargs) == expected
+
+    AddFields(fields=inputs, parameters={"alas": "i live"}).transform_page(page, **kwargs)
+    assert page == [expected]
+
+
+def test_add_fields_evaluates_values_not_referencing_the_record_once_per_page():
+    inputs = [
+        AddedFieldDefinition(path=["from_state"], value="{{ stream_state['cursor'] }}", value_type=None, parameters={}),
+        AddedFieldDefinition(path=["from_record"], value="{{ record['id'] * 2 }}", value_type=None, parameters={}),
+        AddedFieldDefinition(path=["nested", "list"], value="{{ [config['value']] }}", value_type=None, parameters={}),
+    ]
+    add_fields = AddFields(fields=inputs, parameters={})
+    page = [{"id": 1}, {"id": 2}, {"id": 3}]
+
+    with patch.object(JinjaInterpolation, "eval", side_effect=JinjaInterpolation.eval, autospec=True) as interpolation_eval:
+        add_fields.transform_page(page, config={"value": "v"}, stream_state={"cursor": "c"})
+
+    assert page == [{"id": i, "from_state": "c", "from_record": i * 2, "nested": {"list": ["v"]}} for i in range(1, 4)]
+    assert interpolation_eval.call_count == 2 + len(page)
+    # Each record gets its own copy of mutable values
+    page[0]["nested"]["list"].append("modified")
+    assert page[1]["nested"]["list"] == ["v"]
+
+
+def test_given_subclass_overriding_transform_when_transform_page_then_transform_is_called_for_each_record():
+    class _AddFieldsAndCount(AddFields):
+        def transform(self, record, config=None, stream_state=None, stream_slice=None):
+            record = super().transform(record, config=config, stream_state=stream_state, stream_slice=stream_slice)
+            record["count"] = len(record)
+            return record
+
+    add_fields = _AddFieldsAndCount(
+        fields=[AddedFieldDefinition(path=["added"], value="{{ config['value'] }}", value_type=None, parameters={})], parameters={}
+    )
+    page = [{"id": 1}, {"id": 2}]
+
+    add_fields.transform_page(page, config={"value": "v"})
+
+    assert page == [{"id": 1, "added": "v", "count": 2}, {"id": 2, "added": "v", "count": 2}]
+
+
+@pytest.mark.parametrize(
+    "record, path",
+    [
+        pytest.param({}, ["a", "b", "c"], id="test_creates_missing_parents"),
+        pytest.param({"a": {"b": {"other": 1}}}, ["a", "b", "c"], id="test_keeps_existing_parents"),
+        pytest.param({"a": "leaf"}, ["a", "b"], id="test_fails_on_leaf_parent"),
+        pytest.param({"a": [{"b": 1}]}, ["a", 0, "b"], id="test_integer_segment"),
+        pytest.param({"a": ["x"]}, ["a", "b"], id="test_string_segment_on_list"),
+    ],
+)
+def test_add_fields_sets_values_like_dpath(record, path):
+    add_fields = AddFields(fields=[AddedFieldDefinition(path=path, value="value", value_type=None, parameters={})], parameters={})
+    expected_record = copy.deepcopy(record)
+    try:
+        dpath.util.new(expected_record, path, "value")
+        expected_exception = None
+    except Exception as exception:
+        expected_exception = exception
+
+    if expected_exception:
+        with pytest.raises(type(expected_exception)):
+            add_fields.transform(record)
+    else:
+        assert add_fields.transform(record) == expected_record
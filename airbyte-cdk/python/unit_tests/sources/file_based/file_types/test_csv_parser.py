@@ -25,7 +25,7 @@ from airbyte_cdk.sources.file_based.config.csv_format import (
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
 from airbyte_cdk.sources.file_based.exceptions import RecordParseError
 from airbyte_cdk.sources.file_based.file_based_stream_reader import AbstractFileBasedStreamReader, FileReadMode
-from airbyte_cdk.sources.file_based.file_types.csv_parser import CsvParser, _CsvReader
+from airbyte_cdk.sources.file_based.file_types.csv_parser import CsvParser, _ArrowCsvReader, _CsvReader
 from airbyte_cdk.sources.file_based.remote_file import RemoteFile
 from airbyte_cdk.utils.traced_exception import AirbyteTracedException
 
@@ -453,6 +453,19 @@ class CsvReaderTest(unittest.TestCase):
         data_generator.close()
         assert f"{self._CONFIG_NAME}_config_dialect" not in csv.list_dialects()
 
+    def test_given_files_of_the_same_stream_read_concurrently_when_read_data_then_unregister_dialect_once_all_are_read(self) -> None:
+        self._stream_reader.open_file.side_effect = lambda *args: CsvFileBuilder().with_data(["header", "a value", "another value"]).build()
+
+        first_data_generator = self._read_data()
+        second_data_generator = self._read_data()
+        next(first_data_generator)
+        next(second_data_generator)
+        first_data_generator.close()
+
+        assert f"{self._CONFIG_NAME}_config_dialect" in csv.list_dialects()
+        assert list(second_data_generator) == [{"header": "another value"}]
+        assert f"{self._CONFIG_NAME}_config_dialect" not in csv.list_dialects()
+
     def test_given_too_many_values_for_columns_when_read_data_then_raise_exception_and_unregister_dialect(self) -> None:
         self._stream_reader.open_file.return_value = (
             CsvFileBuilder()
@@ -538,3 +551,218 @@ def test_encoding_is_passed_to_stream_reader() -> None:
             mock.call().__exit__(None, None, None),
         ]
     )
+
+
+_PARITY_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "id": {"type": "integer"},
+        "score": {"type": ["null", "number"]},
+        "active": {"type": "boolean"},
+        "name": {"type": "string"},
+        "payload": {"type": "object"},
+        "tags": {"type": "array"},
+        "nothing": {"type": "null"},
+    },
+}
+_PARITY_HEADER = "id,score,active,name,payload,tags,nothing"
+
+
+def _read_with_both_engines(
+    data: bytes, config_format: CsvFormat, schema: Any, schemaless: bool = False, block_size: int = 32
+) -> List[Any]:
+    results = []
+    for use_arrow_engine in [False, True]:
+        parser = CsvParser(use_arrow_engine=use_arrow_engine)
+        if use_arrow_engine:
+            parser._arrow_csv_reader = _ArrowCsvReader(_CsvReader(), block_size=block_size)
+        stream_reader = Mock(spec=AbstractFileBasedStreamReader)
+        stream_reader.open_file.side_effect = lambda file, mode, encoding, logger: (
+            io.BytesIO(data) if mode == FileReadMode.READ_BINARY else io.TextIOWrapper(io.BytesIO(data), encoding=encoding)
+        )
+        config = FileBasedStreamConfig(
+            name="parity", validation_policy="Emit Record", file_type="csv", format=config_format, schemaless=schemaless
+        )
+        logger = Mock(spec=logging.Logger)
+        records = []
+        error = None
+        try:
+            for record in parser.parse_records(
+                config, RemoteFile(uri="a uri", last_modified=datetime.now()), stream_reader, logger, schema
+            ):
+                records.append(record)
+        except Exception as exception:
+            error = (type(exception), str(exception))
+        results.append((records, error, logger.warning.call_args_list))
+    return results
+
+
+@pytest.mark.parametrize(
+    "rows,config_format,schema",
+    [
+        pytest.param(
+            [
+                _PARITY_HEADER,
+                '1,1.5,true,a name,"{""a"": 1}","[1, 2]",',
+                "-2,.5,false,,{},[],",
+                '007,1e3,1,"quoted, name",{},[],',
+            ],
+            CsvFormat(),
+            _PARITY_SCHEMA,
+            id="values_of_all_types",
+        ),
+        pytest.param(
+            [
+                _PARITY_HEADER,
+                "0x1,1.,maybe,name,not json,{},value",
+                " 1,inf,yes,name,[],not json,",
+                "+1,1_0,TRUE,name,1,1,",
+                "1_0, 2,no,name,{},[],",
+                "99999999999999999999,1e400,0,name,{},[],",
+            ],
+            CsvFormat(),
+            _PARITY_SCHEMA,
+            id="values_cast_differently_by_arrow",
+        ),
+        pytest.param(
+            [_PARITY_HEADER, "NULL,,true,NULL,{},[],", "1,NULL,NULL,,{},[],"],
+            CsvFormat(null_values={"NULL", ""}),
+            _PARITY_SCHEMA,
+            id="null_values",
+        ),
+        pytest.param(
+            [_PARITY_HEADER, "NULL,,true,NULL,{},[],", "1,NULL,NULL,,{},[],"],
+            CsvFormat(null_values={"NULL", ""}, strings_can_be_null=False),
+            _PARITY_SCHEMA,
+            id="strings_can_not_be_null",
+        ),
+        pytest.param(
+            ["id,name,extra", "1,a name,extra value", "2,another name,"],
+            CsvFormat(true_values={"oui"}, false_values={"non"}),
+            {"type": "object", "properties": {"id": {"type": "integer"}, "name": {"type": "string"}}},
+            id="columns_not_in_schema",
+        ),
+        pytest.param(
+            ["extra", "extra value"],
+            CsvFormat(),
+            {"type": "object", "properties": {"id": {"type": "integer"}}},
+            id="no_column_in_schema",
+        ),
+        pytest.param(["id,name,id", "1,a name,2", "3,another name,4"], CsvFormat(), None, id="duplicated_headers"),
+        pytest.param(
+            ["skipped", "skipped too", "id,name", "skipped after", "1,a name"],
+            CsvFormat(skip_rows_before_header=2, skip_rows_after_header=1),
+            None,
+            id="skipped_rows",
+        ),
+        pytest.param(
+            ["skipped", "1,a name", "2,another name"],
+            CsvFormat(skip_rows_before_header=1, header_definition=CsvHeaderAutogenerated()),
+            None,
+            id="autogenerated_headers",
+        ),
+        pytest.param(
+            ["1,a name", "2,another name"],
+            CsvFormat(header_definition=CsvHeaderUserProvided(column_names=["id", "name"])),
+            _PARITY_SCHEMA,
+            id="user_provided_headers",
+        ),
+        pytest.param(
+            ["id;name", "1;'a ''quoted'' name'", "2;'a name; with a delimiter'", "3;a \\; escaped delimiter"],
+            CsvFormat(delimiter=";", quote_char="'", escape_char="\\"),
+            None,
+            id="delimiter_quote_and_escape_chars",
+        ),
+        pytest.param(
+            ["id,name", '1,"a ""name"""', '2,"a \\"name\\""'],
+            CsvFormat(double_quote=False, escape_char="\\"),
+            None,
+            id="double_quote_off",
+        ),
+        pytest.param(['id,name\r\n1,"a\r\nmultiline\rname"\r\n2,name\r\n'], CsvFormat(), None, id="newlines_in_values"),
+        pytest.param(["id,name", "", "1,a name", "", ""], CsvFormat(), None, id="empty_lines"),
+        pytest.param([_PARITY_HEADER], CsvFormat(), _PARITY_SCHEMA, id="no_rows"),
+        pytest.param(
+            ["id,name"] + [f"{i},name {i}" for i in range(20)] + ["21,name,too many values"] + [f"{i},name {i}" for i in range(5)],
+            CsvFormat(),
+            None,
+            id="too_many_values_after_many_rows",
+        ),
+        pytest.param(["id,name", "1,a name", "2"], CsvFormat(), None, id="too_few_values"),
+        pytest.param(["id,name", "1,a name", "2,\x00"], CsvFormat(), None, id="nul_character"),
+    ],
+)
+def test_arrow_engine_reads_like_the_csv_module(rows: List[str], config_format: CsvFormat, schema: Any) -> None:
+    data = "\n".join(rows).encode("utf8")
+    python_result, arrow_result = _read_with_both_engines(data, config_format, schema)
+    assert arrow_result == python_result
+
+
+@pytest.mark.parametrize(
+    "data,encoding",
+    [
+        pytest.param("id,name\n1,é\n".encode("latin1"), "latin1", id="latin1"),
+        pytest.param(b"\xef\xbb\xbfid,name\n1,a name\n", "utf8", id="byte_order_mark"),
+        pytest.param(b"\xef\xbb\xbfid,name\n1,a name\n", "utf-8-sig", id="byte_order_mark_with_utf_8_sig"),
+        pytest.param(b"id,name\n1,\xff\n", "utf8", id="invalid_utf8"),
+    ],
+)
+def test_arrow_engine_decodes_like_the_csv_module(data: bytes, encoding: str) -> None:
+    python_result, arrow_result = _read_with_both_engines(data, CsvFormat(encoding=encoding), None)
+    assert arrow_result == python_result
+
+
+def test_arrow_engine_reads_schemaless_streams_like_the_csv_module() -> None:
+    data = "\n".join([_PARITY_HEADER, "1,1.5,true,NULL,{},[],"]).encode("utf8")
+    python_result, arrow_result = _read_with_both_engines(data, CsvFormat(null_values={"NULL"}), _PARITY_SCHEMA, schemaless=True)
+    assert arrow_result == python_result
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        pytest.param(["1", "yes", "0", "no"], id="booleans"),
+        pytest.param(["2", "90329", "NULL", "5645"], id="integers"),
+        pytest.param(["2", "2.312", "1e5"], id="numbers"),
+        pytest.param(["2", "a string"], id="strings"),
+        pytest.param(["NULL", "NULL"], id="null_values"),
+    ],
+)
+def test_arrow_engine_infers_schema_like_the_csv_module(values: List[str]) -> None:
+    data = "\n".join(["header,other"] + [f"{value},{value}" for value in values]).encode("utf8")
+    schemas = []
+    for use_arrow_engine in [False, True]:
+        parser = CsvParser(use_arrow_engine=use_arrow_engine)
+        stream_reader = Mock(spec=AbstractFileBasedStreamReader)
+        stream_reader.open_file.side_effect = lambda file, mode, encoding, logger: (
+            io.BytesIO(data) if mode == FileReadMode.READ_BINARY else io.TextIOWrapper(io.BytesIO(data), encoding=encoding)
+        )
+        config = FileBasedStreamConfig(
+            name="parity",
+            validation_policy="Emit Record",
+            file_type="csv",
+            format=CsvFormat(null_values={"NULL"}, inference_type=InferenceType.PRIMITIVE_TYPES_ONLY),
+        )
+        file = RemoteFile(uri="a uri", last_modified=datetime.now())
+        schemas.append(asyncio.get_event_loop().run_until_complete(parser.infer_schema(config, file, stream_reader, Mock())))
+    assert schemas[1] == schemas[0]
+
+
+def test_given_big_file_when_infer_schema_with_arrow_engine_then_stop_at_the_same_row() -> None:
+    data = "\n".join(["header"] + ["2." + "2" * 100] * 20 + ["this is a string"]).encode("utf8")
+    parser = CsvParser(use_arrow_engine=True)
+    parser._arrow_csv_reader = _ArrowCsvReader(_CsvReader(), block_size=256)
+    stream_reader = Mock(spec=AbstractFileBasedStreamReader)
+    stream_reader.open_file.side_effect = lambda *_: io.BytesIO(data)
+    config = FileBasedStreamConfig(
+        name="parity", validation_policy="Emit Record", file_type="csv", format=CsvFormat(inference_type=InferenceType.PRIMITIVE_TYPES_ONLY)
+    )
+    file = RemoteFile(uri="a uri", last_modified=datetime.now())
+
+    with mock.patch.object(CsvParser, "_MAX_BYTES_PER_FILE_FOR_SCHEMA_INFERENCE", 20 * 102):
+        schema = asyncio.get_event_loop().run_until_complete(parser.infer_schema(config, file, stream_reader, Mock()))
+    assert schema == {"header": {"type": "number"}}
+
+    with mock.patch.object(CsvParser, "_MAX_BYTES_PER_FILE_FOR_SCHEMA_INFERENCE", 20 * 102 + 1):
+        schema = asyncio.get_event_loop().run_until_complete(parser.infer_schema(config, file, stream_reader, Mock()))
+    assert schema == {"header": {"type": "string"}}
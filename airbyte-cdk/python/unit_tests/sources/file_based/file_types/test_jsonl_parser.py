@@ -156,3 +156,34 @@ def test_given_unparsable_json_when_parse_records_then_raise_error(stream_reader
     with pytest.raises(RecordParseError):
         list(JsonlParser().parse_records(Mock(), Mock(), stream_reader, logger, None))
     assert logger.warning.call_count == 0
+
+
+def test_given_big_multiline_json_object_when_parse_records_then_return_record(stream_reader: MagicMock) -> None:
+    record = {f"key{i}": i for i in range(100_000)}
+    stream_reader.open_file.return_value.__enter__.return_value = io.StringIO(
+        json.dumps(record, indent=2) + "\n" + json.dumps(record, indent=2)
+    )
+
+    records = list(JsonlParser().parse_records(Mock(), Mock(), stream_reader, Mock(), None))
+
+    assert records == [record, record]
+
+
+def test_given_blank_lines_between_records_when_parse_records_then_return_records(stream_reader: MagicMock) -> None:
+    stream_reader.open_file.return_value.__enter__.return_value = io.StringIO('{"a": 1}\n\n  \n{"a": 2}\n\n')
+    records = list(JsonlParser().parse_records(Mock(), Mock(), stream_reader, Mock(), None))
+    assert records == [{"a": 1}, {"a": 2}]
+
+
+def test_given_integers_over_64_bits_when_parse_records_then_keep_them_exact(stream_reader: MagicMock) -> None:
+    stream_reader.open_file.return_value.__enter__.return_value = io.StringIO('{"a": 1180591620717411303425}\n{"a": -9223372036854775809}')
+    records = list(JsonlParser().parse_records(Mock(), Mock(), stream_reader, Mock(), None))
+    assert records == [{"a": 2**70 + 1}, {"a": -(2**63) - 1}]
+
+
+def test_given_multiline_json_object_followed_by_another_on_the_same_line_when_parse_records_then_stop_parsing(
+    stream_reader: MagicMock,
+) -> None:
+    stream_reader.open_file.return_value.__enter__.return_value = io.StringIO('{"a": 1}\n{\n"a": 2\n} {"a": 3}\n{"a": 4}')
+    records = list(JsonlParser().parse_records(Mock(), Mock(), stream_reader, Mock(), None))
+    assert records == [{"a": 1}]
@@ -4,11 +4,14 @@
 
 import asyncio
 import datetime
+import decimal
+import io
 import math
-from typing import Any, Mapping, Union
+from typing import Any, List, Mapping, Optional, Union
 from unittest.mock import Mock
 
 import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 from airbyte_cdk.sources.file_based.config.csv_format import CsvFormat
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig, ValidationPolicy
@@ -173,12 +176,15 @@ def test_type_mapping(parquet_type: pa.DataType, expected_type: Mapping[str, str
 def test_value_transformation(
     pyarrow_type: pa.DataType, parquet_format: ParquetFormat, parquet_object: Scalar, expected_value: Any
 ) -> None:
-    pyarrow_value = pa.array([parquet_object], type=pyarrow_type)[0]
-    py_value = ParquetParser._to_output_value(pyarrow_value, parquet_format)
+    pyarrow_values = pa.array([parquet_object], type=pyarrow_type)
+    py_value = ParquetParser._to_output_value(pyarrow_values[0], parquet_format)
+    [py_column_value] = ParquetParser._to_output_values(pyarrow_values, parquet_format)
     if isinstance(py_value, float):
         assert math.isclose(py_value, expected_value, abs_tol=0.01)
+        assert math.isclose(py_column_value, expected_value, abs_tol=0.01)
     else:
         assert py_value == expected_value
+        assert py_column_value == expected_value
 
 
 def test_value_dictionary() -> None:
@@ -227,3 +233,71 @@ def test_wrong_file_format(file_format: Union[CsvFormat, JsonlFormat]) -> None:
     logger = Mock()
     with pytest.raises(ValueError):
         asyncio.get_event_loop().run_until_complete(parser.infer_schema(config, file, stream_reader, logger))
+
+
+def _parquet_file(table: pa.Table, row_group_size: int) -> io.BytesIO:
+    buffer = io.BytesIO()
+    pq.write_table(table, buffer, row_group_size=row_group_size)
+    buffer.seek(0)
+    return buffer
+
+
+def _parse_records(
+    table: pa.Table, uri: str = "s3://bucket/test.parquet", discovered_schema: Optional[Mapping[str, Any]] = None, **config: Any
+) -> List[Mapping[str, Any]]:
+    stream_reader = Mock()
+    stream_reader.open_file.return_value = _parquet_file(table, row_group_size=7)
+    stream_config = FileBasedStreamConfig(name="test", file_type="parquet", format=_default_parquet_format, **config)
+    file = RemoteFile(uri=uri, last_modified=datetime.datetime.now())
+    return list(ParquetParser(batch_size=5).parse_records(stream_config, file, stream_reader, Mock(), discovered_schema))
+
+
+_TABLE = pa.table(
+    {
+        "id": pa.array(range(12), type=pa.int64()),
+        "created_at": pa.array([datetime.datetime(2023, 1, 1, i) if i % 3 else None for i in range(12)], type=pa.timestamp("s")),
+        "amount": pa.array([decimal.Decimal(i) if i % 4 else None for i in range(12)], type=pa.decimal128(5, 2)),
+        "payload": pa.array([f"payload {i}".encode() for i in range(12)], type=pa.binary()),
+    }
+)
+
+
+def test_parse_records_across_row_groups_and_batches() -> None:
+    records = _parse_records(_TABLE)
+
+    assert records == [
+        {
+            "id": i,
+            "created_at": datetime.datetime(2023, 1, 1, i).isoformat() if i % 3 else None,
+            "amount": f"{i}.00" if i % 4 else None,
+            "payload": f"payload {i}",
+        }
+        for i in range(12)
+    ]
+
+
+def test_parse_records_adds_partition_columns() -> None:
+    records = _parse_records(_TABLE.select(["id"]), uri="bucket/year=2023/month=01/test.parquet")
+
+    assert records == [{"id": i, "year": "2023", "month": "01"} for i in range(12)]
+
+
+@pytest.mark.parametrize(
+    "config, expected_columns",
+    [
+        pytest.param({}, ["id", "payload"], id="test_only_catalog_columns_are_read"),
+        pytest.param({"schemaless": True}, ["id", "created_at", "amount", "payload"], id="test_schemaless_reads_all_columns"),
+        pytest.param(
+            {"validation_policy": ValidationPolicy.skip_record},
+            ["id", "created_at", "amount", "payload"],
+            id="test_validation_policy_needing_all_columns_reads_all_columns",
+        ),
+    ],
+)
+def test_parse_records_column_projection(config: Mapping[str, Any], expected_columns: List[str]) -> None:
+    discovered_schema = {"type": "object", "properties": {"id": {"type": "integer"}, "payload": {"type": "string"}, "missing": {}}}
+
+    records = _parse_records(_TABLE, discovered_schema=discovered_schema, **config)
+
+    assert len(records) == 12
+    assert all(list(record.keys()) == expected_columns for record in records)
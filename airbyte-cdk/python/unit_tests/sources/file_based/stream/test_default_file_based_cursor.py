@@ -2,6 +2,7 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import random
 from datetime import datetime, timedelta
 from typing import Any, List, Mapping
 from unittest.mock import MagicMock
@@ -298,6 +299,43 @@ def test_set_initial_state_no_history() -> None:
     cursor.set_initial_state({})
 
 
+def test_history_is_evicted_and_cursor_is_computed_as_when_scanning_the_history() -> None:
+    cursor = get_cursor(10, 3)
+    cursor.set_initial_state(
+        {"history": {f"initial_{i}.csv": f"2023-01-{i + 1:02d}T00:00:00.000000Z" for i in range(5)}, "_ab_source_file_last_modified": ""}
+    )
+    expected_history = dict(cursor.get_state()["history"])
+    rng = random.Random(42)
+
+    for i in range(500):
+        # Files are added several times, sometimes with an earlier last modified date than the one in the history
+        uri = f"file_{rng.randrange(30)}.csv"
+        file = RemoteFile(uri=uri, last_modified=datetime(2023, 1, 1) + timedelta(hours=rng.randrange(24 * 30)), file_type="csv")
+        cursor.add_file(file)
+
+        expected_history[uri] = file.last_modified.strftime(DefaultFileBasedCursor.DATE_TIME_FORMAT)
+        if len(expected_history) > 10:
+            del expected_history[min(expected_history.items(), key=lambda f: (f[1], f[0]))[0]]
+        latest_uri, latest_timestamp = max(expected_history.items(), key=lambda f: (f[1], f[0]))
+        earliest_uri, earliest_timestamp = min(expected_history.items(), key=lambda f: (f[1], f[0]))
+
+        assert cursor.get_state() == {"history": expected_history, "_ab_source_file_last_modified": f"{latest_timestamp}_{latest_uri}"}
+        assert cursor._compute_earliest_file_in_history() == RemoteFile(
+            uri=earliest_uri, last_modified=datetime.strptime(earliest_timestamp, DefaultFileBasedCursor.DATE_TIME_FORMAT)
+        )
+
+
+@pytest.mark.parametrize(
+    "timestamp",
+    [
+        pytest.param("2023-06-06T12:34:56.123456Z", id="written_by_the_cursor"),
+        pytest.param("2023-06-06T12:34:56.1Z", id="short_microseconds"),
+    ],
+)
+def test_parse_datetime(timestamp: str) -> None:
+    assert DefaultFileBasedCursor._parse_datetime(timestamp) == datetime.strptime(timestamp, DefaultFileBasedCursor.DATE_TIME_FORMAT)
+
+
 def get_cursor(max_history_size: int, days_to_sync_if_history_is_full: int) -> DefaultFileBasedCursor:
     cursor_cls = DefaultFileBasedCursor
     cursor_cls.DEFAULT_MAX_HISTORY_SIZE = max_history_size
@@ -2,6 +2,7 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import threading
 import unittest
 from datetime import datetime, timezone
 from typing import Any, Iterable, Iterator, Mapping
@@ -65,6 +66,7 @@ def test_fill_nulls(input_schema: Mapping[str, Any], expected_output: Mapping[st
 
 class DefaultFileBasedStreamTest(unittest.TestCase):
     _NOW = datetime(2022, 10, 22, tzinfo=timezone.utc)
+    _LATER = datetime(2022, 10, 23, tzinfo=timezone.utc)
     _A_RECORD = {"a_record": 1}
 
     def setUp(self) -> None:
@@ -138,6 +140,43 @@ class DefaultFileBasedStreamTest(unittest.TestCase):
         assert messages[0].log.level == Level.ERROR
         assert messages[1].log.level == Level.WARN
 
+    def test_given_concurrent_file_reads_when_read_records_from_slice_then_output_is_the_same_as_reading_one_file_at_a_time(self) -> None:
+        def _parse_records(config: Any, file: RemoteFile, *args: Any) -> Iterator[Mapping[str, Any]]:
+            if file.uri == "invalid_file":
+                return self._iter([{"line": 1}, ValueError("An error")])
+            return iter([{"file": file.uri, "line": i} for i in range(300)])
+
+        self._parser.parse_records.side_effect = _parse_records
+        files = [
+            RemoteFile(uri=uri, last_modified=last_modified)
+            for uri, last_modified in [("file0", self._NOW), ("invalid_file", self._NOW), ("file2", self._LATER), ("file3", self._LATER)]
+        ]
+        concurrent_cursor = Mock(spec=AbstractFileBasedCursor)
+        concurrent_stream = DefaultFileBasedStream(
+            config=self._stream_config,
+            catalog_schema=self._catalog_schema,
+            stream_reader=self._stream_reader,
+            availability_strategy=self._availability_strategy,
+            discovery_policy=self._discovery_policy,
+            parsers={MockFormat: self._parser},
+            validation_policy=self._validation_policy,
+            cursor=concurrent_cursor,
+            n_concurrent_file_reads=3,
+        )
+
+        self._stream_reader.get_matching_files.return_value = files
+        concurrent_cursor.get_files_to_sync.return_value = files
+
+        slices = concurrent_stream.compute_slices()
+        assert len(slices) == 2
+        expected = [message for stream_slice in slices for message in self._stream.read_records_from_slice(stream_slice)]
+        messages = [message for stream_slice in slices for message in concurrent_stream.read_records_from_slice(stream_slice)]
+
+        assert [message.record.data if message.record else message.log.message for message in messages] == [
+            message.record.data if message.record else message.log.message for message in expected
+        ]
+        assert concurrent_cursor.add_file.call_args_list == self._cursor.add_file.call_args_list
+
     def test_override_max_n_files_for_schema_inference_is_respected(self) -> None:
         self._discovery_policy.n_concurrent_requests = 1
         self._discovery_policy.get_max_n_files_for_schema_inference.return_value = 3
@@ -159,6 +198,48 @@ class DefaultFileBasedStreamTest(unittest.TestCase):
         }
         assert self._parser.infer_schema.call_count == 3
 
+    def test_given_concurrent_requests_when_infer_schema_then_files_are_inferred_concurrently(self) -> None:
+        self._discovery_policy.n_concurrent_requests = 3
+        barrier = threading.Barrier(3, timeout=5)
+
+        async def _infer_schema_once_all_files_are_opened(*args: Any, **kwargs: Any) -> Mapping[str, Any]:
+            # blocks like a parser reading a file; would raise BrokenBarrierError if the files were inferred one after another
+            barrier.wait()
+            return {"data": {"type": "string"}}
+
+        self._parser.infer_schema.side_effect = _infer_schema_once_all_files_are_opened
+        files = [RemoteFile(uri=f"file{i}", last_modified=self._NOW) for i in range(3)]
+
+        assert self._stream.infer_schema(files) == {"data": {"type": ["null", "string"]}}
+        assert self._parser.infer_schema.call_count == 3
+
+    def test_given_conflicting_schemas_when_infer_schema_then_skip_conflicting_files_only(self) -> None:
+        self._discovery_policy.n_concurrent_requests = 2
+        schemas_by_uri = {
+            "file0": {"a": {"type": "integer"}},
+            "file1": {"b": {"type": "string"}},
+            "file2": {"a": {"type": "object"}},
+            "file3": {"c": {"type": "number"}},
+            "file4": ValueError("An error"),
+            "file5": {"a": {"type": "number"}},
+        }
+
+        async def _infer_schema(config: Any, file: RemoteFile, *args: Any) -> Mapping[str, Any]:
+            if isinstance(schemas_by_uri[file.uri], Exception):
+                raise schemas_by_uri[file.uri]
+            return schemas_by_uri[file.uri]
+
+        self._parser.infer_schema.side_effect = _infer_schema
+        files = [RemoteFile(uri=uri, last_modified=self._NOW) for uri in schemas_by_uri]
+
+        schema = self._stream.infer_schema(files)
+
+        assert schema == {
+            "a": {"type": ["null", "number"]},
+            "b": {"type": ["null", "string"]},
+            "c": {"type": ["null", "number"]},
+        }
+
     def _iter(self, x: Iterable[Any]) -> Iterator[Any]:
         for item in x:
             if isinstance(item, Exception):
@@ -0,0 +1,103 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+import time
+from datetime import datetime
+from typing import Iterable, List
+
+import pytest
+from airbyte_cdk.sources.file_based.file_types.file_type_parser import Record
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+from airbyte_cdk.sources.file_based.stream.file_prefetcher import FilePrefetcher
+
+_NOW = datetime(2023, 1, 1)
+
+
+def _files(n: int) -> List[RemoteFile]:
+    return [RemoteFile(uri=f"file{i}", last_modified=_NOW) for i in range(n)]
+
+
+def _parse(file: RemoteFile) -> Iterable[Record]:
+    for i in range(250):
+        yield {"file": file.uri, "line": i}
+
+
+@pytest.mark.parametrize("n_concurrent_files", [2, 3, 10])
+def test_records_are_read_in_order(n_concurrent_files):
+    files = _files(5)
+    prefetcher = FilePrefetcher(_parse, n_concurrent_files, batch_size=7, max_batches_per_file=2)
+    prefetcher.schedule(files)
+
+    for file in files:
+        assert list(prefetcher.read(file)) == list(_parse(file))
+
+
+def test_next_files_are_parsed_while_reading_the_current_one():
+    files = _files(3)
+    all_files_opened = threading.Barrier(3, timeout=5)
+
+    def _parse_once_all_files_are_opened(file: RemoteFile) -> Iterable[Record]:
+        all_files_opened.wait()
+        yield {"file": file.uri}
+
+    prefetcher = FilePrefetcher(_parse_once_all_files_are_opened, 3)
+    prefetcher.schedule(files)
+
+    assert [record for file in files for record in prefetcher.read(file)] == [{"file": file.uri} for file in files]
+
+
+def test_given_parsing_error_then_records_parsed_before_the_error_are_read_first():
+    def _parse_with_error(file: RemoteFile) -> Iterable[Record]:
+        yield {"line": 1}
+        yield {"line": 2}
+        raise ValueError("An error")
+
+    prefetcher = FilePrefetcher(_parse_with_error, 2, batch_size=10)
+    prefetcher.schedule(_files(2))
+    records = []
+
+    with pytest.raises(ValueError):
+        for record in prefetcher.read(_files(1)[0]):
+            records.append(record)
+
+    assert records == [{"line": 1}, {"line": 2}]
+
+
+def test_given_file_not_scheduled_then_it_is_parsed_on_demand():
+    prefetcher = FilePrefetcher(_parse, 3)
+    prefetcher.schedule(_files(2))
+    file = RemoteFile(uri="not scheduled", last_modified=_NOW)
+
+    assert list(prefetcher.read(file)) == list(_parse(file))
+
+
+def test_given_scheduled_files_are_skipped_then_following_files_are_read():
+    files = _files(5)
+    prefetcher = FilePrefetcher(_parse, 2)
+    prefetcher.schedule(files)
+
+    assert list(prefetcher.read(files[3])) == list(_parse(files[3]))
+    assert list(prefetcher.read(files[4])) == list(_parse(files[4]))
+
+
+def test_given_file_is_not_read_until_the_end_then_prefetching_stops():
+    files = _files(3)
+    parsed = {file.uri: 0 for file in files}
+
+    def _count_parsed_records(file: RemoteFile) -> Iterable[Record]:
+        for i in range(1000):
+            parsed[file.uri] += 1
+            yield {"line": i}
+
+    prefetcher = FilePrefetcher(_count_parsed_records, 3, batch_size=1, max_batches_per_file=1)
+    prefetcher.schedule(files)
+
+    records = prefetcher.read(files[0])
+    next(records)
+    records.close()
+    time.sleep(0.5)
+
+    assert all(count < 1000 for count in parsed.values())
+    assert list(prefetcher.read(files[1])) == [{"line": i} for i in range(1000)]
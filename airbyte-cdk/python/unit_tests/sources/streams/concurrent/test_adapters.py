@@ -96,7 +96,14 @@ def test_stream_partition_generator(sync_mode):
         ),
     ],
 )
-def test_stream_partition(transformer, expected_records):
+@pytest.mark.parametrize(
+    "records_data",
+    [
+        pytest.param([{"data": "1"}, {"data": "2"}], id="test_single_records"),
+        pytest.param([[{"data": "1"}, {"data": "2"}]], id="test_record_batch"),
+    ],
+)
+def test_stream_partition(transformer, expected_records, records_data):
     stream = Mock()
     stream.get_json_schema.return_value = {"type": "object", "properties": {"data": {"type": ["integer"]}}}
     stream.transformer = transformer
@@ -115,7 +122,7 @@ def test_stream_partition(transformer, expected_records):
         ),
     )
 
-    stream_data = [a_log_message, {"data": "1"}, {"data": "2"}]
+    stream_data = [a_log_message, *records_data]
     stream.read_records.return_value = stream_data
 
     records = list(partition.read())
@@ -0,0 +1,82 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+import time
+from queue import Empty, Full
+
+import pytest
+from airbyte_cdk.sources.streams.concurrent.bounded_queue import BoundedQueue
+from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
+
+
+def _put_in_thread(queue: BoundedQueue, item) -> threading.Thread:
+    thread = threading.Thread(target=queue.put, args=(item,), daemon=True)
+    thread.start()
+    return thread
+
+
+def test_items_are_returned_in_order():
+    queue = BoundedQueue(max_size=10)
+    for i in range(3):
+        queue.put(Record({"id": i}))
+
+    assert [queue.get().data["id"] for _ in range(3)] == [0, 1, 2]
+    with pytest.raises(Empty):
+        queue.get(block=False)
+
+
+def test_put_blocks_when_the_queue_is_full():
+    queue = BoundedQueue(max_size=1)
+    queue.put(Record({"id": 1}))
+
+    producer = _put_in_thread(queue, Record({"id": 2}))
+    producer.join(timeout=0.1)
+    assert producer.is_alive()
+
+    assert queue.get() == Record({"id": 1})
+    producer.join(timeout=1)
+    assert not producer.is_alive()
+    assert queue.get() == Record({"id": 2})
+    assert queue.metrics.blocked_puts == 1
+    assert queue.metrics.blocked_time_seconds > 0
+    assert queue.metrics.max_depth == 1
+
+
+def test_put_blocks_when_the_queue_is_over_the_size_in_bytes():
+    queue = BoundedQueue(max_size=100, max_size_in_bytes=1)
+    queue.put(Record({"id": 1}))
+
+    producer = _put_in_thread(queue, Record({"id": 2}))
+    producer.join(timeout=0.1)
+    assert producer.is_alive()
+
+    queue.get()
+    producer.join(timeout=1)
+    assert not producer.is_alive()
+    assert queue.metrics.max_size_in_bytes > 1
+
+
+def test_non_blocking_put_raises_when_the_queue_is_full():
+    queue = BoundedQueue(max_size=1)
+    queue.put(Record({"id": 1}))
+
+    with pytest.raises(Full):
+        queue.put(Record({"id": 2}), block=False)
+    with pytest.raises(Full):
+        queue.put(Record({"id": 2}), timeout=0.01)
+
+
+def test_close_releases_blocked_producers_and_discards_items():
+    queue = BoundedQueue(max_size=1)
+    queue.put(Record({"id": 1}))
+    producer = _put_in_thread(queue, Record({"id": 2}))
+    time.sleep(0.05)
+
+    queue.close()
+    producer.join(timeout=1)
+
+    assert not producer.is_alive()
+    queue.put(Record({"id": 3}))
+    assert queue.qsize() == 1
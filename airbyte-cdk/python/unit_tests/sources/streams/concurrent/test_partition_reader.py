@@ -5,6 +5,7 @@
 from queue import Queue
 from unittest.mock import Mock
 
+from airbyte_cdk.sources.streams.concurrent.bounded_queue import BoundedQueue
 from airbyte_cdk.sources.streams.concurrent.partition_reader import PartitionReader
 from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
 from airbyte_cdk.sources.streams.concurrent.partitions.types import PartitionCompleteSentinel
@@ -30,3 +31,26 @@ def test_partition_reader():
         actual_records.append(record)
 
     assert records == actual_records
+
+
+def test_given_queue_is_closed_when_process_partition_then_stop_reading_partition():
+    queue = BoundedQueue(10)
+    partition_reader = PartitionReader(queue)
+    read_records = []
+
+    def _read():
+        try:
+            for record_id in range(100):
+                read_records.append(record_id)
+                yield Record({"id": record_id})
+        finally:
+            read_records.append("closed")
+
+    stream_partition = Mock()
+    stream_partition.read.return_value = _read()
+    queue.close()
+
+    partition_reader.process_partition(stream_partition)
+
+    assert read_records == [0, "closed"]
+    assert queue.empty()
@@ -0,0 +1,214 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import logging
+import os
+import time
+from typing import Any, Iterable, List, Mapping, Optional
+
+import pytest
+from airbyte_cdk.models import AirbyteLogMessage, AirbyteMessage, Level, SyncMode, Type
+from airbyte_cdk.sources.declarative.manifest_declarative_source import ManifestDeclarativeSource
+from airbyte_cdk.sources.message import InMemoryMessageRepository, MessageRepository
+from airbyte_cdk.sources.streams.concurrent.adapters import StreamFacade
+from airbyte_cdk.sources.streams.concurrent.availability_strategy import STREAM_AVAILABLE, AbstractAvailabilityStrategy, StreamAvailability
+from airbyte_cdk.sources.streams.concurrent.cursor import Cursor, NoopCursor
+from airbyte_cdk.sources.streams.concurrent.partitions.partition import Partition
+from airbyte_cdk.sources.streams.concurrent.partitions.partition_generator import PartitionGenerator
+from airbyte_cdk.sources.streams.concurrent.partitions.record import Record
+from airbyte_cdk.sources.streams.concurrent.process_based_concurrent_stream import ProcessBasedConcurrentStream
+from airbyte_cdk.sources.utils.slice_logger import DebugSliceLogger
+
+_LOGGER = logging.getLogger("test")
+
+
+class _AvailabilityStrategy(AbstractAvailabilityStrategy):
+    def check_availability(self, logger: logging.Logger) -> StreamAvailability:
+        return STREAM_AVAILABLE
+
+
+class _Partition(Partition):
+    def __init__(self, partition_id: int, number_of_records: int, message_repository: MessageRepository, fail: bool = False):
+        self._partition_id = partition_id
+        self._number_of_records = number_of_records
+        self._message_repository = message_repository
+        self._fail = fail
+
+    def read(self) -> Iterable[Record]:
+        self._message_repository.emit_message(
+            AirbyteMessage(type=Type.LOG, log=AirbyteLogMessage(level=Level.INFO, message=f"reading partition {self._partition_id}"))
+        )
+        for record_id in range(self._number_of_records):
+            yield Record({"partition": self._partition_id, "id": record_id, "pid": os.getpid()})
+        if self._fail:
+            raise ValueError(f"partition {self._partition_id} failed")
+
+    def to_slice(self) -> Optional[Mapping[str, Any]]:
+        return {"partition": self._partition_id}
+
+    def __hash__(self) -> int:
+        return hash(self._partition_id)
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, _Partition) and self._partition_id == other._partition_id
+
+
+class _PartitionGenerator(PartitionGenerator):
+    def __init__(self, partitions: List[Partition]):
+        self._partitions = partitions
+
+    def generate(self) -> Iterable[Partition]:
+        yield from self._partitions
+
+
+class _RecordingCursor(Cursor):
+    def __init__(self) -> None:
+        self.observed: List[Record] = []
+        self.closed: List[Partition] = []
+
+    @property
+    def state(self) -> Mapping[str, Any]:
+        return {}
+
+    def observe(self, record: Record) -> None:
+        self.observed.append(record)
+
+    def close_partition(self, partition: Partition) -> None:
+        self.closed.append(partition)
+
+
+def _stream(partitions: List[Partition], message_repository: MessageRepository, cursor: Cursor) -> ProcessBasedConcurrentStream:
+    return ProcessBasedConcurrentStream(
+        partition_generator=_PartitionGenerator(partitions),
+        max_workers=2,
+        name="stream",
+        json_schema={},
+        availability_strategy=_AvailabilityStrategy(),
+        primary_key=[],
+        cursor_field=None,
+        slice_logger=DebugSliceLogger(),
+        logger=_LOGGER,
+        message_repository=message_repository,
+        timeout_seconds=30,
+        cursor=cursor,
+        batch_size=3,
+    )
+
+
+def test_read_partitions_in_worker_processes():
+    message_repository = InMemoryMessageRepository()
+    cursor = _RecordingCursor()
+    partitions = [_Partition(partition_id, 10, message_repository) for partition_id in range(4)]
+
+    records = list(_stream(partitions, message_repository, cursor).read())
+
+    assert sorted((record.data["partition"], record.data["id"]) for record in records) == [(p, r) for p in range(4) for r in range(10)]
+    assert all(record.data["pid"] != os.getpid() for record in records)
+    for partition_id in range(4):
+        # records within a partition keep their order
+        assert [record.data["id"] for record in records if record.data["partition"] == partition_id] == list(range(10))
+    assert cursor.observed == records
+    assert sorted(cursor.closed, key=hash) == partitions
+    assert sorted(message.log.message for message in message_repository.consume_queue()) == [f"reading partition {i}" for i in range(4)]
+
+
+def test_exception_in_worker_process_is_raised():
+    message_repository = InMemoryMessageRepository()
+    partitions = [_Partition(0, 5, message_repository, fail=True)]
+
+    with pytest.raises(ValueError, match="partition 0 failed"):
+        list(_stream(partitions, message_repository, _RecordingCursor()).read())
+
+
+class _SlowPartition(_Partition):
+    def read(self) -> Iterable[Record]:
+        yield Record({"partition": self._partition_id, "id": 0, "pid": os.getpid()})
+        # Stands for a CPU-bound partition which would take a long time to complete
+        time.sleep(60)
+        yield Record({"partition": self._partition_id, "id": 1, "pid": os.getpid()})
+
+
+def test_when_read_is_stopped_early_then_running_partitions_are_not_waited_for():
+    message_repository = InMemoryMessageRepository()
+    partitions = [_SlowPartition(partition_id, 2, message_repository) for partition_id in range(2)]
+    stream = _stream(partitions, message_repository, _RecordingCursor())
+    stream._batch_size = 1
+    records = stream.read()
+
+    pid = next(records).data["pid"]
+    start = time.monotonic()
+    records.close()
+
+    assert time.monotonic() - start < 10
+    _wait_until_process_exited(pid)
+
+
+def test_when_a_partition_fails_then_the_other_running_partitions_are_not_waited_for():
+    message_repository = InMemoryMessageRepository()
+    partitions = [_SlowPartition(0, 2, message_repository), _Partition(1, 5, message_repository, fail=True)]
+    stream = _stream(partitions, message_repository, _RecordingCursor())
+    stream._batch_size = 1
+
+    start = time.monotonic()
+    with pytest.raises(ValueError, match="partition 1 failed"):
+        list(stream.read())
+
+    assert time.monotonic() - start < 10
+
+
+def test_read_declarative_stream_in_worker_processes(httpserver):
+    for category in ["a", "b", "c"]:
+        httpserver.expect_request("/items", query_string=f"category={category}").respond_with_json(
+            {"items": [{"id": f"{category}{item_id}", "value": item_id} for item_id in range(3)]}
+        )
+    manifest = {
+        "version": "0.50.0",
+        "streams": [
+            {
+                "type": "DeclarativeStream",
+                "name": "items",
+                "primary_key": "id",
+                "schema_loader": {"type": "InlineSchemaLoader", "schema": {"type": "object", "properties": {"id": {"type": "string"}}}},
+                "transformations": [{"type": "AddFields", "fields": [{"path": ["source"], "value": "{{ config['source'] }}"}]}],
+                "retriever": {
+                    "type": "SimpleRetriever",
+                    "requester": {"type": "HttpRequester", "url_base": httpserver.url_for(""), "path": "/items", "http_method": "GET"},
+                    "partition_router": {
+                        "type": "ListPartitionRouter",
+                        "values": ["a", "b", "c"],
+                        "cursor_field": "category",
+                        "request_option": {"type": "RequestOption", "inject_into": "request_parameter", "field_name": "category"},
+                    },
+                    "record_selector": {
+                        "type": "RecordSelector",
+                        "extractor": {"type": "DpathExtractor", "field_path": ["items"]},
+                        "record_filter": {"type": "RecordFilter", "condition": "{{ record['value'] > 0 }}"},
+                    },
+                },
+            }
+        ],
+        "check": {"type": "CheckStream", "stream_names": ["items"]},
+    }
+    source = ManifestDeclarativeSource(manifest)
+    stream = source.streams({"source": "test"})[0]
+
+    facade = StreamFacade.create_from_stream(
+        stream, source, _LOGGER, 2, None, NoopCursor(), concurrent_stream_class=ProcessBasedConcurrentStream
+    )
+    records = list(facade.read_records(SyncMode.full_refresh))
+
+    assert sorted(records, key=lambda record: record["id"]) == [
+        {"id": f"{category}{item_id}", "value": item_id, "source": "test"} for category in ["a", "b", "c"] for item_id in [1, 2]
+    ]
+
+
+def _wait_until_process_exited(pid: int) -> None:
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return
+        time.sleep(0.1)
+    raise AssertionError(f"Process {pid} is still running")
@@ -2,6 +2,7 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import time
 import unittest
 from unittest.mock import Mock, call
 
@@ -43,6 +44,29 @@ class ThreadBasedConcurrentStreamTest(unittest.TestCase):
             cursor=self._cursor,
         )
 
+    def test_sleep_time_is_deprecated_and_the_following_positional_arguments_are_kept(self):
+        with self.assertWarns(DeprecationWarning):
+            stream = ThreadBasedConcurrentStream(
+                self._partition_generator,
+                self._max_workers,
+                self._name,
+                self._json_schema,
+                self._availability_strategy,
+                self._primary_key,
+                self._cursor_field,
+                self._slice_logger,
+                self._logger,
+                self._message_repository,
+                1,
+                2,
+                0.5,
+                self._cursor,
+                "test",
+            )
+
+        assert stream._cursor is self._cursor
+        assert stream.as_airbyte_stream().namespace == "test"
+
     def test_get_json_schema(self):
         json_schema = self._stream.get_json_schema()
         assert json_schema == self._json_schema
@@ -121,18 +145,46 @@ class ThreadBasedConcurrentStreamTest(unittest.TestCase):
 
         self._message_repository.emit_message.assert_called_once_with(slice_log_message)
 
-    def test_wait_while_task_queue_is_full(self):
-        f1 = Mock()
-        f2 = Mock()
+    def test_read_does_not_run_more_tasks_than_max_concurrent_tasks(self):
+        stream = ThreadBasedConcurrentStream(
+            self._partition_generator,
+            5,
+            self._name,
+            self._json_schema,
+            self._availability_strategy,
+            self._primary_key,
+            self._cursor_field,
+            self._slice_logger,
+            self._logger,
+            self._message_repository,
+            1,
+            2,
+            cursor=self._cursor,
+        )
+        partitions = [Mock(spec=Partition) for _ in range(5)]
+        running_tasks = []
+        max_running_tasks = []
+
+        def _read_partition(partition_index):
+            def _read():
+                running_tasks.append(partition_index)
+                max_running_tasks.append(len(running_tasks))
+                time.sleep(0.01)
+                yield Record({"id": partition_index})
+                running_tasks.remove(partition_index)
+
+            return _read
+
+        for index, partition in enumerate(partitions):
+            partition.read.side_effect = _read_partition(index)
+        self._slice_logger.should_log_slice_message.return_value = False
+        self._partition_generator.generate.return_value = partitions
 
-        # Verify that the done() method will be called until only one future is still running
-        f1.done.side_effect = [False, False]
-        f2.done.side_effect = [False, True]
-        futures = [f1, f2]
-        self._stream._wait_while_too_many_pending_futures(futures)
+        actual_records = list(stream.read())
 
-        f1.done.assert_has_calls([call(), call()])
-        f2.done.assert_has_calls([call(), call()])
+        assert sorted(record.data["id"] for record in actual_records) == list(range(5))
+        assert max(max_running_tasks) <= 2
+        assert self._cursor.close_partition.call_count == 5
 
     def test_as_airbyte_stream(self):
         expected_airbyte_stream = AirbyteStream(
@@ -206,7 +258,6 @@ class ThreadBasedConcurrentStreamTest(unittest.TestCase):
             self._message_repository,
             1,
             2,
-            0,
         )
 
         expected_airbyte_stream = AirbyteStream(
@@ -243,7 +294,6 @@ class ThreadBasedConcurrentStreamTest(unittest.TestCase):
             self._message_repository,
             1,
             2,
-            0,
         )
 
         expected_airbyte_stream = AirbyteStream(
@@ -273,7 +323,6 @@ class ThreadBasedConcurrentStreamTest(unittest.TestCase):
             self._message_repository,
             1,
             2,
-            0,
             namespace="test",
         )
         expected_airbyte_stream = AirbyteStream(
@@ -0,0 +1,87 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import asyncio
+import socket
+import time
+
+import pytest
+import requests
+from airbyte_cdk.sources.streams.http.async_transport import AiohttpTransport
+from werkzeug import Response
+
+pytest.importorskip("aiohttp")
+
+
+def _send(request: requests.Request, **kwargs) -> requests.Response:
+    async def send() -> requests.Response:
+        transport = AiohttpTransport()
+        try:
+            return await transport.send(requests.Session().prepare_request(request), **kwargs)
+        finally:
+            await transport.close()
+
+    # Not asyncio.run, which leaves the main thread without an event loop for the tests calling asyncio.get_event_loop afterwards
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(send())
+    finally:
+        loop.close()
+
+
+def test_response_is_converted_to_requests_response(httpserver):
+    httpserver.expect_request("/items", query_string="page=2").respond_with_data(
+        '{"items": ["é"]}', status=201, headers={"X-Custom": "value"}, content_type="application/json; charset=utf-8"
+    )
+
+    response = _send(requests.Request("GET", httpserver.url_for("/items"), params={"page": 2}))
+
+    assert response.status_code == 201
+    assert response.headers["x-custom"] == "value"
+    assert response.encoding == "utf-8"
+    assert response.json() == {"items": ["é"]}
+    assert response.url == httpserver.url_for("/items?page=2")
+    assert response.request.url == httpserver.url_for("/items?page=2")
+
+
+def test_prepared_request_is_sent_as_is(httpserver):
+    httpserver.expect_request(
+        "/items", method="POST", headers={"Authorization": "Bearer token"}, json={"name": "an item"}
+    ).respond_with_data("created")
+
+    response = _send(
+        requests.Request("POST", httpserver.url_for("/items"), headers={"Authorization": "Bearer token"}, json={"name": "an item"})
+    )
+
+    assert response.status_code == 200
+    assert response.text == "created"
+
+
+def test_error_status_is_returned_without_raising(httpserver):
+    httpserver.expect_request("/items").respond_with_data("too many requests", status=429, headers={"Retry-After": "10"})
+
+    response = _send(requests.Request("GET", httpserver.url_for("/items")))
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "10"
+
+
+def test_connection_error_is_raised_as_requests_connection_error():
+    with socket.socket() as unused_socket:
+        unused_socket.bind(("localhost", 0))
+        port = unused_socket.getsockname()[1]
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        _send(requests.Request("GET", f"http://localhost:{port}/items"))
+
+
+def test_timeout_is_raised_as_requests_read_timeout(httpserver):
+    def respond_slowly(request):
+        time.sleep(1)
+        return Response("too late")
+
+    httpserver.expect_request("/items").respond_with_handler(respond_slowly)
+
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        _send(requests.Request("GET", httpserver.url_for("/items")), timeout=0.1)
@@ -3,15 +3,19 @@
 #
 
 
+import asyncio
+import datetime
 import json
 from http import HTTPStatus
-from typing import Any, Iterable, Mapping, Optional
-from unittest.mock import ANY, MagicMock, patch
+from typing import Any, Iterable, List, Mapping, Optional
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import pytest
 import requests
 from airbyte_cdk.models import SyncMode
+from airbyte_cdk.sources.streams.call_rate import AbstractAPIBudget, APIBudget, CallRateLimitHit, FixedWindowCallRatePolicy
 from airbyte_cdk.sources.streams.http import HttpStream, HttpSubStream
+from airbyte_cdk.sources.streams.http.async_transport import AiohttpTransport, AsyncHttpTransport
 from airbyte_cdk.sources.streams.http.auth import NoAuth
 from airbyte_cdk.sources.streams.http.auth import TokenAuthenticator as HttpTokenAuthenticator
 from airbyte_cdk.sources.streams.http.exceptions import DefaultBackoffException, RequestBodyException, UserDefinedBackoffException
@@ -628,3 +632,161 @@ def test_duplicate_request_params_are_deduped(deduplicate_query_params, path, pa
     else:
         prepared_request = stream._create_prepared_request(path=path, params=params)
         assert prepared_request.url == expected_url
+
+
+class StubAsyncHttpTransport(AsyncHttpTransport):
+    def __init__(self, status_codes: List[int]):
+        self.sent_requests: List[requests.PreparedRequest] = []
+        self._status_codes = iter(status_codes)
+
+    async def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        self.sent_requests.append(request)
+        response = requests.Response()
+        response.status_code = next(self._status_codes)
+        response.request = request
+        response._content = b"{}"
+        return response
+
+
+def _read_records_async(stream: HttpStream, transport: AsyncHttpTransport) -> List[Mapping[str, Any]]:
+    async def read() -> List[Mapping[str, Any]]:
+        return [record async for record in stream.read_records_async(SyncMode.full_refresh)]
+
+    # Not asyncio.run, which leaves the main thread without an event loop for the tests calling asyncio.get_event_loop afterwards
+    loop = asyncio.new_event_loop()
+    try:
+        with patch.object(stream, "create_async_http_transport", return_value=transport):
+            return loop.run_until_complete(read())
+    finally:
+        loop.close()
+
+
+def test_read_records_async_reads_all_pages():
+    stream = StubNextPageTokenHttpStream(pages=2)
+    transport = StubAsyncHttpTransport([200, 200, 200])
+
+    assert _read_records_async(stream, transport) == [{"data": 1}, {"data": 2}, {"data": 3}]
+    assert len(transport.sent_requests) == 3
+
+
+@pytest.mark.parametrize(
+    "authenticator",
+    [pytest.param(TokenAuthenticator("test-token"), id="requests_native"), pytest.param(HttpTokenAuthenticator("test-token"), id="legacy")],
+)
+def test_read_records_async_authenticates_requests(authenticator):
+    stream = StubBasicReadHttpStream(authenticator=authenticator)
+    transport = StubAsyncHttpTransport([200])
+
+    _read_records_async(stream, transport)
+
+    assert transport.sent_requests[0].headers["Authorization"] == "Bearer test-token"
+
+
+def test_read_records_async_waits_for_user_defined_backoff(mocker):
+    sleep = mocker.patch("asyncio.sleep", AsyncMock())
+    stream = StubCustomBackoffHttpStream()
+    transport = StubAsyncHttpTransport([429, 200])
+
+    assert _read_records_async(stream, transport) == [{"data": 1}]
+    sleep.assert_any_await(1.5)
+
+
+def test_read_records_async_gives_up_after_max_retries(mocker):
+    mocker.patch("asyncio.sleep", AsyncMock())
+    stream = StubCustomBackoffHttpStream()
+    transport = StubAsyncHttpTransport([429] * 10)
+
+    with pytest.raises(UserDefinedBackoffException):
+        _read_records_async(stream, transport)
+    assert len(transport.sent_requests) == stream.max_retries + 1
+
+
+def test_read_records_async_retries_server_errors_with_default_backoff(mocker):
+    sleep = mocker.patch("asyncio.sleep", AsyncMock())
+    stream = StubBasicReadHttpStream()
+    transport = StubAsyncHttpTransport([500, 502, 200])
+
+    assert _read_records_async(stream, transport) == [{"data": 1}]
+    assert sleep.await_count == 2
+
+
+def test_read_records_async_raises_on_http_errors():
+    stream = StubBasicReadHttpStream()
+    transport = StubAsyncHttpTransport([404])
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        _read_records_async(stream, transport)
+
+
+def test_default_async_http_transport_is_aiohttp():
+    pytest.importorskip("aiohttp")
+    assert isinstance(StubBasicReadHttpStream().create_async_http_transport(), AiohttpTransport)
+
+
+class StubPrefetchHttpStream(StubNextPageTokenHttpStream):
+    @property
+    def page_prefetch_depth(self) -> int:
+        return 2
+
+
+def test_page_prefetch_reads_the_same_records(mocker):
+    stream = StubPrefetchHttpStream(pages=5)
+    mocker.patch.object(StubPrefetchHttpStream, "_send_request", return_value={})
+
+    records = list(stream.read_records(SyncMode.full_refresh))
+
+    assert records == [{"data": i} for i in range(1, 7)]
+
+
+def test_page_prefetch_raises_errors_after_the_records_of_the_previous_pages(mocker):
+    stream = StubPrefetchHttpStream(pages=5)
+    responses = [requests.Response() for _ in range(3)]
+    for response, status_code in zip(responses, [200, 200, 404]):
+        response.status_code = status_code
+    mocker.patch.object(requests.Session, "send", side_effect=responses)
+    records = []
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        for record in stream.read_records(SyncMode.full_refresh):
+            records.append(record)
+
+    assert records == [{"data": 1}, {"data": 2}]
+
+
+def test_api_budget_is_acquired_before_each_request_and_updated_with_the_response(requests_mock):
+    api_budget = MagicMock(spec=AbstractAPIBudget)
+    stream = StubBasicReadHttpStream(api_budget=api_budget)
+    requests_mock.register_uri("GET", stream.url_base, headers={"X-RateLimit-Remaining": "10"})
+
+    list(stream.read_records(sync_mode=SyncMode.full_refresh))
+
+    request = api_budget.acquire_call.call_args.args[0]
+    assert request.url == "https://test_base_url.com/"
+    api_budget.update_from_response.assert_called_once_with(request, ANY)
+    assert api_budget.update_from_response.call_args.args[1].headers["X-RateLimit-Remaining"] == "10"
+
+
+def test_api_budget_paces_the_requests_of_all_the_streams_sharing_it(mocker, requests_mock):
+    sleep = mocker.patch("time.sleep")
+    api_budget = APIBudget(policies=[FixedWindowCallRatePolicy(period=datetime.timedelta(hours=1), call_limit=2, matchers=[])])
+    streams = [StubBasicReadHttpStream(api_budget=api_budget) for _ in range(2)]
+    requests_mock.register_uri("GET", "https://test_base_url.com")
+    for stream in streams:
+        list(stream.read_records(sync_mode=SyncMode.full_refresh))
+    sleep.assert_not_called()
+
+    with pytest.raises(CallRateLimitHit):
+        api_budget.acquire_call(requests.Request("GET", "https://test_base_url.com").prepare(), block=False)
+
+
+def test_read_records_async_acquires_the_api_budget():
+    api_budget = MagicMock(spec=AbstractAPIBudget)
+    api_budget.acquire_call_async = AsyncMock()
+    stream = StubBasicReadHttpStream(api_budget=api_budget)
+    transport = StubAsyncHttpTransport([200])
+
+    _read_records_async(stream, transport)
+
+    api_budget.acquire_call_async.assert_awaited_once_with(transport.sent_requests[0])
+    api_budget.update_from_response.assert_called_once_with(transport.sent_requests[0], ANY)
+    api_budget.acquire_call.assert_not_called()
@@ -0,0 +1,85 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import threading
+import time
+from typing import Iterable, Iterator, List
+
+import pytest
+from airbyte_cdk.sources.streams.http.page_prefetcher import PagePrefetcher
+
+
+def _pages(number_of_pages: int, requested_pages: List[int]) -> Iterator[Iterable[int]]:
+    for page in range(number_of_pages):
+        requested_pages.append(page)
+        yield iter(range(page * 10, page * 10 + 10))
+
+
+@pytest.mark.parametrize("depth", [1, 2, 10])
+def test_records_are_read_in_order(depth):
+    records = list(PagePrefetcher[int](depth).read(_pages(5, [])))
+
+    assert records == list(range(50))
+
+
+@pytest.mark.parametrize("depth", [1, 3])
+def test_at_most_depth_pages_are_requested_ahead_of_the_page_being_read(depth):
+    requested_pages: List[int] = []
+    records = PagePrefetcher[int](depth).read(_pages(10, requested_pages))
+
+    next(records)
+    time.sleep(0.2)
+
+    # The page being read and the next ones
+    assert requested_pages == list(range(depth + 1))
+    assert list(records) == list(range(1, 100))
+
+
+def test_next_page_is_requested_while_the_records_of_the_page_are_read():
+    next_page_requested = threading.Event()
+
+    def pages() -> Iterator[Iterable[int]]:
+        yield [1, 2]
+        next_page_requested.set()
+        yield [3]
+
+    records = PagePrefetcher[int](1).read(pages())
+
+    assert next(records) == 1
+    assert next_page_requested.wait(timeout=5)
+    assert list(records) == [2, 3]
+
+
+def test_given_error_then_records_received_before_the_error_are_read_first():
+    def pages() -> Iterator[Iterable[int]]:
+        yield [1, 2]
+
+        def failing_page() -> Iterator[int]:
+            yield 3
+            raise ValueError("An error")
+
+        yield failing_page()
+
+    records = []
+    with pytest.raises(ValueError):
+        for record in PagePrefetcher[int](2).read(pages()):
+            records.append(record)
+
+    assert records == [1, 2, 3]
+
+
+def test_given_records_are_not_read_until_the_end_then_no_other_page_is_requested():
+    requested_pages: List[int] = []
+    records = PagePrefetcher[int](1).read(_pages(1000, requested_pages))
+
+    next(records)
+    records.close()
+    time.sleep(0.5)
+
+    assert len(requested_pages) <= 3
+
+
+def test_depth_must_be_positive():
+    with pytest.raises(ValueError):
+        PagePrefetcher[int](0)
@@ -0,0 +1,312 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import asyncio
+import datetime
+import email.utils
+import threading
+import time
+from typing import Any, Mapping, Optional
+
+import pytest
+import requests
+from airbyte_cdk.sources.streams.call_rate import (
+    APIBudget,
+    CallRateLimitHit,
+    FixedWindowCallRatePolicy,
+    HttpAPIBudget,
+    HttpRequestMatcher,
+    MovingWindowCallRatePolicy,
+    Rate,
+    TokenBucketCallRatePolicy,
+    UnlimitedCallRatePolicy,
+)
+
+
+def _request(url: str = "https://api.example.com/v1/users", method: str = "GET", headers: Optional[Mapping[str, Any]] = None):
+    return requests.Request(method, url, headers=headers).prepare()
+
+
+def _response(status_code: int = 200, headers: Optional[Mapping[str, str]] = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    return response
+
+
+@pytest.mark.parametrize(
+    "matcher, request_to_match, expected_match",
+    [
+        pytest.param(HttpRequestMatcher(), _request(), True, id="test_empty_matcher_matches_all_requests"),
+        pytest.param(HttpRequestMatcher(method="get"), _request(), True, id="test_method_is_case_insensitive"),
+        pytest.param(HttpRequestMatcher(method="POST"), _request(), False, id="test_other_method"),
+        pytest.param(
+            HttpRequestMatcher(url_pattern="/v1/users$"),
+            _request("https://api.example.com/v1/users?page=2"),
+            True,
+            id="test_url_pattern_ignores_query",
+        ),
+        pytest.param(HttpRequestMatcher(url_pattern="/v1/groups"), _request(), False, id="test_other_url"),
+        pytest.param(
+            HttpRequestMatcher(params={"page": 2}),
+            _request("https://api.example.com/v1/users?page=2&size=10"),
+            True,
+            id="test_params_subset",
+        ),
+        pytest.param(
+            HttpRequestMatcher(params={"page": 2}), _request("https://api.example.com/v1/users?page=3"), False, id="test_other_params"
+        ),
+        pytest.param(
+            HttpRequestMatcher(headers={"X-Api": "v2"}), _request(headers={"x-api": "v2", "Accept": "*"}), True, id="test_headers_subset"
+        ),
+        pytest.param(HttpRequestMatcher(headers={"X-Api": "v2"}), _request(), False, id="test_missing_header"),
+        pytest.param(HttpRequestMatcher(), "not a request", False, id="test_not_an_http_request"),
+    ],
+)
+def test_http_request_matcher(matcher, request_to_match, expected_match):
+    assert matcher(request_to_match) == expected_match
+
+
+def test_fixed_window_policy_allows_call_limit_calls_per_period():
+    policy = FixedWindowCallRatePolicy(period=datetime.timedelta(seconds=0.2), call_limit=2, matchers=[])
+
+    policy.try_acquire(_request(), weight=1)
+    policy.try_acquire(_request(), weight=1)
+    with pytest.raises(CallRateLimitHit) as exc_info:
+        policy.try_acquire(_request(), weight=1)
+    assert 0 < exc_info.value.time_to_wait.total_seconds() <= 0.2
+
+    time.sleep(0.2)
+    policy.try_acquire(_request(), weight=1)
+
+
+def test_fixed_window_policy_is_updated_with_the_window_of_the_api():
+    policy = FixedWindowCallRatePolicy(period=datetime.timedelta(hours=1), call_limit=100, matchers=[])
+
+    policy.update(available_calls=1, call_reset_ts=datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=10))
+
+    policy.try_acquire(_request(), weight=1)
+    with pytest.raises(CallRateLimitHit) as exc_info:
+        policy.try_acquire(_request(), weight=1)
+    assert exc_info.value.time_to_wait.total_seconds() <= 10
+
+
+def test_moving_window_policy_respects_all_its_rates():
+    policy = MovingWindowCallRatePolicy(
+        rates=[Rate(limit=5, interval=datetime.timedelta(hours=1)), Rate(limit=2, interval=datetime.timedelta(seconds=0.2))], matchers=[]
+    )
+
+    for _ in range(2):
+        policy.try_acquire(_request(), weight=1)
+    with pytest.raises(CallRateLimitHit) as exc_info:
+        policy.try_acquire(_request(), weight=1)
+    assert exc_info.value.time_to_wait.total_seconds() <= 0.2
+
+    time.sleep(0.2)
+    for _ in range(2):
+        policy.try_acquire(_request(), weight=1)
+    time.sleep(0.2)
+    policy.try_acquire(_request(), weight=1)
+    with pytest.raises(CallRateLimitHit) as exc_info:
+        policy.try_acquire(_request(), weight=1)
+    assert exc_info.value.time_to_wait.total_seconds() > 3000
+
+
+def test_moving_window_policy_counts_the_calls_made_by_other_processes():
+    policy = MovingWindowCallRatePolicy(rates=[Rate(limit=10, interval=datetime.timedelta(hours=1))], matchers=[])
+
+    policy.update(available_calls=1, call_reset_ts=None)
+
+    policy.try_acquire(_request(), weight=1)
+    with pytest.raises(CallRateLimitHit):
+        policy.try_acquire(_request(), weight=1)
+
+
+def test_token_bucket_policy_allows_bursts_then_refills_at_the_rate():
+    policy = TokenBucketCallRatePolicy(rate=Rate(limit=10, interval=datetime.timedelta(seconds=1)), matchers=[], burst=3)
+
+    for _ in range(3):
+        policy.try_acquire(_request(), weight=1)
+    with pytest.raises(CallRateLimitHit) as exc_info:
+        policy.try_acquire(_request(), weight=1)
+    assert 0 < exc_info.value.time_to_wait.total_seconds() <= 0.1
+
+    time.sleep(0.1)
+    policy.try_acquire(_request(), weight=1)
+
+
+def test_token_bucket_policy_is_emptied_when_the_api_has_no_call_left():
+    policy = TokenBucketCallRatePolicy(rate=Rate(limit=10, interval=datetime.timedelta(hours=1)), matchers=[])
+
+    policy.update(available_calls=0, call_reset_ts=None)
+
+    with pytest.raises(CallRateLimitHit):
+        policy.try_acquire(_request(), weight=1)
+
+
+def test_unlimited_policy_blocks_calls_until_the_reset_of_the_api():
+    policy = UnlimitedCallRatePolicy(matchers=[])
+    for _ in range(1000):
+        policy.try_acquire(_request(), weight=1)
+
+    policy.update(available_calls=0, call_reset_ts=datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=0.2))
+
+    with pytest.raises(CallRateLimitHit):
+        policy.try_acquire(_request(), weight=1)
+    time.sleep(0.2)
+    policy.try_acquire(_request(), weight=1)
+
+
+@pytest.mark.parametrize(
+    "policy",
+    [
+        pytest.param(FixedWindowCallRatePolicy(period=datetime.timedelta(seconds=1), call_limit=2, matchers=[]), id="test_fixed_window"),
+        pytest.param(
+            MovingWindowCallRatePolicy(rates=[Rate(limit=2, interval=datetime.timedelta(seconds=1))], matchers=[]), id="test_moving_window"
+        ),
+        pytest.param(
+            TokenBucketCallRatePolicy(rate=Rate(limit=2, interval=datetime.timedelta(seconds=1)), matchers=[]), id="test_token_bucket"
+        ),
+    ],
+)
+def test_weight_above_the_capacity_of_the_policy_raises_an_error(policy):
+    with pytest.raises(ValueError):
+        policy.try_acquire(_request(), weight=3)
+
+
+def test_budget_applies_the_first_matching_policy():
+    users_policy = UnlimitedCallRatePolicy(matchers=[HttpRequestMatcher(url_pattern="/users")])
+    default_policy = UnlimitedCallRatePolicy(matchers=[])
+    budget = APIBudget(policies=[users_policy, default_policy])
+
+    assert budget.get_matching_policy(_request("https://api.example.com/users")) is users_policy
+    assert budget.get_matching_policy(_request("https://api.example.com/groups")) is default_policy
+
+
+def test_budget_doesnt_limit_requests_matching_no_policy():
+    policy = FixedWindowCallRatePolicy(
+        period=datetime.timedelta(hours=1), call_limit=1, matchers=[HttpRequestMatcher(url_pattern="/users")]
+    )
+    budget = APIBudget(policies=[policy])
+
+    for _ in range(10):
+        budget.acquire_call(_request("https://api.example.com/groups"), block=False)
+
+
+def test_budget_waits_until_the_call_is_allowed():
+    budget = APIBudget(policies=[MovingWindowCallRatePolicy(rates=[Rate(limit=2, interval=datetime.timedelta(seconds=0.2))], matchers=[])])
+
+    start = time.monotonic()
+    for _ in range(5):
+        budget.acquire_call(_request())
+
+    assert time.monotonic() - start >= 0.4
+
+
+def test_budget_raises_when_not_blocking_or_when_the_wait_exceeds_the_timeout():
+    budget = APIBudget(policies=[FixedWindowCallRatePolicy(period=datetime.timedelta(hours=1), call_limit=1, matchers=[])])
+    budget.acquire_call(_request())
+
+    with pytest.raises(CallRateLimitHit):
+        budget.acquire_call(_request(), block=False)
+    with pytest.raises(CallRateLimitHit):
+        budget.acquire_call(_request(), timeout=1)
+
+
+def test_budget_is_shared_by_threads():
+    budget = APIBudget(policies=[FixedWindowCallRatePolicy(period=datetime.timedelta(hours=1), call_limit=50, matchers=[])])
+    allowed_calls = []
+
+    def make_calls() -> None:
+        for _ in range(20):
+            try:
+                budget.acquire_call(_request(), block=False)
+                allowed_calls.append(1)
+            except CallRateLimitHit:
+                pass
+
+    threads = [threading.Thread(target=make_calls) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(allowed_calls) == 50
+
+
+def test_budget_waits_without_blocking_the_event_loop():
+    budget = APIBudget(
+        policies=[TokenBucketCallRatePolicy(rate=Rate(limit=10, interval=datetime.timedelta(seconds=1)), matchers=[], burst=1)]
+    )
+    ticks = []
+
+    async def tick() -> None:
+        for _ in range(5):
+            ticks.append(time.monotonic())
+            await asyncio.sleep(0.01)
+
+    async def acquire() -> None:
+        for _ in range(3):
+            await budget.acquire_call_async(_request())
+
+    async def run() -> None:
+        await asyncio.gather(acquire(), tick())
+
+    start = time.monotonic()
+    # Not asyncio.run, which leaves the main thread without an event loop for the tests calling asyncio.get_event_loop afterwards
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(run())
+    finally:
+        loop.close()
+
+    assert time.monotonic() - start >= 0.2
+    assert len(ticks) == 5 and ticks[-1] - start < 0.2
+
+
+def _http_date_in(seconds: int) -> str:
+    return email.utils.format_datetime(datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=seconds), usegmt=True)
+
+
+@pytest.mark.parametrize(
+    "status_code, headers, expected_calls_left, expected_reset_in",
+    [
+        pytest.param(200, lambda: {"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": "30"}, 10, 30, id="test_reset_in_seconds"),
+        pytest.param(
+            200, lambda: {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(time.time() + 60)}, 0, 60, id="test_reset_timestamp"
+        ),
+        pytest.param(429, lambda: {"Retry-After": "20"}, 0, 20, id="test_retry_after_seconds"),
+        pytest.param(429, lambda: {"Retry-After": _http_date_in(90)}, 0, 90, id="test_retry_after_http_date"),
+        pytest.param(200, lambda: {"Retry-After": "20"}, None, None, id="test_retry_after_ignored_without_rate_limit_status"),
+        pytest.param(200, lambda: {"X-RateLimit-Remaining": "invalid"}, None, None, id="test_invalid_header"),
+        pytest.param(200, lambda: {}, None, None, id="test_no_header"),
+    ],
+)
+def test_http_budget_parses_the_rate_limit_headers(status_code, headers, expected_calls_left, expected_reset_in):
+    budget = HttpAPIBudget(policies=[])
+    response = _response(status_code=status_code, headers=headers())
+
+    assert budget.get_calls_left_from_response(response) == expected_calls_left
+    reset_ts = budget.get_reset_ts_from_response(response)
+    if expected_reset_in is None:
+        assert reset_ts is None
+    else:
+        reset_in = (reset_ts - datetime.datetime.now(datetime.timezone.utc)).total_seconds()
+        # HTTP dates are rounded to the second
+        assert expected_reset_in - 2 <= reset_in <= expected_reset_in
+
+
+def test_http_budget_blocks_the_calls_of_the_policy_after_a_rate_limit_response():
+    users_policy = TokenBucketCallRatePolicy(
+        rate=Rate(limit=10, interval=datetime.timedelta(seconds=1)), matchers=[HttpRequestMatcher(url_pattern="/users")]
+    )
+    budget = HttpAPIBudget(policies=[users_policy, UnlimitedCallRatePolicy(matchers=[])])
+    users_request = _request("https://api.example.com/users")
+
+    budget.update_from_response(users_request, _response(status_code=429, headers={"Retry-After": "60"}))
+
+    with pytest.raises(CallRateLimitHit) as exc_info:
+        budget.acquire_call(users_request, block=False)
+    assert exc_info.value.time_to_wait.total_seconds() > 50
+    budget.acquire_call(_request("https://api.example.com/groups"), block=False)
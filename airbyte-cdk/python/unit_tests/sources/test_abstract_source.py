@@ -5,6 +5,8 @@
 import copy
 import datetime
 import logging
+import threading
+import time
 from collections import defaultdict
 from typing import Any, Callable, Dict, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
 from unittest.mock import Mock, call
@@ -1158,3 +1160,184 @@ def test_checkpoint_state_from_stream_instance():
     assert actual_message == _as_state(
         {"teams": {"updated_at": "2022-09-11"}, "managers": {"updated": "expected_here"}}, "managers", {"updated": "expected_here"}
     )
+
+
+class MockStreamWithCursor(MockStream):
+    def __init__(self, inputs_and_mocked_outputs, name: str, checkpoint_interval: Optional[int] = None):
+        super().__init__(inputs_and_mocked_outputs, name)
+        self._checkpoint_interval = checkpoint_interval
+
+    @property
+    def cursor_field(self) -> Union[str, List[str]]:
+        return "id"
+
+    @property
+    def state_checkpoint_interval(self) -> Optional[int]:
+        return self._checkpoint_interval
+
+    def get_updated_state(self, current_stream_state: MutableMapping[str, Any], latest_record: Mapping[str, Any]) -> Mapping[str, Any]:
+        return {"id": latest_record["id"]}
+
+    def get_json_schema(self) -> Mapping[str, Any]:
+        return {}
+
+
+class ArrowLikeBatch:
+    def __init__(self, records: List[Mapping[str, Any]]):
+        self._records = records
+
+    def to_pylist(self) -> List[Mapping[str, Any]]:
+        return list(self._records)
+
+
+@pytest.mark.parametrize(
+    "sync_mode, checkpoint_interval, limit",
+    [
+        pytest.param(SyncMode.full_refresh, None, None, id="test_full_refresh"),
+        pytest.param(SyncMode.full_refresh, None, 4, id="test_full_refresh_with_limit_within_batch"),
+        pytest.param(SyncMode.incremental, None, None, id="test_incremental"),
+        pytest.param(SyncMode.incremental, 2, None, id="test_incremental_with_checkpoint_interval_within_batch"),
+        pytest.param(SyncMode.incremental, 3, None, id="test_incremental_with_checkpoint_interval_on_batch_boundary"),
+        pytest.param(SyncMode.incremental, 2, 5, id="test_incremental_with_checkpoint_interval_and_limit_within_batch"),
+    ],
+)
+@pytest.mark.parametrize(
+    "batch_factory", [pytest.param(list, id="test_list_batch"), pytest.param(ArrowLikeBatch, id="test_arrow_like_batch")]
+)
+def test_read_record_batches_emits_the_same_messages_as_single_records(sync_mode, checkpoint_interval, limit, batch_factory):
+    records = [{"id": i} for i in range(7)]
+    batches = [batch_factory(records[0:3]), batch_factory([]), batch_factory(records[3:7])]
+    stream_input = {"sync_mode": sync_mode} if sync_mode == SyncMode.full_refresh else {"sync_mode": sync_mode, "stream_state": {}}
+    single_records_stream = MockStreamWithCursor([(stream_input, records)], name="s1", checkpoint_interval=checkpoint_interval)
+    batch_stream = MockStreamWithCursor([(stream_input, batches)], name="s1", checkpoint_interval=checkpoint_interval)
+    config = {"_limit": limit} if limit else {}
+
+    def _read(stream: Stream) -> List[AirbyteMessage]:
+        catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(stream, sync_mode)])
+        return _fix_emitted_at(list(MockSource(streams=[stream]).read(logger, config, catalog, state=[])))
+
+    assert _read(batch_stream) == _read(single_records_stream)
+
+
+def test_read_record_batch_shares_emitted_at():
+    stream = MockStreamWithCursor([({"sync_mode": SyncMode.full_refresh}, [[{"id": i} for i in range(100)]])], name="s1")
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(stream, SyncMode.full_refresh)])
+
+    records = [message.record for message in MockSource(streams=[stream]).read(logger, {}, catalog) if message.type == Type.RECORD]
+
+    assert [record.data for record in records] == [{"id": i} for i in range(100)]
+    assert len({record.emitted_at for record in records}) == 1
+
+
+class ConcurrentMockSource(MockSource):
+    def __init__(self, streams: List[Stream], max_concurrent_streams: int, **kwargs):
+        super().__init__(streams=streams, **kwargs)
+        self._max_concurrent_streams = max_concurrent_streams
+
+    @property
+    def max_concurrent_streams(self) -> int:
+        return self._max_concurrent_streams
+
+
+class CallbackStream(Stream):
+    primary_key = None
+
+    def __init__(self, name: str, read_records: Callable[[], Iterable[Mapping[str, Any]]]):
+        self._name = name
+        self._read_records = read_records
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def read_records(self, **kwargs) -> Iterable[Mapping[str, Any]]:  # type: ignore
+        return self._read_records()
+
+    def get_json_schema(self) -> Mapping[str, Any]:
+        return {}
+
+
+def _messages_by_stream(messages: List[AirbyteMessage]) -> Mapping[str, List[AirbyteMessage]]:
+    messages_by_stream = defaultdict(list)
+    for message in messages:
+        if message.type == Type.RECORD:
+            messages_by_stream[message.record.stream].append(message)
+        elif message.type == Type.TRACE:
+            messages_by_stream[message.trace.stream_status.stream_descriptor.name].append(message)
+        elif message.type == Type.STATE:
+            # The legacy state of the message has the state of all the streams, which depends on how far the other streams were read
+            messages_by_stream[message.state.stream.stream_descriptor.name].append(message.state.stream)
+    return messages_by_stream
+
+
+@pytest.mark.parametrize("max_concurrent_streams", [2, 3, 10])
+def test_concurrent_read_emits_the_messages_of_each_stream_in_order(max_concurrent_streams):
+    streams = [
+        MockStreamWithCursor([({"sync_mode": SyncMode.incremental, "stream_state": {}}, [{"id": i} for i in range(50)])], f"s{n}", 10)
+        for n in range(5)
+    ]
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(stream, SyncMode.incremental) for stream in streams])
+
+    sequential_messages = _fix_emitted_at(list(MockSource(streams=streams).read(logger, {}, catalog, state=[])))
+    concurrent_messages = _fix_emitted_at(
+        list(ConcurrentMockSource(streams=streams, max_concurrent_streams=max_concurrent_streams).read(logger, {}, catalog, state=[]))
+    )
+
+    assert len(concurrent_messages) == len(sequential_messages)
+    assert _messages_by_stream(concurrent_messages) == _messages_by_stream(sequential_messages)
+
+
+def test_concurrent_read_reads_streams_at_the_same_time():
+    both_streams_read = threading.Barrier(2, timeout=5)
+
+    def _read_once_both_streams_are_read() -> Iterable[Mapping[str, Any]]:
+        both_streams_read.wait()
+        yield {"id": 1}
+
+    streams = [CallbackStream("s1", _read_once_both_streams_are_read), CallbackStream("s2", _read_once_both_streams_are_read)]
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(stream, SyncMode.full_refresh) for stream in streams])
+
+    messages = list(ConcurrentMockSource(streams=streams, max_concurrent_streams=2).read(logger, {}, catalog))
+
+    assert sorted(message.record.stream for message in messages if message.type == Type.RECORD) == ["s1", "s2"]
+
+
+def test_given_stream_fails_when_concurrent_read_then_streams_being_read_complete_and_no_other_stream_is_started():
+    second_stream_started = threading.Event()
+
+    def _fail() -> Iterable[Mapping[str, Any]]:
+        second_stream_started.wait(timeout=5)
+        raise ValueError("s1 failed")
+
+    def _read() -> Iterable[Mapping[str, Any]]:
+        second_stream_started.set()
+        time.sleep(0.1)
+        yield {"id": 1}
+
+    streams = [CallbackStream("s1", _fail), CallbackStream("s2", _read), CallbackStream("s3", _read)]
+    catalog = ConfiguredAirbyteCatalog(streams=[_configured_stream(stream, SyncMode.full_refresh) for stream in streams])
+    messages = []
+
+    with pytest.raises(ValueError, match="s1 failed"):
+        for message in ConcurrentMockSource(streams=streams, max_concurrent_streams=2).read(logger, {}, catalog):
+            messages.append(message)
+
+    messages_by_stream = _messages_by_stream(messages)
+    assert [message.trace.stream_status.status for message in messages_by_stream["s1"]] == [
+        AirbyteStreamStatus.STARTED,
+        AirbyteStreamStatus.INCOMPLETE,
+    ]
+    assert [message.type for message in messages_by_stream["s2"]] == [Type.TRACE, Type.TRACE, Type.RECORD, Type.TRACE]
+    assert messages_by_stream["s2"][-1].trace.stream_status.status == AirbyteStreamStatus.COMPLETE
+    assert "s3" not in messages_by_stream
+
+
+def test_given_missing_stream_when_concurrent_read_then_raise_key_error():
+    stream = CallbackStream("s1", lambda: [{"id": 1}])
+    missing_stream = CallbackStream("missing", lambda: [])
+    catalog = ConfiguredAirbyteCatalog(
+        streams=[_configured_stream(stream, SyncMode.full_refresh), _configured_stream(missing_stream, SyncMode.full_refresh)]
+    )
+
+    with pytest.raises(KeyError):
+        list(ConcurrentMockSource(streams=[stream], max_concurrent_streams=2).read(logger, {}, catalog))
@@ -2,10 +2,14 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import copy
 import json
+import logging
+from unittest.mock import patch
 
 import pytest
-from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
+from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer, _SchemaCompiler
+from jsonschema.exceptions import UnknownType
 
 SIMPLE_SCHEMA = {"type": "object", "properties": {"value": {"type": "string"}}}
 COMPLEX_SCHEMA = {
@@ -205,8 +209,9 @@ VERY_NESTED_SCHEMA = {
         ),
     ],
 )
-def test_transform(schema, actual, expected, expected_warns, caplog):
-    t = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+@pytest.mark.parametrize("compiled", [pytest.param(True, id="test_compiled"), pytest.param(False, id="test_validator")])
+def test_transform(schema, actual, expected, expected_warns, caplog, compiled):
+    t = TypeTransformer(TransformConfig.DefaultSchemaNormalization, compiled=compiled)
     t.transform(actual, schema)
     assert json.dumps(actual) == json.dumps(expected)
     if expected_warns:
@@ -264,3 +269,108 @@ def test_custom_transform_with_default_normalization():
     obj = {"value": 12}
     s.transformer.transform(obj, SIMPLE_SCHEMA)
     assert obj == {"value": "transformed"}
+
+
+PARITY_VALUES = [None, 0, 1, -3, 1.0, 1.5, "1", "1.5", "true", "no", "text", "", True, False, [], [1, "a"], {}, {"a": 1}, {"b": ["1", 2]}]
+PARITY_SCHEMA = {
+    "$id": "http://example.com/root.json",
+    "type": "object",
+    "properties": {
+        **{
+            f"{json.dumps(field_type)}": {"type": field_type}
+            for field_type in [
+                "string",
+                "number",
+                "integer",
+                "boolean",
+                "null",
+                "object",
+                "array",
+                ["null", "string"],
+                ["null", "integer"],
+                ["null", "boolean"],
+                ["string", "integer"],
+                [],
+            ]
+        },
+        "no_type": {},
+        "array_of_simple": {"type": "array", "items": {"type": ["null", "integer"]}},
+        "array_of_objects": {"type": ["null", "array"], "items": {"type": "object", "properties": {"a": {"type": "integer"}}}},
+        "array_without_items": {"type": "array"},
+        "ref": {"$ref": "#/definitions/ref_type"},
+        "ref_with_sibling": {"$ref": "#/definitions/ref_type", "type": "object"},
+        "tree": {"$ref": "#/definitions/tree"},
+    },
+    "definitions": {
+        "ref_type": {"type": ["null", "string"], "properties": {"a": {"type": "integer"}}},
+        "tree": {
+            "type": "object",
+            "properties": {"value": {"type": "integer"}, "children": {"type": "array", "items": {"$ref": "#/definitions/tree"}}},
+        },
+    },
+}
+
+
+def _parity_records():
+    for value in PARITY_VALUES:
+        record = {field: copy.deepcopy(value) for field in PARITY_SCHEMA["properties"]}
+        record["tree"] = {"value": copy.deepcopy(value), "children": [{"value": copy.deepcopy(value), "children": [{"value": "2"}]}]}
+        record["array_of_objects"] = [{"a": copy.deepcopy(value)}, copy.deepcopy(value)]
+        yield record
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        pytest.param(TransformConfig.DefaultSchemaNormalization, id="test_default_normalization"),
+        pytest.param(TransformConfig.CustomSchemaNormalization, id="test_custom_normalization"),
+        pytest.param(TransformConfig.DefaultSchemaNormalization | TransformConfig.CustomSchemaNormalization, id="test_both_normalizations"),
+    ],
+)
+def test_compiled_transform_matches_validator(config, caplog):
+    def _transform(compiled):
+        transformer = TypeTransformer(config, compiled=compiled)
+        if TransformConfig.CustomSchemaNormalization in config:
+            transformer.registerCustomTransform(lambda value, schema: f"{value}!" if schema.get("type") == "string" else value)
+        records = list(_parity_records())
+        caplog.clear()
+        with caplog.at_level(logging.WARNING, logger="airbyte"):
+            for record in records:
+                transformer.transform(record, PARITY_SCHEMA)
+        return records, [record.message for record in caplog.records]
+
+    compiled_records, compiled_warnings = _transform(compiled=True)
+    validator_records, validator_warnings = _transform(compiled=False)
+
+    assert json.dumps(compiled_records) == json.dumps(validator_records)
+    assert compiled_warnings == validator_warnings
+
+
+def test_compiled_transform_falls_back_on_validator_for_unsupported_schemas():
+    schema = {"type": "object", "properties": {"tuple": {"type": "array", "items": [{"type": "string"}]}, "value": {"type": "string"}}}
+    record = {"value": 1}
+
+    TypeTransformer(TransformConfig.DefaultSchemaNormalization).transform(record, schema)
+
+    assert record == {"value": "1"}
+
+
+def test_compiled_transform_raises_on_unknown_type_like_validator():
+    schema = {"type": "object", "properties": {"value": {"type": "unknown"}}}
+    TypeTransformer(TransformConfig.DefaultSchemaNormalization).transform({"another": 1}, schema)
+
+    with pytest.raises(UnknownType):
+        TypeTransformer(TransformConfig.DefaultSchemaNormalization).transform({"value": 1}, schema)
+
+
+def test_compiled_schemas_are_cached_by_content():
+    transformer = TypeTransformer(TransformConfig.DefaultSchemaNormalization)
+
+    with patch.object(_SchemaCompiler, "compile", side_effect=_SchemaCompiler.compile, autospec=True) as compile_schema:
+        for value in [1, 2, 3]:
+            record = {"value": value}
+            # A new schema instance for each record, like the schema loaders return
+            transformer.transform(record, {"type": "object", "properties": {"value": {"type": "string"}}})
+            assert record == {"value": str(value)}
+
+    assert compile_schema.call_count == 1
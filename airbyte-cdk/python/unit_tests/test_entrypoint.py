@@ -152,6 +152,21 @@ def test_run_spec(entrypoint: AirbyteEntrypoint, mocker):
     assert [MESSAGE_FROM_REPOSITORY.json(exclude_unset=True), _wrap_message(expected)] == messages
 
 
+def test_given_airbyte_message_to_string_is_overridden_when_run_then_messages_are_serialized_with_it(mocker):
+    class _Entrypoint(AirbyteEntrypoint):
+        @staticmethod
+        def airbyte_message_to_string(airbyte_message: AirbyteMessage) -> Any:
+            return f"custom {airbyte_message.type.value}"
+
+    parsed_args = Namespace(command="spec")
+    mocker.patch.object(MockSource, "spec", return_value=ConnectorSpecification(connectionSpecification={}))
+    mocker.patch.object(MockSource, "message_repository", new_callable=mocker.PropertyMock, return_value=None)
+
+    messages = list(_Entrypoint(MockSource()).run(parsed_args))
+
+    assert messages == ["custom SPEC"]
+
+
 @pytest.fixture
 def config_mock(mocker, request):
     config = request.param if hasattr(request, "param") else {"username": "fake"}
@@ -0,0 +1,96 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import io
+
+import pytest
+from airbyte_cdk.models import (
+    AirbyteLogMessage,
+    AirbyteMessage,
+    AirbyteRecordMessage,
+    AirbyteStateMessage,
+    AirbyteStateType,
+    AirbyteStreamState,
+    Level,
+    StreamDescriptor,
+    Type,
+)
+from airbyte_cdk.utils.message_reader import AirbyteMessageReader
+
+RECORD = AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="users", data={"id": 1, "name": "é"}, emitted_at=1))
+STATE = AirbyteMessage(
+    type=Type.STATE,
+    state=AirbyteStateMessage(
+        type=AirbyteStateType.STREAM,
+        stream=AirbyteStreamState(stream_descriptor=StreamDescriptor(name="users"), stream_state={"cursor": 1}),
+    ),
+)
+LOG = AirbyteMessage(type=Type.LOG, log=AirbyteLogMessage(level=Level.INFO, message="a log"))
+
+
+def _input(*lines: str) -> io.BytesIO:
+    return io.BytesIO("\n".join(lines).encode("utf-8"))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1024 * 1024])
+def test_messages_are_read_regardless_of_chunk_boundaries(chunk_size):
+    messages = [RECORD, STATE, LOG, RECORD]
+    input_stream = _input(*[message.json(exclude_unset=True) for message in messages])
+
+    assert list(AirbyteMessageReader(chunk_size=chunk_size).read(input_stream)) == messages
+
+
+def test_record_messages_are_not_validated_by_default():
+    record = AirbyteMessageReader().read(_input(RECORD.json(exclude_unset=True))).__next__()
+
+    assert record.type == Type.RECORD
+    assert isinstance(record.record, AirbyteRecordMessage)
+    assert record.record.data == {"id": 1, "name": "é"}
+    assert record.json(exclude_unset=True) == RECORD.json(exclude_unset=True)
+
+
+def test_record_messages_are_validated_when_requested():
+    input_stream = _input('{"type": "RECORD", "record": {"stream": "users", "data": {"id": 1}, "emitted_at": "1"}}')
+
+    [record] = list(AirbyteMessageReader(validate_records=True).read(input_stream))
+
+    assert record.record.emitted_at == 1
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        pytest.param("not json", id="test_invalid_json"),
+        pytest.param("", id="test_empty_line"),
+        pytest.param("[1, 2]", id="test_not_an_object"),
+        pytest.param('{"type": "RECORD", "record": {"stream": "users"}}', id="test_record_missing_fields"),
+        pytest.param('{"type": "UNKNOWN"}', id="test_unknown_type"),
+    ],
+)
+def test_malformed_input_is_ignored(line):
+    input_stream = _input(line, RECORD.json(exclude_unset=True))
+
+    assert list(AirbyteMessageReader().read(input_stream)) == [RECORD]
+
+
+def test_big_integers_are_supported():
+    input_stream = _input('{"type": "RECORD", "record": {"stream": "users", "data": {"id": 1180591620717411303425}, "emitted_at": 1}}')
+
+    [record] = list(AirbyteMessageReader().read(input_stream))
+
+    assert record.record.data == {"id": 2**70 + 1}
+
+
+@pytest.mark.parametrize(
+    "to_text_stream",
+    [
+        pytest.param(lambda content: io.TextIOWrapper(io.BytesIO(content.encode("utf-8")), encoding="utf-8"), id="test_text_io_wrapper"),
+        pytest.param(io.StringIO, id="test_string_io"),
+    ],
+)
+def test_text_streams_are_read(to_text_stream):
+    messages = [RECORD, STATE, LOG]
+    input_stream = to_text_stream("\n".join(message.json(exclude_unset=True) for message in messages))
+
+    assert list(AirbyteMessageReader(chunk_size=5).read(input_stream)) == messages
@@ -0,0 +1,115 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import datetime
+import json
+from decimal import Decimal
+from enum import Enum
+
+import pytest
+from airbyte_cdk.models import (
+    AirbyteLogMessage,
+    AirbyteMessage,
+    AirbyteRecordMessage,
+    AirbyteStateMessage,
+    AirbyteStateType,
+    AirbyteStreamState,
+    Level,
+    StreamDescriptor,
+    Type,
+)
+from airbyte_cdk.sources.utils.record_helper import stream_data_to_airbyte_message
+from airbyte_cdk.utils.constants import ENV_MESSAGE_SERIALIZATION_MODE
+from airbyte_cdk.utils.message_serializer import AirbyteMessageSerializer, SerializationMode
+
+
+class Color(Enum):
+    RED = "red"
+
+
+RECORD_DATA = {
+    "id": 1,
+    "name": "Airbyté",
+    "amount": Decimal("1.5"),
+    "ratio": 0.1,
+    "created_at": datetime.datetime(2023, 1, 1, 12, 30, 15, 1234),
+    "day": datetime.date(2023, 1, 1),
+    "color": Color.RED,
+    "tags": ("a", "b"),
+    "nested": {"list": [1, None, True], "empty": {}},
+    "big_int": 2**70,
+}
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        pytest.param(stream_data_to_airbyte_message("stream", RECORD_DATA), id="test_record_from_record_helper"),
+        pytest.param(
+            AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="stream", data=RECORD_DATA, emitted_at=1)),
+            id="test_validated_record",
+        ),
+        pytest.param(
+            AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(namespace=None, stream="stream", data={"id": 1}, emitted_at=1)),
+            id="test_record_with_namespace_explicitly_set_to_none",
+        ),
+        pytest.param(
+            AirbyteMessage(
+                type=Type.RECORD, record=AirbyteRecordMessage(namespace="public", stream="stream", data={"id": 1}, emitted_at=1)
+            ),
+            id="test_record_with_namespace",
+        ),
+        pytest.param(
+            AirbyteMessage(type=Type.LOG, log=AirbyteLogMessage(level=Level.INFO, message="a log message")),
+            id="test_log_message",
+        ),
+        pytest.param(
+            AirbyteMessage(
+                type=Type.STATE,
+                state=AirbyteStateMessage(
+                    type=AirbyteStateType.STREAM,
+                    stream=AirbyteStreamState(stream_descriptor=StreamDescriptor(name="stream"), stream_state={"cursor": 1}),
+                ),
+            ),
+            id="test_state_message",
+        ),
+    ],
+)
+def test_json_serialization_is_identical_to_pydantic(message):
+    serializer = AirbyteMessageSerializer(SerializationMode.JSON)
+    assert serializer.serialize(message) == message.json(exclude_unset=True)
+
+
+def test_orjson_serialization_is_equivalent_to_pydantic():
+    pytest.importorskip("orjson")
+    message = stream_data_to_airbyte_message("stream", RECORD_DATA)
+    serializer = AirbyteMessageSerializer(SerializationMode.ORJSON)
+    assert json.loads(serializer.serialize(message)) == json.loads(message.json(exclude_unset=True))
+
+
+def test_pydantic_serialization():
+    message = stream_data_to_airbyte_message("stream", {"id": 1})
+    assert AirbyteMessageSerializer(SerializationMode.PYDANTIC).serialize(message) == message.json(exclude_unset=True)
+
+
+@pytest.mark.parametrize(
+    "env_value, expected_mode",
+    [
+        pytest.param(None, SerializationMode.JSON, id="test_default_is_json"),
+        pytest.param("pydantic", SerializationMode.PYDANTIC, id="test_pydantic"),
+        pytest.param("JSON", SerializationMode.JSON, id="test_mode_is_case_insensitive"),
+    ],
+)
+def test_from_environment(monkeypatch, env_value, expected_mode):
+    if env_value is None:
+        monkeypatch.delenv(ENV_MESSAGE_SERIALIZATION_MODE, raising=False)
+    else:
+        monkeypatch.setenv(ENV_MESSAGE_SERIALIZATION_MODE, env_value)
+    assert AirbyteMessageSerializer.from_environment().mode == expected_mode
+
+
+def test_invalid_mode_from_environment(monkeypatch):
+    monkeypatch.setenv(ENV_MESSAGE_SERIALIZATION_MODE, "unknown")
+    with pytest.raises(ValueError):
+        AirbyteMessageSerializer.from_environment()
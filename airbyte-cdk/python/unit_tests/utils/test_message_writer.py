@@ -0,0 +1,86 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+import io
+
+from airbyte_cdk.utils.message_writer import BufferedMessageWriter
+
+RECORD = '{"type": "RECORD", "record": {"stream": "s", "data": {"id": 1}, "emitted_at": 1}}'
+STATE = '{"type": "STATE", "state": {"data": {"cursor": 1}}}'
+
+
+def _output() -> io.TextIOWrapper:
+    return io.TextIOWrapper(io.BytesIO(), encoding="utf-8")
+
+
+def _written(output: io.TextIOWrapper) -> str:
+    output.flush()
+    return output.buffer.getvalue().decode("utf-8")
+
+
+def test_messages_are_buffered_until_flush():
+    output = _output()
+    writer = BufferedMessageWriter(output, max_buffer_size=1024 * 1024, max_buffer_age=3600)
+
+    writer.write(RECORD)
+    writer.write(RECORD)
+    assert _written(output) == ""
+
+    writer.flush()
+    assert _written(output) == f"{RECORD}\n{RECORD}\n"
+
+
+def test_buffer_is_flushed_when_over_max_size():
+    output = _output()
+    writer = BufferedMessageWriter(output, max_buffer_size=2 * len(RECORD), max_buffer_age=3600)
+
+    writer.write(RECORD)
+    assert _written(output) == ""
+    writer.write(RECORD)
+    assert _written(output) == f"{RECORD}\n{RECORD}\n"
+
+
+def test_buffer_is_flushed_when_too_old():
+    output = _output()
+    writer = BufferedMessageWriter(output, max_buffer_size=1024 * 1024, max_buffer_age=0)
+
+    writer.write(RECORD)
+    assert _written(output) == f"{RECORD}\n"
+
+
+def test_buffer_is_flushed_on_state_message():
+    output = _output()
+    writer = BufferedMessageWriter(output, max_buffer_size=1024 * 1024, max_buffer_age=3600)
+
+    writer.write(RECORD)
+    writer.write(STATE)
+    assert _written(output) == f"{RECORD}\n{STATE}\n"
+
+
+def test_buffer_is_flushed_on_exit_even_on_error():
+    output = _output()
+    try:
+        with BufferedMessageWriter(output, max_buffer_size=1024 * 1024, max_buffer_age=3600) as writer:
+            writer.write(RECORD)
+            raise ValueError("sync failed")
+    except ValueError:
+        pass
+    assert _written(output) == f"{RECORD}\n"
+
+
+def test_pending_text_is_written_before_buffered_messages():
+    output = _output()
+    writer = BufferedMessageWriter(output, max_buffer_size=1024 * 1024, max_buffer_age=3600)
+
+    writer.write(RECORD)
+    output.write("a log line\n")
+    writer.flush()
+    assert _written(output) == f"a log line\n{RECORD}\n"
+
+
+def test_output_without_binary_buffer():
+    output = io.StringIO()
+    with BufferedMessageWriter(output) as writer:
+        writer.write(RECORD)
+    assert output.getvalue() == f"{RECORD}\n"